@@ -6,18 +6,26 @@
 #               slices part.
 
 
+from UM.Application import Application
 from UM.Mesh.MeshWriter import MeshWriter
 from UM.MimeTypeDatabase import MimeTypeDatabase, MimeType
+from cura.CuraApplication import CuraApplication
 from cura.Snapshot import Snapshot
 from cura.Utils.Threading import call_on_qt_thread
 from UM.Logger import Logger
 from UM.Scene.SceneNode import SceneNode #For typing.
+from UM.Scene.Iterator.DepthFirstIterator import DepthFirstIterator
 from UM.PluginRegistry import PluginRegistry
 from UM.i18n import i18nCatalog
 catalog = i18nCatalog("cura")
 
 import re
-from io import StringIO, BufferedIOBase #To write the g-code to a temporary buffer, and for typing.
+import io
+import hashlib
+import numpy
+from collections import OrderedDict
+from io import BufferedIOBase #For typing.
+from PyQt5.QtGui import QImage
 from typing import cast, List
 
 
@@ -37,10 +45,106 @@ def getValue(line, key, default=None):
 
 
 
+class GcodeRewrite:
+    # One rewrite of the post-processing pass. line() gets every line that starts with one of the
+    # markers and returns its replacement, layer() returns text to put in front of a gcode_list element.
+    markers = ()
+
+    def line(self, line):
+        return line
+
+    def layer(self, index, count):
+        return ""
+
+
+class TimeInfoRewrite(GcodeRewrite):
+    # print time estimates of the slicer as M2100 (total) and M2101 (elapsed)
+    markers = (";TIME:", ";TIME_ELAPSED:")
+
+    def line(self, line):
+        if line.startswith(";TIME:"):
+            return "M2100 T%d" % int(getValue(line, ";TIME:", 0))
+        return "M2101 T%d" % int(getValue(line, ";TIME_ELAPSED:", 0))
+
+
+class ThumbnailRewrite(GcodeRewrite):
+    def __init__(self, writer):
+        self._writer = writer
+
+    def layer(self, index, count):
+        return self._writer._thumbnailCode() + "\n" if index == 0 else ""
+
+
+class ChamberFanRewrite(GcodeRewrite):
+    # chamber circulation fan on from the given layer until the end gcode
+    markers = (";LAYER:",)
+
+    def __init__(self, at_layer):
+        self._at_layer = at_layer
+        self._enabled = False
+
+    def line(self, line):
+        if not self._enabled and getValue(line, ";LAYER:") == self._at_layer:
+            self._enabled = True
+            return "M106 T-2 ;Enable chamber loop\n" + line
+        return line
+
+    def layer(self, index, count):
+        if self._enabled and index == count - 1:
+            return "M107 T-2 ;Disable chamber loop\n"
+        return ""
+
+
+class ChituPostProcessor:
+    # Text stream for GCodeWriter that applies all rewrites in a single pass. GCodeWriter writes every
+    # gcode_list element with one write(), each is passed on to the output as soon as it is written
+    # so the whole g-code never has to be in memory at once.
+    def __init__(self, stream, rewrites, layer_count):
+        self._stream = stream
+        self._layer_count = layer_count
+        self._index = 0
+        self._pending = ""  # unterminated last line of the previous write
+        self._layer_rewrites = [rewrite for rewrite in rewrites if type(rewrite).layer is not GcodeRewrite.layer]
+        self._line_rewrites = {}
+        for rewrite in rewrites:
+            for marker in rewrite.markers:
+                self._line_rewrites.setdefault(marker, []).append(rewrite)
+        self._markers = sorted(self._line_rewrites, key=len, reverse=True)
+        self._pattern = re.compile("^(%s).*" % "|".join(map(re.escape, self._markers)), re.M) if self._markers else None
+
+    def write(self, data):
+        prefix = "".join(rewrite.layer(self._index, self._layer_count) for rewrite in self._layer_rewrites)
+        self._index += 1
+        data = self._pending + prefix + data
+        end = data.rfind("\n") + 1
+        self._pending = data[end:]
+        self._stream.write(self._rewrite(data[:end]))
+        return len(data)
+
+    def close(self):
+        self._stream.write(self._rewrite(self._pending) + "\n")
+        self._pending = ""
+
+    def _rewrite(self, text):
+        if self._pattern is None or not any(marker in text for marker in self._markers):
+            return text
+        return self._pattern.sub(self._rewriteLine, text)
+
+    def _rewriteLine(self, match):
+        line = match.group(0)
+        for rewrite in self._line_rewrites[match.group(1)]:
+            line = rewrite.line(line)
+        return line
+
+
 class ChituCodeWriter(MeshWriter):
+    THUMBNAIL_CACHE_SIZE = 8
+    _thumbnail_cache = OrderedDict()  # scene fingerprint -> M4010 code, shared by all writers
+
     def __init__(self):
         super().__init__(add_to_recent_files = False)
         self._snapshot = None
+        self._rewrites = [ThumbnailRewrite(self), TimeInfoRewrite()]
         MimeTypeDatabase.addMimeType(
             MimeType(
                 name = "text/chitu-g-code",
@@ -56,41 +160,69 @@ class ChituCodeWriter(MeshWriter):
             Logger.log("e", "ChituCodeWriter does not support non-text mode.")
             self.setInformation(catalog.i18nc("@error:not supported", "ChituCodeWriter does not support non-text mode."))
             return False
-        gcode_textio = StringIO() #We have to convert the g-code into bytes.
+        gcode_stream = ChituPostProcessor(stream, self._rewrites, self._layerCount())
         gcode_writer = cast(MeshWriter, PluginRegistry.getInstance().getPluginObject("GCodeWriter"))
-        success = gcode_writer.write(gcode_textio, None)
+        success = gcode_writer.write(gcode_stream, None)
         
         if not success: 
             self.setInformation(gcode_writer.getInformation())
             return False
-        result=self.modify(gcode_textio.getvalue())
-        stream.write(result)
+        gcode_stream.close()
         Logger.log("i", "ChituWriter done")
         return True
 
+    def addRewrite(self, rewrite: GcodeRewrite):
+        self._rewrites.append(rewrite)
+
     def modify(self,in_data):
+        output = io.StringIO()
+        gcode_stream = ChituPostProcessor(output, self._rewrites, 1)
+        gcode_stream.write(in_data)
+        gcode_stream.close()
+        return output.getvalue()
+
+    def _layerCount(self):
+        # number of gcode_list elements GCodeWriter is going to write
+        scene = Application.getInstance().getController().getScene()
+        active_build_plate = CuraApplication.getInstance().getMultiBuildPlateModel().activeBuildPlate
+        return len(getattr(scene, "gcode_dict", {}).get(active_build_plate) or [])
+
+    def _thumbnailCode(self):
+        # the scene did not change since an earlier write, skip rendering and encoding it again
+        key = self._sceneFingerprint()
+        if key in self._thumbnail_cache:
+            self._thumbnail_cache.move_to_end(key)
+            return self._thumbnail_cache[key]
         self._createSnapshot()
-        temp_in_data=self.generate_image_code(self._snapshot)
-        temp_in_data+="\n"
-        temp_in_data+=in_data
-        time_data=self.insert_time_infos(temp_in_data)
-        return time_data
-    
-
-    def insert_time_infos(self, gcode_data):
-        return_data=""
-        for line in gcode_data.split("\n"):
-            if line.startswith(';TIME:'):
-                return_data += 'M2100 T%d\n' % int(getValue(line, ';TIME:', 0))
-            elif line.startswith(';TIME_ELAPSED:'):
-                return_data +='M2101 T%d\n' % int(getValue(line, ';TIME_ELAPSED:', 0))  
-            else:
-                if line.endswith("\n"):
-                    return_data += line
-                else:
-                    return_data += line + "\n"     
-        return return_data        
-        
+        code = self.generate_image_code(self._snapshot)
+        if key is not None:
+            self._thumbnail_cache[key] = code
+            while len(self._thumbnail_cache) > self.THUMBNAIL_CACHE_SIZE:
+                self._thumbnail_cache.popitem(last=False)
+        return code
+
+    def _sceneFingerprint(self):
+        # what Snapshot.snapshot() renders: the visible sliceable meshes, where they are and their colors.
+        # Hashes the mesh data itself, so the cache does not keep meshes alive that left the scene.
+        try:
+            application = Application.getInstance()
+            fingerprint = hashlib.sha1()
+            for node in DepthFirstIterator(application.getController().getScene().getRoot()):
+                mesh = node.getMeshData()
+                if node.callDecoration("isSliceable") and mesh and node.isVisible():
+                    fingerprint.update(repr(node.callDecoration("getActiveExtruderPosition")).encode())
+                    for data in (mesh.getVertices(), mesh.getIndices()):
+                        if data is not None:
+                            fingerprint.update(numpy.ascontiguousarray(data).tobytes())
+                    fingerprint.update(node.getWorldTransformation().getData().tobytes())
+            global_stack = application.getGlobalContainerStack()
+            if global_stack:
+                for extruder in global_stack.extruderList:
+                    fingerprint.update(repr(extruder.material.getMetaDataEntry("color_code")).encode())
+            return fingerprint.hexdigest()
+        except Exception:
+            Logger.logException("w", "Failed to fingerprint the scene")
+            return None
 
     def _createSnapshot(self, *args):
         Logger.log("i", "Creating chitu thumbnail image ...")
@@ -124,60 +256,50 @@ class ChituCodeWriter(MeshWriter):
             endX = int(endX * scale)
             endY = int(endY * scale)
             image = image.scaled(width, height)
-        res_list = []
-        for i in range(startY, endY):
-            for j in range(startX, endX):
-                res_list.append(image.pixel(j, i))
-
-        index_pixel = 0
-        pixel_num = 0
-        pixel_data = ''
-        pixel_string=""
-        pixel_string+=('M4010 X%d Y%d\n' % (endX - startX, endY - startY))
-        last_color = -1
-        mask = 32
-        unmask = ~mask
-        same_pixel = 1
-        color = 0
-        for j in res_list:
-            a = j >> 24 & 255
-            if not a:
-                r = g = b = 255
-            else:
-                r = j >> 16 & 255
-                g = j >> 8 & 255
-                b = j & 255
-            color = (r >> 3 << 11 | g >> 2 << 5 | b >> 3) & unmask
-            if last_color == -1:
-                last_color = color
-            elif last_color == color and same_pixel < 4095:
-                same_pixel += 1
-            elif same_pixel >= 2:
-                pixel_data += '%04x' % (last_color | mask)
-                pixel_data += '%04x' % (12288 | same_pixel)
-                pixel_num += same_pixel
-                last_color = color
-                same_pixel = 1
-            else:
-                pixel_data += '%04x' % last_color
-                last_color = color
-                pixel_num += 1
-            if len(pixel_data) >= 180:
-                pixel_string+=("M4010 I%d T%d '%s'\n" % (index_pixel, pixel_num, pixel_data))
-                pixel_data = ''
-                index_pixel += pixel_num
-                pixel_num = 0
-
-        if same_pixel >= 2:
-            pixel_data += '%04x' % (last_color | mask)
-            pixel_data += '%04x' % (12288 | same_pixel)
-            pixel_num += same_pixel
-            last_color = color
-            same_pixel = 1
-        else:
-            pixel_data += '%04x' % last_color
-            last_color = color
-            pixel_num += 1
-        pixel_string+=("M4010 I%d T%d '%s'\n" % (index_pixel, pixel_num, pixel_data))
-        return pixel_string
+        if image.format() != QImage.Format_ARGB32:
+            image = image.convertToFormat(QImage.Format_ARGB32)  # the format pixel() returns
+        bits = image.constBits()
+        bits.setsize(image.sizeInBytes())
+        pixels = numpy.frombuffer(bits, dtype=numpy.uint32).reshape(image.height(), image.bytesPerLine() // 4)
+        pixels = pixels[startY:endY, startX:endX].ravel()
+
+        pixel_string = 'M4010 X%d Y%d\n' % (endX - startX, endY - startY)
+        if not pixels.size:
+            return pixel_string + "M4010 I0 T1 '-001'\n"
+
+        # RGB565, transparent pixels are white, bit 5 is cleared to mark single pixels
+        pixels = numpy.where(pixels >> 24 == 0, numpy.uint32(0xffffff), pixels)
+        colors = (pixels >> 8 & 0xf800 | pixels >> 5 & 0x7c0 | pixels >> 3 & 0x1f).astype(numpy.uint16)
+
+        # runs of the same color, at most 4095 pixels each
+        starts = numpy.concatenate(([0], numpy.flatnonzero(colors[1:] != colors[:-1]) + 1))
+        lengths = numpy.diff(numpy.append(starts, colors.size))
+        parts = (lengths + 4094) // 4095
+        run_colors = numpy.repeat(colors[starts], parts)
+        run_lengths = numpy.full(run_colors.size, 4095)
+        run_lengths[numpy.cumsum(parts) - 1] = lengths - (parts - 1) * 4095
+
+        # a single pixel is its color, a run is the color with bit 5 set followed by 0x3000 | length
+        single = run_lengths == 1
+        word_end = numpy.cumsum(numpy.where(single, 1, 2))
+        words = numpy.empty(word_end[-1], dtype='>u2')
+        first = word_end - 1 - ~single
+        words[first] = numpy.where(single, run_colors, run_colors | 32)
+        words[first[~single] + 1] = 0x3000 | run_lengths[~single]
+        pixel_data = words.tobytes().hex()
+
+        # a line is complete once it reaches 180 characters, the last run always ends up in the last line
+        char_end = word_end * 4
+        pixel_end = numpy.cumsum(run_lengths)
+        lines = [pixel_string]
+        char_start = index_pixel = 0
+        while True:
+            k = numpy.searchsorted(char_end[:-1], char_start + 180)
+            if k == char_end.size - 1:
+                break
+            lines.append("M4010 I%d T%d '%s'\n" % (index_pixel, pixel_end[k] - index_pixel, pixel_data[char_start:char_end[k]]))
+            char_start = char_end[k]
+            index_pixel = pixel_end[k]
+        lines.append("M4010 I%d T%d '%s'\n" % (index_pixel, pixel_end[-1] - index_pixel, pixel_data[char_start:]))
+        return "".join(lines)
     
\ No newline at end of file
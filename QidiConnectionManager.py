@@ -11,19 +11,36 @@ from UM.Logger import Logger
 from UM.Platform import Platform
 from UM.Job import Job
 
+from .QidiGcodeCompressor import QidiGcodeCompressor
+from .QidiPipeline import QidiBlockPipe
+from .QidiLayerIndex import QidiLayerIndex
+from .QidiTelemetry import QidiTelemetry
+from .QidiStatus import QidiStatus, QidiSnapshot
+
 import subprocess
 import re
 import threading
 import platform
 import struct
+import select
 import traceback
 import sys
 import base64
 import json
 import urllib
 import os.path
+import io
+import hashlib
+import copy
+import ipaddress
+
+from threading import Thread, Lock, Event
+from collections import OrderedDict, deque
 
-from threading import Thread, Lock
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 
 class QidiResult(Enum):
@@ -37,36 +54,206 @@ class QidiResult(Enum):
     FAIL = 7
 
 
+def _wait_readable(udp_socket, timeout):
+    # sleep in select() on the native socket instead of spinning on hasPendingDatagrams()
+    deadline = Timer() + timeout
+    while not udp_socket.hasPendingDatagrams():
+        remaining = deadline - Timer()
+        if remaining <= 0:
+            return False
+        fd = udp_socket.socketDescriptor()
+        if fd is None or fd < 0:  # not bound until the first datagram is written
+            sleep(min(remaining, 0.001))
+            continue
+        select.select([fd], [], [], remaining)
+    return True
+
+
+class QidiRttEstimator:
+    # Jacobson/Karels smoothed round trip time (RFC 6298), shared by everything talking to one printer
+    ALPHA = 0.125
+    BETA = 0.25
+    K = 4
+
+    def __init__(self, initial_rto=1.0, min_rto=0.1, max_rto=3.0):
+        self._lock = Lock()
+        self.min_rto = min_rto
+        self.max_rto = max_rto
+        self.srtt = None
+        self.rttvar = None
+        self.rto = initial_rto
+
+    def sample(self, rtt):
+        with self._lock:
+            if self.srtt is None:
+                self.srtt = rtt
+                self.rttvar = rtt / 2
+            else:
+                self.rttvar += self.BETA * (abs(self.srtt - rtt) - self.rttvar)
+                self.srtt += self.ALPHA * (rtt - self.srtt)
+            self.rto = min(self.max_rto, max(self.min_rto, self.srtt + self.K * self.rttvar))
+
+    def backoff(self):
+        # keep the doubled timeout until the next valid sample (Karn)
+        with self._lock:
+            self.rto = min(self.max_rto, self.rto * 2)
+
+    def __str__(self):
+        if self.srtt is None:
+            return "rto:{:.0f}ms".format(self.rto * 1000)
+        return "srtt:{:.1f}ms rttvar:{:.1f}ms rto:{:.0f}ms".format(self.srtt * 1000, self.rttvar * 1000, self.rto * 1000)
+
+
+class QidiUploadCache:
+    # content hash of the g-code -> uploads of it that completed, per printer
+    MAX_ENTRIES = 256
+    _lock = Lock()  # shared by the managers of all printers
+
+    def __init__(self, path):
+        self._path = path
+
+    def lookup(self, digest, printer):
+        with self._lock:
+            return self.__load().get(digest, {}).get(printer)
+
+    def add(self, digest, printer, filename, size):
+        with self._lock:
+            index = self.__load()
+            index.setdefault(digest, {})[printer] = {'filename': filename, 'size': size, 'time': time()}
+            if len(index) > self.MAX_ENTRIES:
+                newest = sorted(index, key=lambda key: max(entry['time'] for entry in index[key].values()))
+                for key in newest[:len(index) - self.MAX_ENTRIES]:
+                    del index[key]
+            self.__save(index)
+
+    def holds(self, printer, filename):
+        # True if an upload to this printer listed here is stored under the remote filename
+        filename = filename.lower()
+        with self._lock:
+            return any(entry.get(printer, {}).get('filename', '').lower() == filename
+                       for entry in self.__load().values())
+
+    def remove(self, digest, printer):
+        with self._lock:
+            index = self.__load()
+            if index.get(digest, {}).pop(printer, None) is not None:
+                if not index[digest]:
+                    del index[digest]
+                self.__save(index)
+
+    def __load(self):
+        try:
+            with open(self._path, 'r') as fp:
+                index = json.load(fp)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def __save(self, index):
+        try:
+            with open(self._path, 'w') as fp:
+                json.dump(index, fp)
+        except OSError as e:
+            Logger.log("w", "Could not save upload cache: {}", str(e))
+
+
+class QidiPreparedUpload:
+    # a job compressed once for any number of printers with the same config
+    def __init__(self, gcode_hash, path, suffix, index, config):
+        self.gcode_hash = gcode_hash
+        self.path = path
+        self.suffix = suffix  # '.gcode.tz' or '.gcode'
+        self.file_hash = QidiConnectionManager._file_hash(path)
+        self.size = os.path.getsize(path)
+        self.index = index
+        self.config = config
+
+
+class _QidiSideRequest:
+    # a status poll or command of another thread that goes out between the blocks of a running upload
+    def __init__(self, cycle=None, commands=None):
+        self.cycle = cycle  # a status cycle like _pollCycle(), or None for commands
+        self.commands = commands
+        self.request = None  # (command, timeout_ms, retries) the cycle waits on
+        self.tries = 0
+        self.sent = 0.0
+        self.result = QidiResult.TIMEOUT
+        self.done = Event()
+
+
 class QidiConnectionManager(QObject):
     progressChanged = pyqtSignal(int)
     conectionStateChanged = pyqtSignal(bool)
-    updateDone = pyqtSignal()
-
-    def __init__(self, ip_addr, temp_gcode_file, log_enabled=False):
+    updateDone = pyqtSignal(object)  # frozenset of the status fields that changed
+
+    BLOCK_SIZES = (512, 1024, 1280, 1466, 2048, 4096)  # calibration candidates, 1466 fills a 1500 byte MTU
+    RESUME_ATTEMPTS = 3  # reconnects during one upload before giving up
+    RECONNECT_TIMEOUT = 30  # seconds to wait for the printer, its Wi-Fi module needs a while to reboot
+    POLL_INTERVAL = 1.0
+    # poll intervals in multiples of the base interval, by what the printer is doing
+    POLL_FAST = 0.5  # heating, first layer and right after a command
+    POLL_PRINTING = 5
+    POLL_IDLE = 10
+    RECONNECT_BACKOFF = 30  # longest wait between connection attempts
+    FAST_AFTER_COMMAND = 10.0  # seconds
+    HEATING_MARGIN = 2.0  # degrees from the target temperature
+    FIRST_LAYER_Z = 0.5  # mm, for prints without a layer index
+    SIDE_COMMAND_TIMEOUT = 5  # seconds commands wait for a running upload to send them
+    HISTORY_SIZE = 24 * 3600  # status polls kept in the telemetry, a day at the default interval
+    ALL_FIELDS = frozenset(QidiStatus._fields + ('printing', 'printing_filename'))
+    # replies that can be told apart from the block acks, so their requests can interleave with an upload
+    SIDE_REPLIES = {'M4000': re.compile(r'(?<!\S)D:\d+/\d+/\d'), 'M4006': re.compile("'")}
+
+    def __init__(self, ip_addr, temp_gcode_file, log_enabled=False, send_window=1, fleet=None, history_size=HISTORY_SIZE):
         super().__init__()
         self._ip = QHostAddress(ip_addr)
         self._localTempGcode = temp_gcode_file
         self._port = 3000
         self.BUFSIZE = 1280
+        self._block_buffer = bytearray(self.BUFSIZE + 6)  # reused for every file block datagram
+        self._block_view = memoryview(self._block_buffer)
+        self._blocks_sent = 0
+        self._resends = 0
+        self._send_window = max(1, int(send_window))  # file blocks in flight, 1 = stop-and-wait
+        self.rtt = QidiRttEstimator()
+        self._checkpoint_file = '{}.{}.resume'.format(temp_gcode_file, ip_addr)  # group uploads run in parallel
+        self.__transfer = None  # printer, remote filename, hash and size of the running upload
+        self.__acked = 0  # the printer has every byte of the upload before this offset
+        self._upload_cache = QidiUploadCache(os.path.join(os.path.dirname(temp_gcode_file), 'qidi_uploads.json'))
+        self.__cache_candidate = False
+        self.__stop_stream = False  # set by the cache watcher, _abort is the user's cancel
+        self.__report_progress = True  # off while a scratch file is uploaded
+        self._layer_index_file = os.path.join(os.path.dirname(temp_gcode_file), 'qidi_layers_{}.idx'.format(ip_addr))
+        self._layer_index = QidiLayerIndex.load(self._layer_index_file)  # of the last file uploaded to the printer
+        self.__upload_index = QidiLayerIndex()
         self._file_encode = 'utf-8'
         self._abort = False
         self._filename = None
         self._log_enabled = log_enabled
         self._connected = False
-        self._socket = QUdpSocket(self)
+        self._fleet = fleet
+        self._socket = fleet.endpoint(ip_addr) if fleet is not None else QUdpSocket(self)
         self._last_reply = None
-        self._isPrinting = False
-        self._isIdle = False
-        self._print_now = 0
-        self._print_total = 0
         self._busy = False
-        self._printing_filename = ""
         self._firmware_ver = ""
-        self._printing_time = 0
         self._update_fail_cnt = 0
+        self.__unanswered_connect = float('-inf')  # time of the last connect attempt that timed out
         self._last_times = []
-        self._status = {}
+        self.snapshot = QidiSnapshot(QidiStatus(), False, "")  # replaced, never modified, by the poller
+        self.__changed = frozenset()
+        self.telemetry = QidiTelemetry(history_size)
         self._mutex = Lock()
+        self._poll_interval = self.POLL_INTERVAL
+        self.__poll_stop = None
+        self.__poll_wake = Event()
+        self.__last_command = None
+        self.__connect_failures = 0
+        self.__side_lock = Lock()
+        self.__side_open = False  # an upload holds the printer and takes side requests
+        self.__side_polls = deque()
+        self.__side_commands = deque()
+        self.__side_active = []  # side requests waiting for their reply, only touched by the upload thread
+        self.__side_poll = None
         self._config = {'e_mm_per_step': '0.0',
                         's_machine_type': '0',
                         's_x_max': '0.0',
@@ -85,19 +272,34 @@ class QidiConnectionManager(QObject):
         new_command = cast(str, cmd).encode(self._file_encode, 'ignore') if type(cmd) is str else cast(bytes, cmd)  # type: bytes
         self._socket.writeDatagram(new_command, self._ip, self._port)
 
+    def __wait_readable(self, timeout):
+        if self._fleet is not None:
+            return self._socket.waitForReadyRead(timeout * 1000)
+        return _wait_readable(self._socket, timeout)
+
     def __recieve(self, timeout_ms=100):
-        if timeout_ms > 0:
-            start = Timer() + timeout_ms / 1000.0
-            while Timer() < start and not self._socket.hasPendingDatagrams():
-                pass
+        deadline = Timer() + timeout_ms / 1000.0
         msg = ''
         res = QidiResult.TIMEOUT
-        while self._socket.hasPendingDatagrams():
-            datagram, host, port = self._socket.readDatagram(self._socket.pendingDatagramSize())
-            if datagram:
-                msg += datagram.decode(self._file_encode, 'ignore')
-                res = QidiResult.SUCCES
+        while True:
+            if timeout_ms > 0:
+                self.__wait_readable(max(0.0, deadline - Timer()))
+            while self._socket.hasPendingDatagrams():
+                datagram, host, port = self._socket.readDatagram(self._socket.pendingDatagramSize())
+                if datagram:
+                    text = datagram.decode(self._file_encode, 'ignore')
+                    if self.__side_active and self.__route_side(text):
+                        continue
+                    msg += text
+                    res = QidiResult.SUCCES
+            if res is QidiResult.SUCCES or timeout_ms <= 0 or Timer() >= deadline:
+                return self.__reply(msg, res)
+
+    def _decodeReply(self, datagram):
+        # a reply the fleet loop received for one of the requests of _pollCycle()
+        return self.__reply(datagram.decode(self._file_encode, 'ignore'), QidiResult.SUCCES)
 
+    def __reply(self, msg, res):
         if 'Error:Wifi reboot' in msg or 'Error:IP is connected' in msg:
             res = QidiResult.DISCONNECTED
             self._connected = False
@@ -105,14 +307,85 @@ class QidiConnectionManager(QObject):
         return msg, res
 
     def sendCommand(self, cmd):
-        result = self._mutex.acquire(blocking=True, timeout=1)
-        if result:
-            self.__send(cmd)
-            self._mutex.release()
-        else:
-            self.__log("d", 'timeout: lock not available')
+        # during an upload the command goes out between two blocks instead of waiting for the lock
+        self.__commanded()
+        side = _QidiSideRequest(commands=[cmd])
+        deadline = Timer() + 1
+        while not self.__submit_side(side):
+            if self._mutex.acquire(blocking=True, timeout=0.05):
+                try:
+                    self.__send(cmd)
+                finally:
+                    self._mutex.release()
+                return
+            if Timer() >= deadline:
+                self.__log("d", 'timeout: lock not available')
+                return
+
+    def sendCommands(self, commands):
+        # pipelines the commands and returns one QidiResult for all of them, SUCCES when each was acknowledged
+        self.__commanded()
+        side = _QidiSideRequest(commands=list(commands))
+        deadline = Timer() + 1
+        while not self.__submit_side(side):
+            if self._mutex.acquire(blocking=True, timeout=0.05):
+                try:
+                    return self.__send_commands(side.commands)
+                finally:
+                    self._mutex.release()
+            if Timer() >= deadline:
+                self.__log("d", 'timeout: lock not available')
+                return QidiResult.TIMEOUT
+        if not side.done.wait(self.SIDE_COMMAND_TIMEOUT):
+            with self.__side_lock:
+                if side in self.__side_commands:
+                    self.__side_commands.remove(side)
+                    self.__log("d", 'timeout: upload did not send the commands')
+                    return QidiResult.TIMEOUT
+            side.done.wait()  # on its way, bounded by the reply timeouts of __send_commands
+        return side.result
+
+    def __send_commands(self, commands):
+        # keeps up to send_window commands in flight. The printer answers each one with a line of its own,
+        # but nothing in it tells which command it belongs to, so only the whole list gets a result.
+        # Unanswered commands are not sent again, the printer may have executed them.
+        sent = answered = 0
+        timeouts = 0
+        failed = missing = False
+        self.__recieve(0)  # discard pending datagrams
+        while answered < len(commands):
+            if not self._connected:
+                return QidiResult.DISCONNECTED
+            while sent < len(commands) and sent - answered < self._send_window:
+                self.__log("d", 'sending cmd to {}: {}', self._ip.toString(), commands[sent])
+                self.__send(commands[sent])
+                sent += 1
+            msg, res = self.__recieve(self.rtt.rto * 1000)
+            if res == QidiResult.DISCONNECTED:
+                continue
+            if res != QidiResult.SUCCES:
+                self.rtt.backoff()
+                answered = sent
+                missing = True
+                timeouts += 1
+                if timeouts > 1:
+                    break  # the printer does not answer, the remaining commands are not sent
+                continue
+            timeouts = 0
+            for line in msg.splitlines():
+                if answered == sent:
+                    break
+                if 'Error' in line:
+                    failed = True
+                    answered += 1
+                elif line.startswith('ok'):
+                    answered += 1
+        if failed:
+            return QidiResult.FAIL
+        return QidiResult.TIMEOUT if missing else QidiResult.SUCCES
 
-    def request(self, cmd, timeout_ms=100, retries=1):
+    def request(self, cmd, timeout_ms=None, retries=1, min_timeout_ms=0):
+        # timeout_ms None: wait for the estimated retransmission timeout, backing off on every miss
         tryCnt = 0
         msg = ''
         res = QidiResult.TIMEOUT
@@ -126,11 +399,20 @@ class QidiConnectionManager(QObject):
             if not self._connected:
                 return '', QidiResult.DISCONNECTED
             self.__send(cmd)
-            msg, res = self.__recieve(timeout_ms)
+            sent = Timer()
+            if timeout_ms is None:
+                msg, res = self.__recieve(max(self.rtt.rto * 1000, min_timeout_ms))
+            else:
+                msg, res = self.__recieve(timeout_ms)
             if res == QidiResult.SUCCES:
+                if tryCnt == 1 and min_timeout_ms == 0:  # a reply to a resent command is ambiguous
+                    self._sampleRtt(Timer() - sent)
                 if type(cmd) is str:  # Log reply message only for str commands
                     self.__log("d", 'got reply from {}: {}', self._ip.toString(), str(msg).rstrip())
                 break
+            elif res == QidiResult.TIMEOUT and timeout_ms is None:
+                self.rtt.backoff()
+                self.__log("d", 'request timeout, {}', self.rtt)
         return msg, res
 
     def abort(self):
@@ -142,58 +424,76 @@ class QidiConnectionManager(QObject):
 
     def __connect(self, retries=1):
         tryCnt = 0
+        self.__recieve(0)  # discard pending datagrams
         while tryCnt < retries and self._connected == False:
             tryCnt += 1
             self.__send("M4001")
-            msg, res = self.__recieve()
+            sent = Timer()
+            msg, res = self.__recieve(self.rtt.rto * 1000)
             if res is not QidiResult.SUCCES:
                 self.__log("w", '{} Connection timeout ', self._ip.toString())
+                self.rtt.backoff()
+                self.__unanswered_connect = Timer()
                 continue
-            self.__log("d", 'Connected')
-            msg = msg.rstrip()
-            self.__log("d", msg)
-            msgs = msg.split(' ')
-            for item in msgs:
-                _ = item.split(':')
-                if len(_) == 2:
-                    id = _[0]
-                    value = _[1]
-                    if id == 'X':
-                        self._config["x_mm_per_step"] = value
-                    elif id == 'Y':
-                        self._config["y_mm_per_step"] = value
-                    elif id == 'Z':
-                        self._config["z_mm_per_step"] = value
-                    elif id == 'E':
-                        self._config["e_mm_per_step"] = value
-                    elif id == 'T':
-                        _ = value.split('/')
-                        if len(_) == 5:
-                            self._config["s_machine_type"] = _[0]
-                            self._config["s_x_max"] = _[1]
-                            self._config["s_y_max"] = _[2]
-                            self._config["s_z_max"] = _[3]
-                    elif id == 'U':
-                        self._file_encode = value.replace("'", '')
+            if tryCnt == 1:
+                self._sampleRtt(Timer() - sent)
+            self.__parse_config(msg)
             self._connected = True
-            msg, res = self.request('M4002 ', 2000, 2)
-            if res == QidiResult.SUCCES:
-                if 'ok ' in msg:
-                    msg = msg.rstrip()
-                    msg = msg.split('ok ')
-                    self._firmware_ver = msg[1]
+            self.__connect_failures = 0
+            self._update_fail_cnt = 0
+            self.__changed = self.ALL_FIELDS  # the first poll reports every field to the fresh printer model
+            self.__parse_firmware(*self.request('M4002 ', retries=2))
             self.conectionStateChanged.emit(self._connected)
             return True
+        self.__connect_failures += 1
         return False
 
+    def _sampleRtt(self, rtt):
+        # a reply while an unanswered M4001 may still be answered could be the late one to it, it is not timed
+        if Timer() - self.__unanswered_connect >= self.rtt.max_rto:
+            self.rtt.sample(rtt)
+
+    def __parse_config(self, msg):
+        self.__log("d", 'Connected')
+        msg = msg.rstrip()
+        self.__log("d", msg)
+        msgs = msg.split(' ')
+        for item in msgs:
+            _ = item.split(':')
+            if len(_) == 2:
+                id = _[0]
+                value = _[1]
+                if id == 'X':
+                    self._config["x_mm_per_step"] = value
+                elif id == 'Y':
+                    self._config["y_mm_per_step"] = value
+                elif id == 'Z':
+                    self._config["z_mm_per_step"] = value
+                elif id == 'E':
+                    self._config["e_mm_per_step"] = value
+                elif id == 'T':
+                    _ = value.split('/')
+                    if len(_) == 5:
+                        self._config["s_machine_type"] = _[0]
+                        self._config["s_x_max"] = _[1]
+                        self._config["s_y_max"] = _[2]
+                        self._config["s_z_max"] = _[3]
+                elif id == 'U':
+                    self._file_encode = value.replace("'", '')
+
+    def __parse_firmware(self, msg, res):
+        if res == QidiResult.SUCCES:
+            if 'ok ' in msg:
+                msg = msg.rstrip()
+                msg = msg.split('ok ')
+                self._firmware_ver = msg[1]
+
     def __compress_gcode(self):
         exePath = None
         if Platform.isWindows():
             exePath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'VC_compress_gcode.exe')
         elif Platform.isOSX():
             exePath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'VC_compress_gcode_MAC')
-        else:
-            self.__log("w", "Could not find gcode compression tool")
 
         if exePath is not None and os.path.exists(exePath):
             cmd = '"' + exePath + '"' + ' "' + self._localTempGcode + '" ' + self._config["x_mm_per_step"] + ' ' + self._config["y_mm_per_step"] + ' ' + self._config["z_mm_per_step"] + ' ' + \
@@ -208,10 +508,40 @@ class QidiConnectionManager(QObject):
                 return True
             else:
                 return False
+        else:
+            return self.__compress_gcode_native()
+
+    def __create_compressor(self):
+        try:
+            steps = [float(self._config[key]) for key in ('x_mm_per_step', 'y_mm_per_step', 'z_mm_per_step', 'e_mm_per_step')]
+            if 0.0 in steps:
+                self.__log("w", "Could not compress gcode, missing printer config")
+                return None
+            return QidiGcodeCompressor(*steps, self._config["s_x_max"], self._config["s_y_max"], self._config["s_z_max"],
+                                       self._config["s_machine_type"])
+        except ValueError as e:
+            self.__log("w", "Invalid printer config: {}", str(e))
+            return None
+
+    def __compress_gcode_native(self):
+        compressor = self.__create_compressor()
+        if compressor is None:
+            return False
+
+        self.__log("d", "Compressing gcode with built-in encoder")
+        start = Timer()
+        try:
+            if not compressor.compress(self._localTempGcode, self._localTempGcode + '.tz', self.__upload_index.track):
+                return False
+        except Exception as e:
+            self.__log("w", str(e))
+            return False
+        self.__log("d", "Compressed gcode in {:.2f}s", Timer() - start)
+        return os.path.exists(self._localTempGcode + '.tz')
 
     def __send_start_write(self, filename):
         self.__log("i", 'Creating file {}', filename)
-        msg, res = self.request('M28 ' + filename, 2000, 3)
+        msg, res = self.request('M28 ' + filename, retries=3, min_timeout_ms=1000)
         if res == QidiResult.SUCCES:
             if 'Error' in msg:
                 self.__log("e", 'cmd:' + msg)
@@ -222,7 +552,7 @@ class QidiConnectionManager(QObject):
 
     def __send_end_write(self, filename):
         self.__log("i", 'Closing file')
-        msg, res = self.request('M29 ' + filename, 2000, 3)
+        msg, res = self.request('M29 ' + filename, retries=3, min_timeout_ms=1000)
         if res == QidiResult.SUCCES:
             if 'Error' in msg:
                 self.__log("e", 'cmd:' + msg)
@@ -231,25 +561,135 @@ class QidiConnectionManager(QObject):
                 return QidiResult.SUCCES
         return res
 
-    def __send_file_block(self, buff, seek):
-        check_sum = 0
-        buff += b"000000"
-        dataArray = bytearray(buff)
-        seekArray = struct.pack('>I', seek)
-        datSize = len(dataArray) - 6
-        dataArray[datSize] = seekArray[3]
-        dataArray[datSize + 1] = seekArray[2]
-        dataArray[datSize + 2] = seekArray[1]
-        dataArray[datSize + 3] = seekArray[0]
-        for i in range(0, datSize + 4, 1):
-            check_sum ^= dataArray[i]
-        dataArray[datSize + 4] = check_sum
-        dataArray[datSize + 5] = 131
-        datSize = len(dataArray) - 6
-        if datSize <= 0:
-            raise Exception('error computing checksum!')
+    @staticmethod
+    def _xor_checksum(data):
+        # fold the block onto itself instead of xor-ing it byte by byte
+        value = int.from_bytes(data, 'little')
+        width = len(data) * 8
+        while width > 8:
+            width = (width + 15) // 16 * 8
+            value = (value >> width) ^ (value & ((1 << width) - 1))
+        return value
+
+    def __read_file_block(self, fp, seek):
+        # read straight into the reusable datagram buffer and frame in place: data, seek, checksum, 0x83
+        if len(self._block_buffer) != self.BUFSIZE + 6:
+            self._block_buffer = bytearray(self.BUFSIZE + 6)
+            self._block_view = memoryview(self._block_buffer)
+        size = fp.readinto(self._block_view[:self.BUFSIZE])
+        if not size:
+            return None
+        self._blocks_sent += 1
+        struct.pack_into('<I', self._block_buffer, size, seek)
+        struct.pack_into('BB', self._block_buffer, size + 4, self._xor_checksum(self._block_view[:size + 4]), 0x83)
+        if size == self.BUFSIZE:
+            return self._block_buffer
+        return self._block_buffer[:size + 6]
+
+    def __send_file_block(self, block):
+        return self.request(block, retries=3)
+
+    def __stream_file(self, fp):
+        if self._send_window > 1:
+            return self.__send_file_windowed(fp)
+        return self.__send_file(fp)
+
+    def __with_side_channel(self, upload, *args):
+        # other threads' status polls and commands wait for the upload's block stream and go out in between
+        with self.__side_lock:
+            self.__side_open = True
+        try:
+            return upload(*args)
+        finally:
+            with self.__side_lock:
+                self.__side_open = False
+            try:
+                deadline = Timer() + self.rtt.rto
+                while self.__side_active and Timer() < deadline:
+                    self.__recieve((deadline - Timer()) * 1000)
+                for side in list(self.__side_active):
+                    self.__advance_side(side, ('', QidiResult.TIMEOUT))
+                while self.__side_polls:
+                    side = self.__side_polls.popleft()
+                    side.cycle.close()
+                    side.done.set()
+                if self._connected:
+                    self.__run_side_commands()  # queued before the upload ended
+            finally:
+                # nothing that waits on this upload is left hanging
+                with self.__side_lock:
+                    commands, self.__side_commands = self.__side_commands, deque()
+                for side in commands:
+                    side.result = QidiResult.ABORTED
+                    side.done.set()
+                for side in self.__side_active + list(self.__side_polls):
+                    side.done.set()
+                self.__side_active = []
+                self.__side_polls.clear()
+
+    def __submit_side(self, side):
+        # False when no upload takes side requests
+        with self.__side_lock:
+            if not self.__side_open:
+                return False
+            (self.__side_commands if side.cycle is None else self.__side_polls).append(side)
+            return True
+
+    def __service_side(self):
+        # start queued status polls, resend or give up the ones whose reply is overdue
+        while self.__side_polls:
+            side = self.__side_polls.popleft()
+            self.__side_active.append(side)
+            self.__advance_side(side, None)
+        now = Timer()
+        for side in list(self.__side_active):
+            command, timeout_ms, retries = side.request
+            if now - side.sent < (self.rtt.rto if timeout_ms is None else timeout_ms / 1000.0):
+                continue
+            if side.tries < retries:
+                self.__send_side(side)
+            else:
+                self.__advance_side(side, ('', QidiResult.TIMEOUT))
+
+    def __send_side(self, side):
+        side.tries += 1
+        side.sent = Timer()
+        self.__send(side.request[0])
+
+    def __advance_side(self, side, reply):
+        try:
+            side.request = side.cycle.send(reply)
+        except StopIteration as e:
+            side.result = e.value
+        except Exception:
+            Logger.logException("w", "Polling {} failed", self._ip.toString())
+        else:
+            side.tries = 0
+            self.__send_side(side)
             return
-        return self.request(dataArray, 2000, 3)
+        self.__side_active.remove(side)
+        side.done.set()
+
+    def __route_side(self, msg):
+        # hand a status reply to the side request that waits for its type
+        for side in self.__side_active:
+            reply_type = self.SIDE_REPLIES.get(side.request[0])
+            if reply_type is not None and reply_type.search(msg):
+                self.__advance_side(side, self.__reply(msg, QidiResult.SUCCES))
+                return True
+        return False
+
+    def __run_side_commands(self):
+        # commands are answered with a plain "ok" like the blocks, they only go out with no block in flight
+        while True:
+            with self.__side_lock:  # a caller that gave up waiting takes its commands back
+                if not self.__side_commands:
+                    return
+                side = self.__side_commands.popleft()
+            try:
+                side.result = self.__send_commands(side.commands)
+            finally:
+                side.done.set()
 
     def __send_file(self, fp):
         self.__log("i", 'begin sending file')
@@ -257,24 +697,28 @@ class QidiConnectionManager(QObject):
 
         while True:
             try:
-                if self._abort:
+                if self._abort or self.__stop_stream:
                     return QidiResult.ABORTED
+                self.__service_side()
+                self.__run_side_commands()
 
-                seek = fp.tell()
-                data = fp.read(self.BUFSIZE)
+                seek = self.__acked = fp.tell()
+                block = self.__read_file_block(fp, seek)
                 if int(100 * seek / self.__sendFileSize) > int(100 * lastProgress):
                     lastProgress = seek / self.__sendFileSize
                     progress = int(100 * lastProgress)
-                    self.progressChanged.emit(progress)
+                    if self.__report_progress:
+                        self.progressChanged.emit(progress)
+                    self.__save_checkpoint()
                     sys.stdout.write('*')
                     sys.stdout.flush()
-                if not data:
+                if not block:
                     sys.stdout.write('\r\n')
                     self.__log("d", 'reach file end')
                     return QidiResult.SUCCES
 
                 #self.__log("d","sending file block: {}", seek)
-                msg, res = self.__send_file_block(data, seek)
+                msg, res = self.__send_file_block(block)
 
                 if res == QidiResult.SUCCES:
                     if 'ok' in msg:
@@ -286,6 +730,7 @@ class QidiConnectionManager(QObject):
                             if value:
                                 resend_offset = int(value[0].replace('resend ', ''))
                                 fp.seek(resend_offset, 0)
+                                self._resends += 1
 
                             else:
                                 self.__log("d", 'bad offset:' + msg)
@@ -294,6 +739,8 @@ class QidiConnectionManager(QObject):
                             return QidiResult.WRITE_ERROR
                         else:
                             return QidiResult.WRITE_ERROR
+                elif res == QidiResult.DISCONNECTED:
+                    return res
                 else:
                     self.__log("e", 'send file block timeout')
                     continue
@@ -301,137 +748,683 @@ class QidiConnectionManager(QObject):
                 self.__log("w", str(e))
                 return QidiResult.WRITE_ERROR
 
+    def __send_file_windowed(self, fp):
+        self.__log("i", 'begin sending file, window: {}', self._send_window)
+        window = self._send_window
+        in_flight = OrderedDict()  # seek -> block length, oldest first
+        next_seek = sent_end = fp.tell()
+        sent_at = {}  # seek -> send time of blocks sent for the first time, for RTT samples
+        rewind_seek = None
+        clean_acks = 0
+        timeouts = 0
+        lastProgress = 0
+        eof = False
+
+        while True:
+            try:
+                if self._abort or self.__stop_stream:
+                    return QidiResult.ABORTED
+                if not self._connected:
+                    return QidiResult.DISCONNECTED
+                self.__service_side()
+
+                while not eof and len(in_flight) < window and not self.__side_commands:
+                    fp.seek(next_seek, 0)
+                    block = self.__read_file_block(fp, next_seek)
+                    if not block:
+                        eof = True
+                        break
+                    self.__send(block)
+                    if next_seek >= sent_end:
+                        sent_at[next_seek] = Timer()
+                    in_flight[next_seek] = len(block) - 6
+                    next_seek += len(block) - 6
+                    sent_end = max(sent_end, next_seek)
+
+                acked = self.__acked = next(iter(in_flight)) if in_flight else next_seek
+                if int(100 * acked / self.__sendFileSize) > int(100 * lastProgress):
+                    lastProgress = acked / self.__sendFileSize
+                    if self.__report_progress:
+                        self.progressChanged.emit(int(100 * lastProgress))
+                    self.__save_checkpoint()
+                    sys.stdout.write('*')
+                    sys.stdout.flush()
+                if not in_flight and self.__side_commands:
+                    self.__run_side_commands()
+                    continue
+                if not in_flight:
+                    sys.stdout.write('\r\n')
+                    self.__log("d", 'reach file end')
+                    return QidiResult.SUCCES
+
+                msg, res = self.__recieve(self.rtt.rto * 1000)
+                if res == QidiResult.DISCONNECTED:
+                    return res
+                if res != QidiResult.SUCCES:
+                    timeouts += 1
+                    if timeouts > 3:
+                        self.__log("e", 'send file block timeout')
+                        return QidiResult.TIMEOUT
+                    self.rtt.backoff()
+                    self.__log("d", 'send file block timeout, {}', self.rtt)
+                    self._resends += 1
+                    # nothing came back, go back to the oldest unacknowledged block
+                    next_seek = next(iter(in_flight))
+                    in_flight.clear()
+                    sent_at.clear()
+                    eof = False
+                    window = max(1, window // 2)
+                    clean_acks = 0
+                    continue
+                timeouts = 0
+
+                for reply in re.findall('ok(?: \\d+)?|resend \\d+|Error', msg):
+                    if reply.startswith('ok'):
+                        if not in_flight:
+                            continue
+                        value = re.findall('\\d+', reply)
+                        seek = int(value[0]) if value else None
+                        if seek not in in_flight:
+                            seek = next(iter(in_flight))  # plain "ok" acks the oldest block
+                        in_flight.pop(seek)
+                        if seek in sent_at:
+                            self.rtt.sample(Timer() - sent_at.pop(seek))
+                        rewind_seek = None
+                        clean_acks += 1
+                        if clean_acks >= window and window < self._send_window:
+                            window += 1
+                            clean_acks = 0
+                    elif reply.startswith('resend'):
+                        resend_offset = int(reply.replace('resend ', ''))
+                        if resend_offset == rewind_seek:
+                            continue  # blocks that were already in flight when we rewound
+                        self.__log("w", "got reply: " + reply)
+                        # the printer has everything before the offset, go back and resend from there
+                        in_flight.clear()
+                        sent_at.clear()
+                        next_seek = rewind_seek = resend_offset
+                        self._resends += 1
+                        eof = False
+                        if window > 1:
+                            window //= 2
+                            self.__log("d", 'send window reduced to {}', window)
+                        clean_acks = 0
+                    else:
+                        self.__log("w", "got reply: " + msg)
+                        return QidiResult.WRITE_ERROR
+            except Exception as e:
+                self.__log("w", str(e))
+                return QidiResult.WRITE_ERROR
+
+    def calibrateBlockSize(self, sizes=BLOCK_SIZES, sample_size=64 * 1024):
+        with self._mutex:
+            return self.__calibrate_block_size(sizes, sample_size)
+
+    def __calibrate_block_size(self, sizes, sample_size):
+        # upload a scratch file with every block size and keep the one with the best goodput
+        filename = 'blocksize_test.gcode'
+        line = b';block size calibration\n'
+        payload = (line * (sample_size // len(line) + 1))[:sample_size]
+        default_size = self.BUFSIZE
+        best_size = None
+        best_rate = 0
+        self.__report_progress = False  # no upload progress for the scratch file
+        try:
+            for size in sorted(sizes):
+                if self._abort or not self._connected:
+                    break
+                self.BUFSIZE = size
+                self.__sendFileSize = len(payload)
+                self._blocks_sent = self._resends = 0
+                if self.__send_start_write(filename) != QidiResult.SUCCES:
+                    break
+                start = Timer()
+                # the windowed sender also in stop-and-wait mode, it is the one that gives up on lost blocks
+                res = self.__send_file_windowed(io.BytesIO(payload))
+                elapsed = Timer() - start
+                if self.__send_end_write(filename) != QidiResult.SUCCES and res == QidiResult.SUCCES:
+                    res = QidiResult.WRITE_ERROR
+                self.request('M30 ' + filename, retries=2, min_timeout_ms=1000)
+                if res != QidiResult.SUCCES:
+                    self.__log("i", 'block size {}: {}', size, res)
+                    break  # larger blocks will not get through either
+                rate = len(payload) / elapsed
+                resend_rate = self._resends / max(1, self._blocks_sent)
+                self.__log("i", 'block size {}: {:.1f} kB/s, {:.1%} resent', size, rate / 1000, resend_rate)
+                if resend_rate <= 0.05 and rate > best_rate:
+                    best_size = size
+                    best_rate = rate
+        except Exception as e:
+            self.__log("w", str(e))
+        finally:
+            self.__report_progress = True
+            self.BUFSIZE = best_size if best_size else default_size
+        return best_size
+
     def sendfile(self, filename):
         with self._mutex:
-            ret = self.__sendfile(filename)
+            ret = self.__with_side_channel(self.__sendfile, filename)
+            return ret
+
+    def prepareUpload(self):
+        # compresses the temp gcode for this printer, other printers with the same config can send it as is
+        with self._mutex:
+            if not self._connected:
+                if not self.__connect():
+                    return None
+            return self.__prepare_upload(self._file_hash(self._localTempGcode))
+
+    def sendPrepared(self, filename, upload):
+        with self._mutex:
+            ret = self.__with_side_channel(self.__sendfile, filename, upload)
             return ret
 
-    def __sendfile(self, filename):
+    def __prepare_upload(self, gcode_hash):
+        if os.path.exists(self._localTempGcode + '.tz'):
+            os.remove(self._localTempGcode + '.tz')
+
+        index = QidiLayerIndex()
+        self.__upload_index = index
+        if self.__compress_gcode():
+            return QidiPreparedUpload(gcode_hash, self._localTempGcode + '.tz', '.gcode.tz', index, dict(self._config))
+        with open(self._localTempGcode, 'rb') as fp:
+            for _ in index.track(fp):
+                pass
+        return QidiPreparedUpload(gcode_hash, self._localTempGcode, '.gcode', index, dict(self._config))
+
+    def __sendfile(self, filename, upload=None):
         self._abort = False
         self._filename = None
         if not self._connected:
             if not self.__connect():
                 return QidiResult.DISCONNECTED
 
-        if os.path.exists(self._localTempGcode + '.tz'):
-            os.remove(self._localTempGcode + '.tz')
+        gcode_hash = upload.gcode_hash if upload is not None else self._file_hash(self._localTempGcode)
+        cached = self.__find_cached(gcode_hash)
+        if cached is not None:
+            self.__log("i", 'Printer already has this job as {}, skipping upload', cached)
+            self._filename = cached
+            return QidiResult.SUCCES
 
-        if self.__compress_gcode():
-            filename += '.gcode.tz'
-            send_file_path = self._localTempGcode + '.tz'
+        if upload is None:
+            upload = self.__prepare_upload(gcode_hash)
         else:
-            filename += '.gcode'
-            send_file_path = self._localTempGcode
+            self.__upload_index = copy.copy(upload.index)  # filename and size are set per printer
+        filename += upload.suffix
+        send_file_path = upload.path
 
         self.__log("d", 'file path: ' + send_file_path)
 
         try:
-            self.__sendFileSize = os.path.getsize(send_file_path)
+            self.__sendFileSize = upload.size
             self.__log("d", 'file size: {}', self.__sendFileSize)
             if self.__sendFileSize == 0:
                 self.__log("e", 'file empty')
                 return QidiResult.FILE_EMPTY
 
+            self.__transfer = {'printer': self._ip.toString(), 'filename': filename,
+                               'hash': upload.file_hash, 'size': self.__sendFileSize}
+            offset = self.__checkpoint_offset(self.__transfer)
             with open(send_file_path, 'rb', buffering=1) as fp:
-                if not self.__send_start_write(filename):
-                    return QidiResult.WRITE_ERROR
-
-                res = self.__send_file(fp)
+                for attempt in range(self.RESUME_ATTEMPTS + 1):
+                    if attempt:
+                        # the link dropped, wait for the printer and continue after the last acknowledged block,
+                        # start over if the printer refused the resumed upload right away
+                        offset = 0 if res is QidiResult.WRITE_ERROR and self.__acked == offset else self.__acked
+                        self.__save_checkpoint()
+                        if not self.__reconnect():
+                            return QidiResult.DISCONNECTED
+                    self.__acked = offset
+                    fp.seek(offset, 0)
+                    if offset:
+                        self.__log("i", 'Resuming {} at {} of {} bytes', filename, offset, self.__sendFileSize)
+                    else:
+                        res = self.__send_start_write(filename)
+                        if res == QidiResult.WRITE_ERROR:
+                            return res  # the printer refused to create the file
+                        if res != QidiResult.SUCCES:
+                            continue  # the link dropped before the file was opened
+
+                    res = self.__stream_file(fp)
+                    if res is QidiResult.SUCCES or res is QidiResult.ABORTED:
+                        break
                 if res is not QidiResult.SUCCES:
+                    self.__save_checkpoint()
                     return res
 
-                if not self.__send_end_write(filename):
-                    return QidiResult.WRITE_ERROR
+                res = self.__send_end_write(filename)
+                if res != QidiResult.SUCCES:
+                    return res
+                self.__clear_checkpoint()
+                self._upload_cache.add(gcode_hash, self._ip.toString(), filename, self.__sendFileSize)
+                self.__save_layer_index(filename, self.__sendFileSize)
 
         except Exception as e:
             self.__log("w", str(e))
             return QidiResult.WRITE_ERROR
+        finally:
+            self.__transfer = None
 
         self._filename = filename
         return QidiResult.SUCCES
 
+    def __find_cached(self, digest):
+        # remote filename of an earlier upload of the same g-code that is still on the printer
+        printer = self._ip.toString()
+        entry = self._upload_cache.lookup(digest, printer)
+        if entry is None:
+            return None
+        files = self.__list_files()
+        if files is None:
+            return None
+        name = entry['filename'].lower()
+        if name in files and files[name] in (None, entry['size']):
+            return entry['filename']
+        self._upload_cache.remove(digest, printer)
+        return None
+
+    def __list_files(self):
+        # name -> size (None if not reported) of the files on the printer storage, None if the listing failed
+        msg, res = self.request('M20', retries=2, min_timeout_ms=1000)
+        if res != QidiResult.SUCCES or 'Begin file list' not in msg:
+            return None
+        while 'End file list' not in msg:
+            more, res = self.__recieve(max(self.rtt.rto * 1000, 1000))
+            if res != QidiResult.SUCCES:
+                return None
+            msg += more
+        files = {}
+        for line in msg.split('Begin file list', 1)[1].split('End file list', 1)[0].splitlines():
+            match = re.match('(.+?)(?: (\\d+))?$', line.strip())
+            if match:
+                files[match.group(1).lower()] = int(match.group(2)) if match.group(2) else None
+        return files
+
+    def __reconnect(self):
+        deadline = Timer() + self.RECONNECT_TIMEOUT
+        while not self._abort and Timer() < deadline:
+            if not self._connected:
+                if self.__connect():
+                    return True
+                sleep(1)
+            elif self.request('M4001', 1000)[1] == QidiResult.SUCCES:
+                return True
+        return False
+
+    @staticmethod
+    def _file_hash(path):
+        digest = hashlib.sha1()
+        with open(path, 'rb') as fp:
+            for chunk in iter(lambda: fp.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def __checkpoint_offset(self, transfer):
+        # where an earlier, interrupted upload of the same file to the same printer stopped
+        try:
+            with open(self._checkpoint_file, 'r') as fp:
+                checkpoint = json.load(fp)
+            if all(checkpoint.get(key) == value for key, value in transfer.items()):
+                return min(int(checkpoint['offset']), int(checkpoint['size']))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return 0
+
+    def __save_checkpoint(self):
+        if self.__transfer is None:
+            return
+        checkpoint = dict(self.__transfer, offset=self.__acked)
+        try:
+            with open(self._checkpoint_file, 'w') as fp:
+                json.dump(checkpoint, fp)
+        except OSError as e:
+            self.__log("w", str(e))
+
+    def __clear_checkpoint(self):
+        if os.path.exists(self._checkpoint_file):
+            os.remove(self._checkpoint_file)
+
+    def sendPipelined(self, filename, gcode):
+        with self._mutex:
+            ret = self.__with_side_channel(self.__send_pipelined, filename, gcode)
+            return ret
+
+    def __send_pipelined(self, filename, gcode):
+        # compress and upload the g-code while it is still being generated
+        self._abort = False
+        self._filename = None
+        if not self._connected:
+            if not self.__connect():
+                return QidiResult.DISCONNECTED
+
+        compressor = self.__create_compressor()
+        resume = {'printer': self._ip.toString(), 'filename': filename + '.gcode.tz'}
+        if compressor is None or self.__checkpoint_offset(resume) or \
+                self._upload_cache.holds(resume['printer'], resume['filename']):
+            # an interrupted upload of this job is continued from the finished file, and M28 would truncate
+            # a cached copy stored under this name before its hash is known
+            if not gcode.wait():
+                return QidiResult.ABORTED
+            return self.__sendfile(filename)
+
+        remote = filename + '.gcode.tz'
+        keep = 2 * self._send_window * self.BUFSIZE
+        blocks = QidiBlockPipe(keep + 512 * 1024, keep)
+        self.__sendFileSize = 1
+        self.__stream_final = None  # True when done, False when the print has to be re-centered
+        self.__stream_hash = hashlib.sha1()
+        self.__acked = 0
+        res = QidiResult.WRITE_ERROR
+        self.__cache_candidate = self.__stop_stream = False
+        worker = Thread(target=self.__compress_stream, args=(compressor, gcode, blocks))
+        worker.start()
+        watcher = Thread(target=self.__watch_cache, args=(gcode,))
+        watcher.start()
+        opened = False
+        try:
+            res = self.__send_start_write(remote)
+            if res == QidiResult.SUCCES:
+                opened = True
+                res = self.__stream_file(blocks)
+        finally:
+            if not opened or res is QidiResult.ABORTED or self._abort:
+                blocks.abort()
+            else:
+                blocks.drain()  # finish compressing, the hash is needed for the checkpoint
+            worker.join()
+            watcher.join()
+
+        self.__stop_stream = False
+        if not opened:
+            if res != QidiResult.WRITE_ERROR:
+                self.__drop_file(remote)  # the printer may have created it without its reply getting through
+            return QidiResult.WRITE_ERROR
+
+        if self.__cache_candidate and res is not QidiResult.SUCCES and not self._abort:
+            # the same gcode was uploaded before, use that copy if the printer still has it
+            self.__drop_file(remote)
+            return self.__sendfile(filename)
+
+        if self.__stream_final is False and not self._abort and self._connected:
+            # the print has to be moved to the bed center, drop the upload and send it the usual way
+            self.__log("i", 'gcode has to be re-centered, sending it again')
+            self.__drop_file(remote)
+            return self.__sendfile(filename)
+        if res is not QidiResult.SUCCES:
+            if self.__stream_final and not self._abort:
+                # the link dropped, continue from the checkpoint like a regular upload
+                self.__transfer = dict(resume, hash=self.__stream_hash.hexdigest(), size=blocks.produced)
+                self.__save_checkpoint()
+                self.__transfer = None
+                return self.__sendfile(filename)
+            # cannot be resumed, do not leave a partial file on the printer
+            self.__drop_file(remote)
+            return res
+        if self.__send_end_write(remote) != QidiResult.SUCCES:
+            self.request('M30 ' + remote, retries=2, min_timeout_ms=1000)
+            return QidiResult.WRITE_ERROR
+
+        self._filename = remote
+        if self.__gcode_hash is not None:
+            self._upload_cache.add(self.__gcode_hash, self._ip.toString(), self._filename, blocks.produced)
+        self.__save_layer_index(self._filename, blocks.produced)
+        return QidiResult.SUCCES
+
+    def __drop_file(self, filename):
+        # close and delete an unfinished upload on the printer storage
+        self.__send_end_write(filename)
+        self.request('M30 ' + filename, retries=2, min_timeout_ms=1000)
+
+    def __watch_cache(self, gcode):
+        # stop the upload as soon as the finished gcode turns out to be known
+        self.__gcode_hash = self._file_hash(self._localTempGcode) if gcode.wait() else None
+        if self.__gcode_hash is not None and self._upload_cache.lookup(self.__gcode_hash, self._ip.toString()):
+            self.__cache_candidate = True
+            self.__stop_stream = True
+
+    def __compress_stream(self, compressor, gcode, blocks):
+        start = Timer()
+
+        def write(data):
+            blocks.write(data)
+            self.__stream_hash.update(data)
+            # the final size is unknown until the gcode is complete, estimate it from the ratio so far
+            estimate = blocks.produced * os.path.getsize(self._localTempGcode) / max(1, gcode.consumed)
+            self.__sendFileSize = max(blocks.produced, int(estimate))
+
+        self.__upload_index = QidiLayerIndex()
+        try:
+            lines = self.__upload_index.track(gcode.lines(), lambda: blocks.produced)
+            self.__stream_final = compressor.compressStream(lines, write)
+            self.__sendFileSize = blocks.produced
+            blocks.close(self.__stream_final)
+            self.__log("d", "Compressed gcode in {:.2f}s", Timer() - start)
+        except Exception as e:
+            self.__log("w", str(e))
+            blocks.close(False)
+
+    def __save_layer_index(self, filename, size):
+        index = self.__upload_index
+        if not len(index):
+            return  # compressed by the bundled executable, positions in the file are unknown
+        index.filename = filename
+        index.size = size
+        self._layer_index = index
+        try:
+            index.save(self._layer_index_file)
+        except OSError as e:
+            self.__log("w", str(e))
+
+    def layerIndex(self, snapshot=None):
+        # slicer timeline of the file being printed, if it was the last one uploaded from here
+        snapshot = snapshot or self.snapshot
+        index = self._layer_index
+        if index is not None and index.size == snapshot.print_total and snapshot.filename.endswith(index.filename):
+            return index
+        return None
+
+    def __commanded(self):
+        # poll fast for a while to show what the command does
+        self.__last_command = Timer()
+        if self._fleet is not None:
+            self._fleet.wake(self)
+        else:
+            self.__poll_wake.set()
+
     def print(self):
-        msg, res = self.request('M6030 ":' + self._filename + '" I1', 2000, 3)
+        self.__commanded()
+        msg, res = self.request('M6030 ":' + self._filename + '" I1', retries=3, min_timeout_ms=1000)
         if res == QidiResult.SUCCES and 'Error' in msg:
             return QidiResult.FAIL
         return res
 
     def update(self):
-        result = self._mutex.acquire(blocking=True, timeout=0.5)
-        if result:
-            ret = self.__update()
-            if ret == QidiResult.SUCCES:
-                self._update_fail_cnt = 0
-                self.updateDone.emit()
+        deadline = Timer() + 0.5
+        while True:
+            side = self._pollDuringUpload()
+            if side is not None:
+                side.done.wait()
+                return side.result
+            if self._mutex.acquire(blocking=True, timeout=0.05):
+                try:
+                    return self.__poll_status()
+                finally:
+                    self._mutex.release()
+            if Timer() >= deadline:
+                self.__log("d", 'timeout: lock not available')
+                return QidiResult.TIMEOUT
+
+    def _pollDuringUpload(self):
+        # hands a status poll to the running upload, None when there is none
+        side = self.__side_poll
+        if side is not None and not side.done.is_set():
+            return side  # the last one is still on its way
+        side = _QidiSideRequest(cycle=self.__side_poll_cycle())
+        if not self.__submit_side(side):
+            return None
+        self.__side_poll = side
+        return side
+
+    def __side_poll_cycle(self):
+        # a status poll between upload blocks, a lost reply is not held against the connection
+        res = yield from self.__status_cycle()
+        if res == QidiResult.SUCCES:
+            self.__count_poll(res)
+        return res
+
+    def startPolling(self, interval=POLL_INTERVAL):
+        # one worker per printer connects and polls the status, its cycles never overlap
+        self._poll_interval = interval
+        if self._fleet is not None:
+            self._fleet.add(self)
+            return
+        if self.__poll_stop is not None:
+            return
+        self.__poll_stop = Event()
+        Thread(target=self.__poll, args=(self.__poll_stop,), daemon=True, name="Qidi Poll " + self._ip.toString()).start()
+
+    def stopPolling(self):
+        if self._fleet is not None:
+            self._fleet.remove(self)
+        elif self.__poll_stop is not None:
+            self.__poll_stop.set()
+            self.__poll_stop = None
+            self.__poll_wake.set()
+
+    def _nextPollDelay(self):
+        # seconds from the last poll to the next one, connection attempts back off exponentially
+        if not self._connected:
+            return self._poll_interval * min(2 ** self.__connect_failures, self.RECONNECT_BACKOFF)
+        return self._poll_interval * self.__poll_rate()
+
+    def __poll_rate(self):
+        snapshot = self.snapshot
+        status = snapshot.status
+        if self.__changed == self.ALL_FIELDS:
+            # just connected and nothing reported yet, the first status comes right away unless it failed
+            return 0 if self._update_fail_cnt == 0 else self.POLL_FAST
+        if self.__last_command is not None and Timer() - self.__last_command < self.FAST_AFTER_COMMAND:
+            return self.POLL_FAST
+        for now, target in ((status.bed_nowtemp, status.bed_targettemp), (status.e1_nowtemp, status.e1_targettemp),
+                            (status.e2_nowtemp, status.e2_targettemp)):
+            if target and now is not None and abs(target - now) > self.HEATING_MARGIN:
+                return self.POLL_FAST
+        if not snapshot.printing:
+            return self.POLL_IDLE
+        index = self.layerIndex(snapshot)
+        if index is not None:
+            layer, _ = index.lookup(snapshot.print_now)
+            if layer is None or layer <= 0:
+                return self.POLL_FAST
+        elif status.z_pos is not None and status.z_pos <= self.FIRST_LAYER_Z:
+            return self.POLL_FAST
+        return self.POLL_PRINTING
+
+    def __poll(self, stop):
+        last = None
+        while not stop.is_set():
+            if last is not None:
+                delay = last + self._nextPollDelay() - Timer()
+                if delay > 0:
+                    if self.__poll_wake.wait(delay):
+                        self.__poll_wake.clear()  # a command or stopPolling(), look again
+                        continue
+            last = Timer()
+            # a running upload takes the poll along, other holders of the printer drop the tick
+            if self._mutex.acquire(blocking=False):
+                try:
+                    if not self._connected:
+                        self.__connect()
+                    else:
+                        self.__poll_status()
+                except Exception:
+                    Logger.logException("w", "Polling {} failed", self._ip.toString())
+                finally:
+                    self._mutex.release()
             else:
-                self._update_fail_cnt += 1
-                if self._update_fail_cnt > 2:
-                    self._connected = False
-                    self.conectionStateChanged.emit(self._connected)
-            self._mutex.release()
-            return ret
+                self._pollDuringUpload()
+
+    def __poll_status(self):
+        return self.__count_poll(self.__update())
+
+    def _pollCycle(self):
+        # connect or status poll driven by the fleet loop, which holds the lock meanwhile. Yields the
+        # requests as (command, timeout_ms, retries) and gets their (reply, result) back.
+        if not self._connected:
+            msg, res = yield 'M4001', None, 1
+            if res is not QidiResult.SUCCES:
+                self.__log("w", '{} Connection timeout ', self._ip.toString())
+                self.__unanswered_connect = Timer()
+                self.__connect_failures += 1
+                return
+            self.__parse_config(msg)
+            self._connected = True
+            self.__connect_failures = 0
+            self._update_fail_cnt = 0
+            self.__changed = self.ALL_FIELDS  # the first poll reports every field to the fresh printer model
+            self.__parse_firmware(*(yield 'M4002 ', None, 2))
+            self.conectionStateChanged.emit(self._connected)
+            return
+        self.__count_poll((yield from self.__status_cycle()))
+
+    def __count_poll(self, ret):
+        if ret == QidiResult.SUCCES:
+            self._update_fail_cnt = 0
+            self.__record_status()
+            changed, self.__changed = self.__changed, frozenset()
+            if changed:
+                self.updateDone.emit(changed)
         else:
-            self.__log("d", 'timeout: lock not available')
-            return QidiResult.TIMEOUT
+            self._update_fail_cnt += 1
+            if self._update_fail_cnt > 2:
+                self._connected = False
+                self.conectionStateChanged.emit(self._connected)
+        return ret
+
+    def __record_status(self):
+        status = self.snapshot.status
+        values = (getattr(status, field) for field in QidiTelemetry.FIELDS)
+        row = [float('nan') if value is None else value for value in values]
+        self.telemetry.record(time(), row)
 
     def __update(self):
-        msg, res = self.request("M4000", 100, 3)
+        cycle = self.__status_cycle()
+        try:
+            request = next(cycle)
+            while True:
+                request = cycle.send(self.request(*request))
+        except StopIteration as e:
+            return e.value
+
+    def __status_cycle(self):
+        # builds the next snapshot aside and publishes it once complete
+        # a lost reply to an idle printer is not worth more datagrams, the next poll comes soon enough
+        msg, res = yield "M4000", None, 1 if self.__poll_rate() == self.POLL_IDLE else 3
         if res == QidiResult.SUCCES:
-            prev_printing_time = self._printing_time
-            msg = msg.rstrip()
-            msgs = msg.split(' ')
-            for item in msgs:
-                _ = item.split(':')
-                try:
-                    if len(_) == 2:
-                        id = _[0]
-                        value = _[1]
-                        if id == 'B':
-                            _ = value.split('/')
-                            if len(_) == 2:
-                                self._status["bed_nowtemp"] = _[0]
-                                self._status["bed_targettemp"] = _[1]
-                        elif id == 'E1':
-                            _ = value.split('/')
-                            if len(_) == 2:
-                                self._status["e1_nowtemp"] = _[0]
-                                self._status["e1_targettemp"] = _[1]
-                        elif id == 'E2':
-                            _ = value.split('/')
-                            if len(_) == 2:
-                                self._status["e2_nowtemp"] = _[0]
-                                self._status["e2_targettemp"] = _[1]
-                        elif id == 'D':
-                            _ = value.split('/')
-                            if len(_) == 3:
-                                self._print_now = int(_[0])
-                                self._print_total = int(_[1])
-                                self._isIdle = _[2] is '1'
-                        elif id == 'F':
-                            _ = value.split('/')
-                            if len(_) == 2:
-                                self._status["fan"] = _[0]
-                        elif id == 'X':
-                            self._status["x_pos"] = value
-                        elif id == 'Y':
-                            self._status["y_pos"] = value
-                        elif id == 'Z':
-                            self._status["z_pos"] = value
-                        elif id == 'T':
-                            self._printing_time = int(value)
-                except:
-                    self.__log("e", "Could not parse M4000 reply: {}", msg)
-
-            if self._isPrinting == False and self._printing_time > 0:
+            previous = self.snapshot
+            status, errors = QidiStatus.parse(msg, previous.status)
+            if errors:
+                self.__log("e", "Could not parse M4000 reply: {}", msg)
+            changed = status.changes(previous.status)
+            printing = previous.printing
+            filename = previous.filename
+            printing_time = status.printing_time or 0
+
+            if printing == False and printing_time > 0:
                 self._last_times = []
-                self._isPrinting = True
-                msg, res = self.request("M4006", 100, 3)
+                printing = True
+                changed |= {'printing'}
+                msg, res = yield "M4006", None, 3
                 if res == QidiResult.SUCCES:
                     _ = msg.split("'")
-                    if len(_) > 2:
-                        self._printing_filename = _[1]
-            elif self._printing_time == 0:
-                self._isPrinting = False
+                    if len(_) > 2 and _[1] != filename:
+                        filename = _[1]
+                        changed |= {'printing_filename'}
+            elif printing_time == 0 and printing:
+                printing = False
+                changed |= {'printing'}
+            self.snapshot = QidiSnapshot(status, printing, filename)
+            self.__changed |= changed  # kept until a poll succeeds and reports them
 
         return res
 
@@ -450,12 +1443,25 @@ class QidiFinderJob(QObject, Job):
 
     IPListChanged = pyqtSignal()
 
-    def __init__(self):
+    SCAN_DURATION = 5.0  # seconds at most
+    REBROADCAST_TIME = 0.2  # first repeat of the discovery packet, doubled every time
+    QUIET_TIME = 1.0  # after the last sweep probe for its replies, well above a Wi-Fi module's reply time
+    SWEEP_RATE = 500  # unicast probes per second
+    SWEEP_MIN_PREFIX = 22  # 'auto' sweeps larger interface networks only around the own address
+    SWEEP_MAX = 4096  # addresses per scan
+    # SIOCGIFADDR and SIOCGIFNETMASK
+    IOCTLS = {'linux': (0x8915, 0x891b), 'darwin': (0xc0206921, 0xc0206925)}
+
+    def __init__(self, duration=SCAN_DURATION):
         super().__init__()
         self._scan_in_progress = False
         self._udpSocket = QUdpSocket(self)
         # self._udpSocket.bind(64942)
         self.devices = []
+        self.duration = duration
+        self.expected = set()  # addresses of printers that should answer, the scan may end once they did
+        self.sweep = ''  # 'auto' or comma separated CIDR ranges to probe one address at a time
+        self._device_ips = set()
 
     def _generate_broad_addr(self, targetIP, maskstr):
         iptokens = list(map(int, targetIP.split('.')))
@@ -468,37 +1474,83 @@ class QidiFinderJob(QObject, Job):
             broadlist.append(broad)
         return '.'.join(map(str, broadlist))
 
+    def _getInterfaces(self):
+        # (address, netmask) of the IPv4 interfaces, straight from the kernel
+        interfaces = []
+        codes = self.IOCTLS.get('linux' if Platform.isLinux() else 'darwin' if Platform.isOSX() else None)
+        if fcntl is not None and codes is not None:
+            sock = socket(AF_INET, SOCK_DGRAM)
+            try:
+                for _, name in if_nameindex():
+                    request = struct.pack('256s', name.encode()[:15])
+                    try:
+                        address = inet_ntoa(fcntl.ioctl(sock.fileno(), codes[0], request)[20:24])
+                        netmask = inet_ntoa(fcntl.ioctl(sock.fileno(), codes[1], request)[20:24])
+                    except OSError:
+                        continue  # no IPv4 address
+                    interfaces.append((address, netmask))
+            finally:
+                sock.close()
+        if not interfaces:
+            # the address of the default route, connecting a UDP socket sends nothing
+            sock = socket(AF_INET, SOCK_DGRAM)
+            try:
+                sock.connect(('10.255.255.255', 1))
+                interfaces.append((sock.getsockname()[0], '255.255.255.0'))
+            except OSError:
+                pass
+            finally:
+                sock.close()
+        return interfaces
+
     def _getAllBroadcast(self):
-        ipconfig_process = subprocess.Popen('ifconfig' if Platform.isLinux() or Platform.isOSX() else 'ipconfig', stdout=subprocess.PIPE, shell=True)
-        output = ipconfig_process.stdout.read().decode('utf-8', 'ignore')
-        allIPlist = re.findall('\\d{1,3}\\.\\d{1,3}\\.\\d{1,3}\\.\\d{1,3}', output)
-        allIP = ''
-        for j in allIPlist:
-            if j.count('255.255') < 1:
-                allIP += j + '   '
-
-        ipList = gethostbyname_ex(gethostname())
-        if len(ipList) == 3:
-            ipList = ipList[2]
         broadcast = []
-        for i in range(len(allIPlist)):
-            ipaddr = allIPlist[i]
-            if ipaddr in ipList and ipaddr != '127.0.0.1' and i + 1 <= len(allIPlist):
-                if Platform.isLinux() or Platform.isOSX():
-                    broadcast.append(allIPlist[(i + 1)])
-                else:
-                    broadcast.append(self._generate_broad_addr(ipaddr, allIPlist[(i + 1)]))
+        for address, netmask in self._getInterfaces():
+            if address.startswith('127.') or address == '0.0.0.0':
+                continue
+            broad = self._generate_broad_addr(address, netmask)
+            if broad not in broadcast:
+                broadcast.append(broad)
 
         if not broadcast:
             Logger.log("w", "Cann't find valid boradcast,use all IP")
-            broadcast = allIPlist
+            broadcast = ['255.255.255.255']
         return broadcast
 
+    def _getSweepTargets(self):
+        # unicast probes for networks that filter the broadcast
+        own = set()
+        networks = []
+        for address, netmask in self._getInterfaces():
+            own.add(address)
+            if self.sweep.strip().lower() == 'auto' and not address.startswith('127.'):
+                network = ipaddress.IPv4Network('{}/{}'.format(address, netmask), strict=False)
+                if network.prefixlen < self.SWEEP_MIN_PREFIX:
+                    network = ipaddress.IPv4Network('{}/{}'.format(address, self.SWEEP_MIN_PREFIX), strict=False)
+                networks.append(network)
+        if self.sweep.strip().lower() != 'auto':
+            for item in self.sweep.split(','):
+                try:
+                    networks.append(ipaddress.IPv4Network(item.strip(), strict=False))
+                except ValueError as e:
+                    Logger.log("w", "Invalid sweep range {}: {}", item, str(e))
+
+        targets = []
+        seen = set(own)
+        for network in networks:
+            for host in network.hosts() if network.num_addresses > 1 else [network.network_address]:
+                address = str(host)
+                if address in seen:
+                    continue
+                if len(targets) >= self.SWEEP_MAX:
+                    Logger.log("w", "Sweeping only the first {} addresses", self.SWEEP_MAX)
+                    return targets
+                seen.add(address)
+                targets.append(address)
+        return targets
+
     def _isDuplicateIP(self, ip):
-        for device in self.devices:
-            if ip == device.ipaddr:
-                return True
-        return False
+        return ip in self._device_ips
 
     def _readPendingDatagrams(self):
         while self._udpSocket.hasPendingDatagrams():
@@ -513,23 +1565,51 @@ class QidiFinderJob(QObject, Job):
                         device.name = message[message.find('NAME:') + len('NAME:'):].split(' ')[0]
                     Logger.log("d", 'Got reply from: {}', device)
                     self.devices.append(device)
+                    self._device_ips.add(device.ipaddr)
                     self.IPListChanged.emit()
                 else:
                     Logger.log("d", 'Got reply from known device')
 
     def run(self) -> None:
         self.devices = []
+        self._device_ips = set()
         self.IPListChanged.emit()
         self._scan_in_progress = True
 
         broadcasts = self._getAllBroadcast()
         Logger.log("i", "Brodcast networks: {}", broadcasts)
-        end_time = Timer() + 5
-        while Timer() < end_time:
-            Logger.log("d", 'Broadcasting discovery packet')
-            for broadcast in broadcasts:
-                self._udpSocket.writeDatagram('M99999'.encode('utf-8'), QHostAddress(broadcast), 3000)
-            sleep(1)
+        probes = self._getSweepTargets() if self.sweep else []
+        if probes:
+            Logger.log("i", "Sweeping {} addresses", len(probes))
+        # repeat the broadcast with growing pauses in case it got lost, send the sweep probes at SWEEP_RATE.
+        # With known printers the scan stops as soon as everything is sent and all of them answered.
+        # Without, it runs for the whole duration, a slow printer would be missed.
+        start = Timer()
+        end_time = start + max(self.duration, len(probes) / self.SWEEP_RATE + self.QUIET_TIME)
+        next_broadcast = start
+        interval = self.REBROADCAST_TIME
+        probed = 0
+        while True:
+            now = Timer()
+            if now >= end_time:
+                break
+            if self.expected and self.expected <= self._device_ips and probed == len(probes):
+                break
+            if now >= next_broadcast:
+                Logger.log("d", 'Broadcasting discovery packet')
+                for broadcast in broadcasts:
+                    self._udpSocket.writeDatagram('M99999'.encode('utf-8'), QHostAddress(broadcast), 3000)
+                next_broadcast = now + interval
+                interval *= 2
+            if probed < len(probes):
+                due = min(len(probes), int((now - start) * self.SWEEP_RATE) + 1)
+                for address in probes[probed:due]:
+                    self._udpSocket.writeDatagram('M99999'.encode('utf-8'), QHostAddress(address), 3000)
+                probed = due
+            wake = min(next_broadcast, end_time)
+            if probed < len(probes):
+                wake = min(wake, start + probed / self.SWEEP_RATE)
+            _wait_readable(self._udpSocket, wake - Timer())
             self._readPendingDatagrams()
 
         self.IPListChanged.emit()
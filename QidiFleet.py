@@ -0,0 +1,273 @@
+from UM.Logger import Logger
+
+from .QidiConnectionManager import QidiResult
+
+from collections import deque
+from threading import Condition, Lock, Thread
+from timeit import default_timer as Timer
+
+import heapq
+import select
+import socket
+
+
+class QidiFleetEndpoint:
+    # The part of a QUdpSocket a QidiConnectionManager uses, for one printer on the shared fleet socket.
+    # Datagrams the fleet loop does not consume itself wait here for the manager's blocking reads.
+    def __init__(self, fleet, ip_addr):
+        self._fleet = fleet
+        self._ip = ip_addr
+        self._cond = Condition()
+        self._datagrams = deque()
+
+    def writeDatagram(self, data, host, port):
+        return self._fleet._socket.sendto(data, (self._ip, port))
+
+    def hasPendingDatagrams(self):
+        return bool(self._datagrams)
+
+    def pendingDatagramSize(self):
+        return len(self._datagrams[0]) if self._datagrams else -1
+
+    def readDatagram(self, size):
+        with self._cond:
+            data = self._datagrams.popleft() if self._datagrams else b''
+        return data[:size], self._ip, QidiFleet.PORT
+
+    def waitForReadyRead(self, msecs):
+        deadline = Timer() + msecs / 1000.0
+        with self._cond:
+            while not self._datagrams:
+                remaining = deadline - Timer()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def localPort(self):
+        return self._fleet._socket.getsockname()[1]
+
+    def _push(self, data):
+        with self._cond:
+            self._datagrams.append(data)
+            self._cond.notify_all()
+
+    def _clear(self):
+        with self._cond:
+            self._datagrams.clear()
+
+
+class _QidiFleetPrinter:
+    # poll state of one printer in the fleet loop
+    def __init__(self, manager, endpoint):
+        self.manager = manager
+        self.endpoint = endpoint
+        self.cycle = None  # the running _pollCycle() generator
+        self.request = None  # (command, timeout_ms, retries) the cycle waits on
+        self.tries = 0
+        self.sent = 0.0
+        self.due = 0.0
+        self.last = 0.0  # start of the last poll cycle
+        self.token = 0  # invalidates scheduled timers
+
+
+class QidiFleet:
+    # One UDP socket and one thread for any number of printers. Replies are routed by their source
+    # address, status polls and connects of all printers run as small state machines in the loop and
+    # are spread evenly over the poll interval. Uploads and commands still block their own thread,
+    # they read their replies from the printer's endpoint.
+    PORT = 3000
+    __instance = None
+    __instance_lock = Lock()
+
+    @classmethod
+    def getInstance(cls):
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls()
+            return cls.__instance
+
+    def __init__(self):
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(('', 0))
+        self._socket.setblocking(False)
+        self._endpoints = {}
+        self._printers = {}  # ip -> _QidiFleetPrinter, only touched by the loop
+        self._timers = []
+        self._seq = 0
+        self._lock = Lock()
+        self._changes = []
+        Thread(target=self.__run, daemon=True, name="Qidi Fleet").start()
+
+    def endpoint(self, ip_addr):
+        with self._lock:
+            if ip_addr not in self._endpoints:
+                self._endpoints[ip_addr] = QidiFleetEndpoint(self, ip_addr)
+            return self._endpoints[ip_addr]
+
+    def add(self, manager):
+        self.__change(manager, True)
+
+    def remove(self, manager):
+        self.__change(manager, False)
+
+    def wake(self, manager):
+        # poll a printer sooner than planned, its manager changed its mind about the rate
+        self.__change(manager, None)
+
+    def __change(self, manager, polled):
+        with self._lock:
+            self._changes.append((manager, polled))
+        self.__wake()
+
+    def __wake(self):
+        self._socket.sendto(b'', ('127.0.0.1', self._socket.getsockname()[1]))
+
+    def __run(self):
+        while True:
+            try:
+                self.__apply_changes()
+                now = Timer()
+                while self._timers and self._timers[0][0] <= now:
+                    _, _, printer, token = heapq.heappop(self._timers)
+                    if printer.token == token:
+                        self.__on_timer(printer, now)
+                timeout = self._timers[0][0] - Timer() if self._timers else None
+                if select.select([self._socket], [], [], None if timeout is None else max(0.0, timeout))[0]:
+                    self.__read()
+            except Exception:
+                Logger.logException("e", "Qidi fleet loop failed")
+
+    def __read(self):
+        while True:
+            try:
+                data, (host, port) = self._socket.recvfrom(65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:  # e.g. ICMP port unreachable from an earlier send on Windows
+                continue
+            printer = self._printers.get(host)
+            if printer is not None and printer.cycle is not None:
+                self.__on_reply(printer, data)
+                continue
+            endpoint = self._endpoints.get(host)
+            if endpoint is not None:
+                endpoint._push(data)
+
+    def __apply_changes(self):
+        with self._lock:
+            changes, self._changes = self._changes, []
+        if not changes:
+            return
+        now = Timer()
+        moved = False
+        for manager, polled in changes:
+            ip_addr = manager._ip.toString()
+            if polled is None:
+                printer = self._printers.get(ip_addr)
+                if printer is not None and printer.cycle is None:
+                    self.__schedule_poll(printer, max(now, min(printer.due, printer.last + manager._nextPollDelay())))
+                continue
+            moved = True
+            printer = self._printers.pop(ip_addr, None)
+            if printer is not None and printer.cycle is not None:
+                self.__finish(printer)
+            if printer is not None:
+                printer.token += 1
+            if polled:
+                self._printers[ip_addr] = _QidiFleetPrinter(manager, self.endpoint(ip_addr))
+        if not moved:
+            return
+        # spread the polls of all printers evenly over their interval
+        printers = list(self._printers.values())
+        for index, printer in enumerate(printers):
+            if printer.cycle is None:
+                self.__schedule_poll(printer, now + printer.manager._poll_interval * index / len(printers))
+
+    def __schedule_poll(self, printer, when):
+        printer.due = when
+        self.__schedule(printer, when)
+
+    def __schedule(self, printer, when):
+        printer.token += 1
+        self._seq += 1
+        heapq.heappush(self._timers, (when, self._seq, printer, printer.token))
+
+    def __on_timer(self, printer, now):
+        if printer.cycle is None:
+            self.__start(printer, now)
+        else:
+            # no reply in time, resend or give up like QidiConnectionManager.request()
+            command, timeout_ms, retries = printer.request
+            if timeout_ms is None:
+                printer.manager.rtt.backoff()
+            if printer.tries < retries:
+                self.__send(printer)
+            else:
+                self.__advance(printer, ('', QidiResult.TIMEOUT))
+
+    def __start(self, printer, now):
+        manager = printer.manager
+        if not manager._mutex.acquire(blocking=False):
+            # a running upload takes the poll along, for any other holder of the printer the tick is dropped
+            manager._pollDuringUpload()
+            self.__schedule_poll(printer, max(printer.due + manager._poll_interval, now))
+            return
+        printer.endpoint._clear()
+        printer.last = now
+        printer.cycle = manager._pollCycle()
+        try:
+            printer.request = next(printer.cycle)
+        except StopIteration:
+            self.__finish(printer)
+            return
+        except Exception:
+            Logger.logException("w", "Polling {} failed", manager._ip.toString())
+            self.__finish(printer)
+            return
+        printer.tries = 0
+        self.__send(printer)
+
+    def __send(self, printer):
+        command, timeout_ms, retries = printer.request
+        printer.tries += 1
+        printer.sent = Timer()
+        try:
+            printer.endpoint.writeDatagram(command.encode(printer.manager._file_encode, 'ignore'), None, self.PORT)
+        except OSError as e:
+            # unlike QUdpSocket, sendto() raises, e.g. when the network is unreachable. The cycle gets the
+            # failure right away, so it finishes, releases the printer and the next poll is scheduled.
+            Logger.log("w", "Could not send {} to {}: {}", command, printer.manager._ip.toString(), str(e))
+            self.__advance(printer, ('', QidiResult.DISCONNECTED))
+            return
+        if timeout_ms is None:
+            timeout_ms = printer.manager.rtt.rto * 1000
+        self.__schedule(printer, printer.sent + timeout_ms / 1000.0)
+
+    def __on_reply(self, printer, data):
+        if printer.tries == 1:
+            printer.manager._sampleRtt(Timer() - printer.sent)
+        self.__advance(printer, printer.manager._decodeReply(data))
+
+    def __advance(self, printer, reply):
+        try:
+            printer.request = printer.cycle.send(reply)
+        except StopIteration:
+            self.__finish(printer)
+            return
+        except Exception:
+            Logger.logException("w", "Polling {} failed", printer.manager._ip.toString())
+            self.__finish(printer)
+            return
+        printer.tries = 0
+        self.__send(printer)
+
+    def __finish(self, printer):
+        manager = printer.manager
+        printer.cycle.close()
+        printer.cycle = None
+        printer.request = None
+        manager._mutex.release()
+        if self._printers.get(manager._ip.toString()) is printer:
+            # the manager picks the rate from the printer's state, ticks missed by a slow cycle are skipped
+            self.__schedule_poll(printer, max(printer.last + manager._nextPollDelay(), Timer()))
@@ -0,0 +1,541 @@
+from UM.Logger import Logger
+
+import re
+import struct
+import os.path
+
+
+# Native implementation of the .gcode.tz format written by VC_compress_gcode.
+#
+# The output is a sequence of 256 byte blocks, each padded with 0xa3 and
+# closed by an XOR checksum byte. Every G-code line becomes one record:
+#  - full record: 32 bit little endian header (type:2 G/M/T, code:14,
+#    parameter flags:16) followed by the parameters, big endian. Coordinates
+#    of G0/G1/G28/G92 are absolute motor steps, everything else is float.
+#  - compact record: G0/G1 moves without Z change are stored as step deltas
+#    with a one byte header selecting the field widths.
+# The first record of a block is always a full one, so the printer can
+# resync on every block.
+#
+# The encoding is sequential: the width of a record depends on the previous
+# absolute position and on how full the current block is. That is why it is
+# written as a plain loop and not vectorised with NumPy like the thumbnail
+# encoder.
+
+_F32 = struct.Struct('>f')
+_INT_MIN = -0x80000000
+
+_FLOAT_RE = re.compile(rb'[ \t\n\v\f\r]*([+-]?(?:0[xX](?:[0-9a-fA-F]+\.?[0-9a-fA-F]*|\.[0-9a-fA-F]+)(?:[pP][+-]?[0-9]+)?'
+                       rb'|(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?'
+                       rb'|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN](?:\([0-9A-Za-z_]*\))?))')
+_INT_RE = re.compile(rb'[ \t\n\v\f\r]*([+-]?)(0[xX](?=[0-9a-fA-F])[0-9a-fA-F]+|0[0-7]*|[1-9][0-9]*)')
+
+# Cura writes nearly every line as a plain "G0/G1 F X Y Z E", parse those in one go
+_NUMBER = rb'(-?(?:[0-9]+\.?[0-9]*|\.[0-9]+))'
+_SIMPLE_MOVE_RE = re.compile(rb'G[01](?: F' + _NUMBER + rb')?(?: X' + _NUMBER + rb')?(?: Y' + _NUMBER + rb')?'
+                             rb'(?: Z' + _NUMBER + rb')?(?: E' + _NUMBER + rb')?[ \t\r\n]*$')
+
+_STRING_M_CODES = (117, 23, 28, 29, 30, 5000, 5001, 6500)
+
+FLAG_X = 0x1
+FLAG_Y = 0x2
+FLAG_Z = 0x4
+FLAG_E = 0x8
+FLAG_B = 0x10
+FLAG_F = 0x20
+FLAG_S = 0x40
+FLAG_I = 0x80
+FLAG_T = 0x100
+FLAG_P = 0x200
+FLAG_D = 0x400
+FLAG_C = 0x800
+FLAG_R = 0x1000
+FLAG_STR = 0x2000
+
+_FLOAT_PARAMS = {ord('S'): FLAG_S, ord('I'): FLAG_I, ord('P'): FLAG_P, ord('D'): FLAG_D, ord('C'): FLAG_C, ord('R'): FLAG_R}
+
+
+def _f32(value):
+    # round a double to single precision like a C float assignment
+    try:
+        return _F32.unpack(_F32.pack(value))[0]
+    except OverflowError:
+        return float('inf') if value > 0 else float('-inf')
+
+
+def _trunc(value):
+    # float to int conversion with x86 semantics (out of range gives INT_MIN)
+    if value != value or not -2147483648.0 <= value < 2147483648.0:
+        return _INT_MIN
+    return int(value)
+
+
+def _i32(value):
+    return (value + 0x80000000 & 0xffffffff) - 0x80000000
+
+
+def _strtod(line, pos):
+    m = _FLOAT_RE.match(line, pos)
+    if m is None:
+        return 0.0, pos
+    text = m.group(1)
+    body = text.lstrip(b'+-')
+    if body[:2] in (b'0x', b'0X'):
+        value = float.fromhex(text.decode())
+    elif body[:1] in b'nN':
+        value = float('nan')
+    else:
+        value = float(text)
+    return value, m.end()
+
+
+def _strtol(line, pos):
+    m = _INT_RE.match(line, pos)
+    if m is None:
+        return 0, pos
+    digits = m.group(2)
+    if digits[:2] in (b'0x', b'0X'):
+        value = int(digits[2:], 16)
+    elif len(digits) > 1 and digits[0] == 0x30:
+        value = int(digits, 8)
+    else:
+        value = int(digits)
+    if m.group(1) == b'-':
+        value = -value
+    value = max(-0x8000000000000000, min(0x7fffffffffffffff, value))
+    # the result is stored in a 32 bit int
+    value &= 0xffffffff
+    return value - 0x100000000 if value & 0x80000000 else value, m.end()
+
+
+def _be(value, size):
+    return (value & (0xffffffff >> (32 - 8 * size))).to_bytes(size, 'big')
+
+
+class QidiGcodeCompressor:
+    BLOCK_SIZE = 256
+    PAD = 0xa3
+
+    def __init__(self, x_step, y_step, z_step, e_step, x_max, y_max, z_max, machine_type):
+        self._step = [_f32(float(x_step)), _f32(float(y_step)), _f32(float(z_step)), _f32(float(e_step))]
+        self._x_max = _f32(float(x_max))
+        self._y_max = _f32(float(y_max))
+        self._z_max = _f32(float(z_max))
+        self._machine_type = int(float(machine_type))
+
+    def compress(self, in_path, out_path, track=None):
+        # track(lines, position) can wrap the input lines, position() is the offset in the output file
+        if not os.path.exists(in_path):
+            Logger.log("e", "Cannot open file {}", in_path)
+            return False
+        with open(in_path, 'rb') as fin, open(out_path, 'wb') as fout:
+            bounds = self._encode(track(fin, fout.tell) if track else fin, fout.write, 0.0, 0.0)
+        x_offset, y_offset = self._centerOffset(*bounds)
+        if self._needsShift(x_offset, y_offset):
+            Logger.log("d", "Shifting print by X:{} Y:{}", x_offset, y_offset)
+            with open(in_path, 'rb') as fin, open(out_path, 'wb') as fout:
+                self._encode(track(fin, fout.tell) if track else fin, fout.write, x_offset, y_offset)
+        return True
+
+    def compressStream(self, lines, write):
+        # Single pass over the lines as they are generated, every finished block is passed to write().
+        # Returns False if the print has to be shifted to the bed center, the output is not usable then.
+        x_offset, y_offset = self._centerOffset(*self._encode(lines, write, 0.0, 0.0))
+        return not self._needsShift(x_offset, y_offset)
+
+    @staticmethod
+    def _needsShift(x_offset, y_offset):
+        return (x_offset < -1.0 and y_offset < -1.0) or (x_offset > 1.0 and y_offset > 1.0)
+
+    def _centerOffset(self, x_min, x_max, y_min, y_max):
+        # machine type 1 has its origin in the middle of the bed, 0 and 2 in the corner
+        if self._machine_type == 1:
+            if x_min >= -0.1 and y_min >= -0.1 and x_max >= -0.1 and y_max >= -0.1:
+                return _f32(-_f32(x_max + x_min) / 2.0), _f32(-_f32(y_max + y_min) / 2.0)
+        elif self._machine_type in (0, 2):
+            if -0.1 > x_min or x_max > self._x_max or 0.1 > y_min or y_max > self._y_max:
+                return _f32(_f32(self._x_max - _f32(x_max + x_min)) / 2.0), _f32(_f32(self._y_max - _f32(y_max + y_min)) / 2.0)
+        return 0.0, 0.0
+
+    def _header(self):
+        header = struct.pack('<I', (FLAG_X | FLAG_Y | FLAG_Z | FLAG_E) << 16 | 4004 << 2 | 2)
+        header += b''.join(_F32.pack(step) for step in self._step)
+        header += struct.pack('<I', (FLAG_E | FLAG_B) << 16 | 92 << 2 | 1) + bytes(8)  # G92 E0 B0
+        return header
+
+    def _encode(self, lines, write, x_offset, y_offset):
+        x_step, y_step, z_step, e_step = self._step
+        pack = _F32.pack
+        unpack = _F32.unpack
+        block = bytearray(b'\xa3\xa3\xa3\xa3')
+        block += self._header()
+        x_min = y_min = 1000000.0
+        x_max = y_max = -1000000.0
+        x_abs = y_abs = z_abs = e_abs = 0
+        absolute = True
+        compact_head = 0
+        xval = yval = zval = eval_ = 0.0
+        t_val = 0
+        float_values = {}
+
+        def flush():
+            block.extend(bytes((self.PAD,)) * (self.BLOCK_SIZE - 1 - len(block)))
+            check_sum = 0
+            for byte in block:
+                check_sum ^= byte
+            block.append(check_sum)
+            write(bytes(block))
+            block.clear()
+
+        for line in self._lines(lines):
+            dx = dy = dz = de = 0
+            feed = 0
+            cmd = 0
+            code = 0
+            flags = 0
+            move = False
+            set_position = False
+            home = False
+            extra_axis = False
+            string = None
+            parsed = True  # False when parsing stopped before the end of the line
+            length = len(line)
+            i = 0
+            simple = _SIMPLE_MOVE_RE.match(line)
+            if simple is not None:
+                f, x, y, z, e = simple.groups()
+                try:
+                    if x is not None:
+                        x = unpack(pack(float(x)))[0]
+                        if absolute:
+                            x = unpack(pack(x_offset + x))[0]
+                        nx = _trunc(unpack(pack(x / x_step))[0])
+                    if y is not None:
+                        y = unpack(pack(float(y)))[0]
+                        if absolute:
+                            y = unpack(pack(y_offset + y))[0]
+                        ny = _trunc(unpack(pack(y / y_step))[0])
+                    if z is not None:
+                        z = unpack(pack(float(z)))[0]
+                        nz = _trunc(unpack(pack(z / z_step))[0])
+                    if e is not None:
+                        e = unpack(pack(float(e)))[0]
+                        ne = _trunc(unpack(pack(e / e_step))[0])
+                except OverflowError:
+                    simple = None  # leave the float32 overflow handling to the full parser
+            if simple is not None:
+                cmd = 0x47
+                code = 1
+                move = True
+                length = 0
+                if f is not None:
+                    feed = _trunc(float(f) / 60.0)
+                    flags |= FLAG_F
+                if x is not None:
+                    xval = x
+                    if absolute:
+                        dx = _i32(nx - x_abs)
+                        x_abs = nx
+                    else:
+                        dx = nx
+                        x_abs = _i32(x_abs + nx)
+                    flags |= FLAG_X
+                if y is not None:
+                    yval = y
+                    if absolute:
+                        dy = _i32(ny - y_abs)
+                        y_abs = ny
+                    else:
+                        dy = ny
+                        y_abs = _i32(y_abs + ny)
+                    flags |= FLAG_Y
+                if z is not None:
+                    zval = z
+                    if absolute:
+                        dz = _i32(nz - z_abs)
+                        z_abs = nz
+                    else:
+                        dz = nz
+                        z_abs = _i32(z_abs + nz)
+                    flags |= FLAG_Z
+                if e is not None:
+                    eval_ = e
+                    if absolute:
+                        de = _i32(ne - e_abs)
+                        e_abs = ne
+                    else:
+                        de = ne
+                        e_abs = _i32(e_abs + ne)
+                    flags |= FLAG_E
+            while i < length:
+                c = line[i]
+                if c <= 0x20 or c >= 0x80:
+                    i += 1
+                    continue
+                end = None
+                if c == 0x3b:  # ';'
+                    if line.startswith(b'TIME:', i + 1):
+                        cmd = 0x4d
+                        code = 2100
+                        t_val, end = _strtol(line, i + 6)
+                        flags |= FLAG_T
+                    elif line.startswith(b'TIME_ELAPSED:', i + 1):
+                        cmd = 0x4d
+                        code = 2101
+                        t_val, end = _strtol(line, i + 14)
+                        flags |= FLAG_T
+                    parsed = False
+                    break
+                elif c == 0x28 or c == 0x2a:  # '(' '*'
+                    parsed = False
+                    break
+                elif c == 0x4e:  # 'N'
+                    _, end = _strtol(line, i + 1)
+                elif c == 0x47 or c == 0x4d or c == 0x54:  # 'G' 'M' 'T'
+                    if cmd:
+                        if c == 0x54:
+                            t_val, end = _strtol(line, i + 1)
+                            flags |= FLAG_T
+                    else:
+                        code, end = _strtol(line, i + 1)
+                        if end == i + 1:
+                            cmd = -1  # no code, the line is ignored
+                            break
+                        cmd = c
+                        if cmd == 0x47:
+                            if code == 0 or code == 1:
+                                move = True
+                            if code == 90:
+                                absolute = True
+                            elif code == 91:
+                                code = 90
+                                absolute = False
+                            elif code == 92:
+                                set_position = True
+                            elif code in (28, 161, 162):
+                                home = True
+                        elif cmd == 0x4d and code in _STRING_M_CODES:
+                            start = end
+                            while start < length and (line[start] <= 0x20 or line[start] >= 0x80):
+                                start += 1
+                            if start < length:
+                                stop = length
+                                while line[stop - 1] <= 0x20 or line[stop - 1] >= 0x80:
+                                    stop -= 1
+                                string = line[start:stop]
+                                flags |= FLAG_STR
+                            parsed = False
+                            break
+                elif c == 0x58:  # 'X'
+                    xval, end = _strtod(line, i + 1)
+                    xval = _f32(xval)
+                    if set_position or home:
+                        x_abs = _trunc(_f32(xval / x_step))
+                    elif move:
+                        if absolute:
+                            xval = _f32(x_offset + xval)
+                            n = _trunc(_f32(xval / x_step))
+                            dx = _i32(n - x_abs)
+                            x_abs = n
+                        else:
+                            dx = _trunc(_f32(xval / x_step))
+                            x_abs = _i32(x_abs + dx)
+                    flags |= FLAG_X
+                elif c == 0x59:  # 'Y'
+                    yval, end = _strtod(line, i + 1)
+                    yval = _f32(yval)
+                    if set_position or home:
+                        y_abs = _trunc(_f32(yval / y_step))
+                    elif move:
+                        if absolute:
+                            yval = _f32(y_offset + yval)
+                            n = _trunc(_f32(yval / y_step))
+                            dy = _i32(n - y_abs)
+                            y_abs = n
+                        else:
+                            dy = _trunc(_f32(yval / y_step))
+                            y_abs = _i32(y_abs + dy)
+                    flags |= FLAG_Y
+                elif c == 0x5a:  # 'Z'
+                    zval, end = _strtod(line, i + 1)
+                    zval = _f32(zval)
+                    if set_position or home:
+                        z_abs = _trunc(_f32(zval / z_step))
+                    elif move:
+                        n = _trunc(_f32(zval / z_step))
+                        if absolute:
+                            dz = _i32(n - z_abs)
+                            z_abs = n
+                        else:
+                            dz = n
+                            z_abs = _i32(z_abs + n)
+                    flags |= FLAG_Z
+                elif c == 0x45 or c == 0x41 or c == 0x42:  # 'E' 'A' 'B'
+                    extra_axis = extra_axis or c != 0x45
+                    eval_, end = _strtod(line, i + 1)
+                    eval_ = _f32(eval_)
+                    if set_position or extra_axis:
+                        e_abs = _trunc(_f32(eval_ / e_step))
+                    elif move:
+                        n = _trunc(_f32(eval_ / e_step))
+                        if absolute:
+                            de = _i32(n - e_abs)
+                            e_abs = n
+                        else:
+                            de = n
+                            e_abs = _i32(e_abs + n)
+                    flags |= FLAG_B if c == 0x42 else FLAG_E
+                elif c == 0x46:  # 'F'
+                    value, end = _strtod(line, i + 1)
+                    feed = _trunc(value / 60.0)
+                    flags |= FLAG_F
+                elif c in _FLOAT_PARAMS:
+                    value, end = _strtod(line, i + 1)
+                    float_values[c] = _f32(value)
+                    flags |= _FLOAT_PARAMS[c]
+                elif c == 0x27 or c == 0x22:  # quoted string
+                    stop = line.find(bytes((c,)), i + 1)
+                    string = line[i + 1:] if stop < 0 else line[i + 1:stop]
+                    flags |= FLAG_STR
+                    parsed = False
+                    break
+                else:
+                    parsed = False
+                    break
+                i = end if end is not None else i + 1
+
+            if cmd == -1:
+                continue
+
+            if parsed and flags & (FLAG_E | FLAG_B) and move and absolute:
+                if flags & FLAG_X:
+                    if x_min > xval:
+                        x_min = xval
+                    if xval > x_max:
+                        x_max = xval
+                if flags & FLAG_Y:
+                    if y_min > yval:
+                        y_min = yval
+                    if yval > y_max:
+                        y_max = yval
+
+            if block and move and dz == 0 and not extra_axis:
+                record, compact_head = self._compactRecord(compact_head, dx, dy, de, feed)
+                if len(record) + len(block) <= 0xff:
+                    block += record
+                    continue
+                flush()
+
+            if cmd == 0x47:
+                kind = 1
+                if code == 0:
+                    code = 1
+            elif cmd == 0x4d:
+                kind = 2
+            elif cmd == 0x54:
+                kind = 3
+            else:
+                continue
+            record = bytearray(struct.pack('<I', (flags & 0xffff) << 16 | (code & 0x3fff) << 2 | kind))
+            if set_position or home or move:
+                if flags & FLAG_X:
+                    record += _be(x_abs, 4)
+                if flags & FLAG_Y:
+                    record += _be(y_abs, 4)
+                if flags & FLAG_Z:
+                    record += _be(z_abs, 4)
+                if flags & FLAG_E:
+                    record += _be(e_abs, 4)
+                if flags & FLAG_B:
+                    record += _be(e_abs, 4)
+            else:
+                if flags & FLAG_X:
+                    record += _F32.pack(xval)
+                if flags & FLAG_Y:
+                    record += _F32.pack(yval)
+                if flags & FLAG_Z:
+                    record += _F32.pack(zval)
+                if flags & FLAG_E:
+                    record += _F32.pack(eval_)
+                if flags & FLAG_B:
+                    record += _F32.pack(eval_)
+            if flags & FLAG_F:
+                record += _be(feed, 2)
+            if flags & FLAG_S:
+                record += _F32.pack(float_values[0x53])
+            if flags & FLAG_I:
+                record += _F32.pack(float_values[0x49])
+            if flags & FLAG_T:
+                record += _be(t_val, 4)
+            if flags & FLAG_P:
+                record += _F32.pack(float_values[0x50])
+            if flags & FLAG_D:
+                record += _F32.pack(float_values[0x44])
+            if flags & FLAG_C:
+                record += _F32.pack(float_values[0x43])
+            if flags & FLAG_R:
+                record += _F32.pack(float_values[0x52])
+            if flags & FLAG_STR:
+                record += _be(len(string), 2) + string + b'\0'
+            if len(record) + len(block) > 0xff:
+                flush()
+            block += record
+
+        flush()
+        return x_min, x_max, y_min, y_max
+
+    @staticmethod
+    def _compactRecord(head, dx, dy, de, feed):
+        head &= 0xfc
+        # abs() of a C int, INT_MIN stays negative
+        adx = -dx if dx < 0 else dx
+        ady = -dy if dy < 0 else dy
+        ade = -de if de < 0 else de
+        if adx == 0x80000000:
+            adx = _INT_MIN
+        if ady == 0x80000000:
+            ady = _INT_MIN
+        if ade == 0x80000000:
+            ade = _INT_MIN
+        if adx <= 0x7f and ady <= 0x7f:
+            head &= 0xf3
+            data = [dx & 0xff, dy & 0xff]
+        elif adx <= 0x7ff and ady <= 0x7ff:
+            head = head & 0xf3 | 0x4
+            data = [dx >> 4 & 0xff, (dx << 4 | dy >> 8 & 0xf) & 0xff, dy & 0xff]
+        elif adx <= 0x7fff and ady <= 0x7fff:
+            head = head & 0xf3 | 0x8
+            data = [dx >> 8 & 0xff, dx & 0xff, dy >> 8 & 0xff, dy & 0xff]
+        else:
+            head = head & 0xf3 | 0xc
+            data = [dx >> 16 & 0xff, dx >> 8 & 0xff, dx & 0xff, dy >> 16 & 0xff, dy >> 8 & 0xff, dy & 0xff]
+        if de == 0:
+            head &= 0xcf
+        elif ade < 0x7f:
+            head = head & 0xcf | 0x10
+            data.append(de & 0xff)
+        elif ade < 0x7fff:
+            head = head & 0xcf | 0x20
+            data += (de >> 8 & 0xff, de & 0xff)
+        elif ade < 0x7fffff:
+            head = head & 0xcf | 0x30
+            data += (de >> 16 & 0xff, de >> 8 & 0xff, de & 0xff)
+        if feed == 0:
+            head &= 0x3f
+        elif feed <= 0xff:
+            head = head & 0x3f | 0x40
+            data.append(feed & 0xff)
+        else:
+            head = head & 0x3f | 0x80
+            data += (feed >> 8 & 0xff, feed & 0xff)
+        data.insert(0, head)
+        return bytes(data), head
+
+    @staticmethod
+    def _lines(fp):
+        # fgets() with a 1024 byte buffer, parsing stops at the first NUL
+        for line in fp:
+            while len(line) > 1023:
+                yield line[:1023].split(b'\0', 1)[0]
+                line = line[1023:]
+            yield line.split(b'\0', 1)[0]
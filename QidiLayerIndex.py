@@ -0,0 +1,90 @@
+from array import array
+from bisect import bisect_right
+
+import json
+import re
+
+
+_ELAPSED_RE = re.compile(b'(?:;TIME_ELAPSED:|M2101 T)(-?[0-9]+\\.?[0-9]*)')
+_TOTAL_RE = re.compile(b'(?:;TIME:|M2100 T)(-?[0-9]+\\.?[0-9]*)')
+_LAYER_RE = re.compile(b';LAYER:(-?[0-9]+)')
+
+
+class QidiLayerIndex:
+    # Slicer timeline of an uploaded file: where every layer starts in the file the printer reads, in the
+    # same bytes M4000 reports as D:now/total, and the slicer's elapsed time at that point.
+    def __init__(self):
+        self.offsets = array('Q')
+        self.layers = array('i')
+        self.elapsed = array('d')
+        self.total_time = 0.0
+        self.filename = None  # remote filename
+        self.size = 0  # size of the uploaded file
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def track(self, lines, position=None):
+        # Passes the g-code lines through and indexes them on the way. position() returns the offset in the
+        # uploaded file the current line ends up at, by default the offset of the line itself.
+        self.__init__()
+        offset = 0
+        elapsed = 0.0
+        for line in lines:
+            first = line[:1]
+            if first == b';' or first == b'M':
+                match = _LAYER_RE.match(line)
+                if match:
+                    self.offsets.append(position() if position else offset)
+                    self.layers.append(int(match.group(1)))
+                    self.elapsed.append(elapsed)
+                else:
+                    match = _ELAPSED_RE.match(line)
+                    if match:
+                        elapsed = float(match.group(1))
+                    else:
+                        match = _TOTAL_RE.match(line)
+                        if match:
+                            self.total_time = float(match.group(1))
+            offset += len(line)
+            yield line
+        self.size = position() if position else offset
+
+    def lookup(self, position):
+        # layer and slicer elapsed time at a position in the file, None before the first layer
+        i = bisect_right(self.offsets, position) - 1
+        if i < 0:
+            return None, 0.0
+        start = self.offsets[i]
+        if i + 1 < len(self.offsets):
+            end = self.offsets[i + 1]
+            end_time = self.elapsed[i + 1]
+        else:
+            end = self.size
+            end_time = max(self.total_time, self.elapsed[i])
+        fraction = min(1.0, (position - start) / (end - start)) if end > start else 0.0
+        return self.layers[i], self.elapsed[i] + (end_time - self.elapsed[i]) * fraction
+
+    def save(self, path):
+        header = {'filename': self.filename, 'size': self.size, 'total_time': self.total_time, 'count': len(self)}
+        with open(path, 'wb') as fp:
+            fp.write(json.dumps(header).encode() + b'\n')
+            self.offsets.tofile(fp)
+            self.layers.tofile(fp)
+            self.elapsed.tofile(fp)
+
+    @classmethod
+    def load(cls, path):
+        index = cls()
+        try:
+            with open(path, 'rb') as fp:
+                header = json.loads(fp.readline().decode())
+                index.filename = header['filename']
+                index.size = header['size']
+                index.total_time = header['total_time']
+                index.offsets.fromfile(fp, header['count'])
+                index.layers.fromfile(fp, header['count'])
+                index.elapsed.fromfile(fp, header['count'])
+        except (OSError, EOFError, ValueError, KeyError):
+            return None
+        return index
@@ -0,0 +1,153 @@
+from threading import Condition
+
+
+# Hand-over points between the upload stages: g-code generation (Qt thread), compression and
+# the UDP transfer. They let every stage start on data as soon as the previous one produced it.
+
+
+class QidiGcodeTail:
+    # The temp g-code file while the writer is still filling it. The writer runs on the Qt thread
+    # and must never wait for the network, so the file itself is the buffer and readers follow it
+    # as it grows.
+    def __init__(self, stream, path):
+        self._stream = stream
+        self._path = path
+        self._cond = Condition()
+        self._version = 0
+        self._done = False
+        self.success = False
+        self.consumed = 0  # bytes handed out by lines()
+
+    def write(self, data):
+        count = self._stream.write(data)
+        self._stream.flush()
+        with self._cond:
+            self._version += 1
+            self._cond.notify_all()
+        return count
+
+    def close(self, success=True):
+        self._stream.flush()
+        with self._cond:
+            self._done = True
+            self.success = success
+            self._cond.notify_all()
+
+    def wait(self):
+        with self._cond:
+            while not self._done:
+                self._cond.wait()
+        return self.success
+
+    def lines(self):
+        # binary lines of the file as they are written, raises if the writer gave up
+        partial = b''
+        with open(self._path, 'rb') as fp:
+            while True:
+                with self._cond:
+                    done = self._done
+                    version = self._version
+                line = fp.readline()
+                if line.endswith(b'\n'):
+                    self.consumed += len(line)
+                    yield partial + line
+                    partial = b''
+                elif line:
+                    partial += line  # the rest of the line is not written yet
+                elif done:
+                    if not self.success:
+                        raise IOError('g-code generation failed')
+                    if partial:
+                        self.consumed += len(partial)
+                        yield partial
+                    return
+                else:
+                    with self._cond:
+                        if self._version == version and not self._done:
+                            self._cond.wait(0.5)
+
+
+class QidiBlockPipe:
+    # Bounded buffer between the compressor and the sender. The sender reads it like a file, but
+    # may only seek back up to `keep` bytes behind the furthest offset it has read. That is all the
+    # windowed sender needs, as it never rewinds past its oldest unacknowledged block.
+    def __init__(self, capacity, keep):
+        self._cond = Condition()
+        self._data = bytearray()
+        self._base = 0  # stream offset of _data[0]
+        self._pos = 0
+        self._read_end = 0
+        self._capacity = max(capacity, keep * 2)
+        self._keep = keep
+        self._closed = False
+        self._failed = False
+        self._aborted = False
+        self._draining = False
+        self.produced = 0
+
+    def write(self, data):
+        # producer side, blocks while the sender is too far behind
+        with self._cond:
+            while len(self._data) + len(data) > self._capacity and not self._aborted and not self._draining:
+                if not self._trim():
+                    self._cond.wait()
+            if self._aborted:
+                raise IOError('upload stopped')
+            if not self._draining:
+                self._data += data
+            self.produced += len(data)
+            self._cond.notify_all()
+
+    def close(self, success=True):
+        with self._cond:
+            self._closed = True
+            self._failed = not success
+            self._cond.notify_all()
+
+    def abort(self):
+        # consumer gave up, release a waiting producer
+        with self._cond:
+            self._aborted = True
+            self._cond.notify_all()
+
+    def drain(self):
+        # consumer is gone but the producer should finish, further data is only counted
+        with self._cond:
+            self._draining = True
+            self._data = bytearray()
+            self._cond.notify_all()
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=0):
+        self._pos = offset
+        return offset
+
+    def readinto(self, buffer):
+        # blocks until the buffer can be filled or the stream has ended
+        size = len(buffer)
+        with self._cond:
+            while not self._closed and self._base + len(self._data) < self._pos + size:
+                self._cond.wait()
+            if self._failed:
+                raise IOError('compression failed')
+            start = self._pos - self._base
+            if start < 0:
+                raise IOError('offset {} is no longer buffered'.format(self._pos))
+            chunk = self._data[start:start + size]
+            buffer[:len(chunk)] = chunk
+            self._pos += len(chunk)
+            self._read_end = max(self._read_end, self._pos)
+            if self._trim():
+                self._cond.notify_all()
+            return len(chunk)
+
+    def _trim(self):
+        # drop what the sender can no longer ask for, in large steps to keep the copying cheap
+        drop = self._read_end - self._keep - self._base
+        if drop < self._keep:
+            return False
+        del self._data[:drop]
+        self._base += drop
+        return True
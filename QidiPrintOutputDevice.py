@@ -31,9 +31,12 @@ from UM.Signal import signalemitter
 from UM.Job import Job
 
 from UM.i18n import i18nCatalog
-from .ChituCodeWriter import ChituCodeWriter
+from .ChituCodeWriter import ChituCodeWriter, ChamberFanRewrite
 
 from .QidiConnectionManager import QidiConnectionManager, QidiResult
+from .QidiPipeline import QidiGcodeTail
+from .QidiFleet import QidiFleet
+from .QidiTelemetry import QidiTelemetry
 
 from queue import Queue
 from threading import Thread, Event
@@ -50,8 +53,14 @@ class OutputStage(Enum):
 
 class QidiPrintOutputDevice(PrinterOutputDevice):
     printerStatusChanged = pyqtSignal()
+    positionChanged = pyqtSignal()
+    coolingFanChanged = pyqtSignal()
+    currentLayerChanged = pyqtSignal()
 
-    def __init__(self, name, address):
+    # status fields that decide the print job and printer state
+    JOB_FIELDS = frozenset(('print_now', 'print_total', 'idle', 'printing_time', 'printing', 'printing_filename'))
+
+    def __init__(self, name, address, printers=None):
         super().__init__(name, connection_type=ConnectionType.NetworkConnection)
         self.setShortDescription(catalog.i18nc("@action:button Preceded by 'Ready to'.", "Send to " + name))
         self.setDescription(catalog.i18nc("@info:tooltip",  "Send to " + name))
@@ -60,6 +69,8 @@ class QidiPrintOutputDevice(PrinterOutputDevice):
         self.setIconName("print")
         self._properties = {}
         self._address = address
+        self._peers = printers if printers is not None else {}  # all printers of the plugin, for group uploads
+        self._current_layer = None
         self._PluginName = 'QIDI Print'
         self.setPriority(3)
 
@@ -67,6 +78,12 @@ class QidiPrintOutputDevice(PrinterOutputDevice):
         self._preferences = Application.getInstance().getPreferences()
         self._preferences.addPreference("QidiPrint/autoprint", False)
         self._autoPrint = self._preferences.getValue("QidiPrint/autoprint")        
+        self._preferences.addPreference("QidiPrint/sendwindow", 8)
+        self._preferences.addPreference("QidiPrint/autotune", True)
+        self._preferences.addPreference("QidiPrint/blocksizes", "{}")
+        self._preferences.addPreference("QidiPrint/pipeline", True)
+        self._preferences.addPreference("QidiPrint/fleet", False)  # all printers on one socket and thread
+        self._preferences.addPreference("QidiPrint/historyhours", 24)
 
         self._update_timer.setInterval(1000)
 
@@ -82,7 +99,9 @@ class QidiPrintOutputDevice(PrinterOutputDevice):
         self._monitor_view_qml_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'qml', 'MonitorItem.qml')
         self._localTempGcode = Resources.getStoragePath(Resources.Resources, 'data.gcode')
 
-        self._qidi = QidiConnectionManager(self._address, self._localTempGcode, False)
+        fleet = QidiFleet.getInstance() if self._preferences.getValue("QidiPrint/fleet") else None
+        history_size = max(1, int(float(self._preferences.getValue("QidiPrint/historyhours")) * 3600 / QidiConnectionManager.POLL_INTERVAL))
+        self._qidi = QidiConnectionManager(self._address, self._localTempGcode, False, self._preferences.getValue("QidiPrint/sendwindow"), fleet, history_size)
         self._qidi.progressChanged.connect(self._update_progress)
         self._qidi.conectionStateChanged.connect(self._conectionStateChanged)
         self._qidi.updateDone.connect(self._update_status)
@@ -116,18 +135,24 @@ class QidiPrintOutputDevice(PrinterOutputDevice):
             self.setConnectionState(ConnectionState.Connecting)
             if self.printers[0]:
                 self.printers[0].updateState("offline")
+        self.printerStatusChanged.emit()  # status and firmware version
 
     def _update(self):
+        # connecting and polling run on the connection manager's poller, this only follows its state
         if self._qidi._connected == False:
-            Thread(target=self._qidi.connect, daemon=True, name="Qidi Connect").start()
             self.printerStatusChanged.emit()
             return
         if self.connectionState != ConnectionState.Connected:
             self.setConnectionState(ConnectionState.Connected)
-        Thread(target=self._qidi.update, daemon=True, name="Qidi Update").start()
+            self.printerStatusChanged.emit()
+
+    def connect(self):
+        super().connect()
+        self._qidi.startPolling()
 
     def close(self):
         super().close()
+        self._qidi.stopPolling()
         if self._message:
             self._message.hide()
         self.printerStatusChanged.emit()
@@ -142,42 +167,59 @@ class QidiPrintOutputDevice(PrinterOutputDevice):
         self._cancelPrint = True
         self.sendCommand("M33")        
 
-    def _update_status(self):
+    def _update_status(self, changed):
+        # only the parts of the printer model whose status fields changed since the last poll
         printer = self.printers[0]
-        status = self._qidi._status
-        if "bed_nowtemp" in status:
-            printer.updateBedTemperature(int(status["bed_nowtemp"]))
-        if "bed_targettemp" in status:
-            printer.updateTargetBedTemperature(int(status["bed_targettemp"]))
+        snapshot = self._qidi.snapshot
+        status = snapshot.status
+        if "bed_nowtemp" in changed and status.bed_nowtemp is not None:
+            printer.updateBedTemperature(int(status.bed_nowtemp))
+        if "bed_targettemp" in changed and status.bed_targettemp is not None:
+            printer.updateTargetBedTemperature(int(status.bed_targettemp))
 
         extruder = printer.extruders[0]
-        if "e1_nowtemp" in status:
-            extruder.updateHotendTemperature(int(status["e1_nowtemp"]))
-        if "e1_targettemp" in status:
-            extruder.updateTargetHotendTemperature(int(status["e1_targettemp"]))
+        if "e1_nowtemp" in changed and status.e1_nowtemp is not None:
+            extruder.updateHotendTemperature(int(status.e1_nowtemp))
+        if "e1_targettemp" in changed and status.e1_targettemp is not None:
+            extruder.updateTargetHotendTemperature(int(status.e1_targettemp))
 
         if len(printer.extruders) > 1:
             extruder = printer.extruders[1]
-            if "e2_nowtemp" in status:
-                extruder.updateHotendTemperature(int(status["e2_nowtemp"]))
-            if "e2_targettemp" in status:
-                extruder.updateTargetHotendTemperature(int(status["e2_targettemp"]))
-
-        if self._qidi._isPrinting:
+            if "e2_nowtemp" in changed and status.e2_nowtemp is not None:
+                extruder.updateHotendTemperature(int(status.e2_nowtemp))
+            if "e2_targettemp" in changed and status.e2_targettemp is not None:
+                extruder.updateTargetHotendTemperature(int(status.e2_targettemp))
+
+        if "x_pos" in changed or "y_pos" in changed or "z_pos" in changed:
+            self.positionChanged.emit()
+        if "fan" in changed:
+            self.coolingFanChanged.emit()
+        if changed & self.JOB_FIELDS:
+            self.__update_job(snapshot)
+
+    def __update_job(self, snapshot):
+        printer = self.printers[0]
+        current_layer = self._current_layer
+        if snapshot.printing:
             if printer.activePrintJob is None:
                 print_job = PrintJobOutputModel(output_controller=self._output_controller)
                 printer.updateActivePrintJob(print_job)
             else:
                 print_job = printer.activePrintJob
-            elapsed = self._qidi._printing_time
-            print_job.updateTimeElapsed(int(self._qidi._printing_time))
-            print_job.updateName(self._qidi._printing_filename)
-
-            if self._qidi._print_total > 0:
-                progress = float(self._qidi._print_now) / float(self._qidi._print_total)
+            print_job.updateTimeElapsed(int(snapshot.printing_time))
+            print_job.updateName(snapshot.filename)
+
+            layer_index = self._qidi.layerIndex(snapshot)
+            if layer_index is not None:
+                # remaining time from the slicer's timeline at the layer the printer is in
+                self._current_layer, slicer_elapsed = layer_index.lookup(snapshot.print_now)
+                print_job.updateTimeTotal(int(snapshot.printing_time + max(0.0, layer_index.total_time - slicer_elapsed)))
+            elif snapshot.print_total > 0:
+                self._current_layer = None
+                progress = float(snapshot.print_now) / float(snapshot.print_total)
                 if progress > 0:
-                    print_job.updateTimeTotal(int(self._qidi._printing_time / progress))
-            if self._qidi._isIdle:
+                    print_job.updateTimeTotal(int(snapshot.printing_time / progress))
+            if snapshot.idle:
                 if self._cancelPrint:
                     job_state = 'aborting'
                 else:
@@ -189,14 +231,15 @@ class QidiPrintOutputDevice(PrinterOutputDevice):
             if printer.activePrintJob:
                 printer.updateActivePrintJob(None)
             job_state = 'idle'
+            self._current_layer = None
             self._cancelPrint = False
-            print_job = None
 
         printer.updateState(job_state)
-        self.printerStatusChanged.emit()
+        if self._current_layer != current_layer:
+            self.currentLayerChanged.emit()
 
     def requestWrite(self, node, fileName=None, *args, **kwargs):
-        if self._stage != OutputStage.ready or self._qidi._isPrinting:
+        if self._stage != OutputStage.ready or self._qidi.snapshot.printing:
             Message(catalog.i18nc('@info:status', 'Cannot Print, printer is busy'), title=catalog.i18nc("@info:title", "BUSY")).show()
             raise OutputDeviceError.DeviceBusyError()
 
@@ -235,20 +278,28 @@ class QidiPrintOutputDevice(PrinterOutputDevice):
         self._dialog.setProperty('validName', len(fileName) > 0)
         self._dialog.setProperty('validationError', 'Filename too short')
 
-    def startSendingThread(self):
+    def startSendingThread(self, gcode=None, upload=None):
         Logger.log('i', '=============QIDI SEND BEGIN============')
         self._errorMsg = ''
 
         self._qidi._abort = False
         self._stage = OutputStage.writing
 
-        res = self._qidi.sendfile(self.targetSendFileName)
+        self._applyBlockSize()
+        if gcode is not None:
+            res = self._qidi.sendPipelined(self.targetSendFileName, gcode)
+        elif upload is not None:
+            res = self._qidi.sendPrepared(self.targetSendFileName, upload)
+        else:
+            res = self._qidi.sendfile(self.targetSendFileName)
         if self._message:
             self._message.hide()
             self._message = None  # type:Optional[Message]
         self.writeFinished.emit(self)
 
         self._stage = OutputStage.ready
+        if gcode is not None and not gcode.wait():
+            return  # reported by onFilenameAccepted
 
         if res == QidiResult.SUCCES:
             if self._autoPrint is False:
@@ -290,36 +341,35 @@ class QidiPrintOutputDevice(PrinterOutputDevice):
         self._message.show()
         Logger.log('e', result_msg)
 
-    def updateChamberFan(self):        
+    def _applyBlockSize(self):
+        # block size is remembered per printer and firmware, calibrated before the first upload
+        key = self._address + "/" + self._qidi._firmware_ver
+        try:
+            block_sizes = json.loads(self._preferences.getValue("QidiPrint/blocksizes"))
+        except ValueError:
+            block_sizes = {}
+        if key not in block_sizes:
+            if not self._preferences.getValue("QidiPrint/autotune") or not self._qidi._connected:
+                return
+            Logger.log("i", self._name + " | Calibrating block size")
+            size = self._qidi.calibrateBlockSize()
+            if size is None:
+                return
+            block_sizes[key] = size
+            self._preferences.setValue("QidiPrint/blocksizes", json.dumps(block_sizes))
+        Logger.log("d", self._name + " | Block size: {}".format(block_sizes[key]))
+        self._qidi.BUFSIZE = block_sizes[key]
+
+    def _chamberFanRewrite(self):
         global_container_stack = self._application.getGlobalContainerStack()
         if not global_container_stack:
-            return
+            return None
 
         cooling_chamber = global_container_stack.getProperty("cooling_chamber", "value")
         if cooling_chamber == False:
-            return
-
-        cooling_chamber_at_layer = global_container_stack.getProperty("cooling_chamber_at_layer", "value")
-
-        scene = self._application.getController().getScene()
-        gcode_dict = getattr(scene, "gcode_dict", {})
-        if not gcode_dict:
-            return
-
-        data = gcode_dict[0]
-        for layer in data:
-            lines = layer.split("\n")
-            for line in lines:
-                if ";LAYER:" in line:
-                    index = data.index(layer)
-                    current_layer = int(line.split(":")[1])
-                    if current_layer == cooling_chamber_at_layer:
-                        layer = "M106 T-2 ;Enable chamber loop\n" + layer
-                        data[index] = layer
-                        data[-1] = "M107 T-2 ;Disable chamber loop\n" + data[-1]
-                        setattr(scene, "gcode_dict", gcode_dict)
-                        return
+            return None
 
+        return ChamberFanRewrite(global_container_stack.getProperty("cooling_chamber_at_layer", "value"))
 
     def onFilenameAccepted(self):
         self.targetSendFileName = self._dialog.findChild(QObject, "nameField").property('text').strip()
@@ -328,27 +378,85 @@ class QidiPrintOutputDevice(PrinterOutputDevice):
             self._autoPrint = autoprint
             self._preferences.setValue("QidiPrint/autoprint", self._autoPrint)
         Logger.log("d", self._name + " | Filename set to: " + self.targetSendFileName)
+        group = [self._peers[name] for name in self._dialog.property('groupSelection') or [] if name in self._peers]
         self._dialog.deleteLater()        
-        self.updateChamberFan()
+        # a group upload needs the whole compressed file before it is sent to all printers
+        pipeline = self._preferences.getValue("QidiPrint/pipeline") and not group
         success = False
         with open(self._localTempGcode, 'w+', buffering=1) as fp:
-            if fp:
+            gcode = QidiGcodeTail(fp, self._localTempGcode)
+            if pipeline:
+                # compress and upload while the gcode is being written
+                self._showUploadMessage()
+                Thread(target=self.startSendingThread, args=(gcode,), daemon=True, name=self._name + " File Send").start()
+            try:
                 writer = ChituCodeWriter()
-                success = writer.write(fp, None, MeshWriter.OutputMode.TextMode)
+                chamber_fan = self._chamberFanRewrite()
+                if chamber_fan:
+                    writer.addRewrite(chamber_fan)
+                success = writer.write(gcode, None, MeshWriter.OutputMode.TextMode)
+            finally:
+                gcode.close(bool(success))
 
         if success:
-            self._message = Message(
-                catalog.i18nc("@info:status", "Uploading to {}").format(self._name),
-                title=catalog.i18nc("@label", "Print jobs"),
-                progress=-1, lifetime=0, dismissable=False, use_inactivity_timer=False
-            )
-            self._message.addAction("ABORT", catalog.i18nc("@action:button", "Cancel"), None, "")
-            self._message.actionTriggered.connect(self._onActionTriggered)
-            self._message.show()
-            Thread(target=self.startSendingThread, daemon=True, name=self._name + " File Send").start()
+            if group:
+                Thread(target=self._sendToGroup, args=(group,), daemon=True, name=self._name + " Group Send").start()
+            elif not pipeline:
+                self._showUploadMessage()
+                Thread(target=self.startSendingThread, daemon=True, name=self._name + " File Send").start()
         else:
-            self._message = Message(catalog.i18nc("@info:status", "Cannot create gcode file!"), title=catalog.i18nc("@label", "FAILURE"))
-            self._message.show()
+            self._qidi._abort = True
+            Message(catalog.i18nc("@info:status", "Cannot create gcode file!"), title=catalog.i18nc("@label", "FAILURE")).show()
+
+    def _sendToGroup(self, group):
+        # compress once and upload to all printers at the same time, each with its own progress and
+        # resends. Printers reporting another config than this one get their own file afterwards.
+        devices = [self]
+        for device in group:
+            if device is self or device in devices:
+                continue
+            if device._stage != OutputStage.ready or device._qidi.snapshot.printing:
+                Message(catalog.i18nc('@info:status', '{} is busy, skipped').format(device.name), title=catalog.i18nc("@info:title", "BUSY")).show()
+                continue
+            device.targetSendFileName = self.targetSendFileName
+            device._autoPrint = self._autoPrint
+            devices.append(device)
+
+        connects = [Thread(target=device._qidi.connect, daemon=True) for device in devices if not device._qidi._connected]
+        for thread in connects:
+            thread.start()
+        for thread in connects:
+            thread.join()
+
+        upload = self._qidi.prepareUpload()
+        same = [device for device in devices if upload is not None and device._qidi._config == upload.config]
+        senders = []
+        for device in same:
+            device._showUploadMessage()
+            senders.append(Thread(target=device.startSendingThread, kwargs={'upload': upload}, daemon=True, name=device.name + " File Send"))
+        for thread in senders:
+            thread.start()
+        for thread in senders:
+            thread.join()
+
+        for device in devices:
+            if device not in same:
+                device._showUploadMessage()
+                device.startSendingThread()
+
+    @pyqtProperty("QVariantList", constant=True)
+    def groupPrinters(self):
+        return sorted(name for name, device in self._peers.items() if device is not self)
+
+    def _showUploadMessage(self):
+        self._message = Message(
+            catalog.i18nc("@info:status", "Uploading to {}").format(self._name),
+            title=catalog.i18nc("@label", "Print jobs"),
+            progress=-1, lifetime=0, dismissable=False, use_inactivity_timer=False
+        )
+        self._message.addAction("ABORT", catalog.i18nc("@action:button", "Cancel"), None, "")
+        self._message.actionTriggered.connect(self._onActionTriggered)
+        self._message.show()
 
     def _onActionTriggered(self, message, action):
         if self._message:
@@ -367,6 +475,14 @@ class QidiPrintOutputDevice(PrinterOutputDevice):
     def getProperties(self):
         return self._properties
 
+    @pyqtSlot(str, int, int, result="QVariantList")
+    def getHistory(self, field, seconds, points):
+        # [time, min, max] of a telemetry field over the last seconds, at most points entries for a chart
+        if field not in QidiTelemetry.COLUMNS or points < 1:
+            return []
+        times, lows, highs = self._qidi.telemetry.downsample(points, time() - seconds, None, [field])
+        return [[float(t), float(low[0]), float(high[0])] for t, low, high in zip(times, lows, highs)]
+
     @pyqtSlot(str, result=str)
     def getProperty(self, key):
         key = key.encode("utf-8")
@@ -380,8 +496,13 @@ class QidiPrintOutputDevice(PrinterOutputDevice):
         if isinstance(cmd, str):
             self._qidi.sendCommand(cmd)
         elif isinstance(cmd, list):
-            for eachCommand in cmd:
-                self._qidi.sendCommand(eachCommand)
+            # waits for the replies, or for a running upload to send them, so not on the GUI thread
+            Thread(target=self.__send_commands, args=(cmd,), daemon=True, name=self._name + " Commands").start()
+
+    def __send_commands(self, commands):
+        res = self._qidi.sendCommands(commands)
+        if res != QidiResult.SUCCES:
+            Logger.log("w", "{} did not acknowledge all of {}: {}", self._name, commands, res)
 
     @pyqtProperty(str, notify=printerStatusChanged)
     def status(self):
@@ -398,31 +519,33 @@ class QidiPrintOutputDevice(PrinterOutputDevice):
     def getFirmwareName(self):
         return self._qidi._firmware_ver
 
-    @pyqtProperty(str, notify=printerStatusChanged)
-    def xPosition(self) -> bool:
-        if "x_pos" in self._qidi._status:
-            return self._qidi._status["x_pos"][:-1]
-        else:
-            return ""
+    @pyqtProperty(str, notify=positionChanged)
+    def xPosition(self) -> str:
+        return self.__format_position(self._qidi.snapshot.status.x_pos)
 
-    @pyqtProperty(str, notify=printerStatusChanged)
-    def yPosition(self) -> bool:
-        if "y_pos" in self._qidi._status:
-            return self._qidi._status["y_pos"][:-1]
-        else:
+    @pyqtProperty(str, notify=positionChanged)
+    def yPosition(self) -> str:
+        return self.__format_position(self._qidi.snapshot.status.y_pos)
+
+    @pyqtProperty(str, notify=positionChanged)
+    def zPosition(self) -> str:
+        return self.__format_position(self._qidi.snapshot.status.z_pos)
+
+    @staticmethod
+    def __format_position(position):
+        if position is None:
             return ""
+        return "{:.2f}".format(position)
 
-    @pyqtProperty(str, notify=printerStatusChanged)
-    def zPosition(self) -> bool:
-        if "z_pos" in self._qidi._status:
-            return self._qidi._status["z_pos"][:-1]
-        else:
+    @pyqtProperty(str, notify=coolingFanChanged)
+    def coolingFan(self) -> str:
+        fan = self._qidi.snapshot.status.fan
+        if fan is None:
             return ""
+        return "{}".format(int(fan/2.55))
 
-    @pyqtProperty(str, notify=printerStatusChanged)
-    def coolingFan(self) -> bool:
-        if "fan" in self._qidi._status:
-            fan = float(self._qidi._status["fan"])
-            return "{}".format(int(fan/2.55))
-        else:
+    @pyqtProperty(str, notify=currentLayerChanged)
+    def currentLayer(self) -> str:
+        if self._current_layer is None:
             return ""
+        return str(self._current_layer)
@@ -35,6 +35,8 @@ class QidiPrintPlugin(QObject, OutputDevicePlugin):
         self.removePrinterSignal.connect(self.removePrinter)
         self._preferences = Application.getInstance().getPreferences()
         self._preferences.addPreference("QidiPrint/instances", json.dumps({}))
+        self._preferences.addPreference("QidiPrint/scantime", QidiFinderJob.SCAN_DURATION)
+        self._preferences.addPreference("QidiPrint/sweep", "")  # 'auto' or CIDR ranges, for networks that drop broadcasts
         Application.getInstance().globalContainerStackChanged.connect(self.onglobalContainerStackChanged)
 
         self._printers = {}
@@ -125,6 +127,9 @@ class QidiPrintPlugin(QObject, OutputDevicePlugin):
     def startDiscovery(self):
         if self._scan_job.isRunning() is True:
             return
+        self._scan_job.duration = float(self._preferences.getValue("QidiPrint/scantime"))
+        self._scan_job.expected = {instance['ip'] for instance in self._instances.values() if 'ip' in instance}
+        self._scan_job.sweep = self._preferences.getValue("QidiPrint/sweep")
         self._scan_job.start()
 
     def stop(self):
@@ -177,7 +182,7 @@ class QidiPrintPlugin(QObject, OutputDevicePlugin):
         # Check if printer instance is already in OutputDeviceManager
         printer = self.getOutputDeviceManager().getOutputDevice(name)
         if not printer:
-            printer = QidiPrintOutputDevice.QidiPrintOutputDevice(name, address)
+            printer = QidiPrintOutputDevice.QidiPrintOutputDevice(name, address, self._printers)
         self._printers[name] = printer
         self.printerListChanged.emit()
 
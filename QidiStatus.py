@@ -0,0 +1,72 @@
+from collections import namedtuple
+
+import re
+
+
+# key, then one to three numbers separated by '/', e.g. B:60/60, D:10/100/0 or X:12.500
+_FIELD_RE = re.compile(r'(?<!\S)(E1|E2|B|F|D|X|Y|Z|T):(-?[0-9.]+)(?:/(-?[0-9.]+))?(?:/(-?[0-9.]+))?')
+
+_FIELDS = ('bed_nowtemp', 'bed_targettemp', 'e1_nowtemp', 'e1_targettemp', 'e2_nowtemp', 'e2_targettemp',
+           'fan', 'x_pos', 'y_pos', 'z_pos', 'print_now', 'print_total', 'idle', 'printing_time')
+
+
+class QidiStatus(namedtuple('QidiStatus', _FIELDS)):
+    # One parsed M4000 reply. Immutable, so a poller can replace it while the UI reads the previous one.
+    # None marks a value the printer has not reported yet.
+    __slots__ = ()
+
+    # key -> column of its first value, numbers the printer sends for it
+    _KEYS = {'B': (0, 2), 'E1': (2, 2), 'E2': (4, 2), 'F': (6, 2), 'X': (7, 1), 'Y': (8, 1), 'Z': (9, 1),
+             'D': (10, 3), 'T': (13, 1)}
+
+    def __new__(cls, **fields):
+        return super().__new__(cls, *(fields.get(name) for name in cls._fields))
+
+    def changes(self, other):
+        # names of the fields that differ from another status
+        return frozenset(name for name, mine, theirs in zip(self._fields, self, other) if mine != theirs)
+
+    @classmethod
+    def parse(cls, msg, previous=None):
+        # the status after an M4000 reply, fields missing in the reply keep their previous value. Returns
+        # the new status and the keys that could not be parsed.
+        values = list(previous) if previous is not None else [None] * len(cls._fields)
+        errors = []
+        for key, first, second, third in _FIELD_RE.findall(msg):
+            column, count = cls._KEYS[key]
+            try:
+                if count != (3 if third else 2 if second else 1):
+                    raise ValueError(key)
+                if key == 'D':
+                    values[column:column + 3] = int(first), int(second), third == '1'
+                elif key == 'T':
+                    values[column] = int(first)
+                elif key == 'F' or count == 1:
+                    values[column] = float(first)  # the second number of F is not used
+                else:
+                    values[column:column + 2] = float(first), float(second)
+            except ValueError:
+                errors.append(key)
+        return tuple.__new__(cls, values), errors
+
+
+class QidiSnapshot(namedtuple('QidiSnapshot', ('status', 'printing', 'filename'))):
+    # What the UI reads about a printer, published by the poller as a whole with one reference swap.
+    # Readers take the current snapshot once and read everything from it.
+    __slots__ = ()
+
+    @property
+    def print_now(self):
+        return self.status.print_now or 0
+
+    @property
+    def print_total(self):
+        return self.status.print_total or 0
+
+    @property
+    def printing_time(self):
+        return self.status.printing_time or 0
+
+    @property
+    def idle(self):
+        return bool(self.status.idle)
@@ -0,0 +1,77 @@
+import numpy
+
+from threading import Lock
+
+
+class QidiTelemetry:
+    # Status history of one printer in a fixed size ring buffer, one row of float32 per M4000 poll.
+    # NaN marks a value the printer did not report.
+    FIELDS = ('bed_nowtemp', 'bed_targettemp', 'e1_nowtemp', 'e1_targettemp', 'e2_nowtemp', 'e2_targettemp',
+              'fan', 'x_pos', 'y_pos', 'z_pos', 'print_now', 'print_total')
+    COLUMNS = {name: column for column, name in enumerate(FIELDS)}
+
+    def __init__(self, capacity):
+        # only the rows written so far are ever read, the memory is committed as the buffer fills up
+        self._times = numpy.empty(capacity, dtype=numpy.float64)
+        self._values = numpy.empty((capacity, len(self.FIELDS)), dtype=numpy.float32)
+        self._next = 0
+        self._count = 0
+        self._lock = Lock()  # the poller records while the UI reads
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def capacity(self):
+        return len(self._times)
+
+    def record(self, timestamp, values):
+        # values in the order of FIELDS, timestamps never go back so windows can be bisected
+        with self._lock:
+            if self._count:
+                timestamp = max(timestamp, self._times[self._next - 1])
+            self._times[self._next] = timestamp
+            self._values[self._next] = values
+            self._next = (self._next + 1) % len(self._times)
+            self._count = min(self._count + 1, len(self._times))
+
+    def window(self, start=None, end=None, fields=None):
+        # copies of the times and values recorded in [start, end), oldest first
+        columns = [self.COLUMNS[field] for field in fields] if fields is not None else slice(None)
+        times = []
+        values = []
+        with self._lock:
+            for part in self.__parts():
+                part_times = self._times[part]
+                first = 0 if start is None else numpy.searchsorted(part_times, start, 'left')
+                last = len(part_times) if end is None else numpy.searchsorted(part_times, end, 'left')
+                if first < last:
+                    times.append(part_times[first:last])
+                    values.append(self._values[part][first:last][:, columns])
+            if times:
+                return numpy.concatenate(times), numpy.concatenate(values)  # copied before the next record
+        width = len(self.FIELDS) if fields is None else len(fields)
+        return numpy.empty(0, dtype=numpy.float64), numpy.empty((0, width), dtype=numpy.float32)
+
+    def downsample(self, points, start=None, end=None, fields=None):
+        # at most `points` buckets of equal duration with the smallest and largest value of each, so a
+        # plot keeps every peak no matter how many samples fall on one pixel. Empty buckets are left out.
+        if points < 1:
+            raise ValueError('points must be at least 1, got {}'.format(points))
+        times, values = self.window(start, end, fields)
+        if len(times) <= points:
+            return times, values, values
+        start = times[0] if start is None else start
+        end = times[-1] if end is None else end
+        step = max((end - start) / points, 1e-9)
+        buckets = numpy.minimum(((times - start) / step).astype(numpy.int64), points - 1)
+        firsts = numpy.flatnonzero(numpy.diff(buckets, prepend=-1))
+        return (start + buckets[firsts] * step,
+                numpy.fmin.reduceat(values, firsts, axis=0),
+                numpy.fmax.reduceat(values, firsts, axis=0))
+
+    def __parts(self):
+        # the filled part of the ring as up to two slices in recording order
+        if self._count < len(self._times):
+            return [slice(0, self._count)]
+        return [slice(self._next, len(self._times)), slice(0, self._next)]
@@ -0,0 +1,64 @@
+# Framing of the file block datagrams, before and after the reused buffer and folded XOR checksum.
+# Runs with the same Python, PyQt5 and Uranium the plugin runs with:
+#   python benchmarks/bench_block_framing.py [blocks]
+import importlib
+import io
+import os
+import struct
+import sys
+import timeit
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(PLUGIN_DIR))
+QidiConnectionManager = importlib.import_module(os.path.basename(PLUGIN_DIR) + ".QidiConnectionManager").QidiConnectionManager
+
+BUFSIZE = 1280
+
+
+def old_block(buff, seek):
+    # the framing of __send_file_block before the change
+    check_sum = 0
+    buff += b"000000"
+    dataArray = bytearray(buff)
+    seekArray = struct.pack('>I', seek)
+    datSize = len(dataArray) - 6
+    dataArray[datSize] = seekArray[3]
+    dataArray[datSize + 1] = seekArray[2]
+    dataArray[datSize + 2] = seekArray[1]
+    dataArray[datSize + 3] = seekArray[0]
+    for i in range(0, datSize + 4, 1):
+        check_sum ^= dataArray[i]
+    dataArray[datSize + 4] = check_sum
+    dataArray[datSize + 5] = 131
+    return dataArray
+
+
+def main(blocks=2000):
+    data = os.urandom(BUFSIZE * blocks + BUFSIZE // 3)  # with a short last block
+    manager = QidiConnectionManager("127.0.0.1", os.path.join(PLUGIN_DIR, "bench.gcode"))
+    manager.BUFSIZE = BUFSIZE
+    read_block = manager._QidiConnectionManager__read_file_block
+
+    fp = io.BytesIO(data)
+    for seek in range(0, len(data), BUFSIZE):
+        assert bytes(read_block(fp, seek)) == bytes(old_block(data[seek:seek + BUFSIZE], seek))
+
+    def run_old():
+        fp = io.BytesIO(data)
+        for seek in range(0, len(data), BUFSIZE):
+            old_block(fp.read(BUFSIZE), seek)
+
+    def run_new():
+        fp = io.BytesIO(data)
+        for seek in range(0, len(data), BUFSIZE):
+            read_block(fp, seek)
+
+    count = -(-len(data) // BUFSIZE)
+    print("{} blocks of {} bytes, frames identical, best of 5".format(count, BUFSIZE))
+    for name, run in (("before", run_old), ("after", run_new)):
+        seconds = min(timeit.repeat(run, number=1, repeat=5))
+        print("  {:6s} {:>9,.0f} blocks/s".format(name, count / seconds))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
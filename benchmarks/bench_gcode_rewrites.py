@@ -0,0 +1,128 @@
+# The g-code rewrites of an upload, before and after they were merged into one streaming pass, on a
+# Cura-like gcode_list of about a million lines. Runs with the same Python, PyQt5, Uranium and Cura
+# the plugin runs with:
+#   python benchmarks/bench_gcode_rewrites.py [lines]
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ChituCodeWriter import ChituPostProcessor, ChamberFanRewrite, GcodeRewrite, TimeInfoRewrite, getValue
+
+THUMBNAIL = ";thumbnail\n" * 200  # the M4010 block from the thumbnail cache
+
+
+class CachedThumbnail(GcodeRewrite):
+    def layer(self, index, count):
+        return THUMBNAIL + "\n" if index == 0 else ""
+
+
+def gcode_list(lines, seed=1):
+    rand = random.Random(seed)
+    data = [";FLAVOR:Marlin\n;TIME:6666\n;Filament used: 1m\nM104 S200\n", ";Generated\nG28\nG92 E0\n"]
+    count = layer = 0
+    while count < lines:
+        moves = rand.randint(100, 900)
+        count += moves + 2
+        data.append(";LAYER:%d\n" % layer
+                    + "".join("G1 X%.3f Y%.3f E%.5f\n" % (rand.random() * 200, rand.random() * 200, rand.random()) for _ in range(moves))
+                    + ";TIME_ELAPSED:%.6f\n" % (layer * 1.5))
+        layer += 1
+    data.append(";TIME_ELAPSED:9999.5\n;End of Gcode\nM104 S0\nM84\n")
+    data.append(';SETTING_3 {"global_quality": "x"}\n;SETTING_3 y')
+    return data
+
+
+def old_chamber_fan(data, at_layer):
+    # updateChamberFan of the output device before the change, on the scene's gcode_list
+    for layer in data:
+        lines = layer.split("\n")
+        for line in lines:
+            if ";LAYER:" in line:
+                index = data.index(layer)
+                current_layer = int(line.split(":")[1])
+                if current_layer == at_layer:
+                    layer = "M106 T-2 ;Enable chamber loop\n" + layer
+                    data[index] = layer
+                    data[-1] = "M107 T-2 ;Disable chamber loop\n" + data[-1]
+                    return
+
+
+def insert_time_infos(lines):
+    for line in lines:
+        if line.startswith(';TIME:'):
+            yield 'M2100 T%d\n' % int(getValue(line, ';TIME:', 0))
+        elif line.startswith(';TIME_ELAPSED:'):
+            yield 'M2101 T%d\n' % int(getValue(line, ';TIME_ELAPSED:', 0))
+        else:
+            yield line + "\n"
+
+
+class OldTimeInfoStream:
+    # the stream ChituCodeWriter wrote through before the change
+    def __init__(self, stream):
+        self._stream = stream
+        self._pending = ""
+
+    def write(self, data):
+        data = self._pending + data
+        end = data.rfind("\n") + 1
+        self._pending = data[end:]
+        if ";TIME" in data:
+            self._stream.write("".join(insert_time_infos(data[:end - 1].split("\n"))) if end else "")
+        else:
+            self._stream.write(data[:end])
+        return len(data)
+
+    def close(self):
+        self._stream.write("".join(insert_time_infos([self._pending])))
+        self._pending = ""
+
+
+def run_old(gcode, at_layer):
+    data = list(gcode)  # the old code changed the scene's list in place
+    start = time.perf_counter()
+    if at_layer is not None:
+        old_chamber_fan(data, at_layer)
+    out = io.StringIO()
+    stream = OldTimeInfoStream(out)
+    stream.write(THUMBNAIL)
+    stream.write("\n")
+    for element in data:
+        stream.write(element)
+    stream.close()
+    return out.getvalue(), time.perf_counter() - start
+
+
+def run_new(gcode, at_layer):
+    start = time.perf_counter()
+    rewrites = [CachedThumbnail(), TimeInfoRewrite()]
+    if at_layer is not None:
+        rewrites.append(ChamberFanRewrite(at_layer))
+    out = io.StringIO()
+    stream = ChituPostProcessor(out, rewrites, len(gcode))
+    for element in gcode:
+        stream.write(element)
+    stream.close()
+    return out.getvalue(), time.perf_counter() - start
+
+
+def main(lines=1000000):
+    gcode = gcode_list(lines)
+    layers = sum(1 for element in gcode if element.startswith(";LAYER:"))
+    print("{:,} lines, {:.1f} MB, {} layers, best of 3".format(sum(element.count("\n") for element in gcode),
+                                                             sum(map(len, gcode)) / 1e6, layers))
+    for label, at_layer in (("no chamber fan", None), ("chamber fan at layer 500", 500),
+                            ("chamber fan at the last layer", layers - 1)):
+        old_output, _ = run_old(gcode, at_layer)
+        new_output, _ = run_new(gcode, at_layer)
+        assert old_output == new_output, label
+        old_time = min(run_old(gcode, at_layer)[1] for _ in range(3))
+        new_time = min(run_new(gcode, at_layer)[1] for _ in range(3))
+        print("  {:30s} {:.2f} s -> {:.2f} s".format(label, old_time, new_time))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
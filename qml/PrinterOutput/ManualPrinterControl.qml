@@ -66,6 +66,17 @@ Item
                 height: UM.Theme.getSize("setting_control").height
                 verticalAlignment: Text.AlignVCenter
             }        
+
+            Label
+            {
+                text: connectedPrinter != null && connectedPrinter.currentLayer != "" ? "Layer: " + connectedPrinter.currentLayer : ""
+                color: UM.Theme.getColor("setting_control_text")
+                font: UM.Theme.getFont("default")
+
+                width: Math.floor(parent.width * 0.4) - UM.Theme.getSize("default_margin").width
+                height: UM.Theme.getSize("setting_control").height
+                verticalAlignment: Text.AlignVCenter
+            }
         }
         
         MonitorSection
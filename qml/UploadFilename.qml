@@ -14,11 +14,12 @@ UM.Dialog
     property bool validName: true;
     property string validationError;
     property string dialogTitle: "Upload Filename";
+    property var groupSelection: [];
 
     title: dialogTitle;
 
     minimumWidth: screenScaleFactor * 400
-    minimumHeight: screenScaleFactor * 120
+    minimumHeight: screenScaleFactor * (120 + (manager.groupPrinters.length > 0 ? 25 * (manager.groupPrinters.length + 1) : 0))
 
     property variant catalog: UM.I18nCatalog { name: "uranium"; }
 
@@ -55,6 +56,24 @@ UM.Dialog
             checked: true
             text: "Auto Print"
         }           
+
+        Label {
+            visible: manager.groupPrinters.length > 0;
+            text: "Also send to:";
+        }
+
+        Repeater {
+            model: manager.groupPrinters;
+            CheckBox {
+                text: modelData
+                onCheckedChanged: {
+                    var selection = base.groupSelection.filter(function(name) { return name != modelData; });
+                    if (checked)
+                        selection.push(modelData);
+                    base.groupSelection = selection;
+                }
+            }
+        }
     }
 
     rightButtons: [
@@ -0,0 +1,1654 @@
+;FLAVOR:Marlin
+;TIME:17711
+M104 S210
+M140 S60
+M190 S60
+M109 S210
+G28 ;Home
+G92 E0
+G1 Z15.0 F6000
+M117 Printing hello world  
+M106 S255
+M107
+G21
+G90
+M82
+M4010 I1 T0 'abcdef'
+T0
+G1 X115.049 Y119.433 E1.60453
+G1 F2700 X247.020 Y173.098 E1.60453
+G1 X176.861 Y144.621 E1.66123
+G1 F600 X275.333 Y131.306 E1.66123
+G0 X157.29 Y118.18
+G1 X161.964 Y110.736 E1.70587
+G0 X164.92 Y187.52
+G1 F30000 X-28.117 Y145.031 E1.70587
+G1 X128.469 Y127.502 E2.17204
+G1 X111.719 Y177.006 E2.75160
+G1 X124.873 Y189.403 E4.03619
+G0 X119.67 Y136.62
+G1 F30000 X429.322 Y143.769 E4.03619
+G0 X163.62 Y134.27
+G1 X177.696 Y150.423 E5.80115
+G1 X129.419 Y173.792 E5.87020
+G1 X153.904 Y166.243 E6.21621
+G1 X145.117 Y150.674 E6.96562
+G1 F30000 X367.569 Y139.642 E6.96562
+G1 F2700 X-142.168 Y166.271 E6.96562
+G1 X150.000 Y150.000 A0.59 B0.39
+G1 X188.566 Y171.642 E7.97010
+G1 X128.574 Y151.102 E9.69068
+M117 Layer 23 of 99
+G1 X131.542 Y153.840 E10.60894
+M117 Layer 25 of 99
+;LAYER:26
+G0 F9000 X172.692 Y175.639 Z0.4
+;TIME_ELAPSED:9.620000
+G0 X169.24 Y174.73
+G1 X144.087 Y114.490 E11.73166
+G0 X155.60 Y125.99
+G1 X138.543 Y137.686 E12.70151
+G1 X158.996 Y146.652 E13.94849
+G1 X124.177 Y156.757 E14.40770
+G0 X173.88 Y173.77
+G0 X130.42 Y177.34
+G1 X111.335 Y111.165 E14.57416
+G1 F1200 X1.931 Y173.783 E14.57416
+G1 X123.398 Y130.417 E15.15473
+M117 Layer 38 of 99
+G1 X133.559 Y166.210 E16.45114
+G1 X134.960 Y137.467 E16.67952
+G1 F1800 X-100.393 Y181.985 E16.67952
+G1 X158.452 Y175.363 E17.09770
+G1 X121.717 Y167.507 E17.13343
+G1 X164.254 Y153.576 E18.54264
+G1 X173.825 Y151.328 E20.49383
+G1 X141.592 Y156.068 E21.79084
+G1 X114.703 Y133.888 E23.05274
+N48 G1 X1 Y2*6
+G1 X134.829 Y185.143 E24.76977
+G1 F2700 X191.562 Y120.431 E24.76977
+G1 X157.247 Y127.407 E26.47082
+G1 F2700 E19.97082
+G1 F2700 E26.47082
+G1 X179.591 Y172.401 E28.12665
+G1 X126.033 Y117.922 E28.20149
+G1 X157.313 Y149.388 E29.99463
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X111.376 Y158.970 E31.00284
+G1 X122.557 Y178.603 E31.56554
+G0 X155.07 Y120.81
+G1 X117.712 Y140.339 E32.09862
+G1 X177.015 Y152.746 E33.92750
+G1 F30000 X-19.830 Y168.037 E33.92750
+G1 X182.879 Y127.037 E34.26689
+G1 F30000 X153.769 Y130.423 E34.26689
+G1 X128.815 Y185.520 E34.49472
+G1 F2700 X-83.379 Y154.094 E34.49472
+G1 X115.855 Y179.293 E34.57299
+G1 F1200 X48.174 Y159.215 E34.57299
+G1 F2700 X-120.943 Y154.022 E34.57299
+G1 X139.191 Y133.644 E36.47749
+G1 X181.741 Y118.618 E36.70612
+G1 X159.094 Y111.164 E37.29759
+G1 X173.190 Y125.034 E38.94983
+G1 F30000 X99.449 Y119.245 E38.94983
+G1 X169.521 Y118.227 E39.43268
+G1 F2700 E32.93268
+G1 F2700 E39.43268
+G1 X182.738 Y133.522 E41.37320
+G1 X118.010 Y162.164 E42.32722
+G1 X188.607 Y133.644 E42.34824
+G1 X135.062 Y115.037 E43.24792
+G1 F2700 E36.74792
+G1 F2700 E43.24792
+N82 G1 X1 Y2*58
+G1 X159.425 Y188.396 E43.67831
+G1 X162.947 Y130.727 E45.05469
+G1 X129.710 Y116.510 E45.66933
+G1 X145.832 Y162.161 E47.63609
+G1 X141.238 Y134.543 E49.51756
+G1 X177.771 Y181.480 E50.15103
+G1 X153.538 Y156.319 E50.81969
+G1 X111.630 Y129.501 E51.30989
+G1 X115.673 Y116.010 E52.41230
+G1 X173.375 Y149.461 E52.99394
+G0 X122.33 Y150.11
+G1 F600 X155.933 Y163.220 E52.99394
+G1 X121.323 Y179.244 E53.29307
+G1 X176.775 Y158.151 E54.71172
+G1 X153.639 Y167.810 E55.12520
+G1 F30000 X344.468 Y182.572 E55.12520
+G0 X169.69 Y165.17
+G1 X122.632 Y167.186 E55.99047
+G1 X115.153 Y187.071 E56.49565
+G0 X153.94 Y153.31
+G0 X146.26 Y141.66
+G1 X111.953 Y161.715 E57.01158
+G1 X114.986 Y138.395 E58.15279
+G1 X130.729 Y176.315 E58.40305
+G1 X158.996 Y128.682 E59.20521
+;LAYER:108
+G0 F9000 X152.296 Y150.072 Z0.6
+;TIME_ELAPSED:39.960000
+G1 X164.921 Y168.514 E60.08185
+G1 X148.306 Y128.005 E61.07199
+G1 X182.555 Y183.417 E62.19281
+G1 X113.856 Y115.724 E63.48564
+G1 X122.757 Y171.282 E65.24048
+G0 X134.94 Y165.40
+G0 X139.73 Y166.10
+G1 F30000 X-115.617 Y119.860 E65.24048
+G1 X140.176 Y122.462 E66.26839
+G1 X167.568 Y172.581 E68.15177
+G1 X160.958 Y140.718 E68.93899
+G0 X153.54 Y189.54
+G1 X130.415 Y118.084 E69.11979
+G1 F600 X444.041 Y121.130 E69.11979
+G1 F600 X114.838 Y183.945 E69.11979
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X144.634 Y123.180 E70.72522
+G1 X182.711 Y186.754 E70.97788
+G1 X142.658 Y119.447 E72.17923
+G1 X169.966 Y110.321 E72.67567
+G1 X111.683 Y160.202 E73.55321
+G1 X126.528 Y132.783 E75.22388
+G1 X156.859 Y130.071 E75.77033
+G1 X174.692 Y187.889 E77.35251
+G1 X178.456 Y171.525 E78.33413
+G1 X132.724 Y118.651 E79.10064
+G0 X119.45 Y169.78
+G1 X170.885 Y187.882 E81.03053
+G1 X155.806 Y134.900 E82.03127
+G1 X152.272 Y110.068 E82.74491
+G1 X134.384 Y141.952 E83.64402
+G1 F30000 X145.071 Y161.813 E83.64402
+G1 X110.310 Y132.210 E84.05184
+G1 X176.354 Y150.877 E85.81517
+G1 X150.000 Y150.000 A0.46 B0.83
+G1 X189.007 Y134.427 E87.30443
+G1 X152.476 Y138.754 E88.54450
+;LAYER:146
+G0 F9000 X141.133 Y144.070 Z0.8
+;TIME_ELAPSED:54.020000
+G1 X156.754 Y168.706 E90.26699
+G0 X169.90 Y149.42
+G1 F1800 X232.992 Y142.560 E90.26699
+G1 X184.969 Y172.598 E91.53445
+G0 X171.40 Y175.23
+G1 X131.167 Y166.642 E92.23335
+G0 X153.54 Y122.17
+G0 X148.76 Y147.37
+G1 X169.580 Y143.808 E93.25392
+G1 X111.579 Y150.573 E94.56760
+M106 S47
+M204 S500 P1000
+G1 X158.400 Y126.711 E95.94542
+G1 X131.526 Y115.991 E97.71747
+G0 X151.86 Y139.46
+G1 X123.484 Y162.245 E99.19092
+G1 F30000 X2.647 Y158.773 E99.19092
+G1 X123.789 Y173.181 E100.31301
+G0 X136.37 Y127.79
+N165 G1 X1 Y2*90
+G1 X178.142 Y179.475 E101.63469
+G1 X184.650 Y129.874 E103.49069
+G1 X168.586 Y179.684 E103.63577
+G1 X184.635 Y121.854 E104.79863
+M106 S235
+M204 S500 P1000
+G1 X121.048 Y167.260 E105.07587
+G1 X129.239 Y167.453 E106.57862
+G1 F1800 X-126.335 Y128.210 E106.57862
+G1 X186.426 Y113.598 E108.43584
+G0 X111.86 Y170.19
+G1 X152.283 Y167.917 E109.42476
+G0 X145.38 Y163.03
+G1 X123.815 Y127.765 E110.65124
+G1 X170.049 Y187.875 E111.55087
+G1 X153.762 Y141.167 E112.11815
+G1 X149.707 Y118.876 E112.63390
+G1 X111.233 Y110.418 E112.79161
+G1 X177.833 Y132.977 E114.56927
+G1 X175.938 Y161.684 E114.88940
+G1 F600 X-160.284 Y121.614 E114.88940
+G1 X140.359 Y120.398 E115.00364
+G1 X182.487 Y112.838 E116.68360
+G1 X113.425 Y131.887 E118.36485
+G1 X112.210 Y161.001 E118.54693
+G1 F1200 X254.330 Y141.176 E118.54693
+G1 X161.328 Y129.447 E120.48612
+G1 X157.240 Y137.969 E122.35645
+G1 X151.774 Y114.864 E123.47696
+G1 X125.949 Y180.408 E124.30226
+G1 X167.084 Y169.463 E125.62704
+G1 F600 X-8.988 Y188.112 E125.62704
+G1 X178.366 Y178.173 E127.46433
+G1 X175.044 Y147.533 E127.64677
+G1 X113.209 Y152.517 E129.61614
+G1 X141.615 Y166.612 E129.87255
+G0 X111.97 Y151.96
+G1 X116.863 Y112.735 E131.47333
+G1 X135.057 Y120.400 E132.93855
+G1 F600 X377.750 Y134.300 E132.93855
+G1 X154.574 Y136.409 E133.42933
+G1 X186.504 Y156.731 E134.99657
+G1 X145.889 Y189.042 E136.30172
+G1 F30000 X278.823 Y152.850 E136.30172
+G0 X176.53 Y133.31
+G1 X151.686 Y117.790 E137.04242
+G1 X113.486 Y175.196 E138.19223
+G1 X133.866 Y138.209 E138.81953
+G1 X150.085 Y152.090 E140.31656
+G1 X136.046 Y136.205 E142.14540
+G1 X148.376 Y183.031 E144.10422
+G92 E0
+N217 G1 X1 Y2*10
+G92 E0
+G0 X120.77 Y151.90
+G1 X172.716 Y166.233 E1.98500
+G1 F1800 X463.987 Y173.753 E1.98500
+G1 X157.861 Y137.236 E2.59977
+G1 X130.010 Y127.691 E2.65792
+G1 X171.306 Y185.136 E2.88344
+G1 X188.288 Y164.505 E4.50690
+G1 F1200 X-2.514 Y160.571 E4.50690
+G1 X115.825 Y178.050 E4.66389
+G1 X178.947 Y111.748 E5.01062
+G1 X166.822 Y132.700 E6.70588
+G0 X157.85 Y179.24
+G0 X144.04 Y164.05
+G1 X173.853 Y168.065 E8.59535
+G0 X189.85 Y130.52
+G1 X171.627 Y151.143 E10.08892
+G1 X180.616 Y173.699 E10.89640
+G1 X178.091 Y146.676 E10.97664
+G1 X165.307 Y110.441 E11.57535
+G1 X180.975 Y169.749 E12.18066
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X154.110 Y152.050 E13.32460
+G1 X186.269 Y142.664 E14.96173
+G1 X134.153 Y150.505 E15.57725
+G1 X188.126 Y123.038 E16.67724
+G1 X168.891 Y155.273 E18.66630
+G1 X184.922 Y181.626 E19.47058
+G1 X184.013 Y177.707 E21.26807
+G1 X173.673 Y139.811 E22.19680
+G1 F2700 X321.927 Y141.077 E22.19680
+G0 X148.70 Y121.58
+G1 X175.124 Y139.421 E24.18681
+G1 X185.970 Y143.033 E25.75913
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X131.894 Y136.872 E26.60063
+G1 F2700 E20.10063
+G1 F2700 E26.60063
+G1 X185.948 Y142.152 E28.25988
+G1 X126.491 Y121.968 E28.38876
+G1 F600 X-7.937 Y148.383 E28.38876
+M117 Layer 258 of 99
+G1 X176.749 Y117.133 E29.83577
+G1 X153.968 Y152.759 E31.82734
+G1 X187.568 Y118.254 E33.71955
+G1 X163.732 Y119.492 E34.55881
+G1 X148.377 Y173.463 E35.11631
+G0 X172.91 Y164.14
+G1 X163.496 Y133.540 E35.89575
+G1 X119.293 Y178.310 E37.70591
+G1 X182.431 Y126.096 E38.47863
+G1 X181.036 Y189.365 E39.31184
+G1 X181.600 Y153.584 E40.29680
+G1 X136.967 Y148.878 E41.81612
+;LAYER:271
+G0 F9000 X189.117 Y162.583 Z1.0
+;TIME_ELAPSED:100.270000
+G92 E0
+N273 G1 X1 Y2*34
+G1 X133.989 Y182.335 E1.25090
+G1 X131.627 Y129.708 E2.26693
+G1 X142.617 Y160.402 E2.77956
+G1 F2700 E-3.72044
+G1 F2700 E2.77956
+G1 X150.749 Y185.669 E4.44846
+G1 X134.464 Y149.306 E5.40875
+G1 X129.333 Y124.093 E6.60676
+G1 F30000 X274.270 Y152.781 E6.60676
+G1 X165.209 Y161.605 E7.25878
+G0 X181.32 Y135.23
+G1 X120.234 Y121.209 E7.91886
+G1 X153.106 Y166.234 E8.09492
+G1 X128.100 Y125.952 E9.46445
+G1 X143.781 Y110.339 E11.23302
+G1 X159.230 Y116.765 E11.84363
+G1 X188.799 Y137.286 E13.20501
+G1 X111.850 Y136.387 E14.24187
+G1 X171.598 Y164.496 E14.74351
+G1 X167.994 Y118.257 E14.89826
+G1 X113.981 Y112.494 E15.43694
+G1 X184.696 Y161.070 E16.23559
+G1 X131.891 Y151.219 E17.59488
+G1 X138.189 Y174.285 E19.49222
+G1 X158.493 Y179.631 E21.17888
+G1 X159.651 Y152.219 E22.53688
+G1 X141.502 Y181.866 E23.60841
+G1 X114.315 Y150.682 E24.70665
+G1 X144.769 Y153.677 E25.13670
+G1 X152.412 Y147.859 E25.67857
+G1 X139.878 Y162.354 E25.88607
+G1 X177.505 Y167.853 E26.97558
+G1 X134.650 Y164.593 E27.03641
+G1 X121.354 Y180.330 E28.86335
+G1 X177.858 Y136.837 E30.54653
+G0 X122.78 Y177.93
+G1 X119.429 Y158.080 E31.42597
+G1 X173.951 Y158.295 E32.75973
+;LAYER:311
+G0 F9000 X186.187 Y183.574 Z1.2
+;TIME_ELAPSED:115.070000
+G1 X154.953 Y180.625 E33.51874
+G1 X157.885 Y143.782 E35.07718
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X114.262 Y147.661 E36.28873
+G1 X110.047 Y113.365 E37.69700
+G1 X150.646 Y138.503 E37.97615
+G1 X182.720 Y162.389 E39.94340
+G0 X175.58 Y129.61
+G0 X129.18 Y154.99
+G1 X172.148 Y183.307 E40.26071
+G1 X137.700 Y162.604 E42.02024
+G1 X150.000 Y150.000 A0.77 B0.06
+G1 X133.515 Y175.291 E42.77285
+G1 X160.794 Y151.520 E44.17133
+G1 X181.311 Y123.776 E45.51740
+G1 X137.279 Y166.834 E46.49228
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X140.659 Y176.708 E48.28689
+G1 X117.976 Y136.849 E49.72007
+N331 G1 X1 Y2*84
+G1 X169.439 Y139.564 E51.07367
+G1 X184.942 Y144.559 E52.40002
+G1 X149.062 Y131.317 E52.64084
+G1 X143.169 Y173.921 E52.66473
+G1 X146.704 Y140.161 E54.54743
+G1 X183.437 Y122.343 E56.17731
+G1 X130.367 Y147.155 E56.38878
+G0 X166.37 Y173.44
+G1 X189.332 Y153.530 E57.77980
+G1 X122.712 Y124.324 E58.62574
+G1 X152.909 Y154.629 E58.77785
+G1 X111.726 Y127.349 E59.52922
+G1 X151.253 Y125.219 E59.61013
+G1 X189.857 Y116.178 E60.83386
+G1 X155.361 Y113.868 E61.76376
+G1 X175.200 Y113.598 E61.95294
+G1 X111.668 Y178.743 E63.50765
+G1 X123.336 Y120.656 E64.95353
+G1 X171.648 Y160.920 E66.60697
+G1 X150.000 Y150.000 A0.80 B0.55
+G1 X174.670 Y149.632 E68.00406
+G1 X130.756 Y132.359 E69.86043
+G1 X116.693 Y138.842 E71.30235
+G92 E0
+G1 X140.741 Y155.237 E0.50455
+G1 X186.705 Y128.073 E2.41226
+G1 X159.474 Y153.441 E3.57095
+G1 F1200 X199.672 Y154.313 E3.57095
+G1 X160.032 Y116.172 E3.96263
+G1 F600 X-150.633 Y142.431 E3.96263
+G1 X157.752 Y163.815 E4.23754
+G1 X177.994 Y121.154 E6.09246
+G1 X141.774 Y169.925 E7.53028
+G1 X121.504 Y149.370 E8.12596
+G1 X133.915 Y166.430 E9.15453
+G1 X159.766 Y118.243 E10.75561
+G1 X159.469 Y114.165 E11.64280
+G1 F1200 X349.854 Y186.531 E11.64280
+G1 X178.319 Y160.674 E11.84938
+G1 X150.618 Y119.725 E12.26513
+G1 F2700 E5.76513
+G1 F2700 E12.26513
+G1 F2700 X252.946 Y151.396 E12.26513
+G0 X156.27 Y168.01
+G1 F1200 X461.134 Y155.017 E12.26513
+G1 X128.453 Y113.017 E13.35512
+G1 X154.349 Y128.649 E14.69631
+G1 X162.931 Y141.884 E15.24369
+G1 X176.703 Y124.932 E16.58226
+G1 X149.076 Y141.515 E18.08984
+G1 F1800 X411.103 Y117.522 E18.08984
+G1 X143.813 Y145.342 E18.17516
+M117 Layer 383 of 99
+G1 X150.780 Y151.746 E18.55516
+G1 X180.200 Y188.518 E19.27462
+G1 F600 X48.264 Y114.144 E19.27462
+G1 X181.302 Y178.304 E20.49584
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X115.190 Y179.277 E21.66249
+G1 X141.996 Y150.938 E21.84646
+G1 X131.433 Y138.175 E22.44905
+N392 G1 X1 Y2*6
+G1 X148.173 Y144.146 E24.26877
+G1 X121.952 Y157.147 E24.90339
+G0 X132.22 Y179.20
+G1 F1800 X95.683 Y189.901 E24.90339
+G1 F30000 X202.309 Y112.955 E24.90339
+G1 X136.564 Y184.631 E25.10523
+G1 F600 X237.977 Y156.618 E25.10523
+G1 X177.771 Y145.697 E26.37394
+G1 X110.272 Y122.857 E27.99464
+G1 X181.681 Y121.857 E28.42251
+G1 X150.691 Y175.718 E29.05691
+G1 X150.000 Y150.000 A0.85 B0.61
+G1 X160.459 Y175.591 E29.18384
+G1 X154.031 Y155.902 E31.12228
+G1 X123.631 Y184.895 E31.27211
+G1 X132.594 Y168.092 E31.43870
+G1 X132.170 Y148.434 E31.85986
+G1 F1800 X333.936 Y174.864 E31.85986
+G1 X154.057 Y137.173 E32.94719
+G1 X112.820 Y175.130 E33.97954
+G1 F600 X-151.626 Y135.238 E33.97954
+G1 F30000 X-143.999 Y157.068 E33.97954
+G1 X143.966 Y187.844 E35.72537
+G1 X120.404 Y156.938 E35.95490
+G1 X125.704 Y114.423 E36.48809
+N418 G1 X1 Y2*42
+G92 E0
+G1 X184.049 Y160.832 E0.70936
+G1 X123.151 Y181.895 E1.68684
+G1 X180.990 Y151.944 E2.14702
+G1 X126.020 Y145.439 E4.03872
+G1 X135.992 Y185.556 E5.05051
+G1 X125.002 Y159.845 E6.23915
+M117 Layer 426 of 99
+G1 X139.078 Y148.987 E7.46648
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X159.581 Y177.674 E8.62240
+G0 X156.58 Y137.11
+G1 X151.138 Y149.547 E9.01299
+G0 X158.64 Y162.83
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G0 X158.00 Y169.07
+G1 F2700 E2.51299
+G1 F2700 E9.01299
+G1 F30000 X131.552 Y176.566 E9.01299
+G1 X155.076 Y174.456 E10.06189
+G1 X134.819 Y158.368 E10.58019
+G1 X181.353 Y128.572 E11.49535
+G1 X184.040 Y165.702 E12.89436
+G1 X144.989 Y161.356 E13.66215
+G1 X110.655 Y170.113 E15.23189
+G1 F1800 X72.392 Y135.958 E15.23189
+G1 X175.922 Y113.979 E16.98781
+G1 F1800 X-93.273 Y189.124 E16.98781
+G1 X165.261 Y186.758 E17.24454
+G1 X186.991 Y166.044 E17.70969
+G1 X150.334 Y155.923 E19.24212
+G1 X143.635 Y152.112 E19.82962
+G1 X115.936 Y125.919 E21.56216
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X160.380 Y129.480 E22.79722
+G1 X122.159 Y189.161 E23.21751
+G1 F1800 X-169.064 Y166.358 E23.21751
+G1 X164.020 Y112.495 E24.21333
+G1 X179.950 Y151.057 E25.32113
+G1 X156.689 Y133.383 E26.52865
+G1 X110.903 Y134.858 E27.08089
+G1 X150.092 Y179.618 E28.06467
+G1 F1800 X109.535 Y172.754 E28.06467
+G1 X151.134 Y123.045 E29.25851
+G1 X180.742 Y127.460 E29.35516
+G1 X167.265 Y111.683 E30.20105
+G1 X137.130 Y172.812 E30.27080
+G1 X147.517 Y131.301 E31.38886
+G1 X181.103 Y124.614 E32.43189
+G1 X187.616 Y166.044 E32.55143
+G1 X119.580 Y155.004 E33.20480
+G1 X124.788 Y127.991 E33.39216
+G1 X114.704 Y135.109 E35.00423
+G1 F600 X363.104 Y122.005 E35.00423
+G1 X137.546 Y157.163 E35.57670
+G1 X163.181 Y119.536 E37.16361
+G1 X119.275 Y186.211 E38.65594
+G0 X127.59 Y132.89
+G1 X129.891 Y112.581 E39.50163
+G1 X137.994 Y146.341 E39.89122
+G0 X162.76 Y159.24
+G0 X140.92 Y144.09
+G1 X180.189 Y182.866 E41.55163
+G1 X115.781 Y173.803 E41.77931
+G0 X152.58 Y183.66
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 F1800 X91.924 Y139.149 E41.77931
+G1 X150.899 Y139.623 E43.69551
+G1 X120.141 Y153.882 E44.29994
+G1 F1200 X122.918 Y160.184 E44.29994
+G1 X158.963 Y128.834 E44.45931
+G1 X178.472 Y134.779 E44.80240
+G1 X180.908 Y183.310 E45.90233
+G0 X164.76 Y115.54
+G1 X188.810 Y168.092 E46.97154
+G1 X186.997 Y150.620 E47.68354
+G0 X178.64 Y172.54
+G1 X137.366 Y119.633 E49.01523
+M106 S16
+M204 S500 P1000
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G0 X166.93 Y173.87
+G1 X134.352 Y155.067 E50.69071
+G1 X128.540 Y133.243 E52.23559
+G1 X188.066 Y127.821 E52.62626
+G1 X122.990 Y116.032 E53.15934
+G1 X181.169 Y158.021 E54.17786
+G0 X173.14 Y179.02
+G1 X124.630 Y179.133 E55.20136
+G1 X132.154 Y128.315 E56.81029
+G1 X111.696 Y148.857 E58.35531
+G1 X116.597 Y128.986 E59.92201
+G1 X145.300 Y162.479 E60.34483
+G1 X165.312 Y176.846 E60.67483
+G1 F600 X-30.754 Y181.172 E60.67483
+G1 X178.262 Y149.997 E62.47734
+G1 X150.894 Y163.142 E63.45373
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X135.420 Y172.697 E64.07685
+G1 X178.086 Y130.966 E64.75284
+G1 X150.000 Y150.000 A0.65 B0.32
+G1 X150.000 Y150.000 A0.91 B0.23
+G1 X179.550 Y186.170 E66.38777
+G1 X122.988 Y133.263 E66.41174
+G1 X159.038 Y132.265 E67.27298
+G1 F30000 X146.257 Y132.504 E67.27298
+G1 X121.425 Y117.568 E67.61773
+G1 X165.711 Y125.381 E69.10665
+G1 X150.000 Y150.000 A0.15 B0.48
+G1 X161.177 Y116.319 E69.18216
+G1 X147.734 Y148.741 E70.22087
+G1 X123.635 Y166.658 E71.26168
+G1 X167.957 Y176.457 E72.03369
+G1 X139.851 Y177.258 E73.22046
+G1 X129.000 Y161.590 E73.92627
+G1 X145.349 Y179.733 E75.62892
+G1 X184.436 Y113.605 E75.89823
+G1 X174.656 Y155.501 E76.57263
+G1 X180.755 Y158.755 E77.72453
+G1 X126.670 Y142.026 E78.05157
+G1 X121.066 Y123.545 E78.68120
+G1 X169.323 Y152.421 E80.29209
+G1 X147.446 Y150.836 E81.70529
+G1 X150.583 Y134.706 E82.74514
+G0 X126.54 Y163.88
+G1 X137.237 Y144.035 E84.37200
+G1 F30000 X300.144 Y159.451 E84.37200
+G1 X145.389 Y176.824 E86.00186
+G1 X117.784 Y141.005 E87.44588
+G1 X145.916 Y178.232 E87.80986
+G1 X188.049 Y145.997 E88.19770
+G1 X172.070 Y123.882 E90.02299
+G1 X172.058 Y154.515 E90.38380
+G1 F600 X454.261 Y154.007 E90.38380
+G1 X136.824 Y169.687 E91.02180
+G1 X132.256 Y142.750 E92.51613
+G1 X142.100 Y179.263 E92.70818
+G0 X159.09 Y178.49
+G1 X137.996 Y120.977 E93.34720
+G1 X188.681 Y180.962 E94.92135
+G1 X165.933 Y144.016 E95.23287
+G1 X154.818 Y185.010 E97.21158
+G1 X167.339 Y134.134 E97.98664
+G1 F30000 X77.657 Y177.937 E97.98664
+G1 X124.377 Y122.267 E98.18728
+G1 X135.487 Y189.573 E98.43405
+G1 X184.787 Y137.283 E99.78776
+G1 X173.925 Y135.863 E100.91249
+G1 X182.614 Y123.287 E102.55998
+G1 X184.678 Y114.130 E104.27768
+G1 X114.923 Y143.580 E105.51699
+G1 X158.020 Y180.472 E106.23602
+G0 X126.73 Y182.18
+G1 X150.000 Y150.000 A0.91 B0.31
+G1 X150.000 Y150.000 A0.38 B0.77
+;LAYER:572
+G0 F9000 X162.106 Y187.469 Z1.4
+;TIME_ELAPSED:211.640000
+G1 X159.249 Y181.550 E107.80330
+G1 X135.620 Y126.301 E109.44905
+G0 X117.66 Y110.32
+G1 X186.159 Y118.912 E111.06621
+G1 F1200 X312.219 Y121.540 E111.06621
+G1 X161.021 Y166.067 E112.15059
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+M106 S106
+M204 S500 P1000
+G1 X153.027 Y187.132 E112.48007
+G1 X151.769 Y144.503 E113.36412
+G0 X158.54 Y168.61
+G1 X111.658 Y172.334 E114.55345
+G1 X157.396 Y112.741 E115.93952
+G1 X147.511 Y189.665 E116.20667
+G1 X132.404 Y169.221 E117.62430
+G1 X150.000 Y150.000 A0.38 B0.03
+G1 X129.271 Y165.134 E118.01832
+G1 F1800 X-143.019 Y175.575 E118.01832
+G1 X175.074 Y171.719 E119.61289
+G1 X118.384 Y167.490 E120.41346
+G1 X150.000 Y150.000 A0.52 B0.65
+G1 X139.717 Y137.912 E120.69889
+G1 F2700 X109.167 Y187.263 E120.69889
+G92 E0
+G1 X129.197 Y129.283 E0.28965
+G1 X145.263 Y117.630 E1.85865
+G1 X152.182 Y113.546 E3.49963
+G0 X132.28 Y120.62
+G1 X139.949 Y143.178 E5.04286
+G1 X150.505 Y120.338 E6.53784
+G1 F2700 E0.03784
+G1 F2700 E6.53784
+G1 X119.378 Y178.951 E6.65797
+G1 X186.067 Y174.415 E6.90706
+G1 X111.980 Y161.030 E7.20798
+G1 X188.369 Y157.170 E8.70840
+G1 X150.105 Y120.297 E9.79660
+G0 X166.54 Y141.49
+G1 X129.343 Y189.827 E11.69962
+G1 X135.378 Y119.343 E13.36468
+G1 X165.812 Y118.349 E14.58657
+G1 X125.671 Y165.172 E16.35261
+G1 X144.547 Y187.187 E16.35980
+G1 X114.946 Y144.321 E17.33494
+G1 X163.613 Y112.318 E18.59097
+G1 F2700 E12.09097
+G1 F2700 E18.59097
+G1 X182.739 Y179.540 E19.02875
+G1 F2700 X112.645 Y114.379 E19.02875
+G1 X145.037 Y133.656 E20.51907
+G1 X187.879 Y141.824 E21.16103
+N622 G1 X1 Y2*88
+G1 X157.750 Y148.192 E22.53152
+G1 X115.053 Y121.827 E23.14424
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G0 X176.16 Y130.73
+G0 X173.16 Y153.30
+G1 X189.823 Y189.902 E23.35791
+G0 X145.66 Y168.37
+G1 F2700 E16.85791
+G1 F2700 E23.35791
+G1 X188.102 Y153.019 E23.60816
+G1 F30000 X348.599 Y172.801 E23.60816
+G1 X167.990 Y150.151 E24.90135
+G1 X117.830 Y135.779 E25.70423
+G1 X155.826 Y180.991 E27.09570
+G1 X137.499 Y179.902 E28.09241
+G1 X159.371 Y174.508 E28.43164
+G1 X170.239 Y126.042 E29.49121
+G1 X127.385 Y150.297 E29.94708
+G0 X177.23 Y144.82
+G1 X174.984 Y115.565 E30.51890
+G1 X189.333 Y144.550 E30.63261
+N643 G1 X1 Y2*60
+G1 X115.432 Y127.183 E32.31363
+G1 X188.485 Y170.594 E34.17562
+M117 Layer 646 of 99
+G1 X150.931 Y121.857 E36.05709
+G1 X174.781 Y114.748 E36.50907
+G1 X175.133 Y127.525 E37.40198
+G1 X166.368 Y140.515 E39.18477
+G1 X184.379 Y158.955 E40.64931
+G1 X173.442 Y133.293 E41.17432
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X160.929 Y163.013 E41.43993
+G1 F2700 X122.519 Y179.200 E41.43993
+G1 X161.635 Y180.890 E43.15424
+G1 F2700 X-41.422 Y136.716 E43.15424
+G1 X119.275 Y149.717 E44.13760
+G1 F30000 X236.086 Y159.972 E44.13760
+G1 X176.975 Y111.906 E46.08122
+G1 X144.062 Y114.852 E47.81875
+G1 X117.630 Y157.857 E48.67885
+G1 X150.698 Y171.374 E49.52341
+G1 X154.897 Y153.031 E51.41032
+G1 X164.189 Y154.922 E52.75476
+G1 F600 X322.979 Y146.334 E52.75476
+G1 F1800 X-81.043 Y116.774 E52.75476
+G1 F2700 X-152.150 Y156.617 E52.75476
+G1 X187.640 Y149.357 E54.28703
+G0 X128.64 Y112.25
+G0 X142.84 Y116.72
+G1 X116.703 Y158.863 E56.08926
+G1 X115.858 Y113.628 E56.17414
+G1 X152.996 Y159.659 E56.78991
+G0 X178.50 Y123.69
+G1 X129.993 Y158.241 E58.54323
+G1 X150.000 Y150.000 A0.63 B0.70
+G1 X176.516 Y135.821 E60.52826
+G1 X148.492 Y179.873 E60.53786
+G1 F1200 X452.269 Y178.884 E60.53786
+G1 X121.019 Y175.161 E61.33527
+N682 G1 X1 Y2*79
+G1 X166.428 Y122.666 E62.10742
+G1 X119.010 Y181.719 E62.90886
+G1 F1800 X157.372 Y173.528 E62.90886
+G1 X115.636 Y128.472 E63.07571
+G1 X154.490 Y110.782 E64.50519
+M117 Layer 688 of 99
+G1 X125.377 Y129.471 E65.58588
+G1 X182.694 Y131.129 E66.79879
+G1 X112.327 Y110.840 E67.37377
+G1 F2700 X-142.871 Y116.153 E67.37377
+G1 X129.731 Y179.582 E67.98223
+G1 X182.483 Y159.855 E68.37158
+G1 X112.063 Y188.235 E69.70830
+G1 X148.017 Y177.009 E70.16312
+M106 S4
+M204 S500 P1000
+G1 X179.701 Y135.625 E70.28853
+G1 X130.877 Y141.872 E71.32344
+G1 X188.943 Y140.837 E72.02728
+G1 X147.237 Y117.081 E73.08447
+G1 F30000 X82.144 Y182.137 E73.08447
+G1 X114.134 Y135.372 E73.13574
+G1 X180.421 Y168.254 E73.92953
+G1 X180.326 Y115.195 E75.59341
+G1 X142.861 Y141.169 E75.85563
+G1 X125.544 Y166.509 E75.94439
+M117 Layer 708 of 99
+G1 F2700 E69.44439
+G1 F2700 E75.94439
+G1 X125.257 Y151.670 E77.08353
+G1 X117.034 Y148.434 E77.40830
+G1 X181.094 Y111.189 E79.09042
+G0 X177.10 Y113.18
+G1 X124.017 Y175.504 E80.04018
+G1 X184.809 Y187.590 E81.66486
+G1 X115.076 Y137.032 E83.41060
+G1 X139.406 Y175.359 E84.43502
+G1 X145.446 Y185.342 E86.12827
+G1 X155.306 Y140.178 E88.11468
+G1 X164.950 Y157.987 E88.32719
+G0 X116.06 Y143.56
+G1 X171.009 Y182.033 E88.44885
+G1 X185.554 Y146.373 E89.97717
+G1 X164.141 Y132.135 E91.75356
+G1 X177.534 Y120.384 E93.28835
+G1 X167.278 Y168.363 E94.66327
+G1 X186.834 Y130.379 E95.43074
+G1 X116.757 Y160.021 E95.48035
+G1 X169.207 Y123.635 E95.91817
+G1 X172.187 Y146.226 E97.19165
+G0 X147.76 Y163.11
+G0 X155.02 Y155.00
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X112.912 Y134.875 E97.22914
+G1 X164.511 Y111.363 E98.46490
+G0 X129.00 Y187.39
+G1 X167.013 Y111.833 E100.15447
+G1 X189.471 Y128.558 E100.94188
+G1 X110.375 Y153.072 E101.29034
+G1 X177.002 Y127.769 E101.61546
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X145.031 Y177.071 E103.55798
+G1 X142.842 Y150.911 E104.98792
+G1 X184.044 Y116.264 E105.66192
+G0 X170.00 Y122.96
+G1 X150.705 Y150.624 E107.33251
+G1 X189.257 Y169.867 E107.67635
+G1 X166.611 Y179.609 E108.37099
+G1 X138.707 Y153.576 E108.94370
+G0 X166.31 Y128.04
+G1 X131.064 Y180.131 E110.25858
+G1 X174.061 Y130.189 E112.25118
+G1 X118.841 Y122.165 E113.89264
+G1 X117.585 Y153.936 E114.23780
+G1 X114.632 Y114.103 E115.80844
+G1 X126.629 Y157.639 E117.29184
+G1 X179.883 Y184.908 E119.08915
+G1 X175.403 Y145.311 E119.25438
+G1 X166.735 Y168.245 E120.10915
+G1 X122.068 Y114.228 E120.64222
+N761 G1 X1 Y2*48
+G1 X187.852 Y156.072 E121.82824
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X177.303 Y119.167 E123.26692
+G1 X128.652 Y159.322 E125.16025
+G1 F2700 E118.66025
+G1 F2700 E125.16025
+G1 F1200 X21.390 Y177.964 E125.16025
+G1 X149.133 Y166.313 E125.96016
+G1 X139.450 Y122.452 E126.11056
+G1 F2700 E119.61056
+G1 F2700 E126.11056
+G1 X144.091 Y178.741 E127.28905
+G92 E0
+G1 F2700 E-6.50000
+G1 F2700 E0.00000
+G1 X172.157 Y183.403 E1.22179
+G1 X124.093 Y110.653 E2.16163
+G1 X167.624 Y142.181 E2.71878
+G1 X187.864 Y183.628 E3.26145
+G1 X118.431 Y141.623 E4.03005
+G1 X135.017 Y164.871 E5.48330
+G1 X160.986 Y133.233 E6.89684
+G1 F600 X274.470 Y145.129 E6.89684
+G1 X135.261 Y180.669 E8.42091
+G1 F600 X203.617 Y164.687 E8.42091
+G0 X165.22 Y117.79
+G1 X155.235 Y180.484 E8.66748
+G1 X154.563 Y142.676 E10.53609
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X121.453 Y185.204 E12.00485
+G1 X142.875 Y161.628 E13.40715
+G1 F2700 X292.766 Y156.622 E13.40715
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X172.327 Y141.264 E14.76585
+M106 S210
+M204 S500 P1000
+G1 F2700 E8.26585
+G1 F2700 E14.76585
+G1 X156.191 Y184.076 E15.67232
+G1 X120.049 Y181.565 E17.60617
+G1 X159.277 Y130.840 E18.78280
+G1 X160.101 Y133.254 E18.84984
+G0 X184.88 Y141.06
+G1 X187.621 Y176.683 E20.78083
+G92 E0
+G0 X147.44 Y122.11
+G1 X127.987 Y118.663 E0.47530
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 F30000 X250.840 Y113.506 E0.47530
+G1 X119.124 Y177.410 E2.10558
+G1 F2700 E-4.39442
+G1 F2700 E2.10558
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X122.739 Y155.930 E3.74826
+G0 X179.24 Y123.73
+G0 X141.84 Y151.00
+G1 F1200 X38.625 Y178.477 E3.74826
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G0 X113.98 Y111.21
+G1 X116.970 Y179.697 E3.94712
+G1 X134.399 Y184.603 E4.50946
+M106 S130
+M204 S500 P1000
+G1 X187.105 Y127.878 E4.74392
+G1 X150.777 Y180.840 E6.30089
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X117.552 Y144.473 E7.71968
+G1 X139.858 Y170.757 E8.26925
+G1 X121.270 Y127.838 E10.11392
+G1 X177.197 Y138.706 E10.57406
+G1 X144.195 Y159.912 E11.91213
+G1 X133.627 Y151.212 E12.01817
+G1 X176.893 Y129.363 E12.43459
+G1 X189.832 Y171.779 E14.17718
+G1 X117.234 Y173.961 E15.70657
+G1 X144.091 Y121.377 E16.14507
+G1 X163.309 Y173.794 E17.79132
+G1 X176.992 Y136.122 E18.33641
+G1 F30000 X313.088 Y112.483 E18.33641
+G1 X172.464 Y152.879 E19.30071
+G1 X177.008 Y123.963 E21.11938
+G1 X128.408 Y144.092 E22.40489
+G1 X170.219 Y171.301 E24.37672
+G1 X141.384 Y155.854 E24.38583
+G1 X189.963 Y173.144 E25.20660
+G1 X159.168 Y171.856 E26.01167
+G1 X183.866 Y144.983 E27.86980
+G1 X171.828 Y167.361 E29.63155
+G1 X114.302 Y159.778 E30.69378
+G1 X145.144 Y133.509 E32.45626
+G1 X141.749 Y168.477 E32.46539
+G1 X163.594 Y141.502 E34.29065
+G1 X161.717 Y123.202 E36.12520
+G1 F2700 X-32.432 Y134.704 E36.12520
+G1 X133.904 Y173.037 E36.19757
+G1 X134.310 Y120.669 E37.49396
+G1 X132.231 Y134.847 E38.13630
+G1 F2700 E31.63630
+G1 F2700 E38.13630
+G1 X131.134 Y133.183 E39.13074
+G1 F1800 X453.457 Y130.712 E39.13074
+G0 X145.35 Y162.59
+G0 X167.67 Y181.60
+G1 X126.460 Y184.450 E39.31623
+G1 X113.212 Y173.615 E40.80748
+M117 Layer 859 of 99
+G1 X183.713 Y137.551 E41.45537
+G1 X185.005 Y129.267 E42.49361
+G1 X162.215 Y112.085 E43.16345
+G0 X180.46 Y132.48
+G1 X178.168 Y144.308 E44.82328
+G1 X149.777 Y179.647 E44.91117
+G1 X118.916 Y133.029 E46.72597
+G1 X150.000 Y150.000 A0.05 B0.23
+G1 X157.995 Y156.360 E47.87758
+G1 X160.747 Y179.282 E48.55073
+G1 X151.371 Y176.789 E50.43899
+M106 S36
+M204 S500 P1000
+G0 X143.52 Y141.62
+G1 X112.606 Y172.471 E50.44210
+G1 X145.907 Y144.776 E50.94737
+G1 X148.178 Y175.328 E52.52544
+G1 X163.836 Y154.067 E52.77763
+G1 X168.134 Y137.191 E53.37181
+G1 X125.994 Y123.986 E54.56745
+G1 F30000 X240.123 Y152.462 E54.56745
+G1 F1200 X419.876 Y164.567 E54.56745
+G1 X171.167 Y173.839 E55.62290
+G1 F1200 X-135.836 Y183.390 E55.62290
+G1 X122.734 Y117.326 E56.45170
+G1 X178.174 Y163.168 E57.54051
+G1 X175.663 Y129.793 E58.73218
+G1 X187.772 Y121.770 E59.24773
+G1 X167.987 Y150.022 E59.97108
+G1 X152.968 Y111.757 E61.69045
+G1 X135.766 Y123.024 E62.02790
+G1 X141.031 Y130.601 E63.24488
+G1 X171.438 Y179.116 E63.99592
+G1 F2700 X22.869 Y178.091 E63.99592
+G1 X159.393 Y132.927 E65.71176
+G1 X148.665 Y122.213 E67.42579
+G1 X114.895 Y130.817 E67.70878
+G1 F1200 X120.457 Y134.601 E67.70878
+G1 X176.372 Y164.276 E69.39590
+G1 X179.732 Y144.509 E70.25877
+G1 F30000 X290.932 Y170.812 E70.25877
+G1 F2700 X15.110 Y117.690 E70.25877
+M117 Layer 901 of 99
+G1 X139.228 Y144.353 E70.93309
+G1 X140.113 Y144.699 E72.61253
+G1 X178.722 Y148.218 E74.60942
+G1 X159.549 Y165.409 E74.87557
+G1 X171.586 Y123.337 E75.75450
+G1 X186.846 Y112.990 E76.72295
+G1 X120.508 Y131.895 E77.22291
+M106 S6
+M204 S500 P1000
+;LAYER:910
+G0 F9000 X132.837 Y176.575 Z1.6
+;TIME_ELAPSED:336.700000
+G1 X164.274 Y120.194 E77.84653
+G1 F30000 X97.542 Y171.223 E77.84653
+G1 X183.779 Y122.853 E79.64816
+G1 X153.286 Y149.218 E81.21117
+G1 X129.422 Y115.821 E82.81793
+G1 X158.811 Y166.092 E84.61787
+G1 X115.221 Y171.576 E85.13693
+G0 X183.37 Y189.17
+G1 X162.530 Y147.577 E85.69448
+G1 F30000 X284.573 Y127.658 E85.69448
+G1 X173.606 Y144.839 E86.87254
+G1 X164.022 Y186.037 E87.32036
+G1 X124.672 Y171.264 E88.45480
+G1 X159.524 Y122.922 E89.18938
+G1 F30000 X68.857 Y122.499 E89.18938
+G1 X132.573 Y126.644 E90.14385
+G1 X176.585 Y117.046 E90.70920
+G1 X127.136 Y176.959 E91.55803
+G1 X126.321 Y165.891 E91.68139
+G1 X126.861 Y110.999 E92.28018
+G1 F1800 X98.626 Y161.800 E92.28018
+G1 X140.575 Y123.034 E92.38216
+G0 X151.15 Y184.18
+G1 X112.302 Y161.633 E94.09831
+G1 X129.001 Y189.872 E94.87669
+G1 X177.443 Y180.698 E94.96307
+G1 X188.068 Y182.899 E95.59419
+G1 X146.167 Y121.485 E97.00041
+G1 X150.000 Y150.000 A0.38 B0.09
+G1 X140.679 Y148.715 E98.39324
+G1 X127.644 Y148.483 E99.45287
+G1 X152.410 Y163.406 E99.92631
+G1 X148.195 Y177.136 E100.52368
+G1 F30000 X346.964 Y128.818 E100.52368
+G1 F2700 E94.02368
+G1 F2700 E100.52368
+G1 X171.573 Y189.313 E100.77021
+G1 F30000 X31.846 Y173.508 E100.77021
+G1 X116.436 Y167.694 E101.68245
+G0 X113.47 Y185.03
+G1 F2700 E95.18245
+G1 F2700 E101.68245
+G1 X169.669 Y146.159 E103.01732
+G1 F2700 X126.714 Y174.287 E103.01732
+G0 X139.27 Y132.81
+G1 X186.826 Y110.598 E103.76623
+G1 X142.425 Y166.015 E105.45008
+G1 X162.139 Y169.549 E107.38182
+G1 F2700 E100.88182
+G1 F2700 E107.38182
+G1 X186.750 Y166.580 E107.46369
+G1 X167.081 Y131.275 E108.11223
+G1 X131.722 Y115.265 E109.91880
+G1 X179.158 Y120.402 E111.68289
+G1 F1800 X2.782 Y180.641 E111.68289
+G1 X134.420 Y143.537 E112.45439
+G1 X144.878 Y131.119 E113.49028
+;LAYER:965
+G0 F9000 X122.123 Y172.491 Z1.8
+;TIME_ELAPSED:357.050000
+G1 F1200 X469.390 Y188.221 E113.49028
+G0 X116.21 Y157.84
+G92 E0
+G1 X154.019 Y189.369 E1.28820
+G1 X168.553 Y136.414 E2.51059
+G1 X165.073 Y119.318 E3.72656
+G1 F30000 X8.073 Y131.841 E3.72656
+;LAYER:973
+G0 F9000 X121.629 Y176.812 Z2.0
+;TIME_ELAPSED:360.010000
+G1 X167.321 Y167.126 E4.63895
+G1 X144.087 Y138.801 E4.90630
+G1 X148.015 Y187.950 E5.49105
+;LAYER:977
+G0 F9000 X128.395 Y177.926 Z2.2
+;TIME_ELAPSED:361.490000
+G1 X116.332 Y189.192 E7.05889
+;LAYER:979
+G0 F9000 X172.897 Y129.636 Z2.4
+;TIME_ELAPSED:362.230000
+G1 F30000 X441.081 Y127.799 E7.05889
+G0 X159.41 Y124.67
+G1 X182.201 Y136.430 E7.24005
+G1 X174.247 Y154.498 E7.48404
+G1 X152.913 Y173.414 E9.07450
+G1 F2700 X195.841 Y185.445 E9.07450
+G1 X138.341 Y124.779 E10.31046
+G0 X149.46 Y116.34
+G1 X115.415 Y160.712 E10.74779
+G1 X156.526 Y144.427 E12.42665
+G1 X125.217 Y142.932 E13.72924
+G1 X165.463 Y145.792 E14.72368
+;LAYER:992
+G0 F9000 X186.263 Y142.870 Z2.6
+;TIME_ELAPSED:367.040000
+M117 Layer 993 of 99
+G1 X150.718 Y113.701 E15.27992
+G0 X134.80 Y189.64
+G1 X118.931 Y124.376 E16.55608
+G1 X182.667 Y184.454 E17.46045
+G1 X174.411 Y138.789 E17.74224
+G1 X117.121 Y144.969 E18.49308
+G1 X128.653 Y148.943 E19.88623
+G1 X138.936 Y151.654 E21.68751
+G1 X111.485 Y129.010 E22.09555
+G1 F30000 X245.785 Y154.667 E22.09555
+G1 X127.572 Y150.834 E22.56501
+N1005 G1 X1 Y2*83
+G1 X173.885 Y121.383 E23.66248
+G1 X188.980 Y121.023 E24.38404
+G1 X138.448 Y179.590 E26.32909
+G1 X146.662 Y168.482 E28.03697
+G1 X164.002 Y169.301 E29.89625
+G1 X148.598 Y163.784 E31.48223
+G1 X110.907 Y118.460 E32.85669
+G1 X110.754 Y147.539 E33.10282
+G1 X137.267 Y182.717 E33.52818
+G1 X165.712 Y155.851 E34.45837
+G1 X140.118 Y168.712 E35.84953
+G1 X189.464 Y145.950 E36.45127
+G1 F2700 X466.092 Y161.403 E36.45127
+G92 E0
+G1 X168.237 Y127.707 E1.68757
+G92 E0
+G1 X149.479 Y185.046 E0.53674
+G1 X167.801 Y163.601 E0.75562
+G1 X141.045 Y143.688 E2.13385
+M106 S90
+M204 S500 P1000
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 F2700 X102.069 Y152.049 E2.13385
+G1 F30000 X285.685 Y113.596 E2.13385
+G1 F30000 X177.866 Y167.778 E2.13385
+G1 X148.041 Y111.682 E2.75396
+G1 X163.927 Y137.605 E4.73539
+G1 F1200 X321.289 Y131.620 E4.73539
+G1 X147.905 Y131.714 E5.88973
+G1 X132.155 Y145.507 E6.72055
+G1 X182.840 Y164.176 E7.37102
+G1 X181.203 Y128.153 E9.35649
+G1 F2700 E2.85649
+G1 F2700 E9.35649
+G1 X130.346 Y181.206 E9.66667
+G1 X163.911 Y141.847 E11.35374
+G1 X147.498 Y168.178 E11.52340
+G1 F1200 X16.967 Y141.300 E11.52340
+;LAYER:1042
+G0 F9000 X189.571 Y119.613 Z2.8
+;TIME_ELAPSED:385.540000
+G1 X134.073 Y143.496 E13.00082
+G1 X121.896 Y181.690 E14.49115
+G1 X144.644 Y184.071 E15.46604
+G1 X112.880 Y189.471 E16.10246
+G0 X112.52 Y132.75
+G1 X169.939 Y123.499 E16.62939
+G1 X154.430 Y117.184 E17.65250
+G1 X120.526 Y135.846 E17.90989
+G0 X147.68 Y133.44
+G1 F1800 X-158.715 Y161.030 E17.90989
+G1 X176.094 Y175.302 E18.75060
+G1 X178.681 Y141.129 E19.98680
+G1 X111.319 Y140.696 E21.13524
+G1 X156.836 Y176.215 E21.56481
+G1 X125.144 Y110.670 E22.64940
+G1 X160.504 Y118.047 E23.15050
+G1 X172.698 Y114.163 E24.18317
+G0 X122.31 Y183.46
+G0 X181.22 Y184.04
+G1 X157.396 Y136.498 E24.90669
+G1 X126.281 Y135.413 E26.64731
+G0 X136.43 Y116.53
+G1 F1800 X186.473 Y186.229 E26.64731
+G1 X150.016 Y140.891 E27.56979
+G1 X189.890 Y174.710 E28.84470
+G0 X184.67 Y121.40
+G1 X161.155 Y126.594 E29.19913
+G1 F1200 X418.728 Y173.233 E29.19913
+G1 X153.845 Y141.547 E30.16794
+G1 X186.512 Y150.319 E31.01613
+G1 X148.198 Y163.614 E31.95731
+G1 X184.635 Y158.800 E32.02762
+G1 X182.119 Y145.386 E32.46269
+G1 X150.000 Y150.000 A0.06 B0.71
+G1 X171.978 Y155.509 E33.03410
+G1 F1800 X-72.028 Y158.105 E33.03410
+G0 X180.24 Y162.82
+G1 X177.246 Y115.934 E34.84001
+G0 X163.29 Y175.38
+G0 X120.49 Y130.12
+G1 X137.017 Y132.283 E36.55529
+G1 F2700 E30.05529
+G1 F2700 E36.55529
+G1 X122.679 Y116.412 E37.92759
+G1 X136.683 Y183.826 E38.82904
+G1 X150.000 Y150.000 A0.90 B0.06
+G1 X167.041 Y126.144 E40.64197
+G0 X182.19 Y146.43
+G0 X111.90 Y165.99
+G1 X150.000 Y150.000 A0.29 B0.31
+G1 X133.047 Y171.155 E40.74666
+G1 X177.568 Y130.174 E41.37815
+G1 X187.533 Y177.910 E42.94746
+G1 X116.191 Y132.848 E43.33116
+G1 X122.598 Y164.332 E45.01831
+G1 X183.822 Y110.274 E46.25216
+G0 X155.42 Y162.14
+G1 X116.452 Y128.562 E47.88380
+G0 X133.81 Y120.86
+G1 X184.810 Y152.702 E48.47923
+G1 X171.742 Y126.696 E49.52562
+G1 X112.428 Y174.962 E51.03230
+G1 X180.089 Y165.525 E52.31565
+G1 X148.178 Y179.698 E52.67595
+G0 X125.96 Y169.02
+G1 X144.613 Y181.851 E53.12886
+G1 X128.229 Y129.650 E53.85820
+G1 X165.659 Y127.006 E54.58452
+G1 X145.341 Y146.832 E55.39855
+G1 X162.285 Y145.924 E56.89049
+G1 X164.520 Y120.423 E58.86188
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 F600 X333.973 Y180.650 E58.86188
+G0 X136.21 Y176.75
+G0 X161.35 Y125.88
+G1 X150.000 Y150.000 A0.80 B0.38
+G1 X162.772 Y139.953 E60.49110
+G1 F2700 E53.99110
+G1 F2700 E60.49110
+G1 X150.000 Y150.000 A0.68 B0.83
+G1 X173.885 Y166.019 E61.10100
+G0 X137.83 Y185.09
+G1 X177.399 Y146.410 E62.60194
+G0 X181.28 Y187.67
+G1 X129.312 Y125.782 E62.72539
+G1 X157.013 Y189.173 E63.48264
+G1 X153.759 Y174.083 E65.39720
+G0 X138.29 Y166.22
+G1 F1800 X451.779 Y139.930 E65.39720
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X131.870 Y163.548 E66.00057
+G1 F2700 X6.933 Y149.332 E66.00057
+G0 X144.27 Y146.46
+G0 X177.25 Y127.61
+G1 X125.349 Y126.113 E66.80248
+G1 X143.734 Y130.233 E67.13698
+G1 F600 X-4.880 Y166.190 E67.13698
+G1 X146.254 Y144.050 E68.88649
+G1 X121.363 Y112.930 E69.90701
+G1 X178.334 Y151.415 E71.40685
+G1 F2700 X-102.157 Y174.838 E71.40685
+G1 X162.384 Y144.181 E72.33357
+G0 X112.13 Y131.00
+G1 X188.880 Y112.296 E72.85231
+G1 X169.300 Y123.112 E73.28890
+G1 F30000 X329.699 Y121.465 E73.28890
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X115.042 Y139.243 E75.23486
+G1 X146.842 Y158.925 E75.53398
+G1 X154.377 Y152.387 E76.53112
+G1 X187.365 Y126.417 E76.70701
+G1 X148.395 Y121.869 E78.10088
+G0 X182.54 Y120.62
+G1 F600 X57.883 Y169.274 E78.10088
+G1 F1800 X292.931 Y139.600 E78.10088
+G1 X145.063 Y136.093 E78.89807
+G0 X166.04 Y122.12
+G1 X160.960 Y165.514 E79.85365
+G1 X158.419 Y133.533 E81.00887
+G0 X137.57 Y120.51
+G1 X147.944 Y177.598 E82.30546
+G0 X128.62 Y172.40
+G1 X189.648 Y123.597 E83.43069
+G1 X131.583 Y159.350 E84.25049
+G0 X148.38 Y116.48
+G1 X146.750 Y113.650 E85.68939
+G1 X135.761 Y126.478 E86.74981
+G1 X180.948 Y135.708 E86.97154
+G1 X145.928 Y183.736 E88.01346
+G1 X122.470 Y114.866 E89.00144
+G1 F1800 X242.007 Y130.702 E89.00144
+G1 X127.167 Y185.920 E89.87327
+G1 X129.688 Y176.134 E91.49688
+G1 X135.951 Y164.499 E92.38035
+G1 X112.718 Y133.100 E93.73000
+G1 X150.000 Y150.000 A0.59 B0.60
+G1 F600 X-4.875 Y187.172 E93.73000
+G1 X133.592 Y132.371 E95.52954
+G1 X140.308 Y145.553 E95.64480
+G1 X181.287 Y177.399 E95.65864
+G1 X121.998 Y148.817 E95.93143
+G1 X127.540 Y171.557 E96.49440
+G1 X185.845 Y158.309 E96.90932
+G1 F2700 X125.010 Y139.215 E96.90932
+G1 X128.007 Y185.259 E98.85513
+G1 X153.611 Y165.490 E100.19236
+G1 X150.000 Y150.000 A0.14 B0.20
+G1 F2700 X395.671 Y147.487 E100.19236
+G1 X157.755 Y168.257 E100.35257
+G0 X119.08 Y155.71
+G0 X181.37 Y117.45
+G1 X140.583 Y143.898 E102.16433
+G1 F1200 X436.142 Y110.306 E102.16433
+G1 X176.329 Y116.555 E102.38930
+G1 X154.740 Y139.949 E103.74329
+G1 X178.732 Y177.833 E103.89254
+G1 X172.278 Y184.615 E104.49293
+G1 X120.671 Y158.353 E105.58222
+G1 X132.197 Y176.450 E105.79424
+G1 X117.570 Y186.389 E107.11198
+G1 F600 X-167.111 Y136.153 E107.11198
+G1 X159.526 Y111.384 E107.95572
+G1 X179.800 Y141.616 E108.75920
+G1 X179.994 Y148.886 E109.23950
+G1 X133.076 Y121.138 E109.86729
+G1 X121.305 Y121.662 E110.14722
+G1 X125.870 Y112.453 E111.93552
+M106 S250
+M204 S500 P1000
+G1 X139.108 Y160.698 E112.85145
+G1 X181.579 Y166.850 E114.80629
+G0 X131.33 Y184.90
+G1 X135.917 Y174.533 E115.85791
+G0 X176.14 Y176.68
+G1 X180.685 Y147.423 E116.37182
+G0 X153.79 Y130.15
+G1 X187.677 Y184.537 E117.84604
+G92 E0
+G1 F2700 X112.816 Y143.750 E0.00000
+G1 X140.130 Y112.255 E0.87831
+G1 X135.810 Y128.481 E1.85427
+G1 X124.366 Y148.011 E2.00840
+G1 X169.293 Y116.046 E2.92776
+G1 X182.369 Y189.526 E4.44098
+G1 X161.895 Y153.502 E4.52800
+G1 F2700 E-1.97200
+G1 F2700 E4.52800
+G1 X110.885 Y147.611 E6.17247
+G1 X115.766 Y185.652 E6.53549
+G1 X171.919 Y174.642 E8.12954
+G1 X146.366 Y184.767 E9.66515
+G1 X186.271 Y138.590 E11.46079
+G1 X176.615 Y159.407 E11.46652
+G1 X185.430 Y184.053 E12.71136
+G1 X150.000 Y150.000 A0.34 B0.25
+;LAYER:1235
+G0 F9000 X121.474 Y130.581 Z3.0
+;TIME_ELAPSED:456.950000
+G1 X184.342 Y161.855 E12.72392
+G0 X132.76 Y151.88
+G1 F2700 E6.22392
+G1 F2700 E12.72392
+G1 X121.971 Y126.239 E12.87989
+G1 X122.549 Y145.198 E12.94235
+G1 X150.158 Y166.587 E13.83567
+G1 X185.584 Y181.901 E15.77736
+G1 X146.176 Y149.330 E16.26386
+G1 X163.633 Y184.884 E18.14323
+G1 X131.209 Y111.459 E19.42309
+;LAYER:1246
+G0 F9000 X139.660 Y124.726 Z3.2
+;TIME_ELAPSED:461.020000
+G1 X112.357 Y129.815 E19.50776
+G1 F2700 X290.986 Y157.860 E19.50776
+G1 X117.153 Y124.012 E20.18332
+G1 F600 X333.052 Y121.555 E20.18332
+G1 X145.853 Y159.145 E21.10671
+G0 X129.74 Y117.61
+G1 X139.583 Y119.764 E21.73118
+G0 X138.83 Y129.95
+G1 X160.327 Y174.753 E23.49833
+G1 X142.524 Y147.114 E23.83312
+G1 X116.349 Y115.817 E24.22699
+G1 X134.117 Y158.142 E24.71480
+G1 X150.000 Y150.000 A0.57 B0.48
+G1 X162.793 Y146.343 E24.93205
+G1 X126.986 Y136.679 E25.72143
+G1 X186.191 Y125.670 E26.25832
+G1 X142.195 Y135.755 E28.10999
+G1 X184.255 Y147.631 E28.37517
+G1 X166.750 Y120.731 E28.46148
+G1 X174.202 Y178.701 E29.97057
+G1 X119.508 Y135.423 E30.28267
+G1 X119.723 Y143.248 E30.67556
+G1 X175.625 Y117.107 E30.94164
+G1 X141.512 Y159.472 E31.71346
+G1 X168.574 Y117.459 E32.91787
+N1272 G1 X1 Y2*66
+G1 X148.914 Y140.295 E34.84632
+G1 F1800 X186.734 Y179.796 E34.84632
+G1 X165.929 Y183.728 E35.89440
+G1 X169.240 Y141.457 E37.84312
+G1 X142.541 Y166.505 E38.36227
+G1 X116.530 Y185.147 E38.46961
+G1 X183.108 Y158.867 E40.27525
+G1 X176.873 Y167.039 E41.98244
+G1 F1800 X-15.393 Y142.790 E41.98244
+G1 F2700 X229.995 Y168.158 E41.98244
+G1 X155.375 Y124.990 E43.11820
+G1 X126.660 Y114.208 E44.92416
+G1 X170.498 Y138.915 E46.65024
+G1 X128.231 Y184.331 E47.52362
+G1 X177.765 Y120.265 E47.97373
+G1 X147.045 Y174.037 E48.71127
+G1 X115.866 Y147.352 E50.26677
+G1 X165.625 Y111.136 E51.67402
+M106 S185
+M204 S500 P1000
+G1 X138.095 Y147.259 E52.14685
+G1 X110.926 Y174.519 E53.18599
+G1 F600 X-25.804 Y139.217 E53.18599
+G0 X124.75 Y145.59
+G1 X166.222 Y124.602 E54.58352
+G1 X175.177 Y154.176 E55.27877
+G1 X130.821 Y116.570 E55.88326
+G1 X134.772 Y174.861 E56.42221
+G1 X179.642 Y129.664 E57.59305
+G1 X150.481 Y133.021 E58.37753
+G1 X150.000 Y150.000 A0.49 B0.98
+G0 X117.39 Y127.96
+G1 X187.705 Y177.717 E58.62023
+G1 X116.672 Y116.538 E60.34855
+G1 X125.418 Y112.644 E61.23374
+G1 X115.160 Y180.643 E62.60495
+G1 X149.536 Y148.341 E62.85585
+G1 X160.699 Y157.768 E63.35605
+G1 X154.718 Y176.511 E64.60829
+G1 X153.126 Y154.836 E65.07482
+G0 X188.69 Y184.17
+G1 X140.654 Y174.306 E65.74179
+G1 X134.643 Y126.546 E67.29901
+G1 X140.458 Y182.692 E68.26696
+G0 X176.83 Y110.36
+G1 X118.426 Y168.448 E70.10637
+G1 X111.050 Y141.316 E71.26262
+G1 X129.481 Y143.534 E71.44278
+G0 X145.75 Y178.13
+G1 X149.515 Y159.816 E71.50793
+G1 X131.426 Y172.793 E71.74093
+G1 X146.229 Y121.804 E73.06533
+G1 X158.456 Y146.682 E73.61068
+M117 Layer 1325 of 99
+G0 X166.47 Y141.75
+G1 F30000 X198.271 Y111.749 E73.61068
+G1 X163.766 Y187.471 E74.10376
+G1 X116.635 Y172.222 E76.01184
+G0 X136.52 Y168.10
+G1 X116.723 Y122.915 E76.33942
+G1 X180.975 Y164.638 E76.84055
+G0 X137.85 Y139.74
+G1 X149.930 Y120.472 E78.06644
+G1 X131.192 Y182.952 E78.43102
+G1 F2700 X251.686 Y174.068 E78.43102
+G1 X156.935 Y143.228 E80.21469
+G1 X176.751 Y175.380 E80.55685
+G1 X121.788 Y141.443 E80.67164
+G1 X171.124 Y123.490 E82.54521
+G0 X186.87 Y186.75
+G1 X182.571 Y124.620 E83.83544
+G1 X150.000 Y150.000 A0.29 B0.35
+G1 X168.519 Y128.303 E85.24466
+G1 X174.505 Y131.506 E87.23413
+G0 X166.26 Y144.42
+M106 S143
+M204 S500 P1000
+G1 F1200 X60.229 Y172.637 E87.23413
+G1 X126.154 Y151.083 E88.05593
+G1 X128.603 Y153.180 E88.68706
+G1 X170.916 Y184.421 E89.77504
+G1 X117.569 Y126.211 E90.97692
+G1 X126.880 Y152.043 E92.06728
+G1 F30000 X376.135 Y158.265 E92.06728
+G1 F600 X70.891 Y185.060 E92.06728
+G1 F30000 X339.183 Y139.402 E92.06728
+G0 X180.19 Y143.74
+G1 F1200 X441.747 Y116.008 E92.06728
+G1 X143.610 Y127.851 E92.57634
+G1 X184.912 Y137.578 E94.29800
+G92 E0
+G1 X183.390 Y122.080 E0.10913
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X169.585 Y181.928 E1.42713
+G1 X182.810 Y144.053 E3.36588
+G1 X130.745 Y146.283 E4.83532
+N1367 G1 X1 Y2*42
+G1 X173.938 Y164.501 E6.39141
+G1 X138.127 Y121.509 E6.66413
+G1 X141.928 Y188.698 E7.55813
+G1 X135.479 Y126.548 E9.29019
+G1 X150.821 Y117.214 E10.09006
+G1 X119.006 Y174.977 E12.02408
+G1 X171.702 Y187.487 E12.24762
+G1 F1200 X128.753 Y148.635 E12.24762
+G1 X182.502 Y186.326 E13.75590
+M106 S235
+M204 S500 P1000
+G1 X126.144 Y168.145 E14.75574
+G1 X148.296 Y169.660 E15.43616
+G1 X177.900 Y143.382 E16.44702
+G1 X177.052 Y143.506 E16.83170
+G1 X140.135 Y150.832 E18.12712
+G1 X183.516 Y184.599 E18.40269
+G1 X134.675 Y174.795 E20.01501
+G1 X166.140 Y126.469 E21.03191
+G1 X162.744 Y171.494 E22.97296
+G1 X149.476 Y138.202 E23.14970
+G1 X148.563 Y138.512 E23.23011
+G1 X169.591 Y153.184 E24.46936
+G1 F1200 X-15.474 Y174.041 E24.46936
+G1 X185.702 Y152.803 E24.94917
+G1 X188.150 Y187.831 E25.61808
+G1 X120.615 Y144.006 E26.59389
+G1 X140.219 Y179.900 E27.71518
+G1 X165.830 Y129.473 E29.32144
+G1 X145.612 Y116.299 E30.00160
+G0 X187.28 Y185.41
+G1 X147.800 Y178.319 E30.10748
+G1 X113.404 Y112.782 E31.39442
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X147.362 Y144.346 E32.31174
+G1 X132.791 Y128.411 E32.51921
+G1 X163.149 Y182.486 E33.37822
+G1 F1800 X-99.797 Y147.306 E33.37822
+G1 X176.546 Y153.129 E34.95284
+G1 X130.413 Y150.216 E35.54687
+M117 Layer 1407 of 99
+G1 X135.057 Y146.528 E37.05501
+G1 X113.370 Y165.398 E37.76151
+G1 X172.503 Y141.938 E38.37220
+G1 X147.447 Y136.100 E39.93063
+G1 X123.036 Y144.131 E41.55989
+G1 X182.116 Y117.305 E42.18455
+G1 X123.006 Y185.456 E43.91168
+G1 X115.049 Y154.654 E44.19199
+G1 X153.084 Y129.102 E45.33406
+G0 X173.58 Y143.12
+G1 X180.190 Y147.060 E47.31201
+G1 X151.296 Y155.347 E48.41623
+G1 X175.306 Y160.542 E48.86148
+G1 X169.414 Y129.452 E50.31319
+G1 X151.093 Y112.705 E52.00501
+G1 X188.750 Y123.090 E52.96848
+G1 X188.880 Y153.792 E54.14257
+G1 X137.149 Y115.285 E55.30531
+G1 X123.565 Y164.467 E56.48939
+G1 X135.116 Y185.325 E57.71430
+G1 X147.200 Y183.667 E59.59083
+G1 X126.177 Y111.403 E59.59259
+G1 X144.966 Y183.251 E60.31566
+G1 X112.531 Y114.962 E61.95113
+G1 X154.209 Y175.573 E62.69033
+G1 X161.098 Y169.574 E63.45193
+G1 X128.796 Y142.295 E63.45962
+G1 X157.186 Y111.525 E65.15616
+G1 X149.716 Y142.337 E65.61971
+G1 X158.485 Y156.986 E65.74313
+G1 X125.252 Y149.345 E66.03328
+G1 X110.477 Y139.241 E67.54128
+M117 Layer 1440 of 99
+G1 F2700 X-85.664 Y161.615 E67.54128
+G1 X168.631 Y131.161 E67.82428
+G1 X129.194 Y188.688 E68.07957
+G1 X125.929 Y139.797 E68.39447
+G1 X146.811 Y155.929 E69.58166
+G1 F600 X-149.754 Y121.271 E69.58166
+G1 X127.004 Y181.866 E70.60759
+G1 X151.089 Y183.178 E71.65642
+G1 F1800 X273.144 Y154.718 E71.65642
+G1 X182.361 Y155.200 E72.81561
+G1 X172.390 Y129.005 E73.41569
+G1 X170.194 Y170.266 E73.77393
+G0 X160.64 Y176.14
+G1 X149.027 Y165.206 E75.05821
+G1 F2700 E68.55821
+G1 F2700 E75.05821
+G1 X160.265 Y119.330 E76.99029
+G1 X186.543 Y174.442 E78.33307
+G1 X129.939 Y181.844 E79.87510
+G1 X115.457 Y178.680 E81.09296
+G1 X165.751 Y151.606 E82.75633
+G1 X153.570 Y161.064 E84.10416
+G1 X150.001 Y166.002 E84.39882
+G1 X159.285 Y110.054 E85.94914
+G1 X183.720 Y113.842 E87.02865
+G0 X161.83 Y152.71
+G1 X188.200 Y111.412 E88.16233
+G1 X115.150 Y124.169 E88.32306
+G1 X125.492 Y163.578 E89.47713
+M106 S249
+M204 S500 P1000
+G1 X163.834 Y175.879 E90.52431
+G1 X159.822 Y164.412 E91.96370
+G1 X187.514 Y117.068 E92.58138
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X145.309 Y169.168 E93.22589
+G1 X150.504 Y172.864 E93.80306
+G1 F2700 E87.30306
+G1 F2700 E93.80306
+G1 X156.590 Y183.168 E94.10200
+G1 X132.890 Y155.453 E95.43643
+G1 X156.634 Y162.328 E95.69649
+G1 F1800 X256.516 Y186.431 E95.69649
+G1 X129.518 Y153.242 E96.56800
+G1 X130.303 Y164.557 E97.91639
+G1 F1800 X-118.420 Y130.676 E97.91639
+G1 X148.892 Y146.984 E98.39986
+G1 F30000 X202.652 Y188.012 E98.39986
+G1 X155.666 Y171.675 E99.18798
+G1 X120.663 Y177.803 E100.70194
+G1 X150.000 Y150.000 A0.02 B0.64
+G1 X137.677 Y175.509 E101.58349
+G1 X165.879 Y186.869 E103.18908
+G1 F30000 X462.708 Y162.915 E103.18908
+G1 F2700 E96.68908
+G1 F2700 E103.18908
+G1 X145.429 Y131.949 E105.08088
+G1 X159.718 Y153.771 E105.25559
+G1 X157.472 Y186.647 E106.21472
+G1 X150.452 Y123.356 E106.45481
+G1 X151.742 Y172.536 E107.74543
+G1 X172.787 Y128.289 E108.78726
+G0 X116.99 Y148.09
+M107
+M104 S0
+G28 X0 Y0
+M84
@@ -0,0 +1,1641 @@
+;FLAVOR:Marlin
+;TIME:7512
+M104 S210
+M140 S60
+M190 S60
+M109 S210
+G28 ;Home
+G92 E0
+G1 Z15.0 F6000
+M117 Printing hello world  
+M106 S255
+M107
+G21
+G90
+M82
+M4010 I1 T0 'abcdef'
+T0
+G1 X316.763 Y342.358 E0.72211
+G0 X320.06 Y318.49
+G1 X349.989 Y335.539 E2.08461
+G0 X344.41 Y330.36
+G1 X330.083 Y346.048 E3.95603
+G0 X324.56 Y347.27
+G1 F2700 E-2.54397
+G1 F2700 E3.95603
+G1 X316.580 Y317.097 E5.72416
+G1 X316.944 Y330.407 E6.07760
+G1 X332.396 Y349.807 E7.10507
+G1 X331.015 Y346.339 E7.93442
+G1 X324.475 Y344.359 E9.12139
+G1 X325.995 Y339.544 E11.03125
+G1 X321.164 Y329.923 E11.53106
+G1 X336.467 Y328.188 E13.12349
+G1 F2700 E6.62349
+G1 F2700 E13.12349
+G1 X332.303 Y328.262 E14.57526
+G1 X342.587 Y343.401 E16.45645
+G0 X334.65 Y340.92
+G1 X341.970 Y343.243 E17.06305
+G1 X334.632 Y326.267 E18.07776
+G1 F2700 X333.805 Y347.366 E18.07776
+G1 X342.816 Y339.038 E18.22851
+G1 F2700 E11.72851
+G1 F2700 E18.22851
+G1 X312.350 Y336.116 E19.71808
+G1 X345.020 Y314.251 E20.17131
+G1 X319.793 Y318.419 E21.87920
+G0 X326.92 Y338.68
+G1 X316.875 Y336.911 E22.60391
+G1 X311.014 Y339.177 E24.51303
+G1 X342.534 Y316.285 E25.02441
+G1 X325.423 Y311.726 E26.40740
+G1 X330.000 Y330.000 A0.15 B0.04
+G1 X339.698 Y314.525 E27.63788
+G1 X327.946 Y340.639 E27.69951
+G1 F1800 X411.812 Y344.498 E27.69951
+G1 F2700 X476.811 Y313.738 E27.69951
+G1 X310.968 Y341.536 E29.37631
+M106 S201
+M204 S500 P1000
+G1 X344.978 Y323.642 E30.03223
+G1 X336.133 Y337.979 E31.97360
+M117 Layer 41 of 99
+G1 X315.268 Y316.828 E32.47953
+G1 X346.656 Y338.324 E32.94284
+G1 X338.555 Y312.942 E33.43636
+G1 X341.663 Y334.956 E33.89277
+G1 X321.149 Y340.027 E35.26189
+G1 X316.409 Y330.483 E36.03140
+G1 X310.792 Y340.023 E36.23522
+G1 X336.780 Y328.154 E36.28410
+G1 X337.387 Y340.421 E37.04410
+G1 X327.024 Y310.853 E38.65626
+G1 X347.155 Y333.254 E40.41914
+G92 E0
+G1 X310.779 Y348.427 E0.95961
+G1 X337.616 Y347.298 E1.69257
+G1 X326.490 Y314.201 E3.44127
+G1 X343.016 Y342.482 E4.99194
+G1 X328.534 Y345.582 E6.26653
+G1 X310.966 Y322.233 E6.27719
+G1 F1200 X411.595 Y317.694 E6.27719
+G1 X328.529 Y340.143 E7.06075
+G1 X314.871 Y313.220 E7.30421
+G0 X335.64 Y348.39
+G1 X336.366 Y341.088 E7.35355
+G1 F2700 X263.041 Y348.384 E7.35355
+G1 X329.368 Y344.632 E8.10337
+G1 F2700 X468.257 Y343.440 E8.10337
+G1 X329.552 Y320.376 E8.56662
+G1 X346.743 Y333.436 E9.92491
+G0 X313.84 Y324.24
+G1 X330.000 Y330.000 A0.15 B0.42
+G1 X345.820 Y349.545 E10.09720
+G1 X321.855 Y319.268 E10.35423
+G1 X327.554 Y330.960 E11.71643
+G1 X347.998 Y340.231 E12.79822
+G1 X338.615 Y320.290 E13.83122
+G0 X328.44 Y338.13
+G1 X341.313 Y332.938 E15.82149
+G1 X311.175 Y333.807 E16.70385
+G0 X317.22 Y330.41
+G1 X338.418 Y347.467 E17.51368
+G1 F2700 X285.234 Y331.903 E17.51368
+G1 F600 X413.715 Y344.083 E17.51368
+G1 X326.109 Y336.679 E18.75618
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X328.582 Y338.463 E18.77939
+G0 X336.00 Y342.64
+G1 X339.179 Y334.258 E20.66585
+G1 F2700 E14.16585
+G1 F2700 E20.66585
+G0 X314.02 Y342.62
+G1 F1200 X257.811 Y346.855 E20.66585
+G1 X334.477 Y310.339 E21.64546
+G1 X330.538 Y316.943 E22.60957
+G1 F600 X282.076 Y346.227 E22.60957
+G1 X312.618 Y333.662 E23.94775
+G92 E0
+G92 E0
+G1 X328.413 Y349.483 E1.75504
+G1 X340.385 Y347.541 E2.45032
+G1 X330.000 Y330.000 A0.26 B0.63
+G0 X338.78 Y312.16
+G1 X337.027 Y316.234 E4.43491
+G1 X310.073 Y311.361 E5.36969
+G0 X332.57 Y318.18
+G1 X315.335 Y337.585 E6.36625
+G1 F1800 X194.548 Y342.975 E6.36625
+G1 X341.834 Y336.136 E7.65886
+G1 X313.718 Y335.333 E9.34027
+G1 X344.038 Y341.915 E10.40121
+G1 X319.317 Y328.302 E11.01736
+G1 X348.310 Y314.479 E11.57234
+G0 X325.17 Y324.58
+G1 X328.295 Y316.660 E11.72711
+G1 X345.783 Y346.870 E12.31108
+G1 X347.186 Y323.049 E13.59032
+G1 X317.582 Y337.139 E14.06601
+G1 X341.804 Y319.327 E14.77820
+G0 X335.32 Y326.01
+G0 X323.69 Y345.14
+G92 E0
+G1 X347.951 Y339.702 E1.37997
+G1 F1800 X340.221 Y335.480 E1.37997
+G1 X329.360 Y320.317 E1.99714
+G1 F2700 E-4.50286
+G1 F2700 E1.99714
+G1 X346.941 Y322.595 E2.17253
+G1 X314.171 Y316.683 E4.10851
+G1 X339.293 Y336.070 E5.86532
+;LAYER:128
+G0 F9000 X322.816 Y343.003 Z0.4
+;TIME_ELAPSED:47.360000
+G1 X328.756 Y346.028 E6.94762
+G1 X329.938 Y348.829 E7.35187
+G1 F1800 X250.314 Y326.816 E7.35187
+G1 X319.859 Y319.604 E8.03725
+G1 X324.912 Y340.713 E8.71017
+G1 X344.033 Y327.191 E8.99825
+G1 F1200 X272.713 Y333.072 E8.99825
+G1 X338.424 Y348.295 E10.29465
+G1 X340.663 Y329.594 E10.40293
+G0 X331.79 Y334.86
+G1 X336.587 Y329.828 E11.42379
+G1 X316.776 Y325.440 E12.80689
+G1 X328.053 Y333.654 E14.56459
+G1 X330.000 Y317.004 E16.40720
+G1 X338.293 Y320.118 E17.32259
+G1 X310.998 Y327.092 E17.76377
+G1 X330.000 Y330.000 A0.34 B0.82
+G1 X328.994 Y312.585 E19.48022
+G1 X337.830 Y331.686 E19.54096
+G1 X310.249 Y342.570 E20.63327
+G1 X319.539 Y324.861 E21.69022
+;LAYER:150
+G0 F9000 X331.605 Y319.868 Z0.6
+;TIME_ELAPSED:55.500000
+G1 X334.641 Y335.055 E23.28611
+G1 X325.753 Y347.399 E24.58132
+G1 X337.017 Y330.439 E26.14322
+G0 X316.06 Y348.29
+G1 X323.626 Y315.749 E26.54700
+G1 X321.972 Y313.973 E27.17438
+G1 X331.095 Y329.557 E27.71913
+G1 X315.505 Y331.881 E28.56047
+G1 X340.071 Y318.494 E29.76438
+G1 X315.524 Y310.941 E29.84259
+G1 X331.587 Y339.461 E31.28623
+G0 X318.98 Y315.78
+G1 X349.886 Y315.617 E32.66430
+G1 X340.515 Y313.691 E34.49824
+G1 X335.183 Y348.516 E36.23458
+G1 X342.800 Y343.992 E36.88323
+G1 X345.922 Y336.711 E37.01829
+G1 X344.483 Y335.458 E37.61312
+G1 F600 X238.606 Y323.329 E37.61312
+G1 X331.018 Y346.952 E38.39793
+G1 X337.732 Y341.449 E39.94229
+G1 X323.834 Y328.930 E40.85132
+G1 X329.044 Y317.685 E41.23301
+G1 X322.378 Y316.817 E42.37963
+G1 X318.890 Y334.628 E44.09998
+G1 X337.286 Y322.313 E45.86967
+G1 X321.967 Y310.505 E47.54340
+G0 X317.92 Y322.52
+G1 X338.966 Y323.714 E48.05520
+G1 X343.340 Y310.730 E48.89390
+G1 X316.021 Y334.275 E49.15761
+G1 X333.528 Y346.575 E49.28732
+G1 X342.031 Y346.635 E50.27837
+G1 X348.592 Y347.038 E50.87700
+G1 X344.972 Y333.653 E52.28428
+G1 F30000 X300.163 Y335.764 E52.28428
+G1 X319.977 Y347.729 E52.80724
+G1 F2700 X208.208 Y328.231 E52.80724
+G1 X321.393 Y319.624 E54.72934
+G1 X345.445 Y334.116 E55.77910
+G1 X325.490 Y327.224 E55.78627
+G1 X324.578 Y324.449 E56.33182
+M106 S252
+M204 S500 P1000
+G1 X339.381 Y318.845 E57.74146
+G1 X315.173 Y315.671 E58.69853
+G1 X334.630 Y335.855 E59.77392
+M106 S52
+M204 S500 P1000
+G1 X337.133 Y315.456 E60.85567
+G1 F600 X269.371 Y336.421 E60.85567
+G1 X324.207 Y323.603 E62.74448
+G92 E0
+G1 X341.368 Y324.537 E0.21409
+M106 S141
+M204 S500 P1000
+G0 X345.84 Y330.37
+N205 G1 X1 Y2*3
+G1 X335.329 Y323.977 E1.08220
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X336.491 Y337.616 E1.18359
+G1 X327.145 Y319.595 E2.72378
+G1 X310.636 Y340.396 E3.95121
+G1 F1800 X385.412 Y321.790 E3.95121
+G1 F2700 E-2.54879
+G1 F2700 E3.95121
+G1 X341.523 Y345.788 E4.44447
+G1 X314.434 Y333.878 E6.26282
+G1 X317.597 Y310.251 E6.72953
+G1 X321.241 Y336.066 E7.72993
+G1 X331.110 Y326.126 E8.76481
+G1 F2700 E2.26481
+G1 F2700 E8.76481
+G1 X328.392 Y324.912 E9.61859
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X327.599 Y327.499 E10.65140
+M117 Layer 222 of 99
+G1 F2700 X221.966 Y333.781 E10.65140
+G1 X310.921 Y338.207 E11.35331
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X320.016 Y327.695 E12.49286
+G1 X320.777 Y318.775 E13.33884
+G1 F600 X432.803 Y334.862 E13.33884
+G1 X343.600 Y348.909 E13.94333
+G1 X337.455 Y319.885 E15.08117
+G1 F1800 X337.026 Y334.746 E15.08117
+G1 F2700 E8.58117
+G1 F2700 E15.08117
+G1 X316.381 Y321.524 E16.77636
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X337.382 Y319.828 E16.99583
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X327.306 Y328.458 E17.76951
+G1 X339.676 Y343.321 E17.94981
+G1 X338.454 Y339.565 E19.83279
+G1 F2700 E13.33279
+G1 F2700 E19.83279
+G1 X319.337 Y345.853 E20.16393
+G1 X338.332 Y338.882 E21.06623
+G1 X322.504 Y346.658 E21.59418
+G1 X348.787 Y320.581 E23.02295
+G1 X333.693 Y318.242 E23.04599
+G1 X343.483 Y322.901 E23.06736
+G1 X339.906 Y346.993 E23.87940
+G1 F30000 X361.927 Y326.094 E23.87940
+G1 F2700 E17.37940
+G1 F2700 E23.87940
+G1 X310.738 Y311.215 E24.06829
+G1 X312.050 Y323.193 E25.49662
+G1 X348.823 Y345.004 E27.29178
+G1 X318.918 Y334.491 E28.44197
+G1 X343.208 Y332.725 E29.04837
+G1 F2700 X414.056 Y313.435 E29.04837
+G1 X324.467 Y324.871 E29.78232
+G0 X345.79 Y331.56
+G1 X318.381 Y328.737 E31.03150
+G1 X318.141 Y344.526 E31.56308
+;LAYER:260
+G0 F9000 X340.685 Y339.589 Z0.8
+;TIME_ELAPSED:96.200000
+G1 X339.065 Y334.286 E32.91686
+G1 X310.265 Y339.370 E33.88584
+G1 F2700 E27.38584
+G1 F2700 E33.88584
+G1 X330.000 Y330.000 A0.22 B0.62
+G1 X339.646 Y320.919 E35.16297
+G1 X324.383 Y314.633 E35.20648
+G1 X325.218 Y313.045 E35.93658
+G1 X345.192 Y340.813 E36.22237
+G1 F2700 E29.72237
+G1 F2700 E36.22237
+G1 X344.803 Y331.510 E36.75622
+G1 F2700 E30.25622
+G1 F2700 E36.75622
+G0 X338.30 Y321.69
+G1 F2700 E30.25622
+G1 F2700 E36.75622
+G1 X313.112 Y346.450 E37.87680
+G1 X347.004 Y344.289 E38.49312
+G1 X312.498 Y349.321 E39.41166
+G0 X324.04 Y322.27
+G1 X317.616 Y342.561 E39.62787
+G1 X320.909 Y324.920 E40.27424
+G1 X344.072 Y348.303 E41.89460
+G1 F1200 X282.431 Y348.285 E41.89460
+G1 F1200 X269.276 Y340.438 E41.89460
+G1 F1800 X374.418 Y338.775 E41.89460
+G0 X340.13 Y315.48
+G1 F2700 X386.584 Y329.225 E41.89460
+G1 X335.015 Y348.472 E42.02201
+G1 X345.909 Y324.090 E43.66373
+G0 X316.23 Y322.03
+G1 X331.430 Y313.572 E45.42273
+G92 E0
+G1 X319.191 Y323.392 E1.55783
+G1 X327.482 Y326.442 E1.93134
+G1 X323.367 Y347.020 E3.59850
+G1 X317.391 Y348.240 E4.28818
+G1 X337.384 Y325.118 E4.37411
+G1 X318.926 Y320.732 E5.90521
+G1 X313.444 Y343.362 E7.71443
+G1 F1200 X233.600 Y349.217 E7.71443
+G1 X347.861 Y315.173 E7.85906
+G1 X336.929 Y328.238 E9.21473
+G1 X314.279 Y310.730 E9.31022
+G1 X324.128 Y319.623 E10.93256
+G1 X316.694 Y315.231 E11.01949
+G1 F1200 X295.396 Y349.723 E11.01949
+G1 X328.541 Y314.419 E12.54726
+;LAYER:306
+G0 F9000 X313.839 Y311.314 Z1.0
+;TIME_ELAPSED:113.220000
+G1 X344.282 Y342.743 E12.93264
+G0 X316.98 Y344.13
+G0 X332.78 Y348.60
+M106 S158
+M204 S500 P1000
+G1 X329.343 Y343.691 E13.76530
+G1 F2700 X225.423 Y342.218 E13.76530
+G1 X331.085 Y332.989 E14.91840
+G1 X310.315 Y347.099 E15.06243
+G0 X328.40 Y313.59
+G0 X330.07 Y328.81
+G1 X318.742 Y342.590 E15.37766
+G1 F1200 X308.673 Y348.868 E15.37766
+G0 X330.30 Y345.69
+G1 X342.564 Y315.656 E15.51834
+G1 X337.173 Y318.803 E16.99219
+G1 F600 X309.519 Y311.253 E16.99219
+G1 X319.315 Y316.458 E18.52106
+G1 X344.545 Y318.021 E18.96417
+G1 X330.000 Y330.000 A0.23 B0.90
+G1 X316.330 Y335.839 E20.17526
+M117 Layer 327 of 99
+G1 X312.236 Y329.624 E21.61009
+G1 X339.301 Y346.217 E23.48754
+G1 X327.876 Y318.309 E24.15832
+G1 X320.571 Y330.098 E25.64572
+G1 X310.450 Y336.120 E27.08493
+G1 X329.233 Y326.880 E28.46442
+G1 X330.000 Y330.000 A0.07 B0.97
+G1 F600 X304.155 Y343.295 E28.46442
+N336 G1 X1 Y2*74
+G1 X318.559 Y337.197 E28.52519
+G1 X327.227 Y336.797 E29.60254
+G1 F30000 X275.540 Y343.594 E29.60254
+G1 X331.195 Y348.344 E29.64891
+G0 X331.08 Y316.20
+G1 X335.730 Y310.793 E29.88872
+G1 X325.484 Y346.144 E30.43936
+G1 X310.357 Y318.710 E30.81408
+G1 X327.436 Y344.748 E32.05063
+G1 X333.424 Y311.887 E32.25493
+G0 X319.46 Y342.97
+G1 X316.825 Y314.934 E33.88118
+G1 X323.207 Y313.339 E34.36478
+G1 X332.802 Y348.346 E35.63303
+G1 X330.000 Y330.000 A0.36 B0.69
+G1 X310.122 Y319.148 E36.40687
+G1 X330.000 Y330.000 A0.31 B0.37
+G1 X322.495 Y336.504 E38.29855
+G1 F600 X488.567 Y330.039 E38.29855
+G1 X321.483 Y346.280 E39.43157
+G1 X345.500 Y342.512 E40.62205
+M117 Layer 358 of 99
+G1 X346.926 Y335.391 E41.83128
+G1 X315.726 Y311.183 E41.99356
+G1 X330.911 Y315.408 E42.95251
+M106 S53
+M204 S500 P1000
+G1 X315.505 Y333.561 E43.56959
+G1 X310.064 Y346.556 E44.22064
+G1 X321.750 Y341.573 E44.45089
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 F1200 X247.561 Y313.078 E44.45089
+G1 X326.631 Y347.486 E45.22439
+G1 X310.974 Y345.159 E46.25313
+G1 X344.988 Y317.996 E46.50133
+G1 X321.164 Y346.737 E48.29740
+G1 F2700 E41.79740
+G1 F2700 E48.29740
+G1 X317.284 Y333.852 E50.25963
+G1 X317.062 Y348.737 E51.47601
+G1 F2700 E44.97601
+G1 F2700 E51.47601
+G1 X342.052 Y328.405 E53.28721
+G1 X310.106 Y345.855 E55.07428
+G1 X336.889 Y319.614 E56.47583
+G1 X349.020 Y314.646 E58.04121
+N380 G1 X1 Y2*10
+G1 X344.077 Y349.717 E59.72952
+G1 X344.920 Y325.064 E60.97525
+G1 X344.267 Y327.709 E61.42442
+G1 X322.765 Y342.514 E62.73632
+G1 X339.028 Y336.671 E63.59541
+G1 F1200 X428.912 Y326.303 E63.59541
+G1 X312.228 Y336.369 E65.32288
+G1 X314.762 Y321.526 E66.12916
+G1 F2700 X485.724 Y340.180 E66.12916
+G0 X343.05 Y316.59
+G1 X340.081 Y321.059 E67.86745
+G1 F2700 X451.633 Y333.289 E67.86745
+G1 X338.261 Y311.753 E69.23919
+G92 E0
+G1 X338.517 Y331.538 E1.81390
+G0 X316.28 Y349.93
+G1 X349.733 Y334.391 E3.22461
+G1 X319.803 Y335.247 E4.06021
+G1 F600 X432.415 Y347.548 E4.06021
+G1 X330.950 Y329.632 E5.02485
+M117 Layer 401 of 99
+M117 Layer 402 of 99
+G1 X331.126 Y336.000 E5.84100
+G1 X313.943 Y328.447 E7.48134
+G0 X316.83 Y316.95
+G1 X331.813 Y314.975 E7.77146
+G1 X341.324 Y334.446 E8.43999
+G1 X325.870 Y349.047 E9.69551
+G1 X312.691 Y319.992 E10.95274
+G1 X338.142 Y312.173 E12.86446
+G0 X318.49 Y333.82
+G1 X340.907 Y329.434 E12.98731
+G1 X333.755 Y326.660 E14.39688
+G1 X319.840 Y320.495 E15.45701
+G0 X323.69 Y338.84
+G1 X341.420 Y323.216 E16.38782
+;LAYER:417
+G0 F9000 X343.939 Y339.976 Z1.2
+;TIME_ELAPSED:154.290000
+G1 F600 X300.617 Y327.049 E16.38782
+G1 X321.244 Y340.337 E18.13219
+M117 Layer 420 of 99
+G1 X316.487 Y335.813 E18.16696
+G1 X313.688 Y345.792 E20.06345
+G1 X323.559 Y314.442 E21.90378
+G1 X347.596 Y342.908 E22.50218
+G1 X332.015 Y340.917 E23.48256
+G1 X330.749 Y333.520 E24.61487
+G1 X325.485 Y325.804 E25.47947
+G1 X330.000 Y330.000 A0.52 B0.11
+G1 X337.287 Y313.230 E27.01151
+G1 X343.814 Y320.695 E27.91527
+G1 F2700 E21.41527
+G1 F2700 E27.91527
+G0 X310.79 Y329.90
+G1 X345.502 Y318.069 E29.17727
+G0 X310.36 Y343.33
+G1 X342.516 Y348.838 E29.22969
+G1 X325.882 Y319.912 E30.78595
+G1 X320.740 Y325.020 E32.40311
+G1 X344.650 Y310.275 E32.93271
+G1 X341.390 Y332.803 E33.30070
+G1 F1800 X454.227 Y333.468 E33.30070
+G1 X326.471 Y314.737 E33.50532
+G1 X349.336 Y348.586 E34.05461
+G1 X326.520 Y312.816 E34.89699
+G1 X331.285 Y342.655 E35.18385
+G1 X342.579 Y346.590 E36.59648
+G1 X345.585 Y329.967 E37.07065
+G1 X344.534 Y349.332 E38.43740
+G1 X320.007 Y321.932 E38.96724
+G1 X335.369 Y312.007 E40.80640
+G1 X348.734 Y323.690 E41.17670
+G0 X318.99 Y317.83
+M106 S38
+M204 S500 P1000
+G1 X328.121 Y330.250 E41.68559
+G1 X314.735 Y330.994 E42.06374
+G1 F2700 X372.359 Y340.974 E42.06374
+G1 X328.253 Y311.141 E43.94488
+G1 X317.319 Y345.184 E45.00452
+G1 X321.379 Y315.319 E46.04471
+G1 X337.313 Y337.337 E47.32753
+G1 X337.797 Y337.277 E48.88349
+G1 X348.499 Y333.335 E50.59093
+G1 X342.045 Y337.077 E51.67375
+G1 F1800 X355.597 Y349.076 E51.67375
+G1 X337.294 Y337.785 E51.82358
+G0 X340.76 Y310.30
+G1 X312.727 Y335.886 E53.81048
+G1 X333.702 Y322.003 E54.17005
+G1 X347.723 Y310.363 E54.48072
+G1 X346.715 Y346.224 E56.01782
+G1 X345.978 Y319.851 E57.49793
+G1 X318.925 Y322.201 E57.92027
+G1 X348.705 Y313.752 E58.78829
+G1 F1200 X304.753 Y338.186 E58.78829
+G0 X335.27 Y318.69
+G1 X324.648 Y338.995 E59.90713
+G1 X324.330 Y321.207 E61.28835
+G1 X330.162 Y331.756 E62.79711
+G0 X311.08 Y331.81
+G1 X343.138 Y319.714 E63.28466
+G1 X315.523 Y322.400 E64.15242
+;LAYER:481
+G0 F9000 X330.014 Y335.120 Z1.4
+;TIME_ELAPSED:177.970000
+G1 X330.000 Y330.000 A0.96 B0.33
+N483 G1 X1 Y2*13
+G92 E0
+M106 S207
+M204 S500 P1000
+G1 X326.314 Y329.697 E0.07267
+G1 X339.770 Y313.457 E1.59499
+G1 X341.531 Y336.522 E2.98848
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 F2700 X273.168 Y337.185 E2.98848
+G1 X336.483 Y338.971 E3.49034
+G1 X326.599 Y338.030 E4.66393
+G1 X334.754 Y317.635 E6.25735
+G1 F1200 X203.291 Y311.950 E6.25735
+G1 X328.451 Y322.538 E7.34751
+G1 X326.160 Y334.068 E7.35599
+G1 X340.905 Y314.111 E8.47792
+G1 X317.813 Y323.712 E8.90607
+G1 F1800 X183.444 Y339.237 E8.90607
+G1 F30000 X217.681 Y349.302 E8.90607
+G1 X315.235 Y319.502 E9.47611
+G1 F2700 X185.837 Y330.293 E9.47611
+G1 X347.559 Y317.303 E10.45207
+G1 X311.244 Y341.256 E10.61447
+G1 X319.068 Y323.304 E11.48050
+G1 X328.545 Y312.835 E11.68723
+G1 X319.046 Y311.021 E12.71543
+G1 X334.578 Y329.103 E14.60623
+G1 F1200 X367.209 Y321.851 E14.60623
+G92 E0
+G0 X322.31 Y312.66
+G1 X326.932 Y314.802 E1.62705
+G1 X318.244 Y346.828 E3.18834
+G1 X323.869 Y336.212 E4.44406
+G1 X314.898 Y312.529 E4.97876
+G1 X310.265 Y345.138 E6.96192
+G1 X311.254 Y324.000 E7.28221
+G1 X328.344 Y316.689 E8.27277
+G0 X333.34 Y340.37
+G1 X337.804 Y340.969 E9.71615
+G1 X328.248 Y313.214 E11.61498
+G92 E0
+G1 X318.310 Y312.901 E1.79152
+G1 X336.956 Y335.639 E2.88888
+G1 X330.600 Y315.788 E4.40861
+G1 X331.814 Y316.331 E5.11292
+G1 X336.546 Y310.943 E5.64238
+G1 X344.948 Y314.912 E6.44592
+G1 X326.327 Y348.242 E8.06650
+G1 X322.215 Y321.261 E9.05657
+G1 X336.165 Y343.455 E10.61051
+G1 X336.414 Y347.374 E10.97486
+G1 X330.913 Y344.148 E11.50102
+G0 X335.08 Y339.66
+G1 X310.441 Y328.016 E11.77552
+G1 X342.789 Y331.890 E11.81045
+G1 F1200 X374.234 Y331.000 E11.81045
+G1 F1800 X359.555 Y343.203 E11.81045
+G1 X328.605 Y343.670 E13.51059
+G1 X313.116 Y329.609 E15.41198
+G1 X310.703 Y311.955 E15.95659
+G1 X327.594 Y340.579 E16.47944
+G1 X334.628 Y348.381 E16.50693
+G1 X323.790 Y310.670 E16.53567
+G1 X330.000 Y330.000 A0.24 B0.12
+G1 X345.237 Y342.704 E16.56975
+G1 X322.664 Y334.538 E16.88576
+G1 X320.788 Y338.714 E18.07612
+G0 X326.11 Y312.04
+G1 X346.087 Y332.289 E18.71154
+G0 X342.02 Y336.36
+G1 X315.479 Y332.583 E20.54916
+G1 X340.247 Y349.529 E21.53786
+G1 X321.489 Y336.996 E23.28539
+G1 F1800 X265.778 Y344.900 E23.28539
+G1 X339.079 Y314.170 E25.02853
+G1 F2700 X402.337 Y335.370 E25.02853
+M117 Layer 558 of 99
+G1 F30000 X303.154 Y318.246 E25.02853
+G1 X332.260 Y337.572 E25.94111
+G1 X326.213 Y310.340 E27.87062
+G1 X319.679 Y339.686 E29.18573
+G1 X327.836 Y348.099 E30.99366
+G1 X318.224 Y345.250 E32.44134
+G1 X330.000 Y330.000 A0.15 B0.58
+G1 X344.589 Y346.462 E34.20222
+G1 F2700 X303.123 Y322.266 E34.20222
+G1 X343.057 Y320.616 E34.69018
+G0 X339.36 Y346.45
+G1 X321.789 Y338.445 E36.36465
+N571 G1 X1 Y2*49
+G1 F2700 X240.931 Y340.329 E36.36465
+G1 X329.832 Y327.902 E37.65313
+G0 X341.99 Y317.72
+G0 X331.59 Y312.50
+G1 F600 X308.891 Y327.178 E37.65313
+G1 X331.386 Y327.494 E38.04121
+G1 X317.753 Y340.801 E39.35707
+G1 X317.383 Y334.422 E40.17153
+G1 X342.829 Y323.971 E41.73596
+G1 X325.558 Y310.401 E42.96498
+G1 F600 X321.640 Y346.865 E42.96498
+G1 X325.862 Y335.553 E44.13307
+G1 X318.111 Y321.470 E45.57078
+G1 X326.659 Y347.710 E46.40629
+G1 X315.133 Y331.257 E47.52854
+G1 F1800 X476.228 Y333.857 E47.52854
+G1 X349.174 Y348.854 E49.27016
+G1 X316.343 Y320.648 E50.62277
+G1 F600 X359.379 Y322.804 E50.62277
+G1 X320.611 Y318.203 E51.23891
+M106 S229
+M204 S500 P1000
+G1 X339.942 Y338.994 E52.93257
+G1 X342.609 Y338.042 E53.99598
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X324.824 Y326.602 E54.65799
+G1 X330.000 Y330.000 A0.97 B0.83
+G1 X343.946 Y318.558 E56.20669
+G1 X316.650 Y327.810 E58.17389
+G1 X328.527 Y315.522 E59.88222
+G1 X331.800 Y311.096 E61.17493
+G0 X321.36 Y311.42
+G1 X334.286 Y313.677 E62.51618
+G1 X330.337 Y310.440 E63.96429
+G1 X328.929 Y338.386 E64.13184
+G1 X338.782 Y321.030 E64.94451
+G1 X338.162 Y319.447 E65.05670
+G1 X341.114 Y317.389 E67.04500
+G1 F2700 X410.922 Y348.833 E67.04500
+G1 F2700 X485.612 Y325.585 E67.04500
+G1 X314.200 Y326.524 E68.64979
+G1 X349.342 Y329.545 E68.71881
+G1 X324.583 Y312.374 E69.01318
+G0 X310.31 Y347.59
+N615 G1 X1 Y2*25
+G0 X344.63 Y345.78
+G1 X348.265 Y332.960 E70.20755
+G1 X339.805 Y313.639 E71.46818
+G1 X341.600 Y323.472 E72.34966
+G1 X312.670 Y335.272 E73.96959
+G1 X331.490 Y314.453 E74.51416
+G0 X325.50 Y347.42
+M106 S180
+M204 S500 P1000
+G1 X333.719 Y346.699 E75.18031
+G1 X340.882 Y319.882 E75.73932
+G1 X349.621 Y341.490 E76.10021
+G1 X345.438 Y322.821 E78.08904
+G1 X335.451 Y320.587 E79.52240
+;LAYER:629
+G0 F9000 X321.455 Y347.294 Z1.6
+;TIME_ELAPSED:232.730000
+G1 X337.886 Y320.801 E80.86000
+G0 X328.89 Y347.08
+G1 X344.872 Y349.256 E82.22241
+G1 F30000 X301.968 Y322.618 E82.22241
+G1 X345.799 Y323.077 E82.96294
+G1 X338.793 Y347.301 E83.14556
+G1 X340.508 Y343.943 E83.45242
+G1 X324.957 Y331.416 E84.39884
+G1 X323.347 Y348.518 E86.24856
+G1 X343.738 Y319.564 E87.16541
+G1 X343.371 Y344.427 E88.98818
+G1 X341.229 Y319.817 E90.27829
+N642 G1 X1 Y2*85
+G1 X347.873 Y310.545 E91.47551
+G1 X311.892 Y337.919 E93.23111
+G1 X311.991 Y321.392 E93.72005
+G1 X342.510 Y333.962 E95.02610
+G1 X347.080 Y319.396 E96.07494
+G1 X322.089 Y331.722 E96.51625
+G0 X331.53 Y317.68
+G1 X339.299 Y332.315 E96.62156
+G1 X324.270 Y329.669 E97.87572
+G1 X317.677 Y348.549 E99.47501
+G0 X317.54 Y346.43
+G1 X318.531 Y344.469 E101.16755
+G0 X332.37 Y337.18
+G1 F30000 X277.263 Y340.797 E101.16755
+G1 F2700 E94.66755
+G1 F2700 E101.16755
+G1 X324.458 Y327.918 E102.88641
+G1 X341.556 Y341.838 E103.52288
+G1 X345.269 Y330.634 E104.32437
+G1 X317.306 Y328.725 E105.94141
+G1 F2700 E99.44141
+G1 F2700 E105.94141
+G1 F30000 X175.401 Y319.930 E105.94141
+G1 X318.565 Y316.425 E107.90277
+G1 F1800 X399.366 Y331.282 E107.90277
+G0 X334.00 Y311.49
+G0 X310.27 Y349.75
+G1 X319.510 Y344.477 E109.15756
+G1 X312.348 Y336.946 E110.30779
+G0 X334.61 Y342.31
+G1 X343.293 Y317.387 E111.41904
+G1 X339.591 Y346.425 E113.02680
+G1 F1200 X373.833 Y319.047 E113.02680
+G1 F1800 X244.218 Y324.985 E113.02680
+G1 X313.002 Y314.965 E114.49542
+G92 E0
+G1 F2700 X310.964 Y344.064 E0.00000
+G1 X327.103 Y326.654 E0.99137
+G1 X321.837 Y338.245 E2.91347
+G1 X341.909 Y333.055 E3.09293
+G1 X343.894 Y346.958 E4.75455
+G1 X318.705 Y347.889 E5.58262
+G1 X314.247 Y328.241 E7.11261
+G1 X329.813 Y328.205 E7.91852
+G1 X327.960 Y326.288 E8.53305
+G92 E0
+G1 X343.337 Y331.227 E1.39968
+G0 X327.32 Y331.25
+G0 X337.08 Y341.59
+G1 X335.195 Y311.656 E3.30181
+G1 X339.807 Y319.113 E4.25150
+G1 F30000 X354.972 Y331.998 E4.25150
+G1 X328.082 Y342.208 E4.93157
+G1 F2700 E-1.56843
+G1 F2700 E4.93157
+G0 X318.69 Y347.35
+G1 X328.893 Y314.049 E5.58453
+G1 X314.721 Y348.709 E7.47827
+G1 X331.650 Y313.839 E7.98049
+G1 X321.955 Y339.572 E9.50494
+G1 X338.772 Y333.065 E11.00984
+G1 X314.157 Y330.464 E11.46074
+G1 X314.540 Y313.481 E13.14850
+G1 X339.517 Y335.281 E14.24445
+G1 X336.618 Y314.647 E14.40191
+G1 F30000 X207.767 Y336.004 E14.40191
+G1 X336.916 Y324.114 E15.88675
+G1 X320.913 Y348.036 E16.89107
+G0 X336.81 Y326.36
+G0 X317.69 Y321.47
+G1 X330.000 Y330.000 A0.10 B0.40
+G1 X321.307 Y311.378 E18.63985
+G1 X330.000 Y330.000 A0.30 B0.17
+G1 X330.000 Y330.000 A0.85 B0.33
+G1 X330.000 Y330.000 A0.35 B0.99
+G1 X333.008 Y337.486 E20.61554
+G1 X327.011 Y346.350 E21.27713
+G1 X310.740 Y344.678 E21.89002
+G1 X334.202 Y321.699 E22.45855
+G1 X328.768 Y345.729 E23.44844
+G0 X323.87 Y338.17
+G1 X342.870 Y335.670 E24.15962
+G1 X311.755 Y321.525 E25.42915
+G1 X347.284 Y317.369 E26.43779
+G1 X336.670 Y349.484 E26.77446
+;LAYER:725
+G0 F9000 X331.399 Y336.153 Z1.8
+;TIME_ELAPSED:268.250000
+G1 X320.343 Y341.900 E26.92186
+N727 G1 X1 Y2*27
+G1 X316.343 Y314.399 E27.15192
+G0 X343.97 Y328.79
+G1 X337.553 Y319.016 E27.93446
+G1 X323.813 Y349.785 E29.38453
+G1 X329.413 Y344.696 E29.38457
+G1 X332.288 Y345.227 E30.26758
+G1 X313.263 Y338.301 E31.70587
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X321.055 Y328.889 E31.75200
+G0 X327.34 Y319.91
+G1 F30000 X484.631 Y334.757 E31.75200
+G1 F600 X232.107 Y311.499 E31.75200
+G0 X334.96 Y344.79
+G0 X314.87 Y320.90
+G0 X332.19 Y341.46
+G1 F2700 E25.25200
+G1 F2700 E31.75200
+G1 X312.942 Y319.079 E32.25343
+G1 X318.706 Y329.644 E34.08491
+G1 X337.070 Y326.516 E35.99082
+G1 X314.948 Y349.688 E36.52430
+G1 X311.253 Y316.194 E36.88044
+G1 X333.304 Y338.818 E37.87899
+G1 X333.514 Y349.111 E39.07433
+G1 X319.040 Y338.370 E39.51007
+G0 X321.91 Y342.99
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X346.978 Y320.143 E39.69976
+G1 X330.000 Y330.000 A0.40 B0.50
+G1 X324.264 Y313.531 E39.84686
+G1 X334.331 Y331.530 E40.07432
+G92 E0
+G0 X334.63 Y341.77
+G1 X334.831 Y343.199 E1.62383
+G0 X336.82 Y346.08
+G1 X329.479 Y330.171 E3.49007
+G1 X332.249 Y324.417 E4.12791
+;LAYER:764
+G0 F9000 X323.652 Y316.408 Z2.0
+;TIME_ELAPSED:282.680000
+G1 X330.000 Y330.000 A0.09 B0.72
+G1 F600 X404.937 Y339.115 E4.12791
+G1 X343.717 Y330.236 E5.91934
+N768 G1 X1 Y2*73
+G1 X338.700 Y324.063 E7.60297
+G1 X326.641 Y328.216 E9.34244
+G1 X335.710 Y312.487 E10.01824
+G1 X316.813 Y324.389 E11.87238
+G1 X314.036 Y315.927 E12.03099
+G1 F600 X334.828 Y330.420 E12.03099
+G0 X331.59 Y341.36
+G1 X346.825 Y318.525 E12.27960
+G1 X329.778 Y324.554 E13.62986
+G1 X313.149 Y331.576 E14.50820
+G1 X324.392 Y327.809 E14.64973
+G1 X321.897 Y313.027 E16.55302
+G1 X327.284 Y311.113 E16.68169
+G1 X320.353 Y338.129 E18.52960
+G1 X327.435 Y310.714 E18.87800
+G1 X314.674 Y328.324 E19.08494
+G1 X316.208 Y321.314 E19.45676
+N786 G1 X1 Y2*88
+G1 X329.334 Y345.470 E19.50758
+G1 X326.813 Y320.808 E21.48798
+G1 X331.328 Y321.571 E22.05562
+G1 X329.901 Y313.267 E23.49974
+G1 X316.905 Y325.729 E25.22042
+G1 X330.806 Y339.929 E27.17235
+G1 X328.912 Y318.686 E28.77254
+G1 X316.137 Y333.625 E30.02109
+G1 X329.486 Y324.647 E30.78186
+G1 X322.827 Y328.977 E32.75286
+;LAYER:797
+G0 F9000 X321.696 Y342.388 Z2.2
+;TIME_ELAPSED:294.890000
+G1 X346.564 Y337.653 E34.11990
+M106 S130
+M204 S500 P1000
+G1 X310.895 Y335.500 E35.37513
+G1 F2700 E28.87513
+G1 F2700 E35.37513
+G1 F600 X352.947 Y341.021 E35.37513
+G1 X313.516 Y315.266 E35.93889
+G1 F600 X269.759 Y332.035 E35.93889
+G1 X349.022 Y346.343 E37.39233
+N806 G1 X1 Y2*29
+G1 X329.963 Y338.151 E37.43929
+G1 X331.706 Y311.025 E37.75753
+G1 X329.247 Y324.832 E38.42793
+G1 X314.051 Y316.434 E40.29928
+G1 F1800 X448.193 Y344.349 E40.29928
+G0 X323.88 Y335.71
+G1 X348.504 Y341.926 E41.98723
+M106 S140
+M204 S500 P1000
+;LAYER:815
+G0 F9000 X340.182 Y348.082 Z2.4
+;TIME_ELAPSED:301.550000
+G1 X314.304 Y325.832 E43.26150
+M106 S44
+M204 S500 P1000
+G0 X313.80 Y349.91
+G1 X310.036 Y333.341 E43.88398
+G1 X334.441 Y326.273 E45.31304
+G0 X330.12 Y315.29
+G1 X326.542 Y332.766 E46.29946
+G1 F2700 X282.585 Y338.259 E46.29946
+G0 X332.49 Y312.34
+G1 X334.791 Y320.351 E47.60166
+G1 X320.142 Y343.007 E48.65590
+G0 X312.64 Y340.51
+G1 X328.327 Y344.544 E49.51513
+G1 X346.746 Y327.333 E51.39903
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G0 X337.34 Y331.37
+G1 F30000 X397.471 Y310.662 E51.39903
+G1 X322.019 Y321.498 E52.83149
+G1 X315.856 Y315.501 E53.81140
+G0 X317.76 Y348.92
+G1 F1800 X379.262 Y323.263 E53.81140
+G1 X341.130 Y312.728 E54.49530
+G1 X342.729 Y312.834 E55.66783
+G1 X337.030 Y329.041 E55.97335
+G1 X338.764 Y311.974 E56.40641
+G1 X334.326 Y326.082 E56.68740
+G1 X321.936 Y337.864 E57.61161
+G1 X310.058 Y311.268 E58.22709
+G1 X342.314 Y339.938 E59.68068
+G1 X335.793 Y311.044 E59.92631
+G0 X339.11 Y335.31
+G1 X333.825 Y316.820 E60.19857
+G1 X342.516 Y327.710 E61.23184
+G1 X330.932 Y343.159 E62.29465
+G1 X310.778 Y345.449 E63.01968
+G1 X319.565 Y320.512 E63.16170
+G1 F2700 X314.250 Y313.720 E63.16170
+G1 X332.576 Y329.688 E64.11191
+G1 X349.850 Y316.373 E65.20903
+G1 X341.396 Y316.911 E66.69757
+G1 X335.049 Y322.929 E68.10756
+G0 X327.72 Y320.41
+G1 X339.826 Y348.669 E68.53498
+G1 F30000 X222.397 Y341.543 E68.53498
+G1 X338.474 Y340.699 E69.66507
+G1 X313.729 Y346.342 E71.14751
+G1 X330.466 Y313.247 E72.27223
+G1 X334.913 Y343.223 E73.84113
+G1 X337.354 Y328.811 E75.36761
+G1 F2700 E68.86761
+G1 F2700 E75.36761
+G1 X313.350 Y326.271 E77.25152
+G1 X327.811 Y349.447 E78.52770
+G1 X311.963 Y335.118 E79.81007
+G1 F1200 X400.063 Y333.419 E79.81007
+G1 X328.736 Y339.932 E81.03129
+G1 X347.941 Y349.247 E83.00530
+G1 X327.886 Y340.636 E83.39352
+G1 X318.976 Y348.451 E83.41975
+G1 X332.862 Y341.072 E83.55792
+G1 F2700 E77.05792
+G1 F2700 E83.55792
+G1 X314.390 Y335.570 E84.97906
+G1 X316.985 Y326.755 E85.02178
+G1 F1800 X368.769 Y331.891 E85.02178
+G1 X324.813 Y318.997 E85.52722
+G1 F1800 X286.317 Y337.652 E85.52722
+G1 X329.454 Y339.218 E86.85651
+G1 X326.099 Y326.852 E88.47769
+G1 X332.624 Y335.388 E90.13637
+G1 X331.377 Y330.457 E90.25927
+G1 X311.318 Y344.238 E91.89172
+G1 F2700 E85.39172
+G1 F2700 E91.89172
+G1 X347.561 Y324.131 E93.79197
+G1 X312.424 Y342.632 E95.42301
+G1 X311.848 Y328.114 E96.67633
+G1 F30000 X302.216 Y328.013 E96.67633
+G1 X312.592 Y324.092 E97.80387
+G1 X331.221 Y318.998 E97.84440
+G1 X310.670 Y339.107 E98.82869
+G1 X330.000 Y330.000 A0.79 B0.57
+G1 X316.333 Y332.265 E99.19232
+G0 X335.10 Y348.42
+G1 X340.147 Y328.794 E99.22695
+G1 X344.428 Y314.565 E100.62578
+G1 X339.960 Y318.469 E100.67478
+G1 X342.063 Y327.706 E100.95902
+G1 X338.635 Y344.111 E101.70374
+G1 X348.432 Y343.723 E102.62543
+G1 F2700 X361.485 Y330.314 E102.62543
+G1 X327.146 Y340.157 E104.12911
+G1 X316.719 Y343.553 E105.95209
+G1 X325.822 Y341.893 E106.01369
+G1 X325.143 Y321.255 E107.96503
+G1 F1200 X270.248 Y311.546 E107.96503
+G1 X346.531 Y339.151 E109.51471
+G1 X322.212 Y325.112 E110.36718
+G1 X319.787 Y346.530 E110.64738
+G1 F2700 E104.14738
+G1 F2700 E110.64738
+G1 X315.789 Y336.398 E112.54900
+G1 X349.375 Y339.443 E113.69903
+G1 X343.279 Y329.788 E115.01956
+G0 X338.94 Y338.55
+G1 X348.094 Y312.456 E116.59830
+G1 X342.322 Y342.368 E117.98220
+G1 X339.820 Y348.874 E118.92296
+G1 X344.269 Y311.433 E118.95440
+G1 X310.392 Y346.789 E119.68417
+G1 X329.969 Y325.737 E119.83256
+G1 F600 X393.202 Y311.716 E119.83256
+M106 S15
+M204 S500 P1000
+G1 X313.160 Y342.085 E120.17437
+G1 X345.655 Y325.620 E120.86097
+G1 X324.392 Y312.440 E121.13667
+G1 X337.182 Y327.594 E121.87227
+G1 X339.956 Y333.393 E123.85642
+G1 X331.289 Y338.409 E125.15063
+G1 X347.993 Y342.207 E126.48374
+G1 X335.168 Y337.307 E126.87395
+G1 X321.410 Y312.570 E128.68247
+G1 X338.078 Y320.401 E130.49678
+G1 X347.497 Y327.973 E132.27957
+G1 X336.970 Y345.608 E132.83057
+G1 X329.951 Y337.672 E134.47580
+G1 F1200 X240.880 Y336.022 E134.47580
+G1 X349.578 Y326.432 E136.33201
+G1 X339.281 Y313.711 E136.38557
+G1 X346.141 Y318.295 E136.73644
+G1 X322.827 Y314.423 E137.26870
+G1 X345.578 Y345.409 E139.17829
+G1 X329.755 Y337.344 E139.41421
+G1 X321.427 Y336.775 E140.28392
+G1 X314.513 Y342.418 E142.11928
+G1 F600 X433.527 Y339.405 E142.11928
+G1 X323.800 Y323.912 E143.58064
+G1 X341.845 Y341.043 E143.58215
+G0 X326.64 Y338.04
+G1 X327.956 Y314.403 E144.12330
+G0 X338.33 Y311.71
+G1 F2700 X188.265 Y349.372 E144.12330
+G1 X330.000 Y330.000 A0.49 B0.37
+;LAYER:955
+G0 F9000 X340.617 Y339.069 Z2.6
+;TIME_ELAPSED:353.350000
+G1 X326.134 Y341.836 E144.25855
+G1 X337.457 Y317.276 E145.44694
+G1 X342.062 Y329.085 E145.74000
+G0 X327.33 Y326.04
+G1 X341.322 Y322.006 E146.62261
+G1 X316.055 Y316.091 E147.92002
+G1 X319.309 Y346.476 E148.86632
+G1 X321.168 Y310.562 E150.69574
+G0 X326.01 Y311.35
+G1 X326.069 Y337.368 E152.26454
+G1 X330.000 Y330.000 A0.27 B0.62
+G1 X330.000 Y330.000 A0.29 B0.83
+G1 X331.334 Y339.902 E153.61493
+G1 X314.196 Y344.606 E155.03120
+G1 X340.433 Y330.136 E156.40941
+G0 X338.79 Y320.19
+G1 X346.026 Y323.429 E157.86002
+G1 X348.025 Y334.610 E159.21255
+G1 X329.371 Y318.041 E160.21059
+G1 X326.767 Y334.365 E161.34357
+G1 X323.988 Y323.465 E163.16311
+G0 X333.23 Y349.56
+G1 F1800 X189.921 Y332.277 E163.16311
+G1 X349.170 Y349.262 E164.22988
+G1 F1800 X171.161 Y327.955 E164.22988
+G1 X346.857 Y311.117 E164.70542
+G0 X349.61 Y323.52
+G1 X314.096 Y348.064 E165.57111
+G1 X338.582 Y330.624 E165.94825
+G1 X348.632 Y345.062 E166.37419
+G0 X343.03 Y347.55
+G1 X326.056 Y318.197 E167.92461
+G1 F30000 X253.141 Y324.033 E167.92461
+G1 X316.559 Y315.224 E168.88139
+G1 X317.786 Y337.200 E170.60268
+G1 X329.930 Y314.917 E172.45509
+G1 F2700 E165.95509
+G1 F2700 E172.45509
+G1 X324.252 Y347.158 E173.50877
+N994 G1 X1 Y2*34
+M106 S63
+M204 S500 P1000
+G0 X318.49 Y339.59
+G1 X313.816 Y342.056 E174.97049
+G1 X345.385 Y331.980 E175.98878
+G0 X315.75 Y323.30
+G1 X315.527 Y341.085 E176.73537
+G1 F2700 E170.23537
+G1 F2700 E176.73537
+G1 X329.465 Y331.592 E178.28648
+G1 F2700 X393.752 Y334.745 E178.28648
+G1 X341.110 Y315.661 E178.85169
+G1 X313.317 Y349.838 E179.32568
+G0 X320.98 Y339.02
+G1 X342.776 Y329.782 E179.91470
+G1 X320.343 Y335.265 E180.49513
+G1 X339.769 Y318.027 E181.68313
+G1 X311.827 Y341.229 E183.37162
+G1 X348.255 Y349.366 E184.23422
+G1 X339.910 Y315.737 E184.67934
+G92 E0
+G1 X329.764 Y334.737 E0.19472
+G1 X342.923 Y349.100 E1.29853
+G1 F1200 X462.683 Y336.906 E1.29853
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X326.370 Y329.840 E2.24749
+G1 X330.000 Y330.000 A0.77 B0.10
+G1 X326.579 Y315.902 E2.45793
+G1 X339.634 Y320.282 E4.43507
+G1 X349.501 Y313.731 E4.91934
+G1 X325.570 Y349.438 E5.18940
+G1 X346.439 Y345.906 E5.67419
+G1 X330.143 Y347.659 E6.89463
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 F600 X183.563 Y336.461 E6.89463
+G1 X317.004 Y325.985 E7.85278
+G0 X321.02 Y326.39
+G1 X318.092 Y324.270 E8.59224
+G1 X334.850 Y334.774 E9.64711
+G1 X349.725 Y344.567 E10.62397
+G1 X323.162 Y311.281 E12.00103
+G1 X325.765 Y329.204 E13.87114
+G1 X331.980 Y313.209 E13.91396
+G0 X332.93 Y314.66
+G1 X316.485 Y321.661 E14.01723
+G1 X312.124 Y347.651 E14.81506
+G1 X317.389 Y336.924 E16.80246
+G0 X325.84 Y339.84
+G1 X316.891 Y343.905 E18.21374
+G92 E0
+G1 X338.519 Y323.143 E0.51612
+G1 X347.171 Y334.850 E1.31542
+G0 X330.96 Y332.97
+G0 X344.07 Y339.90
+G1 X339.402 Y318.091 E2.58388
+G1 X320.339 Y339.260 E3.81416
+G1 X311.777 Y310.746 E5.18659
+G1 X315.048 Y333.933 E5.87901
+G0 X334.57 Y317.99
+G0 X348.99 Y326.23
+N1053 G1 X1 Y2*77
+G1 F2700 E-0.62099
+G1 F2700 E5.87901
+G1 X327.540 Y340.389 E7.01586
+G0 X326.17 Y310.22
+G0 X335.35 Y311.46
+G1 X335.848 Y325.242 E7.55122
+G1 X330.000 Y330.000 A0.75 B0.46
+G1 X315.089 Y317.739 E8.97156
+G1 X314.878 Y327.160 E10.42451
+G1 X316.918 Y323.554 E11.31822
+G1 X332.302 Y319.795 E12.01970
+G0 X339.19 Y321.26
+G1 X312.234 Y322.095 E12.26275
+G1 X334.544 Y332.245 E13.53505
+G1 X328.344 Y310.224 E13.96635
+G1 X341.872 Y344.697 E15.55605
+G1 X338.992 Y319.064 E16.40164
+G1 X322.157 Y347.747 E17.38945
+G1 X343.343 Y315.453 E17.45547
+G92 E0
+G1 F1800 X488.534 Y340.908 E0.00000
+G1 X330.000 Y330.000 A0.50 B0.42
+G1 X316.414 Y323.593 E0.64697
+G1 F600 X303.755 Y346.269 E0.64697
+G0 X330.50 Y342.23
+G1 F2700 X396.609 Y331.314 E0.64697
+G0 X310.96 Y330.15
+G1 X320.120 Y316.683 E0.77661
+G1 X349.949 Y314.547 E2.48569
+G1 X338.708 Y329.834 E4.25285
+G0 X324.30 Y337.99
+G1 X318.852 Y322.116 E5.31625
+G1 X320.866 Y333.776 E5.78575
+G0 X331.00 Y329.71
+G1 F2700 X288.663 Y329.865 E5.78575
+G1 X342.232 Y328.636 E6.68988
+G1 X337.801 Y327.791 E8.13605
+G0 X340.13 Y339.00
+G1 X339.478 Y339.911 E8.50313
+G1 X331.804 Y337.897 E9.69163
+G1 X346.573 Y346.508 E10.62406
+G1 X328.030 Y312.388 E10.64254
+G0 X336.14 Y339.77
+G1 X331.350 Y342.499 E10.89356
+G1 X315.106 Y320.814 E12.40624
+G1 X324.868 Y330.773 E12.51665
+G1 X341.544 Y319.983 E14.31192
+G0 X332.75 Y342.13
+G1 X323.752 Y330.222 E15.13592
+G0 X312.62 Y321.85
+G1 X330.005 Y330.808 E16.64498
+G1 X332.963 Y334.388 E17.03662
+G0 X318.84 Y329.57
+G1 X341.565 Y318.121 E17.19120
+G1 F1800 X340.590 Y324.945 E17.19120
+G1 X315.192 Y321.333 E18.76103
+G1 F1200 X296.238 Y337.894 E18.76103
+G0 X335.51 Y317.30
+G1 X335.996 Y339.435 E18.86130
+G1 X336.729 Y341.637 E18.92093
+G92 E0
+G1 X339.926 Y318.100 E1.77983
+G1 X311.813 Y327.479 E3.46840
+G1 X315.794 Y331.921 E4.60442
+G1 F2700 X281.166 Y345.311 E4.60442
+G1 X320.327 Y316.754 E5.87964
+G92 E0
+G1 X334.196 Y332.288 E0.63184
+G0 X338.32 Y325.44
+G0 X341.69 Y326.08
+G1 X332.910 Y316.728 E2.18568
+G0 X346.33 Y332.21
+G1 F2700 E-4.31432
+G1 F2700 E2.18568
+G1 X321.733 Y320.808 E3.87580
+G1 X336.096 Y343.110 E5.17365
+G1 X315.951 Y313.943 E6.00638
+G1 X336.436 Y313.917 E7.97361
+G1 X344.659 Y340.538 E8.98036
+G1 X322.964 Y331.908 E9.53221
+G1 X338.810 Y324.072 E9.68247
+G1 F30000 X239.510 Y339.469 E9.68247
+G1 X342.217 Y314.608 E11.45677
+N1135 G1 X1 Y2*59
+G1 F1800 X265.821 Y319.533 E11.45677
+G1 X342.122 Y316.855 E13.44069
+G1 X329.457 Y320.305 E14.76003
+G1 X322.782 Y320.513 E15.27515
+G1 X341.114 Y333.122 E16.50555
+G1 X312.888 Y349.769 E16.84064
+G1 X323.994 Y313.818 E18.09772
+G1 X311.601 Y336.149 E19.26525
+G1 F2700 E12.76525
+G1 F2700 E19.26525
+G1 X348.299 Y338.907 E20.16357
+G0 X328.73 Y341.67
+G1 X321.706 Y320.022 E20.50358
+G1 X313.199 Y340.240 E22.39059
+G1 X349.853 Y333.498 E23.18806
+G1 X312.544 Y323.636 E24.83541
+G1 X337.131 Y343.933 E26.55701
+G1 X329.275 Y343.911 E26.69266
+M106 S22
+M204 S500 P1000
+G1 X327.153 Y327.006 E27.88189
+G1 X343.415 Y322.221 E29.40029
+G1 F1200 X280.504 Y321.610 E29.40029
+G1 X333.012 Y336.239 E30.90239
+G1 F2700 X366.724 Y348.613 E30.90239
+G1 X343.597 Y345.115 E32.56577
+G1 X310.448 Y335.971 E33.12002
+G1 X332.811 Y345.359 E34.21148
+G1 X333.649 Y310.334 E34.99515
+G1 X338.233 Y331.456 E35.23017
+G1 X330.004 Y341.785 E36.20458
+G1 X335.682 Y338.382 E37.03242
+G1 X312.191 Y348.218 E37.93538
+G1 X324.935 Y329.277 E38.92243
+G1 F1200 X387.177 Y322.475 E38.92243
+M117 Layer 1169 of 99
+G1 X346.956 Y334.262 E40.83492
+G1 X312.084 Y330.265 E41.24415
+G1 X330.439 Y345.300 E42.89498
+G1 X330.864 Y310.863 E43.83481
+G1 X317.745 Y344.221 E45.07778
+G1 F1200 X330.667 Y322.950 E45.07778
+G1 X343.905 Y321.350 E45.54116
+G1 X346.224 Y346.206 E46.27079
+;LAYER:1178
+G0 F9000 X346.822 Y316.483 Z2.8
+;TIME_ELAPSED:435.860000
+G1 X330.000 Y330.000 A0.88 B0.06
+G1 X347.941 Y334.743 E47.69018
+G1 X348.637 Y336.039 E49.51582
+G0 X348.40 Y330.47
+G0 X332.63 Y326.82
+G1 F600 X362.837 Y311.317 E49.51582
+G1 X321.114 Y324.815 E50.70764
+G1 X342.142 Y344.339 E52.65656
+G1 X315.505 Y346.669 E52.90798
+G1 X346.510 Y345.458 E53.33858
+G1 X317.091 Y314.308 E54.94437
+G1 X328.246 Y325.126 E56.27866
+G1 F1200 X262.303 Y342.512 E56.27866
+G0 X348.95 Y315.67
+G1 F600 X187.472 Y310.858 E56.27866
+G1 F600 X439.159 Y321.775 E56.27866
+G1 X313.048 Y330.346 E56.39243
+G1 X330.000 Y330.000 A0.91 B0.02
+G1 X324.316 Y310.743 E58.19150
+G1 X325.366 Y329.509 E59.64905
+G0 X347.12 Y326.67
+G1 F2700 X376.578 Y336.649 E59.64905
+G1 X337.108 Y313.585 E60.39355
+G1 X330.000 Y330.000 A0.49 B0.33
+G1 X341.983 Y323.319 E61.79799
+G1 X316.200 Y346.805 E62.75360
+G1 X343.307 Y340.692 E64.16823
+G1 X310.086 Y341.829 E64.59139
+G1 X314.278 Y342.765 E66.51992
+G1 X348.724 Y320.591 E67.84384
+G1 F600 X347.367 Y317.084 E67.84384
+G1 X337.712 Y313.766 E69.25309
+G1 X349.043 Y342.657 E69.68748
+G1 X348.695 Y333.129 E70.85508
+G0 X333.83 Y325.25
+G1 X327.035 Y335.063 E71.65430
+G1 X318.876 Y348.630 E72.75284
+G1 X333.182 Y334.860 E74.28299
+G1 X335.998 Y322.724 E75.06257
+G1 X330.000 Y330.000 A0.53 B0.57
+G1 X340.612 Y315.799 E76.88135
+G1 X338.603 Y339.810 E77.26795
+G1 X323.893 Y321.864 E77.98863
+G0 X310.95 Y316.16
+G1 X312.771 Y318.007 E78.45472
+G1 X328.210 Y311.449 E79.20447
+G1 X342.668 Y347.963 E79.41852
+G1 F600 X177.735 Y326.364 E79.41852
+G1 X349.010 Y336.975 E80.37114
+G1 X313.906 Y336.444 E80.56452
+;LAYER:1229
+G0 F9000 X349.886 Y320.734 Z3.0
+;TIME_ELAPSED:454.730000
+G1 X338.840 Y338.936 E80.99024
+G0 X340.85 Y330.87
+G0 X325.12 Y313.72
+G1 X325.689 Y328.204 E81.23161
+G1 F2700 E74.73161
+G1 F2700 E81.23161
+G1 F30000 X226.856 Y312.019 E81.23161
+G1 X335.276 Y344.592 E82.08428
+G1 F1800 X180.793 Y340.149 E82.08428
+G1 X322.540 Y322.519 E83.81696
+G1 X322.163 Y340.391 E85.71653
+G1 X330.000 Y330.000 A0.10 B0.52
+G1 X320.664 Y349.707 E85.96463
+G1 F600 X222.664 Y325.205 E85.96463
+G1 X345.913 Y314.313 E87.23433
+;LAYER:1244
+G0 F9000 X348.411 Y316.221 Z3.2
+;TIME_ELAPSED:460.280000
+G1 X330.900 Y337.600 E89.06700
+G1 F600 X174.818 Y349.485 E89.06700
+G1 X333.754 Y340.524 E89.36149
+G1 X334.386 Y338.026 E89.92832
+G1 X340.868 Y316.638 E91.27777
+M106 S38
+M204 S500 P1000
+G1 X315.459 Y342.964 E92.13644
+G0 X322.96 Y313.37
+;LAYER:1253
+G0 F9000 X339.810 Y325.998 Z3.4
+;TIME_ELAPSED:463.610000
+G1 X345.410 Y339.153 E92.67805
+G1 X348.674 Y319.526 E92.83440
+G1 X337.166 Y343.196 E93.59452
+G1 X311.480 Y333.746 E94.23829
+G1 X312.134 Y335.913 E95.39433
+G1 X349.614 Y335.403 E95.50461
+G1 X341.117 Y333.779 E96.49589
+G1 X319.683 Y315.744 E97.05624
+G0 X321.87 Y349.46
+G0 X332.05 Y346.07
+G1 X343.738 Y331.309 E97.78071
+G1 X339.422 Y348.961 E97.96739
+G1 X338.830 Y326.859 E99.24202
+G1 F30000 X176.391 Y334.743 E99.24202
+G1 X313.345 Y330.736 E100.50630
+G1 X310.488 Y318.781 E100.59649
+G1 X314.241 Y315.858 E100.66028
+G1 X317.481 Y329.590 E102.54604
+G1 X316.946 Y336.048 E102.95957
+G1 X336.780 Y312.645 E104.79029
+M117 Layer 1274 of 99
+G1 X348.872 Y329.113 E106.44128
+G1 F600 X183.338 Y311.366 E106.44128
+G1 X327.115 Y325.914 E106.87370
+G1 X313.929 Y311.256 E107.96647
+M117 Layer 1279 of 99
+G1 F2700 X232.151 Y338.605 E107.96647
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X325.695 Y317.990 E109.14196
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X346.936 Y329.750 E111.13880
+G1 X348.946 Y311.950 E112.38256
+G1 X326.259 Y311.674 E114.11720
+G1 X348.194 Y317.090 E115.30871
+G1 X317.320 Y326.473 E115.88711
+G0 X329.50 Y321.53
+M106 S238
+M204 S500 P1000
+G1 X327.940 Y335.053 E116.45113
+G1 X317.398 Y329.908 E117.84340
+G1 X329.613 Y337.992 E118.02170
+M117 Layer 1294 of 99
+G1 X332.809 Y320.607 E118.91961
+G1 X349.516 Y346.339 E119.09475
+G1 X323.052 Y333.016 E120.65011
+G1 X334.282 Y348.518 E120.93521
+G1 X335.021 Y328.680 E122.23270
+G1 X349.865 Y318.657 E123.42096
+G0 X326.82 Y324.56
+G1 X329.500 Y344.521 E124.99985
+G1 X340.473 Y336.763 E125.67424
+G1 F30000 X232.794 Y315.005 E125.67424
+G1 X344.891 Y336.845 E127.14518
+G1 X332.044 Y339.979 E127.98298
+G0 X347.06 Y347.02
+G1 X326.845 Y338.178 E129.28474
+G1 X321.819 Y330.979 E131.07588
+G1 X336.739 Y320.173 E132.11600
+G1 X337.287 Y333.841 E133.22307
+G1 F600 X348.283 Y340.911 E133.22307
+N1313 G1 X1 Y2*89
+G1 X320.169 Y315.259 E133.64419
+G1 X337.046 Y326.332 E134.17455
+G0 X330.28 Y341.97
+G1 X324.429 Y323.002 E135.98999
+G0 X335.75 Y327.33
+G0 X318.84 Y318.19
+G1 X326.197 Y310.127 E137.59391
+G1 X334.088 Y310.725 E139.38752
+G1 X321.796 Y337.568 E141.37954
+G1 X330.022 Y311.945 E142.66100
+G1 X330.000 Y330.000 A0.21 B0.49
+G1 X318.610 Y314.093 E144.03381
+G0 X349.43 Y318.29
+G0 X312.62 Y348.35
+G1 X339.074 Y332.149 E144.37495
+G1 X348.543 Y342.292 E145.92781
+G1 X348.545 Y340.122 E147.59988
+G1 X326.995 Y347.270 E149.59377
+G1 F600 X316.467 Y323.002 E149.59377
+G0 X323.49 Y314.87
+G1 X311.833 Y313.246 E151.05639
+G1 X313.029 Y314.431 E151.96215
+G1 X313.330 Y346.916 E153.61054
+;LAYER:1337
+G0 F9000 X348.278 Y322.121 Z3.6
+;TIME_ELAPSED:494.690000
+G1 X326.096 Y321.370 E154.60755
+G1 X332.668 Y325.408 E155.60259
+G1 X311.295 Y314.524 E156.80663
+G1 X313.182 Y347.994 E157.85894
+G1 F2700 X300.770 Y327.125 E157.85894
+G1 X335.092 Y349.252 E157.86061
+G1 X348.863 Y325.910 E159.36918
+G1 F1200 X349.766 Y311.835 E159.36918
+G1 X324.625 Y346.392 E160.26007
+G1 X341.477 Y347.089 E161.10318
+G1 X349.133 Y338.059 E161.39101
+G1 F1200 X474.065 Y333.684 E161.39101
+G1 X325.604 Y335.827 E162.78029
+G1 X332.049 Y339.228 E163.71425
+G1 X310.628 Y313.395 E165.20455
+G1 X345.660 Y327.376 E165.78463
+G1 F1800 X449.412 Y340.220 E165.78463
+G1 X332.275 Y332.539 E166.41575
+G0 X321.63 Y336.61
+M117 Layer 1357 of 99
+G1 X317.251 Y335.257 E168.10754
+G0 X344.13 Y320.26
+G1 X330.000 Y330.000 A0.95 B0.37
+G1 X321.701 Y342.876 E169.72376
+G1 X329.703 Y331.516 E170.30705
+G1 F2700 X452.949 Y343.278 E170.30705
+G1 X343.108 Y317.313 E170.87512
+G0 X324.86 Y321.06
+G1 X338.708 Y345.007 E172.52032
+G1 X325.809 Y348.407 E174.48190
+G1 F30000 X386.576 Y348.598 E174.48190
+G1 F2700 X192.700 Y317.218 E174.48190
+G1 X330.156 Y326.677 E174.53295
+G1 X345.681 Y344.273 E174.65336
+G1 X347.487 Y343.891 E176.03808
+G1 X346.192 Y344.374 E177.08477
+G1 X324.364 Y332.722 E177.24476
+G1 X310.707 Y332.331 E177.55285
+G1 X311.788 Y339.252 E179.03318
+G0 X344.26 Y335.82
+G0 X336.44 Y322.42
+G1 X336.180 Y337.721 E180.92854
+G1 X324.964 Y340.412 E180.95204
+G0 X311.29 Y317.86
+M106 S185
+M204 S500 P1000
+G1 X341.489 Y312.042 E181.08533
+G1 X340.389 Y310.505 E181.47923
+G1 X317.048 Y327.387 E181.65847
+G1 X319.693 Y338.038 E182.67279
+G1 X318.340 Y328.804 E184.66035
+G1 F1800 X269.318 Y340.323 E184.66035
+G1 X321.705 Y317.764 E186.04220
+G0 X324.85 Y320.21
+G1 X317.694 Y342.561 E187.16145
+G0 X323.02 Y342.73
+N1393 G1 X1 Y2*14
+G1 X325.597 Y332.571 E187.19634
+G1 X337.001 Y331.331 E187.51074
+G1 X320.066 Y344.047 E188.61310
+G1 X320.501 Y342.796 E188.74450
+G1 X318.456 Y328.568 E190.20960
+G1 X338.354 Y344.020 E191.21083
+G1 X345.908 Y346.779 E191.26160
+G1 F2700 X452.613 Y337.001 E191.26160
+G1 X322.869 Y312.071 E192.00311
+G1 X339.974 Y332.731 E192.53078
+G1 X339.585 Y347.295 E192.57447
+G1 X311.549 Y319.581 E193.68521
+G1 X319.605 Y336.627 E194.38303
+G0 X332.28 Y332.07
+G1 X338.183 Y335.907 E195.12672
+G1 X311.872 Y317.994 E197.10866
+G1 X330.000 Y330.000 A0.84 B0.68
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X319.071 Y327.976 E197.20911
+G1 X348.180 Y317.207 E198.14648
+G1 X313.560 Y327.605 E199.98326
+G1 X331.129 Y323.811 E201.39169
+G1 X312.222 Y346.600 E202.86728
+G0 X336.64 Y331.15
+G1 X310.016 Y315.289 E204.30023
+G1 X319.120 Y343.621 E206.18934
+G1 X312.112 Y313.586 E206.78879
+G1 F30000 X405.452 Y337.316 E206.78879
+G0 X342.81 Y336.50
+G0 X328.72 Y341.94
+G1 X321.212 Y312.912 E208.69619
+G1 F1200 X259.201 Y310.357 E208.69619
+G1 X341.236 Y314.426 E210.56714
+G1 F1800 X391.350 Y333.773 E210.56714
+G1 X336.416 Y341.768 E211.25722
+G1 X347.364 Y340.834 E213.00899
+G1 X317.667 Y346.884 E213.86179
+G1 X315.066 Y320.496 E214.45751
+G1 X337.880 Y337.327 E215.39276
+G1 X343.597 Y345.349 E216.34906
+M117 Layer 1434 of 99
+G1 X338.384 Y329.911 E217.31514
+G1 X344.700 Y320.565 E217.46780
+G0 X323.44 Y335.57
+G1 X333.670 Y323.980 E218.18580
+G1 X327.097 Y312.038 E219.39223
+G0 X347.96 Y334.33
+G1 X312.563 Y310.519 E221.13953
+G1 X330.136 Y317.088 E221.64898
+G1 X333.891 Y349.098 E222.21701
+G1 X322.321 Y346.980 E224.18125
+G0 X320.16 Y324.49
+G1 X320.030 Y340.525 E225.24184
+G1 X338.379 Y333.694 E225.42084
+G1 X328.203 Y336.452 E226.88909
+G1 X314.879 Y342.612 E228.49592
+G1 X323.579 Y332.747 E228.90609
+G0 X347.65 Y349.34
+G1 X342.093 Y316.613 E229.17267
+G1 X347.030 Y326.053 E229.53282
+G1 X311.784 Y342.828 E231.02581
+G1 X328.013 Y337.103 E231.50721
+M117 Layer 1456 of 99
+G1 X344.216 Y342.305 E232.92648
+G1 X344.437 Y342.443 E234.14359
+G1 X344.629 Y338.959 E234.61530
+G1 X335.600 Y344.093 E234.71007
+G1 F2700 X481.473 Y334.005 E234.71007
+G1 X337.292 Y349.544 E234.98918
+G1 X327.342 Y313.656 E236.32548
+G1 X348.550 Y322.355 E236.91949
+G1 X340.625 Y324.287 E237.68133
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X349.397 Y315.604 E239.39592
+G1 X341.642 Y330.226 E240.46161
+G1 X336.177 Y338.670 E241.97378
+G1 X317.149 Y321.304 E243.92563
+G1 X323.407 Y343.875 E244.92467
+G1 X344.063 Y321.519 E246.50499
+G1 X336.365 Y329.019 E248.49960
+G1 X331.250 Y315.784 E250.05753
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G0 X313.23 Y325.16
+G1 X345.741 Y326.077 E251.68513
+G1 X332.725 Y311.874 E253.31966
+G1 X335.522 Y336.275 E254.88275
+N1480 G1 X1 Y2*99
+G1 X334.438 Y330.154 E256.15240
+G1 X320.437 Y346.820 E256.65746
+G1 F2700 X255.892 Y333.841 E256.65746
+G1 X320.650 Y316.823 E257.57808
+G1 X347.360 Y320.424 E258.86112
+G1 F1200 X198.595 Y316.396 E258.86112
+;LAYER:1487
+G0 F9000 X344.226 Y347.706 Z3.8
+;TIME_ELAPSED:550.190000
+G1 X346.110 Y325.800 E260.85883
+G1 X340.379 Y344.166 E261.50198
+G1 X332.704 Y331.631 E262.48654
+G1 X325.425 Y326.393 E263.55130
+G1 X326.202 Y336.468 E265.44245
+G1 X347.167 Y336.292 E265.84642
+G0 X332.73 Y318.61
+G1 X316.482 Y342.982 E267.56001
+G1 X326.030 Y344.237 E268.24219
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X323.814 Y334.283 E269.55254
+G1 X311.834 Y329.230 E271.32744
+M107
+M104 S0
+G28 X0 Y0
+M84
@@ -0,0 +1,1667 @@
+;FLAVOR:Marlin
+;TIME:31290
+M104 S210
+M140 S60
+M190 S60
+M109 S210
+G28 ;Home
+G92 E0
+G1 Z15.0 F6000
+M117 Printing hello world  
+M106 S255
+M107
+G21
+G90
+M82
+M4010 I1 T0 'abcdef'
+T0
+G1 X134.957 Y108.443 E0.26085
+G1 X134.529 Y108.154 E1.47204
+G1 X123.029 Y112.458 E1.85553
+G1 X131.661 Y93.915 E2.64980
+G1 X103.396 Y80.909 E4.50147
+G1 F1200 X233.951 Y115.466 E4.50147
+G1 X131.932 Y108.365 E4.56350
+G1 F2700 X212.782 Y135.266 E4.56350
+G1 X106.677 Y136.135 E6.16531
+G0 X85.85 Y88.16
+G1 X106.170 Y117.599 E8.09627
+G1 X103.152 Y101.055 E9.11076
+G1 X134.252 Y120.919 E10.27926
+G92 E0
+G0 X139.46 Y120.28
+G1 X137.878 Y134.282 E1.72128
+G1 X92.667 Y129.896 E3.14891
+G1 X83.808 Y131.237 E3.71882
+G1 X110.000 Y110.000 A0.09 B0.80
+G1 X97.633 Y126.128 E4.02035
+G0 X82.65 Y116.87
+G1 X99.857 Y132.854 E5.45724
+G1 X110.000 Y110.000 A0.51 B1.00
+G1 X115.986 Y81.883 E5.61118
+G1 X116.628 Y89.372 E6.42705
+G1 X98.830 Y137.520 E8.16261
+G0 X102.67 Y107.62
+G1 X115.739 Y113.556 E9.45038
+G1 X110.422 Y105.871 E11.33163
+G1 F1200 X319.489 Y106.247 E11.33163
+G1 X100.334 Y127.304 E11.93761
+G1 X110.000 Y110.000 A0.31 B0.38
+G1 X118.012 Y99.947 E12.20415
+G1 X116.532 Y96.735 E14.03883
+G1 X137.290 Y81.275 E15.21758
+G1 X97.918 Y116.087 E16.47352
+G1 X125.486 Y130.630 E16.84401
+G1 X86.292 Y128.783 E18.41862
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X110.001 Y119.223 E18.68146
+G1 X120.684 Y118.972 E19.33703
+G1 X136.949 Y120.496 E20.53848
+G1 X137.641 Y84.797 E22.15801
+G1 F1200 X294.751 Y107.066 E22.15801
+G1 X111.778 Y91.448 E22.39985
+G0 X130.31 Y91.02
+G1 X118.516 Y128.375 E24.01430
+G1 X97.517 Y127.632 E24.27368
+G1 X105.014 Y105.186 E24.96639
+G1 X89.360 Y80.280 E26.80761
+M106 S222
+M204 S500 P1000
+G1 X123.036 Y81.939 E28.77913
+G1 X124.881 Y137.802 E30.28589
+G1 X131.692 Y131.479 E32.06530
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X82.109 Y128.177 E32.55437
+G1 X133.014 Y105.793 E32.95130
+G1 X87.249 Y110.191 E33.91340
+G1 X112.220 Y83.195 E33.95309
+G1 F2700 E27.45309
+G1 F2700 E33.95309
+G1 X138.319 Y112.459 E34.20390
+G0 X83.68 Y93.25
+G1 X87.153 Y94.367 E35.97918
+G1 X87.709 Y135.245 E37.75844
+G1 X104.017 Y125.389 E38.90023
+G1 X111.180 Y83.058 E40.13641
+G1 X131.421 Y126.515 E41.77546
+G1 X108.969 Y81.981 E41.87513
+G1 F30000 X111.018 Y98.954 E41.87513
+G1 X118.815 Y115.197 E42.57771
+G1 X99.727 Y87.425 E42.95987
+G1 X102.814 Y84.794 E44.39196
+G1 X116.266 Y126.957 E45.13851
+G1 X117.376 Y105.896 E46.74083
+G1 X122.173 Y105.231 E47.73313
+G1 X94.705 Y112.150 E48.65481
+G1 X105.493 Y105.551 E48.79798
+G0 X136.19 Y102.45
+G0 X127.46 Y95.73
+G1 X128.793 Y119.737 E49.04427
+G0 X127.55 Y120.05
+G1 F30000 X125.346 Y128.697 E49.04427
+G1 F2700 X-61.111 Y126.458 E49.04427
+G1 X85.958 Y132.828 E49.22787
+G1 X130.492 Y87.277 E49.27484
+G0 X120.41 Y130.17
+M117 Layer 86 of 99
+G1 X82.176 Y126.045 E50.87233
+G1 X86.405 Y124.938 E52.30265
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X113.839 Y129.684 E52.95114
+G1 X94.998 Y116.959 E53.31069
+G1 F2700 X-8.610 Y115.967 E53.31069
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X102.519 Y94.116 E55.24332
+G92 E0
+G0 X138.03 Y104.92
+G1 X135.436 Y121.134 E1.15965
+G1 X133.253 Y89.755 E1.96175
+G1 X121.918 Y137.042 E2.92876
+G1 X88.177 Y125.123 E4.64497
+G1 X136.087 Y131.089 E5.67620
+G1 X120.283 Y131.318 E7.23527
+G1 X139.025 Y133.365 E8.40442
+G1 X128.246 Y92.037 E8.94061
+G1 X108.956 Y131.828 E9.41826
+G1 X122.089 Y92.345 E10.81336
+G1 X119.144 Y81.666 E12.61687
+G1 X110.000 Y110.000 A0.07 B0.95
+G1 F600 X94.350 Y93.776 E12.61687
+G1 X120.521 Y137.523 E14.05225
+G0 X94.53 Y91.38
+G1 X122.284 Y131.516 E14.42662
+G0 X95.30 Y131.91
+G1 X123.738 Y85.156 E15.27321
+G1 X97.506 Y101.400 E16.94107
+G1 X80.413 Y100.088 E18.29208
+G1 X92.606 Y115.106 E19.26389
+M117 Layer 118 of 99
+G1 X87.151 Y96.486 E20.35260
+G1 X133.231 Y134.526 E20.57766
+G1 X102.453 Y126.345 E22.46023
+G1 F1800 X188.193 Y120.198 E22.46023
+M106 S135
+M204 S500 P1000
+G1 X100.312 Y113.963 E24.34913
+G1 X110.521 Y83.571 E25.68289
+G1 X124.536 Y118.750 E27.13868
+G1 F1200 X-44.030 Y133.395 E27.13868
+G1 X135.911 Y88.483 E27.38494
+G1 X115.846 Y113.295 E28.82590
+G1 X98.747 Y90.583 E29.74131
+G1 X125.269 Y112.588 E31.17298
+G1 F1800 X-82.070 Y96.251 E31.17298
+G1 X108.722 Y96.276 E31.44603
+G1 X132.515 Y136.703 E32.47547
+G1 X84.154 Y109.880 E34.09378
+G1 X110.000 Y110.000 A0.15 B0.59
+G1 X134.597 Y86.726 E35.22250
+G1 X120.209 Y103.471 E36.35668
+G1 X110.000 Y110.000 A0.13 B0.61
+G0 X127.89 Y112.68
+G1 X132.114 Y102.176 E36.71446
+G1 X106.690 Y104.434 E38.39905
+G0 X98.96 Y134.37
+G1 X111.745 Y122.417 E39.39469
+G0 X120.06 Y81.81
+G1 X86.449 Y125.358 E40.66277
+G1 X117.501 Y91.934 E41.00898
+G1 F1200 X-112.210 Y110.027 E41.00898
+G1 X113.960 Y137.541 E41.89743
+G0 X88.14 Y127.54
+G1 X101.594 Y94.005 E41.99864
+G1 X135.789 Y99.387 E43.07640
+G0 X121.68 Y88.06
+G0 X116.07 Y135.62
+G1 F1800 X348.971 Y92.305 E43.07640
+G1 X121.942 Y93.253 E43.47636
+G1 X104.509 Y130.715 E45.05013
+G1 F2700 X108.627 Y121.957 E45.05013
+G1 X118.955 Y98.279 E45.89436
+G1 X104.087 Y90.835 E47.40855
+G0 X123.18 Y102.02
+G1 X115.788 Y93.431 E48.46722
+;LAYER:163
+G0 F9000 X92.540 Y126.991 Z0.4
+;TIME_ELAPSED:60.310000
+G1 X91.718 Y92.557 E49.38719
+G1 X90.097 Y81.649 E50.19469
+G1 X109.417 Y83.583 E50.53115
+G1 X104.465 Y122.207 E51.42720
+G1 X103.797 Y81.600 E52.23380
+N169 G1 X1 Y2*28
+G1 X91.439 Y99.979 E53.01197
+G1 X115.665 Y128.448 E54.83735
+G1 X136.519 Y127.356 E56.79992
+N173 G1 X1 Y2*62
+G1 X128.880 Y117.746 E57.33155
+G1 X120.944 Y138.156 E57.51898
+G1 X81.818 Y85.432 E57.52630
+G1 X83.237 Y119.259 E57.59951
+G1 F2700 E51.09951
+G1 F2700 E57.59951
+G1 X108.613 Y128.215 E59.54720
+G1 F2700 E53.04720
+G1 F2700 E59.54720
+M106 S17
+M204 S500 P1000
+G1 X117.890 Y103.661 E61.05036
+M106 S94
+M204 S500 P1000
+G0 X86.88 Y103.39
+G1 X135.711 Y90.478 E62.41046
+G1 F2700 X271.115 Y113.200 E62.41046
+G92 E0
+G1 X93.764 Y126.768 E0.82945
+G1 X90.185 Y123.238 E1.36836
+G1 X103.208 Y109.227 E2.78961
+G1 X81.377 Y108.016 E4.21101
+G1 F600 X23.641 Y116.041 E4.21101
+G0 X83.39 Y116.73
+G1 X132.126 Y118.795 E5.14391
+G1 X110.000 Y110.000 A0.00 B0.19
+G1 F600 X32.466 Y98.679 E5.14391
+G1 X92.624 Y121.292 E6.78777
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X86.727 Y97.250 E8.75840
+G1 X110.934 Y110.297 E10.45991
+G1 F2700 E3.95991
+G1 F2700 E10.45991
+G1 X126.930 Y108.049 E12.22568
+G1 X128.378 Y115.889 E12.30832
+G0 X86.08 Y136.59
+G1 X103.948 Y129.528 E12.52642
+G1 X109.135 Y120.111 E12.74411
+G1 X119.664 Y126.669 E13.54983
+G1 X106.622 Y102.764 E15.43997
+G1 X97.957 Y118.559 E15.45508
+G1 X125.216 Y135.436 E15.83899
+G1 X127.047 Y84.020 E16.56829
+G1 X130.278 Y83.750 E17.06805
+G1 X95.056 Y99.394 E17.94607
+G1 F1200 X218.654 Y132.483 E17.94607
+G1 X110.000 Y110.000 A0.61 B0.93
+G1 X136.883 Y134.186 E18.78355
+M106 S247
+M204 S500 P1000
+G0 X138.98 Y108.16
+G1 X137.449 Y81.087 E18.85348
+G0 X81.70 Y89.04
+G1 X108.326 Y91.689 E18.97621
+G1 X82.257 Y108.092 E19.95972
+G1 X88.577 Y106.644 E21.52373
+G1 F2700 E15.02373
+G1 F2700 E21.52373
+G1 X109.239 Y128.599 E21.93495
+G1 X128.361 Y118.055 E22.68496
+M106 S220
+M204 S500 P1000
+G1 X111.556 Y112.524 E23.61127
+G1 X97.111 Y107.789 E25.31665
+G0 X128.43 Y97.84
+G1 X80.603 Y87.889 E26.92999
+G1 X89.944 Y83.016 E28.00167
+G1 X107.945 Y138.757 E29.54166
+G1 F30000 X-113.141 Y91.102 E29.54166
+G1 X100.296 Y83.076 E30.40638
+G1 X98.697 Y94.834 E30.59401
+G0 X105.09 Y95.62
+G1 X117.649 Y120.514 E31.45314
+G1 F2700 E24.95314
+G1 F2700 E31.45314
+G0 X94.84 Y88.14
+G1 F2700 X114.238 Y129.860 E31.45314
+G1 X90.124 Y81.023 E32.01232
+G1 X134.370 Y108.049 E33.80627
+G1 X128.841 Y116.159 E35.66351
+G1 X90.247 Y90.977 E36.70033
+G1 X112.824 Y104.489 E38.68456
+G1 X128.177 Y107.151 E39.59434
+M117 Layer 249 of 99
+G1 X111.320 Y104.713 E40.22415
+G0 X129.66 Y135.88
+G1 X114.471 Y112.985 E40.28535
+G1 X122.564 Y134.697 E40.84504
+G1 X102.278 Y110.888 E42.18243
+G0 X137.62 Y118.61
+G1 X90.868 Y102.998 E44.02385
+G0 X98.97 Y96.25
+M106 S162
+M204 S500 P1000
+G1 X96.917 Y87.891 E44.80892
+G1 X84.756 Y93.785 E46.76926
+G1 X111.575 Y124.581 E46.92832
+G0 X117.87 Y129.07
+;LAYER:263
+G0 F9000 X96.932 Y137.670 Z0.6
+;TIME_ELAPSED:97.310000
+G1 X108.971 Y96.072 E47.46357
+G1 X94.157 Y137.454 E47.55784
+G1 X90.675 Y139.569 E49.36883
+G1 X88.533 Y83.275 E50.66269
+G1 F1200 X19.276 Y118.919 E50.66269
+G1 X111.443 Y89.121 E50.95618
+G1 X105.997 Y90.907 E52.51374
+G1 X86.906 Y97.702 E52.72270
+G1 X116.220 Y136.073 E54.59848
+;LAYER:273
+G0 F9000 X102.254 Y88.550 Z0.8
+;TIME_ELAPSED:101.010000
+G1 X112.762 Y133.700 E54.72707
+G1 X108.363 Y124.367 E56.42081
+G1 X106.546 Y104.444 E58.12894
+G1 X88.947 Y107.375 E58.73965
+G1 X97.735 Y124.978 E60.25285
+G1 F1800 X332.456 Y130.403 E60.25285
+G1 X92.141 Y83.184 E60.78463
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X86.874 Y80.835 E62.52999
+G0 X127.64 Y139.49
+G1 X125.962 Y85.552 E63.58046
+G1 X88.780 Y116.023 E64.46284
+G1 X102.411 Y99.088 E65.47562
+G1 X138.830 Y136.169 E66.67769
+G0 X130.11 Y97.21
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X110.048 Y123.933 E66.92405
+G1 X96.944 Y138.016 E68.21460
+G1 X111.886 Y132.494 E69.17032
+G1 X110.000 Y110.000 A0.53 B0.44
+G1 X105.529 Y130.849 E69.30888
+G1 F600 X-16.540 Y102.902 E69.30888
+G1 X110.840 Y83.321 E69.45852
+G1 X123.934 Y103.375 E69.69378
+G1 X102.324 Y102.264 E69.71753
+G1 X121.121 Y86.253 E71.53328
+G1 X80.002 Y83.858 E72.18001
+;LAYER:301
+G0 F9000 X133.112 Y92.548 Z1.0
+;TIME_ELAPSED:111.370000
+G1 X81.704 Y123.993 E72.57373
+G1 X101.839 Y123.265 E73.46262
+G0 X92.78 Y100.35
+G1 X135.668 Y93.491 E74.48159
+G1 X113.164 Y87.040 E75.09493
+G1 X105.844 Y127.759 E76.86002
+G1 X139.139 Y108.360 E77.84045
+G1 X118.147 Y115.164 E78.24774
+M106 S152
+M204 S500 P1000
+G1 X138.747 Y121.473 E78.44182
+G1 X125.214 Y139.507 E79.32519
+G1 X108.796 Y105.326 E79.34417
+G0 X129.59 Y99.89
+G1 X133.050 Y92.116 E80.50989
+G1 X118.477 Y81.593 E80.68680
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X85.117 Y93.934 E81.83461
+G1 X112.343 Y97.077 E83.54934
+G1 X110.000 Y110.000 A0.66 B0.53
+G1 X133.991 Y87.974 E84.14646
+G1 X101.292 Y126.122 E85.38638
+G1 F2700 E78.88638
+G1 F2700 E85.38638
+G0 X124.28 Y92.21
+G1 X98.725 Y91.635 E86.25204
+G0 X92.96 Y129.37
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X103.829 Y92.717 E88.07919
+G1 X109.925 Y103.060 E88.15462
+G0 X129.98 Y83.42
+G1 X90.658 Y95.042 E88.93300
+G1 X100.412 Y86.669 E90.32125
+G1 X113.890 Y94.729 E91.20561
+G1 X120.248 Y116.561 E91.63644
+G1 X103.654 Y112.372 E93.13855
+G1 X106.540 Y83.359 E94.39482
+G1 F2700 X105.279 Y114.740 E94.39482
+G1 X121.140 Y93.313 E96.19217
+G0 X139.17 Y100.76
+G1 X110.000 Y110.000 A0.48 B0.18
+G1 F1800 X284.886 Y88.655 E96.19217
+G1 X88.795 Y97.876 E96.89021
+G1 X135.315 Y102.489 E97.19408
+G1 X118.082 Y117.401 E97.88870
+G1 F30000 X154.584 Y115.049 E97.88870
+G1 X99.407 Y104.610 E98.46579
+G92 E0
+G1 X105.378 Y113.519 E1.84748
+G1 F2700 X99.805 Y114.030 E1.84748
+G1 X113.751 Y103.132 E3.24272
+G1 X99.181 Y123.493 E4.35061
+G1 X91.773 Y104.496 E5.13940
+G1 X83.288 Y108.936 E5.35321
+G1 X90.031 Y86.047 E6.36340
+G1 X132.112 Y110.932 E8.20978
+G1 X96.581 Y98.855 E8.34193
+M106 S60
+M204 S500 P1000
+G1 X102.287 Y88.848 E8.56208
+G1 X95.882 Y126.814 E9.92536
+M106 S114
+M204 S500 P1000
+G1 X100.858 Y100.593 E10.44208
+G1 X88.125 Y85.004 E12.17910
+G1 X110.000 Y110.000 A0.33 B0.11
+G0 X88.51 Y82.56
+G1 X87.981 Y133.993 E14.16958
+G1 X113.945 Y114.452 E15.02586
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X96.339 Y134.060 E15.61653
+G1 X105.884 Y80.088 E15.67948
+G1 F1200 X112.353 Y137.188 E15.67948
+G0 X123.64 Y102.35
+G1 X124.740 Y135.264 E16.79277
+G1 X138.829 Y124.367 E17.10967
+G1 X88.966 Y112.643 E18.58664
+G1 X89.670 Y88.207 E19.79421
+G1 X88.287 Y80.426 E21.56291
+G1 X103.447 Y107.347 E23.13333
+G1 X110.000 Y110.000 A0.61 B0.26
+G1 F600 X-96.418 Y120.947 E23.13333
+G1 X100.195 Y123.581 E23.14698
+G0 X101.71 Y82.66
+G1 X112.137 Y136.133 E23.17021
+G1 F1200 X81.730 Y94.196 E23.17021
+;LAYER:384
+G0 F9000 X92.893 Y89.463 Z1.2
+;TIME_ELAPSED:142.080000
+G1 X138.871 Y86.880 E23.96113
+G1 X85.795 Y104.364 E24.44866
+G1 X107.247 Y110.635 E24.89527
+G1 X102.878 Y133.885 E26.86727
+G1 X118.209 Y128.000 E28.03971
+G1 X111.828 Y97.047 E28.94377
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X98.510 Y111.314 E29.98265
+G1 X97.715 Y84.388 E31.03489
+G1 X124.425 Y126.200 E32.63979
+G1 X117.290 Y83.492 E32.68584
+G1 X80.803 Y100.666 E33.64595
+G1 X109.485 Y126.723 E35.27943
+G0 X98.54 Y113.79
+G1 X86.820 Y120.855 E36.57879
+G1 X103.489 Y124.907 E36.89586
+G1 F1200 X172.660 Y84.961 E36.89586
+G1 X137.734 Y80.372 E37.92076
+G1 X135.570 Y105.303 E39.27327
+G1 F30000 X245.701 Y106.037 E39.27327
+G1 X99.373 Y108.871 E41.14928
+G1 X124.866 Y92.335 E42.72272
+G1 X108.733 Y105.246 E43.24620
+G1 F1800 X157.998 Y119.797 E43.24620
+G1 X110.000 Y110.000 A0.05 B0.40
+G1 X119.247 Y134.814 E43.88460
+G1 X105.286 Y114.617 E44.74732
+G1 X101.872 Y128.992 E46.38534
+G1 X103.485 Y111.557 E48.19360
+G1 X125.940 Y81.859 E49.95166
+G1 X116.265 Y104.064 E51.64173
+G1 X113.512 Y116.767 E52.64742
+G1 X113.591 Y89.690 E52.76399
+G1 X121.019 Y137.745 E53.89680
+G1 X103.767 Y110.764 E55.52987
+G1 X92.866 Y135.119 E55.73826
+G1 X105.328 Y139.515 E55.99556
+G1 X117.600 Y109.867 E57.37650
+G1 X81.740 Y112.993 E58.40442
+G1 X113.143 Y92.854 E59.09040
+G1 X92.407 Y103.370 E59.48792
+G0 X132.32 Y100.03
+G1 F600 X29.894 Y98.195 E59.48792
+G1 X113.608 Y103.901 E60.57253
+G1 X130.260 Y136.032 E61.16873
+G1 F30000 X-96.047 Y95.021 E61.16873
+G1 X138.106 Y134.316 E61.47839
+G1 F2700 E54.97839
+G1 F2700 E61.47839
+G1 X105.622 Y83.374 E61.71139
+G1 F2700 E55.21139
+G1 F2700 E61.71139
+G1 X136.746 Y92.030 E62.28768
+G92 E0
+G1 X86.402 Y133.902 E1.32965
+G1 X119.262 Y115.604 E2.01975
+G1 X114.528 Y81.480 E2.26811
+G0 X100.63 Y90.18
+G1 X98.999 Y112.593 E2.49573
+G1 X97.447 Y109.190 E3.16416
+G1 F2700 X349.159 Y90.104 E3.16416
+;LAYER:445
+G0 F9000 X126.969 Y102.166 Z1.4
+;TIME_ELAPSED:164.650000
+G0 X96.68 Y130.85
+G1 X108.392 Y121.820 E4.08577
+G1 F30000 X28.368 Y113.862 E4.08577
+G1 X84.447 Y98.295 E4.10639
+G1 X119.577 Y90.405 E5.16941
+G1 F1800 X20.663 Y101.763 E5.16941
+;LAYER:452
+G0 F9000 X93.274 Y99.991 Z1.6
+;TIME_ELAPSED:167.240000
+G1 X139.021 Y89.904 E6.39098
+G1 X100.911 Y109.084 E7.39497
+;LAYER:455
+G0 F9000 X107.609 Y106.052 Z1.8
+;TIME_ELAPSED:168.350000
+G1 X86.539 Y125.802 E8.87713
+G1 X86.258 Y84.994 E9.28027
+G1 X82.964 Y106.416 E10.87923
+G1 X123.405 Y99.576 E12.65772
+G1 X98.225 Y99.301 E14.61636
+M117 Layer 461 of 99
+G0 X122.12 Y118.75
+G1 X106.102 Y122.082 E16.12560
+G1 X104.613 Y108.302 E17.16449
+G1 X98.179 Y117.759 E18.99352
+G1 X112.688 Y100.024 E20.51061
+G0 X94.48 Y134.45
+G1 X100.689 Y125.058 E21.09417
+G1 X91.053 Y103.195 E21.83972
+G1 X137.936 Y110.614 E22.75085
+G0 X135.29 Y117.55
+;LAYER:472
+G0 F9000 X124.052 Y106.441 Z2.0
+;TIME_ELAPSED:174.640000
+G1 X111.786 Y129.511 E24.03220
+G1 X112.097 Y124.665 E25.81093
+G1 F1200 X276.738 Y139.909 E25.81093
+G1 X128.782 Y126.968 E27.19282
+G1 X131.262 Y122.874 E27.52161
+M117 Layer 478 of 99
+G1 F2700 E21.02161
+G1 F2700 E27.52161
+G1 X136.204 Y117.506 E29.50441
+G1 X87.121 Y102.064 E30.85449
+G1 X86.065 Y99.511 E31.88826
+G1 X134.744 Y118.195 E33.08630
+G1 F1200 X170.121 Y115.088 E33.08630
+G1 X111.132 Y100.590 E34.80490
+G1 X101.809 Y112.196 E35.91067
+G1 X82.268 Y89.474 E35.92443
+G1 X114.845 Y94.311 E37.62724
+G1 F30000 X-100.232 Y125.076 E37.62724
+G1 X88.513 Y97.150 E39.62192
+G1 X129.115 Y114.764 E41.34630
+G1 X122.120 Y83.475 E42.20362
+G92 E0
+G0 X135.90 Y121.92
+G1 X96.015 Y98.333 E1.95011
+G1 X127.908 Y85.714 E2.31089
+G1 F2700 X200.905 Y105.397 E2.31089
+G1 X106.056 Y136.884 E2.46575
+M106 S94
+M204 S500 P1000
+G1 X132.752 Y124.403 E3.80641
+G92 E0
+G1 X110.470 Y124.912 E0.71296
+G0 X102.19 Y101.32
+G1 X132.978 Y80.004 E1.16972
+G1 X91.700 Y114.211 E2.14098
+G1 X133.078 Y115.195 E4.06521
+G0 X133.02 Y89.91
+G0 X130.00 Y139.45
+G1 F2700 X-85.720 Y102.657 E4.06521
+G1 X119.720 Y101.724 E5.81058
+G1 F1800 X15.438 Y134.266 E5.81058
+G1 X113.639 Y106.132 E6.56705
+G1 X97.134 Y138.780 E7.60061
+G0 X125.52 Y96.69
+G1 X129.341 Y119.164 E9.06274
+G1 X111.393 Y102.401 E10.50351
+G1 X118.927 Y125.098 E11.40105
+G1 X110.000 Y110.000 A0.11 B0.57
+M106 S211
+M204 S500 P1000
+G0 X81.88 Y127.56
+G1 X98.641 Y117.154 E12.56953
+G1 X95.466 Y135.899 E13.62052
+G0 X108.37 Y125.30
+G1 X89.690 Y131.473 E14.66773
+G1 F2700 X-90.033 Y129.166 E14.66773
+G1 X109.268 Y83.554 E15.79801
+G1 X117.456 Y98.869 E17.57224
+G0 X101.32 Y133.82
+G1 X138.303 Y84.264 E17.72745
+G1 X86.910 Y112.648 E19.26955
+G0 X115.40 Y100.89
+G1 F1200 X148.098 Y117.615 E19.26955
+G1 X139.512 Y138.310 E20.08447
+;LAYER:534
+G0 F9000 X91.776 Y93.516 Z2.2
+;TIME_ELAPSED:197.580000
+G1 F1200 X40.317 Y112.002 E20.08447
+G1 X110.199 Y81.399 E20.87397
+G1 X102.919 Y134.077 E21.52163
+G1 F600 X-107.895 Y122.192 E21.52163
+G1 X129.968 Y91.822 E22.12797
+G1 X101.024 Y133.081 E22.30250
+G1 X94.193 Y118.661 E22.60963
+G1 X83.634 Y132.134 E24.38398
+G1 X101.253 Y84.148 E26.02844
+G1 X81.555 Y86.611 E27.28207
+G1 F600 X280.936 Y130.246 E27.28207
+G1 X121.855 Y113.444 E29.03261
+G1 X85.378 Y94.980 E29.08130
+G1 X138.228 Y114.590 E29.32338
+G1 F1200 X-21.407 Y133.169 E29.32338
+M117 Layer 550 of 99
+G1 X128.002 Y133.386 E29.57434
+G1 F2700 X-117.184 Y103.155 E29.57434
+G0 X112.64 Y132.01
+G1 X108.409 Y128.659 E29.72734
+G1 X116.428 Y134.469 E30.37454
+G1 X107.549 Y84.597 E32.20391
+G1 F2700 E25.70391
+G1 F2700 E32.20391
+G0 X101.55 Y114.35
+G1 X82.115 Y90.773 E32.92148
+G1 X121.216 Y117.252 E34.64527
+G1 X135.908 Y105.279 E34.65893
+G0 X83.01 Y100.62
+G0 X101.12 Y118.98
+G1 X97.967 Y124.818 E36.22354
+G1 X84.954 Y115.088 E37.00270
+G1 X85.392 Y98.374 E38.02085
+G1 X123.737 Y112.828 E39.76836
+G1 X93.265 Y123.403 E40.26192
+G1 X118.052 Y97.432 E42.17008
+G1 X89.187 Y121.078 E44.06734
+G1 X94.471 Y110.367 E45.19522
+G1 X104.860 Y128.407 E46.67086
+G1 F30000 X139.834 Y139.112 E46.67086
+G1 X98.208 Y122.704 E48.25131
+G1 X132.771 Y84.789 E49.73818
+N576 G1 X1 Y2*78
+G1 X97.824 Y139.919 E51.15276
+G1 X116.618 Y109.006 E52.29243
+G0 X115.04 Y122.93
+G1 X81.243 Y132.594 E53.16746
+G1 X110.000 Y110.000 A0.68 B0.29
+G1 X123.376 Y82.523 E54.94655
+G1 X128.224 Y131.692 E55.72374
+G1 X125.294 Y102.608 E55.75260
+G0 X107.01 Y94.66
+G0 X120.98 Y118.66
+G1 X134.504 Y134.618 E56.89267
+G1 F2700 E50.39267
+G1 F2700 E56.89267
+G1 F1800 X170.300 Y98.574 E56.89267
+G1 X115.222 Y109.443 E58.19090
+G1 F1200 X51.784 Y122.917 E58.19090
+G0 X132.80 Y136.52
+;LAYER:593
+G0 F9000 X94.941 Y99.300 Z2.4
+;TIME_ELAPSED:219.410000
+G1 X103.893 Y102.595 E59.14771
+G1 X138.094 Y113.407 E60.05170
+G1 X106.102 Y110.003 E60.54686
+G1 X94.834 Y81.116 E62.27971
+G1 X127.359 Y82.788 E62.90555
+G1 X86.685 Y119.257 E63.05588
+G1 F2700 X-46.491 Y130.176 E63.05588
+G1 X129.327 Y102.375 E64.83974
+G1 X132.408 Y106.551 E65.04247
+G1 X93.555 Y132.433 E65.39559
+G1 X117.482 Y111.224 E66.50476
+G1 X91.498 Y129.261 E67.29973
+G0 X113.84 Y95.10
+G1 F2700 E60.79973
+G1 F2700 E67.29973
+G1 X117.552 Y129.887 E67.64161
+G1 X138.737 Y89.371 E67.86100
+G1 X127.530 Y125.345 E69.83756
+G1 X104.005 Y80.643 E71.54112
+G1 F1800 X-107.159 Y107.250 E71.54112
+G1 F2700 E65.04112
+G1 F2700 E71.54112
+G1 X126.736 Y106.473 E72.14700
+G1 X110.000 Y110.000 A0.86 B0.86
+G1 F1200 X205.063 Y95.622 E72.14700
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X122.662 Y121.554 E73.04040
+N619 G1 X1 Y2*13
+G1 X109.859 Y90.941 E73.27398
+G1 X83.679 Y116.640 E73.37480
+;LAYER:622
+G0 F9000 X94.105 Y102.181 Z2.6
+;TIME_ELAPSED:230.140000
+G1 X120.631 Y139.507 E74.57913
+G1 X115.716 Y110.944 E76.55152
+G1 X105.476 Y122.603 E78.30396
+G1 F1200 X280.124 Y114.328 E78.30396
+G1 X86.503 Y88.218 E80.29841
+G1 X131.524 Y96.941 E81.17671
+G1 X84.652 Y81.041 E82.77299
+G1 X111.641 Y88.685 E82.94933
+G1 X107.182 Y96.399 E84.65195
+G1 X83.415 Y94.392 E86.05227
+G1 X96.416 Y119.493 E87.06390
+G1 X101.104 Y93.294 E88.87347
+G1 X92.933 Y132.961 E89.12662
+G1 X137.582 Y137.996 E90.01267
+G1 F1200 X-85.768 Y126.057 E90.01267
+G1 X81.556 Y115.115 E91.04213
+G1 X115.609 Y116.096 E92.66837
+G1 X125.551 Y124.721 E93.94491
+G1 X90.040 Y100.255 E95.31302
+G1 X95.075 Y111.944 E96.96102
+G1 X81.762 Y112.971 E98.14892
+G1 X85.702 Y106.682 E100.03876
+G1 X110.829 Y97.772 E101.01614
+G1 X93.459 Y139.429 E101.57018
+G1 X108.577 Y113.431 E103.32484
+G1 X113.299 Y115.865 E103.35533
+G1 X123.177 Y121.913 E104.51963
+G1 X122.653 Y115.371 E105.25620
+G0 X105.44 Y85.97
+G1 X98.811 Y83.821 E105.56019
+G1 X110.000 Y110.000 A0.50 B0.77
+G1 X122.243 Y80.414 E107.46291
+G1 X98.981 Y118.967 E108.36492
+G0 X105.96 Y86.56
+G1 X129.473 Y90.532 E108.61228
+G1 X123.625 Y115.024 E109.84125
+G1 X107.587 Y130.344 E110.21858
+M117 Layer 660 of 99
+G1 X120.121 Y99.045 E112.02861
+G1 X127.041 Y101.237 E113.30124
+G1 X124.995 Y102.459 E114.58286
+G1 X134.470 Y134.859 E115.15647
+G1 F2700 X157.885 Y107.834 E115.15647
+G1 X132.518 Y105.740 E115.35214
+G1 X116.379 Y106.696 E116.82921
+G1 X81.878 Y95.355 E117.76096
+G0 X87.21 Y85.16
+G0 X102.43 Y111.79
+G1 X99.120 Y126.203 E119.19670
+;LAYER:672
+G0 F9000 X130.847 Y98.593 Z2.8
+;TIME_ELAPSED:248.640000
+G1 X124.960 Y102.577 E119.80402
+G1 X129.949 Y126.616 E120.44551
+G1 X136.546 Y94.229 E121.95822
+G1 X137.776 Y87.786 E123.82037
+G1 F1800 X221.965 Y107.405 E123.82037
+G1 X129.431 Y133.749 E124.08638
+G1 X108.057 Y94.193 E124.84272
+G1 X84.485 Y94.355 E126.62460
+G1 X106.631 Y129.761 E126.67056
+M106 S25
+M204 S500 P1000
+G0 X122.66 Y125.80
+G1 F2700 E120.17056
+G1 F2700 E126.67056
+G1 X98.748 Y80.797 E126.73732
+G1 X96.513 Y94.886 E127.91712
+G1 X110.961 Y115.457 E128.63353
+M106 S36
+M204 S500 P1000
+G1 X102.575 Y112.187 E129.74130
+G1 X138.044 Y98.582 E129.92072
+G1 X98.859 Y115.857 E131.65362
+G1 X116.576 Y130.467 E132.38547
+G1 X110.627 Y128.847 E132.60942
+G1 X85.132 Y114.035 E134.25792
+G1 X124.169 Y126.314 E134.67108
+G1 X136.779 Y125.849 E134.97941
+G1 X113.726 Y103.509 E136.44463
+G1 X83.315 Y121.544 E138.35888
+G1 X104.970 Y115.990 E139.34378
+G1 X131.378 Y133.513 E140.80992
+G1 X137.286 Y104.459 E140.95988
+G1 X108.459 Y125.509 E141.39613
+G1 X130.120 Y126.787 E142.13734
+G1 X111.453 Y107.908 E142.35419
+G1 X101.682 Y105.450 E142.99907
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X115.804 Y137.810 E144.81106
+G1 X124.707 Y103.687 E145.32693
+G1 X81.157 Y106.442 E147.14828
+G1 X86.783 Y130.527 E147.35034
+G1 X115.531 Y128.651 E147.86405
+G1 X108.682 Y127.959 E148.05848
+G1 X138.154 Y110.171 E149.55447
+G1 X109.546 Y131.986 E150.98662
+G1 X94.381 Y136.582 E152.75152
+G1 X106.759 Y114.689 E154.00371
+G1 X102.397 Y91.833 E154.57997
+G1 X104.648 Y128.786 E154.58058
+G0 X116.44 Y103.33
+G1 F1200 X209.650 Y129.637 E154.58058
+G0 X82.39 Y121.31
+G1 F30000 X262.486 Y116.825 E154.58058
+G0 X112.67 Y86.49
+G1 X100.183 Y108.287 E156.44575
+G0 X121.12 Y127.44
+G1 X84.626 Y91.974 E157.46142
+G1 X111.577 Y84.333 E158.53585
+G1 X103.146 Y81.589 E158.73903
+G1 X136.427 Y101.719 E159.02867
+G0 X106.54 Y99.63
+G0 X96.48 Y110.90
+G1 X122.224 Y83.082 E161.01672
+G1 X131.282 Y102.135 E162.92110
+G1 X125.423 Y90.826 E163.45958
+G0 X95.94 Y121.36
+G1 X111.124 Y117.702 E163.94412
+G1 X117.651 Y137.444 E165.00821
+G1 X110.425 Y115.805 E165.35582
+G1 X92.105 Y110.502 E167.18153
+G1 X107.283 Y107.152 E167.57777
+G1 X139.183 Y138.149 E169.12427
+G1 X136.965 Y84.982 E169.86821
+G1 X137.598 Y110.329 E169.99785
+G1 X133.048 Y139.578 E170.19464
+G1 X114.078 Y98.661 E172.01915
+G1 X88.997 Y102.106 E172.62673
+G1 X133.842 Y130.887 E172.70819
+G0 X101.11 Y107.03
+G1 X98.214 Y110.740 E174.28283
+G1 X100.960 Y80.196 E175.96486
+G1 X90.492 Y117.580 E177.73254
+G1 X117.483 Y86.158 E178.27473
+G1 X103.286 Y125.364 E179.44830
+G0 X96.75 Y125.65
+G1 F30000 X210.706 Y97.943 E179.44830
+G1 X94.674 Y120.025 E179.53337
+G1 F2700 X91.913 Y133.763 E179.53337
+G1 X114.115 Y116.201 E180.63620
+G1 X86.968 Y111.998 E181.97264
+G1 X131.466 Y139.065 E183.36328
+G1 X108.326 Y110.261 E185.18331
+G1 X93.709 Y96.649 E186.90229
+G1 X97.339 Y97.290 E187.37030
+G1 X125.387 Y135.966 E188.09009
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X123.952 Y123.483 E189.45563
+G1 X125.472 Y119.375 E189.84058
+G1 X84.031 Y127.022 E191.17362
+G0 X138.22 Y86.85
+G1 X88.476 Y116.603 E192.73704
+G1 X81.685 Y96.864 E193.17345
+G0 X115.20 Y127.82
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X133.756 Y118.948 E194.86805
+G1 X106.347 Y102.347 E195.21919
+G1 X118.109 Y95.503 E196.56788
+G1 X122.654 Y119.928 E197.56597
+G1 X125.463 Y106.531 E199.35985
+G1 F1800 X33.730 Y90.037 E199.35985
+G1 X125.045 Y98.241 E200.79592
+G1 X115.880 Y106.940 E200.94561
+G1 F30000 X-104.767 Y137.908 E200.94561
+G1 X139.119 Y93.314 E202.87340
+G1 X134.622 Y125.399 E203.16391
+N785 G1 X1 Y2*80
+G1 X101.375 Y99.771 E204.71200
+G1 X98.982 Y113.611 E206.11239
+G1 X108.208 Y105.230 E207.70134
+G1 X123.891 Y86.443 E208.62300
+G1 X104.782 Y130.917 E208.69983
+G1 X136.131 Y129.287 E209.97241
+G1 X112.254 Y93.753 E210.41671
+G1 X103.450 Y123.316 E210.57521
+G1 X124.910 Y91.613 E210.87366
+G1 F2700 E204.37366
+G1 F2700 E210.87366
+G1 X111.938 Y109.338 E212.65143
+G1 X137.206 Y93.137 E212.76760
+G1 X112.218 Y114.868 E214.63261
+G1 F2700 E208.13261
+G1 F2700 E214.63261
+G1 F1800 X183.134 Y88.385 E214.63261
+G1 X88.130 Y109.707 E214.67712
+G1 X134.045 Y139.801 E215.76749
+G1 X107.640 Y124.744 E217.14520
+G1 X118.124 Y94.959 E217.33338
+G1 X92.748 Y85.742 E218.71484
+G1 X99.203 Y85.853 E218.85752
+G1 X132.344 Y102.518 E220.72096
+G1 X115.150 Y91.734 E221.12633
+G1 F600 X327.992 Y86.524 E221.12633
+G1 X136.091 Y109.750 E221.60818
+G1 F2700 X-66.370 Y86.030 E221.60818
+G0 X129.14 Y106.04
+G1 X128.062 Y121.710 E221.65663
+G1 X128.474 Y80.429 E223.01196
+G1 F2700 X294.361 Y106.398 E223.01196
+G1 X127.552 Y119.595 E223.24015
+G1 X90.750 Y104.103 E223.33926
+G92 E0
+G1 X91.233 Y95.196 E1.73157
+G1 X127.710 Y102.117 E2.30653
+G1 X106.798 Y132.728 E3.66898
+G1 X105.640 Y103.687 E5.33335
+G1 X136.643 Y114.037 E7.30865
+G1 X131.475 Y116.600 E7.45314
+G1 X108.245 Y122.521 E7.78834
+G1 X110.680 Y109.757 E8.31909
+;LAYER:827
+G0 F9000 X83.768 Y102.450 Z3.0
+;TIME_ELAPSED:305.990000
+G1 F2700 X-58.009 Y112.226 E8.31909
+G1 X87.176 Y127.351 E9.59901
+G0 X115.20 Y131.19
+G0 X120.63 Y132.83
+G1 X134.511 Y133.057 E9.82173
+G1 X89.762 Y118.614 E11.01315
+G0 X138.91 Y110.57
+G0 X136.64 Y122.91
+G1 X105.181 Y110.355 E11.63056
+G1 X110.778 Y108.000 E12.14711
+G1 F2700 E5.64711
+G1 F2700 E12.14711
+G1 X87.008 Y93.138 E13.42830
+G1 X84.315 Y108.887 E13.48762
+G1 X86.221 Y106.579 E14.49773
+G1 X82.468 Y84.299 E15.91221
+G1 X90.713 Y104.811 E15.97581
+G1 X84.706 Y104.007 E17.36052
+G1 X101.056 Y111.954 E18.57141
+G1 X105.656 Y129.410 E19.57109
+G1 F1200 X73.860 Y106.692 E19.57109
+G1 X126.153 Y133.002 E20.35586
+G92 E0
+G1 F600 X90.622 Y135.296 E0.00000
+G1 X112.187 Y133.083 E0.59984
+G1 F1800 X-1.930 Y100.528 E0.59984
+G1 X80.693 Y105.299 E0.98981
+G1 X127.219 Y124.549 E1.49893
+G1 X125.811 Y95.791 E1.54850
+G1 X134.326 Y95.357 E3.05358
+G1 X111.184 Y100.934 E4.82882
+G1 X133.507 Y128.703 E4.88410
+G1 X91.538 Y124.829 E6.17508
+G1 X112.065 Y84.939 E7.56739
+G1 X82.778 Y82.200 E8.87577
+G1 X138.624 Y106.811 E10.31953
+G0 X122.63 Y96.38
+G1 X108.954 Y110.371 E12.00990
+G1 F1200 X60.195 Y119.227 E12.00990
+G1 X130.750 Y129.381 E13.69980
+G0 X107.70 Y88.12
+G0 X125.06 Y113.40
+G1 X115.793 Y101.651 E15.57256
+G1 X92.111 Y92.598 E16.03821
+G1 X138.132 Y110.506 E17.44002
+G1 X94.530 Y82.069 E19.40279
+G1 X127.118 Y122.032 E20.10423
+G1 X106.053 Y124.609 E20.70401
+G0 X90.12 Y127.28
+G1 X80.873 Y118.661 E22.37022
+G1 X81.802 Y120.387 E23.61521
+G1 X83.826 Y114.138 E24.23627
+G1 X90.235 Y107.389 E25.64117
+G1 X119.787 Y91.409 E26.61966
+G1 X126.179 Y127.127 E26.85840
+G1 F1200 X304.201 Y113.760 E26.85840
+G1 X95.742 Y101.673 E27.91384
+;LAYER:884
+G0 F9000 X81.104 Y135.954 Z3.2
+;TIME_ELAPSED:327.080000
+G1 F1200 X-51.467 Y125.368 E27.91384
+G1 X136.483 Y89.824 E28.34095
+G1 X113.233 Y138.389 E30.00115
+;LAYER:888
+G0 F9000 X93.575 Y123.287 Z3.4
+;TIME_ELAPSED:328.560000
+G1 X110.093 Y83.666 E31.60461
+G1 X101.430 Y83.394 E31.99960
+;LAYER:891
+G0 F9000 X84.009 Y94.457 Z3.6
+;TIME_ELAPSED:329.670000
+G1 X118.572 Y128.488 E32.99869
+G1 X109.736 Y101.438 E33.82832
+G1 X111.385 Y128.447 E34.01370
+G0 X99.04 Y80.46
+G0 X120.40 Y86.63
+G1 X128.950 Y98.084 E34.43386
+G1 X100.159 Y110.357 E35.09142
+G1 F1200 X326.959 Y89.347 E35.09142
+G1 X135.315 Y102.177 E35.25396
+G1 X126.526 Y92.568 E35.31682
+G1 X126.013 Y121.928 E37.04315
+G1 X90.360 Y104.889 E37.30065
+G1 X134.567 Y118.999 E38.19363
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G92 E0
+G1 X110.000 Y110.000 A0.47 B0.92
+G1 X125.694 Y88.960 E1.65244
+G1 F30000 X113.728 Y130.859 E1.65244
+G0 X129.42 Y132.93
+G1 X109.705 Y119.112 E3.27028
+G1 X84.426 Y131.635 E4.52083
+G1 X130.528 Y129.634 E5.65961
+G0 X105.52 Y84.22
+G1 X110.000 Y110.000 A0.31 B0.86
+G1 X112.508 Y112.726 E6.54180
+G1 F30000 X15.084 Y81.471 E6.54180
+G1 X105.089 Y90.828 E7.10934
+G0 X125.91 Y97.62
+G1 F1200 X29.696 Y105.739 E7.10934
+G1 F30000 X104.379 Y88.520 E7.10934
+G1 X138.246 Y80.357 E9.04965
+G1 X120.712 Y105.302 E11.04297
+G1 X130.877 Y110.134 E11.38079
+G1 X136.878 Y127.890 E12.82066
+G1 X110.000 Y110.000 A0.05 B0.41
+G1 X132.477 Y99.656 E12.96385
+G1 X102.565 Y105.253 E13.55844
+G1 X132.110 Y139.044 E13.78075
+G1 F1800 X-66.157 Y106.104 E13.78075
+G1 X99.905 Y83.650 E13.91065
+G1 F2700 E7.41065
+G1 F2700 E13.91065
+G1 X116.800 Y93.802 E14.22934
+G1 X139.429 Y114.108 E14.91188
+G1 X108.858 Y126.401 E15.27280
+G1 F2700 X117.800 Y136.078 E15.27280
+G1 X137.323 Y127.398 E16.36675
+G1 X126.263 Y97.618 E17.95751
+G1 X102.435 Y101.037 E19.47197
+G1 X95.688 Y139.207 E19.62431
+G1 X80.348 Y98.444 E21.23776
+G1 X136.608 Y137.479 E21.86372
+G1 X135.221 Y127.687 E22.13832
+G1 X80.586 Y121.322 E22.25565
+G1 X99.993 Y96.548 E23.18775
+G1 X116.735 Y104.855 E24.02425
+G1 X119.639 Y136.203 E24.47408
+G1 X118.774 Y93.902 E26.01815
+G1 X88.909 Y87.125 E27.69055
+G1 X102.721 Y80.069 E29.31932
+G1 X108.489 Y88.839 E30.35719
+G0 X121.77 Y96.41
+G1 X81.289 Y116.589 E30.86687
+G1 X130.276 Y99.228 E32.18866
+G1 X108.543 Y82.814 E32.91949
+G1 X86.664 Y130.033 E33.54508
+G1 X84.401 Y123.649 E34.52142
+G1 X118.816 Y94.387 E36.28478
+G1 F30000 X132.116 Y93.264 E36.28478
+G1 X119.919 Y98.665 E38.00570
+G1 F1200 X-54.223 Y82.865 E38.00570
+G1 F1800 X283.799 Y99.375 E38.00570
+G1 X93.162 Y126.625 E39.58112
+G1 X117.999 Y99.069 E41.35608
+G1 X87.737 Y101.869 E43.09388
+G0 X81.03 Y133.77
+G1 X97.806 Y101.977 E43.97465
+G1 X123.456 Y104.423 E44.41574
+G1 X125.674 Y93.878 E44.89562
+G1 X122.617 Y117.485 E46.04010
+G1 X92.976 Y114.980 E47.52654
+G1 X117.117 Y100.847 E49.22957
+G1 X97.219 Y83.324 E49.69329
+G1 X91.991 Y101.753 E51.57845
+G1 X107.604 Y98.327 E52.72227
+G1 X121.955 Y120.795 E54.63109
+G1 X114.148 Y113.971 E54.67645
+G1 X94.397 Y112.299 E55.35398
+;LAYER:979
+G0 F9000 X92.032 Y125.829 Z3.8
+;TIME_ELAPSED:362.230000
+G0 X115.69 Y95.61
+G1 X130.435 Y82.181 E56.80767
+G1 X98.695 Y89.438 E58.35887
+G0 X102.95 Y101.28
+G1 X124.650 Y92.340 E59.82209
+G1 X128.646 Y123.282 E60.92335
+G1 X83.951 Y121.701 E62.68938
+G0 X81.76 Y89.05
+G1 X117.286 Y87.240 E62.88633
+G1 X116.780 Y100.043 E62.97748
+G1 X123.690 Y95.510 E63.43163
+G1 X129.537 Y132.785 E65.07069
+G1 X110.625 Y136.966 E65.99801
+G1 X91.281 Y132.064 E67.67705
+G1 X118.286 Y108.014 E68.81178
+G1 X124.268 Y97.839 E70.66819
+G1 X96.323 Y108.882 E71.04679
+G1 X120.457 Y89.202 E72.13643
+G1 X102.292 Y95.420 E72.43783
+G1 X134.676 Y130.945 E73.66043
+G1 X110.000 Y110.000 A0.04 B0.87
+G1 X128.024 Y91.998 E74.76007
+G1 X117.375 Y117.403 E75.72719
+G1 X94.369 Y128.078 E77.72701
+G1 X95.729 Y93.353 E77.87930
+G1 F1800 X162.944 Y134.035 E77.87930
+G1 X124.515 Y100.890 E78.17320
+G1 X119.300 Y132.295 E79.85417
+N1008 G1 X1 Y2*37
+G1 X90.400 Y80.813 E80.10105
+G1 X91.168 Y125.304 E82.07670
+G1 X128.220 Y83.711 E83.79677
+G1 X118.754 Y131.305 E85.46393
+G1 X103.756 Y127.266 E87.14170
+G1 X111.538 Y81.532 E87.85318
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G0 X118.93 Y118.82
+G1 F2700 X89.048 Y85.065 E87.85318
+G92 E0
+G1 X91.674 Y100.076 E0.02451
+G1 X101.955 Y136.964 E1.31553
+G1 X131.152 Y114.516 E3.09266
+G1 F1200 X218.420 Y105.559 E3.09266
+G1 X97.667 Y93.207 E4.45305
+G1 X109.818 Y83.325 E5.16806
+G1 X132.817 Y135.907 E6.64481
+G1 X89.036 Y121.064 E7.38387
+G1 X112.090 Y123.716 E7.88967
+G1 F1200 X-0.221 Y131.856 E7.88967
+G1 X92.665 Y86.410 E9.16277
+G1 X82.105 Y111.688 E10.07835
+G1 X125.505 Y133.297 E10.79656
+G1 X126.236 Y125.510 E11.40576
+G1 X100.491 Y123.486 E12.63345
+G1 X98.011 Y84.001 E14.35129
+G0 X115.15 Y128.10
+G1 F1200 X43.108 Y131.883 E14.35129
+G1 X90.070 Y85.726 E15.16577
+G1 X99.847 Y117.233 E15.80615
+M117 Layer 1039 of 99
+G1 X80.624 Y121.763 E17.13510
+G1 X100.971 Y118.637 E18.69037
+G1 X106.049 Y129.498 E20.25311
+G0 X111.76 Y110.10
+G1 F30000 X-46.473 Y105.987 E20.25311
+;LAYER:1045
+G0 F9000 X130.510 Y123.344 Z4.0
+;TIME_ELAPSED:386.650000
+G0 X100.19 Y112.45
+G1 X103.354 Y119.792 E21.99559
+G1 X128.887 Y88.136 E22.40897
+G1 X108.642 Y126.830 E23.33754
+M117 Layer 1050 of 99
+G1 X121.073 Y136.395 E23.64494
+G1 X134.607 Y92.486 E25.36967
+G1 X90.746 Y107.605 E25.41942
+G1 X97.619 Y98.565 E26.19047
+G1 X132.215 Y104.547 E27.95069
+G1 X131.397 Y111.897 E28.12992
+G1 X128.884 Y130.665 E29.84039
+G1 X103.943 Y130.388 E30.25848
+G0 X107.88 Y126.68
+G1 X82.966 Y109.520 E30.63356
+G1 X97.746 Y81.710 E31.44072
+G1 X107.419 Y97.827 E31.88008
+G0 X89.57 Y129.94
+G1 X114.808 Y114.124 E33.06756
+G1 X102.755 Y103.168 E34.33988
+G1 F600 X25.328 Y138.638 E34.33988
+G1 F1200 X-123.608 Y107.334 E34.33988
+G0 X126.47 Y136.02
+G1 X122.997 Y86.002 E36.13213
+G1 X99.751 Y95.593 E37.15363
+G1 X122.897 Y89.138 E38.70861
+G1 F2700 E32.20861
+G1 F2700 E38.70861
+G1 X118.021 Y99.984 E39.42273
+G1 F2700 X202.524 Y117.795 E39.42273
+G1 X83.714 Y135.921 E40.64090
+G1 X98.453 Y86.393 E40.93300
+G1 X122.399 Y95.555 E41.65208
+G1 X101.111 Y136.539 E42.52506
+G0 X136.52 Y131.12
+G0 X101.35 Y89.65
+G1 X136.911 Y92.523 E42.78210
+G1 X136.151 Y110.255 E43.86669
+G1 X97.215 Y112.892 E44.91435
+G1 X93.894 Y120.680 E46.01266
+G1 X113.306 Y97.890 E47.74917
+G1 X120.336 Y107.417 E49.61148
+G0 X94.29 Y112.90
+G1 X80.990 Y131.053 E50.03783
+G1 X120.269 Y103.124 E51.47462
+M117 Layer 1090 of 99
+M106 S50
+M204 S500 P1000
+G0 X139.35 Y128.30
+G1 X134.601 Y135.299 E52.18435
+G1 X100.905 Y83.316 E53.75588
+G1 X112.036 Y128.874 E55.55366
+G0 X127.84 Y97.89
+G1 F2700 E49.05366
+G1 F2700 E55.55366
+G1 X85.006 Y102.982 E56.56368
+G0 X128.77 Y139.56
+G1 X89.906 Y109.105 E57.60415
+G1 F2700 E51.10415
+G1 F2700 E57.60415
+G1 X98.229 Y128.100 E59.31255
+G1 X87.039 Y84.832 E61.23962
+G1 X122.653 Y104.334 E62.79403
+G1 F1200 X-67.866 Y116.002 E62.79403
+G1 X133.196 Y95.869 E62.89139
+G1 X112.331 Y101.835 E63.41134
+G1 X91.755 Y132.118 E63.92061
+G1 X104.236 Y133.960 E64.46971
+G1 X103.709 Y137.440 E64.70894
+G1 F2700 E58.20894
+G1 F2700 E64.70894
+G1 F600 X90.914 Y132.599 E64.70894
+G1 X85.541 Y130.589 E66.02077
+G1 X99.170 Y118.033 E67.61873
+G1 X108.349 Y110.723 E69.53060
+G1 X136.465 Y100.544 E70.03119
+G1 X123.146 Y134.176 E70.44746
+G1 X93.452 Y133.153 E72.35998
+G1 F1200 X52.463 Y131.839 E72.35998
+G0 X119.38 Y118.84
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X93.438 Y111.069 E73.50415
+G1 F30000 X0.745 Y88.181 E73.50415
+G1 F600 X11.525 Y94.502 E73.50415
+G1 X94.982 Y127.406 E73.95673
+G1 X131.009 Y128.130 E75.78840
+G1 F2700 X-7.386 Y115.407 E75.78840
+N1128 G1 X1 Y2*76
+G0 X137.65 Y130.82
+G1 F2700 X306.575 Y118.951 E75.78840
+G1 X129.511 Y135.404 E76.51245
+G1 F1200 X168.768 Y93.188 E76.51245
+G1 X129.605 Y102.023 E77.40240
+G1 X116.196 Y96.159 E77.98264
+G1 X82.360 Y99.326 E79.00522
+G0 X92.64 Y125.00
+G1 X105.352 Y119.021 E79.98232
+;LAYER:1138
+G0 F9000 X87.337 Y104.226 Z4.2
+;TIME_ELAPSED:421.060000
+G1 F2700 E73.48232
+G1 F2700 E79.98232
+G1 X111.899 Y139.186 E81.70467
+G1 X95.363 Y93.140 E83.44267
+G1 X139.709 Y136.140 E84.27890
+G1 F1200 X133.135 Y130.231 E84.27890
+G1 F1200 X300.004 Y107.011 E84.27890
+G1 X121.073 Y131.783 E85.11384
+G1 F600 X166.335 Y137.418 E85.11384
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X100.000 Y111.941 E85.20806
+G1 X110.000 Y110.000 A0.03 B0.70
+G1 F1800 X269.863 Y86.703 E85.20806
+G1 F1800 X185.824 Y108.372 E85.20806
+G1 F1200 X39.153 Y122.444 E85.20806
+G1 X109.124 Y121.831 E85.81430
+G1 F1800 X347.692 Y104.875 E85.81430
+G1 X132.853 Y89.933 E86.53036
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X105.636 Y115.960 E88.28147
+G1 X93.270 Y127.162 E89.91742
+G1 X139.333 Y128.101 E91.71399
+G1 X86.115 Y128.641 E93.34591
+G92 E0
+G1 X128.628 Y101.018 E0.08023
+G1 X136.499 Y111.111 E1.71809
+G0 X134.67 Y126.27
+G1 X105.249 Y134.078 E3.55085
+G1 X82.126 Y86.342 E4.52176
+G92 E0
+G1 X108.444 Y123.545 E1.45997
+G1 X98.929 Y118.089 E1.74713
+G1 X83.640 Y113.844 E3.63199
+G0 X123.89 Y88.73
+G1 X104.552 Y85.871 E5.04558
+G1 X81.516 Y97.338 E6.37658
+M106 S129
+M204 S500 P1000
+G1 X139.001 Y93.987 E7.57530
+G1 X112.694 Y111.087 E8.68030
+G1 X136.957 Y112.297 E8.86729
+G1 X120.269 Y119.651 E10.27380
+G1 F600 X160.153 Y103.217 E10.27380
+G0 X130.66 Y92.88
+G1 X139.054 Y134.850 E12.16982
+G1 X133.467 Y92.315 E12.49644
+G1 X130.833 Y102.011 E13.27410
+G1 X123.570 Y139.903 E14.97052
+G1 X120.603 Y109.826 E15.23320
+G0 X107.84 Y82.85
+G1 X127.994 Y128.511 E15.73033
+G0 X86.54 Y113.80
+G1 X88.970 Y119.047 E17.68640
+G1 F1200 X289.935 Y107.112 E17.68640
+G1 X96.086 Y128.534 E19.49656
+G1 X112.438 Y117.821 E20.46002
+G1 X106.476 Y135.544 E22.04290
+G1 X136.175 Y120.231 E22.79729
+G1 X137.820 Y118.007 E24.68265
+G1 X86.730 Y118.394 E26.09747
+N1197 G1 X1 Y2*55
+G1 X109.575 Y87.424 E26.58124
+G0 X105.40 Y82.51
+G1 X91.611 Y98.174 E27.43988
+G1 X116.237 Y95.429 E29.43668
+G1 X94.410 Y105.382 E30.08629
+G1 X89.844 Y135.805 E30.64648
+M106 S224
+M204 S500 P1000
+G1 F2700 X217.676 Y99.511 E30.64648
+G1 X111.594 Y120.160 E30.97149
+G1 X96.838 Y113.137 E32.49857
+N1208 G1 X1 Y2*41
+G1 X92.090 Y89.960 E32.85987
+G1 X137.645 Y84.214 E33.19775
+G1 X102.942 Y124.892 E35.04092
+G1 X82.275 Y135.357 E35.06816
+G1 X95.752 Y118.653 E35.95742
+G1 X92.850 Y112.322 E37.57377
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X82.943 Y132.820 E39.48040
+G1 X122.034 Y95.354 E41.47431
+G1 F1200 X-92.955 Y120.750 E41.47431
+G1 X136.028 Y109.719 E42.08215
+G1 X95.123 Y118.882 E42.16598
+G1 X107.004 Y108.071 E43.92147
+G1 F2700 E37.42147
+G1 F2700 E43.92147
+G1 X131.509 Y119.835 E45.59766
+G1 X125.185 Y83.113 E46.45182
+G1 X86.228 Y89.041 E47.63062
+G1 X135.810 Y113.791 E47.71496
+G0 X105.28 Y81.97
+G1 X127.080 Y126.095 E48.87111
+G1 F1200 X94.051 Y96.230 E48.87111
+G1 X122.265 Y124.433 E48.88583
+G1 X125.893 Y121.824 E49.83301
+G1 X94.586 Y138.385 E51.66889
+G1 X120.882 Y98.302 E52.30706
+G1 X128.401 Y115.860 E53.95301
+G0 X131.94 Y103.36
+G1 X83.593 Y106.691 E55.83385
+G1 X126.811 Y82.105 E56.90984
+G1 X120.165 Y133.918 E57.71605
+G1 X101.177 Y107.876 E57.83644
+G1 X101.590 Y101.567 E59.55452
+G1 X128.422 Y86.676 E60.62856
+G1 X83.745 Y103.864 E61.22254
+G1 X139.729 Y122.164 E62.45090
+G92 E0
+G1 F1200 X285.186 Y125.292 E0.00000
+G1 X131.924 Y81.522 E0.56441
+G1 X97.596 Y109.873 E2.23982
+G1 X129.752 Y83.578 E3.51961
+G1 X104.771 Y138.612 E5.23141
+G1 X90.389 Y132.090 E6.24038
+G1 X121.296 Y95.785 E7.88991
+G0 X84.06 Y135.53
+G1 F1200 X92.978 Y97.621 E7.88991
+G1 X90.608 Y93.540 E8.95986
+G1 X117.474 Y96.309 E9.82107
+G1 X130.401 Y103.762 E10.26016
+G1 X135.948 Y121.203 E11.80353
+G1 X128.737 Y97.130 E12.29499
+G1 X81.024 Y89.348 E12.48684
+G1 X93.656 Y94.455 E13.47176
+G1 F30000 X-66.975 Y130.597 E13.47176
+G1 F1200 X284.250 Y110.580 E13.47176
+N1263 G1 X1 Y2*90
+G1 X90.251 Y126.754 E14.39776
+;LAYER:1265
+G0 F9000 X96.251 Y107.088 Z4.4
+;TIME_ELAPSED:468.050000
+G1 X132.429 Y102.403 E15.03339
+G1 X119.769 Y98.221 E15.53130
+G1 X122.597 Y113.745 E16.11707
+G1 X130.383 Y119.101 E17.92397
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X114.299 Y107.479 E18.64283
+G1 X110.000 Y110.000 A0.44 B0.20
+G1 X100.410 Y98.979 E19.03244
+G1 X87.876 Y82.751 E19.68836
+G0 X112.90 Y100.53
+G1 X133.357 Y124.660 E21.65084
+G1 F1200 X157.503 Y86.510 E21.65084
+G1 X132.716 Y81.291 E23.19056
+M106 S18
+M204 S500 P1000
+G1 X88.413 Y121.396 E25.06791
+N1281 G1 X1 Y2*69
+G1 X121.346 Y124.342 E27.04395
+G1 X96.563 Y139.713 E27.40037
+N1284 G1 X1 Y2*93
+G1 X95.138 Y131.508 E28.86594
+G1 X132.325 Y110.003 E30.81739
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G0 X137.10 Y97.73
+G1 X106.683 Y113.315 E31.42204
+G0 X99.70 Y113.34
+G1 X83.073 Y112.507 E32.31229
+G1 X132.112 Y111.215 E33.49558
+G1 X104.155 Y91.664 E35.39557
+G1 X96.009 Y93.984 E36.79839
+G1 X102.519 Y127.758 E37.91155
+G1 X89.002 Y91.885 E39.13428
+G1 X123.883 Y106.106 E40.42473
+G0 X128.10 Y131.94
+G1 X104.960 Y127.769 E41.32120
+G1 X139.878 Y136.108 E41.80848
+G1 X83.223 Y126.389 E43.47312
+G1 X96.698 Y120.640 E44.06382
+G1 F2700 E37.56382
+G1 F2700 E44.06382
+G1 F600 X110.324 Y125.913 E44.06382
+G1 X136.266 Y115.664 E46.00618
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X101.605 Y89.902 E46.98910
+G1 X96.699 Y133.238 E47.54909
+G1 X81.465 Y82.948 E47.80775
+G1 X91.589 Y80.780 E49.59800
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X136.770 Y88.297 E49.70473
+G1 X134.799 Y119.983 E50.52956
+G1 F600 X86.548 Y114.210 E50.52956
+G1 X130.553 Y117.464 E50.56576
+G1 X127.909 Y123.203 E50.93482
+G1 X127.754 Y133.903 E51.98787
+G1 X104.997 Y113.337 E52.64420
+G1 X80.085 Y109.322 E54.63312
+G1 X137.530 Y126.274 E56.22595
+G1 F600 X288.999 Y80.393 E56.22595
+G1 X104.118 Y134.201 E57.85369
+G1 F1200 X111.425 Y88.585 E57.85369
+G1 X123.655 Y111.065 E57.85728
+G1 X123.162 Y137.037 E57.98100
+G0 X108.61 Y81.75
+G1 X83.313 Y108.472 E59.15685
+G1 X109.594 Y135.141 E59.71998
+G1 F2700 E53.21998
+G1 F2700 E59.71998
+G1 X105.383 Y110.940 E60.92598
+G1 X94.825 Y99.903 E62.65347
+G1 X104.913 Y137.355 E64.61304
+G1 X112.757 Y139.717 E65.76609
+G1 F1800 X170.078 Y97.034 E65.76609
+;LAYER:1335
+G0 F9000 X88.936 Y133.082 Z4.6
+;TIME_ELAPSED:493.950000
+G1 X101.184 Y100.156 E66.52401
+G1 X108.241 Y107.372 E67.08552
+G1 X81.560 Y108.107 E67.30897
+G1 X103.980 Y116.347 E69.07058
+G1 F30000 X217.117 Y88.348 E69.07058
+G1 F2700 X219.008 Y98.172 E69.07058
+G1 X86.507 Y99.843 E69.48835
+G1 X95.056 Y137.847 E70.26449
+G1 X84.259 Y122.915 E70.82599
+G92 E0
+G1 F600 X203.645 Y87.389 E0.00000
+G1 X114.685 Y89.456 E0.79068
+G1 X96.339 Y117.451 E2.20091
+G1 X108.077 Y137.608 E3.54800
+G1 X84.107 Y121.397 E3.63306
+G1 X109.698 Y100.727 E5.16133
+G1 X112.373 Y105.023 E6.84872
+G1 X107.302 Y122.590 E8.00659
+G1 X87.201 Y107.269 E8.57504
+G1 X90.414 Y101.396 E8.96614
+G1 F2700 E2.46614
+G1 F2700 E8.96614
+G1 X108.435 Y107.505 E9.51984
+G1 X110.447 Y139.452 E11.13674
+G1 X138.956 Y86.674 E11.62460
+G1 X89.330 Y88.025 E11.91359
+G1 F2700 E5.41359
+G1 F2700 E11.91359
+G1 X88.638 Y98.701 E12.88875
+G1 X96.924 Y123.568 E13.62598
+G1 X110.000 Y110.000 A0.19 B0.47
+G1 X83.918 Y119.331 E15.59956
+G1 X122.052 Y121.680 E16.60361
+G1 X114.834 Y93.876 E18.23189
+G1 X128.716 Y131.767 E18.62985
+G1 X84.484 Y83.748 E19.81193
+G1 X105.771 Y106.109 E20.92471
+G1 X97.081 Y136.088 E21.67885
+G1 X90.616 Y101.855 E22.85923
+G1 X116.650 Y81.913 E23.14624
+G1 X114.263 Y86.147 E24.36998
+G1 X128.198 Y131.919 E25.02281
+G1 X104.839 Y138.680 E26.59177
+G1 F1200 X-51.228 Y121.676 E26.59177
+G1 X133.628 Y93.675 E27.98190
+G1 X93.304 Y138.118 E29.10379
+G1 F2700 E22.60379
+G1 F2700 E29.10379
+G1 X116.851 Y134.807 E30.71847
+G1 X139.518 Y95.965 E31.12727
+G1 X119.133 Y131.886 E32.68549
+G1 X129.787 Y118.546 E34.53193
+G1 X102.352 Y88.197 E36.06161
+G1 X98.923 Y107.826 E37.95659
+G1 F2700 E31.45659
+G1 F2700 E37.95659
+G1 F1800 X133.779 Y130.343 E37.95659
+G1 X88.138 Y108.993 E38.16759
+G1 X114.105 Y118.964 E39.92575
+G0 X120.63 Y139.56
+G1 X137.791 Y135.610 E40.64030
+G1 X86.354 Y107.595 E41.72857
+G1 X86.694 Y82.674 E42.24297
+G1 X83.349 Y138.970 E43.20605
+G1 F600 X134.075 Y89.260 E43.20605
+G1 X83.581 Y82.247 E43.64362
+G1 X88.612 Y83.273 E43.94864
+G1 X87.008 Y118.569 E45.81808
+G1 X97.273 Y104.104 E45.91596
+G0 X91.56 Y123.35
+G1 X131.553 Y87.107 E47.14327
+G1 X136.084 Y134.137 E47.60021
+G1 X110.000 Y110.000 A0.25 B0.49
+M106 S210
+M204 S500 P1000
+G1 X124.513 Y107.988 E48.60369
+G1 X123.491 Y85.553 E50.43789
+M106 S155
+M204 S500 P1000
+G0 X86.20 Y95.03
+G1 X123.879 Y93.068 E52.18223
+G1 X132.507 Y81.353 E53.77567
+G1 X105.809 Y81.010 E53.99890
+G1 X83.357 Y138.194 E54.33842
+G1 X123.551 Y100.813 E56.19289
+G1 X96.511 Y114.463 E56.93855
+G1 X109.534 Y91.292 E58.11839
+M117 Layer 1417 of 99
+G1 X123.189 Y124.276 E59.37407
+G1 X105.496 Y124.308 E60.29293
+G1 X130.339 Y107.170 E61.41982
+G1 X127.011 Y99.548 E62.80101
+G1 X116.963 Y92.583 E64.43115
+G1 X110.000 Y110.000 A0.34 B0.65
+G1 X113.276 Y134.429 E65.79306
+G1 X99.795 Y105.764 E65.83620
+G1 X126.246 Y131.109 E66.45481
+G1 X83.903 Y95.596 E68.42680
+G1 X137.156 Y96.091 E70.02744
+G1 X126.203 Y95.537 E71.95692
+G1 X132.336 Y109.017 E73.79047
+G1 X103.742 Y128.374 E73.93228
+G1 X113.900 Y81.114 E74.32769
+G1 X91.172 Y109.768 E75.83412
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X83.939 Y111.639 E77.21071
+G1 X108.773 Y83.988 E78.17630
+G1 X122.199 Y95.312 E78.87416
+G1 F2700 E72.37416
+G1 F2700 E78.87416
+G1 X111.307 Y96.950 E80.53939
+G1 X111.815 Y101.763 E81.10059
+G1 X138.129 Y110.638 E83.09704
+G1 X117.933 Y104.896 E84.73920
+G1 X83.890 Y104.664 E86.34133
+G1 X81.595 Y106.368 E87.46892
+G1 X138.485 Y94.032 E88.14963
+G1 X92.403 Y93.596 E89.75627
+G1 X92.366 Y95.364 E90.98367
+G1 X103.421 Y115.630 E91.52068
+G1 X127.089 Y96.824 E92.57346
+G1 F600 X313.967 Y124.403 E92.57346
+G1 X102.868 Y133.647 E93.84865
+G1 X87.552 Y110.583 E94.57146
+G1 F2700 E88.07146
+G1 F2700 E94.57146
+G1 X132.886 Y83.340 E94.60374
+G1 X81.332 Y127.560 E95.56208
+G1 X118.793 Y105.757 E97.49054
+G1 X117.693 Y129.963 E98.12580
+G1 X118.988 Y93.871 E99.17814
+G1 F1800 X136.154 Y125.361 E99.17814
+G1 X125.612 Y90.582 E100.24250
+G1 X88.358 Y85.558 E100.36455
+G1 F2700 X48.510 Y126.863 E100.36455
+G1 F2700 X256.919 Y100.106 E100.36455
+G0 X94.85 Y118.82
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X113.069 Y80.215 E101.97473
+G1 X84.176 Y128.216 E102.72645
+G1 X87.908 Y101.756 E104.60073
+G1 X87.528 Y102.183 E105.29102
+G1 X106.487 Y105.217 E106.27683
+G1 X94.913 Y108.843 E107.64571
+G0 X126.74 Y127.10
+G92 E0
+G1 X127.435 Y101.349 E1.67505
+G1 F2700 X252.690 Y130.206 E1.67505
+G1 F2700 X29.481 Y105.800 E1.67505
+G1 X138.604 Y132.083 E3.19673
+G1 X112.551 Y117.481 E3.78061
+G1 X98.667 Y111.548 E5.59677
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X135.194 Y136.086 E6.44231
+G1 X114.237 Y85.210 E7.84063
+G1 F2700 E1.34063
+G1 F2700 E7.84063
+G0 X134.95 Y92.85
+G1 X131.518 Y131.400 E9.48039
+G1 X100.666 Y88.429 E10.84517
+G1 X98.210 Y105.953 E11.00456
+G1 X109.105 Y110.465 E11.65049
+G1 X99.971 Y81.227 E12.11440
+G1 X94.783 Y132.991 E13.91942
+G1 X126.862 Y106.472 E14.81974
+G1 X84.183 Y106.433 E16.65811
+G1 X113.022 Y121.379 E17.65055
+G1 X137.131 Y126.660 E19.50595
+G1 X83.261 Y117.226 E21.09762
+G1 X120.935 Y102.440 E21.74863
+G0 X86.35 Y95.81
+G1 X87.019 Y120.598 E22.02570
+G1 X122.144 Y131.478 E22.29174
+M107
+M104 S0
+G28 X0 Y0
+M84
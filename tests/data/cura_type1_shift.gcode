@@ -0,0 +1,1647 @@
+;FLAVOR:Marlin
+;TIME:81744
+M104 S210
+M140 S60
+M190 S60
+M109 S210
+G28 ;Home
+G92 E0
+G1 Z15.0 F6000
+M117 Printing hello world  
+M106 S255
+M107
+G21
+G90
+M82
+M4010 I1 T0 'abcdef'
+T0
+G1 X411.427 Y320.491 E0.71707
+G1 X420.421 Y316.558 E1.77715
+G1 X379.411 Y292.308 E1.88086
+G0 X392.85 Y276.12
+G1 X394.489 Y280.925 E3.34322
+G0 X393.37 Y315.72
+G1 X396.690 Y277.934 E4.57908
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+;LAYER:8
+G0 F9000 X416.416 Y327.608 Z0.4
+;TIME_ELAPSED:2.960000
+G1 X388.819 Y281.933 E4.91205
+G0 X407.54 Y280.90
+N11 G1 X1 Y2*25
+N12 G1 X1 Y2*49
+G1 X379.957 Y278.742 E5.63443
+G1 X406.187 Y270.203 E6.23714
+G1 X388.597 Y319.111 E6.91294
+G1 X398.873 Y312.280 E7.54452
+G1 X371.372 Y314.988 E9.49472
+G0 X371.08 Y317.26
+G1 X370.545 Y272.804 E10.65176
+G1 X381.791 Y315.344 E12.56212
+G92 E0
+M106 S176
+M204 S500 P1000
+G1 X385.054 Y297.771 E1.78542
+G1 X392.038 Y287.752 E3.34740
+G1 X382.509 Y300.773 E5.30408
+G1 X386.541 Y312.156 E5.60047
+G1 X388.370 Y317.926 E6.97240
+G1 X388.558 Y299.028 E8.41467
+G1 F600 X633.616 Y302.012 E8.41467
+G1 X405.638 Y319.578 E8.88935
+G1 X373.342 Y324.964 E9.73286
+G1 X420.306 Y277.834 E10.71999
+G1 F1200 X462.592 Y317.281 E10.71999
+G1 X378.955 Y320.684 E11.58910
+G1 X429.958 Y321.135 E12.49541
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X413.770 Y298.743 E13.47173
+G1 X378.790 Y292.620 E14.27931
+G1 X400.000 Y300.000 A0.96 B0.63
+G1 X375.348 Y286.339 E14.95626
+G1 F30000 X333.437 Y317.161 E14.95626
+G1 F30000 X478.729 Y315.578 E14.95626
+G1 X386.851 Y299.141 E16.36520
+G1 F1800 X619.305 Y290.404 E16.36520
+G1 X398.458 Y316.423 E18.06885
+G1 X387.330 Y300.021 E18.61622
+G1 X386.433 Y290.735 E19.32936
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X380.348 Y322.018 E21.17402
+G1 X390.060 Y278.511 E21.90257
+G1 X400.000 Y300.000 A0.20 B0.36
+G0 X386.97 Y274.73
+G1 X407.007 Y326.173 E22.73584
+G1 X388.160 Y303.192 E24.60870
+G0 X386.24 Y329.76
+G1 X407.444 Y280.845 E25.78160
+G1 F1200 X462.815 Y272.512 E25.78160
+G1 X373.249 Y278.012 E26.23408
+G1 X381.602 Y272.139 E26.59718
+G1 X406.708 Y305.410 E27.35778
+G1 X370.040 Y294.323 E29.16414
+G1 X376.904 Y319.882 E29.98423
+G1 X406.814 Y275.689 E30.05635
+G1 X404.854 Y327.498 E30.73510
+G0 X395.15 Y318.78
+G1 X378.527 Y305.756 E31.47398
+G1 X428.080 Y306.517 E33.38841
+G1 X370.057 Y276.475 E35.17534
+G1 X378.442 Y307.767 E36.40568
+G0 X392.55 Y295.90
+G1 X428.347 Y292.787 E36.98867
+N72 G1 X1 Y2*20
+G1 X428.859 Y299.778 E37.50832
+G1 X429.057 Y299.505 E38.14662
+G1 X377.313 Y307.301 E39.10049
+G1 X416.902 Y319.608 E39.68670
+G1 X386.427 Y326.115 E40.75183
+G1 F1200 X395.257 Y320.635 E40.75183
+G1 F1800 X300.730 Y306.482 E40.75183
+G1 X406.231 Y314.608 E42.04158
+G1 X388.041 Y302.010 E43.56238
+G1 X401.792 Y297.860 E44.15602
+G1 X405.448 Y272.186 E45.64606
+G1 X424.994 Y323.276 E46.55728
+G1 X416.703 Y295.664 E46.58641
+G1 X407.934 Y298.913 E48.00277
+G1 F2700 E41.50277
+G1 F2700 E48.00277
+G1 X421.114 Y281.788 E48.78650
+G1 X373.963 Y320.177 E50.44655
+G1 X387.182 Y316.844 E51.31219
+G1 F2700 E44.81219
+G1 F2700 E51.31219
+G1 X402.946 Y299.861 E52.26901
+G1 X405.151 Y318.709 E52.57607
+G1 X419.176 Y317.505 E53.03611
+G1 X413.356 Y328.721 E53.08721
+G1 X400.000 Y300.000 A0.70 B0.05
+G0 X383.15 Y308.74
+M117 Layer 98 of 99
+G1 F1200 X637.145 Y312.346 E53.08721
+G1 X381.117 Y318.123 E53.45338
+G1 X403.331 Y309.613 E53.87966
+G1 F1800 X187.629 Y304.515 E53.87966
+G1 F30000 X224.480 Y295.900 E53.87966
+G1 X399.375 Y326.312 E55.08010
+G1 X411.838 Y279.067 E55.19160
+G1 X424.625 Y303.293 E56.20329
+G1 X403.101 Y285.251 E56.72978
+G1 F30000 X628.049 Y318.482 E56.72978
+G0 X397.20 Y293.33
+G1 X390.496 Y304.394 E56.76716
+G1 X400.388 Y297.210 E58.49393
+G1 X427.798 Y276.454 E59.41920
+G1 X393.077 Y320.895 E60.50341
+M106 S219
+M204 S500 P1000
+G1 X376.965 Y328.362 E60.94958
+G1 X378.386 Y307.488 E62.59077
+G1 X389.996 Y306.825 E63.06081
+G1 X378.186 Y319.866 E63.83231
+G1 X396.004 Y321.095 E65.44131
+G1 X404.396 Y314.410 E66.62657
+G1 X371.990 Y282.144 E66.82057
+G1 X398.860 Y315.621 E68.59908
+;LAYER:123
+G0 F9000 X398.211 Y323.387 Z0.6
+;TIME_ELAPSED:45.510000
+G1 X397.934 Y275.985 E69.45637
+G1 X392.478 Y293.139 E69.77445
+G0 X379.13 Y285.24
+G1 X387.223 Y284.110 E70.09753
+G1 X425.471 Y292.138 E70.16172
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X398.304 Y326.724 E71.50935
+G1 X387.466 Y310.468 E72.84648
+G1 F1200 X176.095 Y312.888 E72.84648
+G1 X407.055 Y324.700 E74.15942
+G1 F1800 X248.549 Y291.688 E74.15942
+G1 X398.082 Y316.551 E76.14666
+G1 X372.635 Y306.521 E76.56419
+G1 F1800 X163.011 Y273.652 E76.56419
+G1 F2700 X241.484 Y271.996 E76.56419
+G0 X420.24 Y303.91
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 F1200 X591.420 Y299.470 E76.56419
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X373.027 Y293.839 E77.05112
+G1 X394.448 Y288.357 E77.56198
+G1 X428.297 Y280.763 E77.63719
+G1 X401.879 Y275.062 E78.44190
+G1 X402.516 Y325.278 E78.65787
+G1 X382.865 Y271.044 E80.37140
+G1 X404.285 Y292.598 E81.34448
+G1 X424.780 Y288.457 E82.79576
+G1 X383.438 Y276.941 E84.44859
+G1 X416.344 Y319.166 E84.62386
+G1 X374.919 Y284.691 E84.88348
+G1 X404.619 Y284.723 E85.74078
+G1 X372.882 Y281.991 E87.14199
+G1 X375.912 Y295.235 E87.88951
+G1 X403.365 Y323.765 E89.39415
+G1 X404.484 Y296.531 E90.91359
+G0 X409.33 Y327.29
+G1 F2700 X288.494 Y318.725 E90.91359
+G1 X373.956 Y280.162 E91.17408
+G1 X387.131 Y273.811 E92.52587
+G1 F30000 X173.389 Y277.300 E92.52587
+N164 G1 X1 Y2*45
+G1 X427.088 Y270.997 E93.04220
+G1 X382.071 Y291.495 E93.29285
+G1 X379.790 Y328.976 E94.53127
+G1 X407.834 Y278.642 E95.74312
+G1 F2700 X541.492 Y277.092 E95.74312
+G1 X397.660 Y296.049 E97.57310
+G1 X426.178 Y301.956 E99.10810
+N172 G1 X1 Y2*76
+;LAYER:173
+G0 F9000 X377.613 Y321.030 Z0.8
+;TIME_ELAPSED:64.010000
+G1 X370.065 Y324.538 E99.52322
+G1 X391.257 Y297.851 E100.93333
+G1 X388.194 Y300.949 E102.57675
+G1 F1200 X335.992 Y318.530 E102.57675
+G0 X409.79 Y324.51
+G1 X390.950 Y278.570 E103.56550
+G1 X375.626 Y293.819 E104.32864
+G1 F1800 X592.087 Y281.959 E104.32864
+G1 F1800 X389.032 Y298.209 E104.32864
+G1 X381.939 Y311.320 E104.51086
+G1 X407.257 Y318.796 E105.72152
+G1 X406.614 Y300.815 E107.07738
+G1 X411.437 Y296.985 E108.16869
+G1 F30000 X603.466 Y311.568 E108.16869
+G1 X417.921 Y291.768 E109.24213
+G1 X401.332 Y287.050 E110.60105
+G1 X391.352 Y304.824 E110.77559
+G1 F2700 X307.260 Y325.751 E110.77559
+G1 X374.322 Y315.204 E112.20772
+G1 X423.829 Y311.260 E114.12154
+G0 X414.32 Y306.66
+G1 X423.768 Y284.345 E115.15493
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X370.178 Y293.410 E115.94174
+G1 X423.972 Y324.610 E117.24793
+G1 X376.534 Y311.327 E118.02126
+G1 X392.441 Y323.206 E119.45178
+G1 X386.060 Y307.330 E120.06294
+G0 X380.05 Y307.97
+G1 F1200 X474.819 Y304.195 E120.06294
+G1 X402.755 Y294.421 E121.34280
+G1 X405.773 Y284.661 E122.30927
+G1 X423.365 Y289.842 E122.47812
+G1 X387.739 Y303.301 E122.77646
+G1 X389.563 Y276.139 E123.64412
+G1 F1800 X509.883 Y273.684 E123.64412
+G1 X427.433 Y289.107 E125.31339
+G0 X408.71 Y325.60
+G1 X420.443 Y298.603 E126.70699
+G1 X379.399 Y275.570 E127.09405
+G1 X376.294 Y315.484 E128.32551
+G1 F1200 X502.288 Y325.445 E128.32551
+M117 Layer 216 of 99
+G1 X376.199 Y276.173 E130.25570
+G1 X392.466 Y297.520 E130.66854
+G1 X375.027 Y294.195 E132.15440
+G1 X377.053 Y305.825 E132.90477
+G1 X399.731 Y327.762 E134.27222
+M106 S36
+M204 S500 P1000
+G1 X412.741 Y270.950 E136.14744
+G0 X429.94 Y315.06
+G1 X378.497 Y324.344 E136.83472
+G1 X375.316 Y276.593 E138.36697
+G1 X373.795 Y295.943 E140.25311
+G1 X386.264 Y313.202 E142.22503
+G1 X403.201 Y295.947 E144.15997
+G1 X421.329 Y284.702 E145.84765
+G1 X375.017 Y319.079 E146.10568
+G1 X371.278 Y303.740 E147.72693
+M117 Layer 233 of 99
+G0 X374.70 Y328.29
+G1 X370.732 Y301.153 E149.33388
+M117 Layer 236 of 99
+G1 X398.221 Y271.350 E151.01224
+G1 X400.010 Y321.609 E152.55398
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X405.228 Y282.936 E153.79038
+G1 X418.748 Y319.419 E155.23690
+G1 X370.894 Y318.939 E157.03323
+G1 X388.179 Y281.444 E157.71007
+G0 X374.60 Y292.17
+G1 X378.355 Y291.805 E158.09136
+;LAYER:246
+G0 F9000 X408.002 Y316.156 Z1.0
+;TIME_ELAPSED:91.020000
+G1 F600 X195.475 Y292.871 E158.09136
+G0 X423.12 Y281.79
+G1 X427.647 Y305.935 E159.74794
+G1 X425.211 Y326.254 E160.22105
+G1 X395.741 Y286.002 E160.59066
+G1 F1800 X320.388 Y282.876 E160.59066
+G1 X423.544 Y303.455 E162.38324
+G1 X393.966 Y288.215 E162.59492
+G1 F2700 E156.09492
+G1 F2700 E162.59492
+G1 X422.248 Y327.901 E163.48165
+G1 X370.758 Y293.115 E163.51670
+G1 X373.354 Y270.913 E164.84675
+G1 X412.972 Y284.162 E165.31160
+G1 X384.311 Y311.535 E166.92038
+G0 X416.59 Y303.47
+G1 X377.405 Y324.371 E167.12546
+G1 X404.986 Y305.653 E167.67678
+G1 X420.806 Y305.453 E168.43241
+G1 X373.312 Y282.724 E169.72174
+G1 X400.804 Y319.046 E169.91866
+G1 X397.372 Y273.790 E170.73608
+;LAYER:268
+G0 F9000 X403.882 Y304.010 Z1.2
+;TIME_ELAPSED:99.160000
+G1 X377.013 Y323.113 E172.22020
+G1 X418.908 Y299.037 E172.90177
+G1 X385.080 Y271.489 E173.15050
+G1 X417.352 Y312.121 E173.48292
+G1 X424.910 Y320.181 E175.23338
+G1 X424.101 Y291.304 E176.36464
+G1 X411.624 Y306.660 E177.27642
+G1 X371.560 Y294.684 E178.57561
+G1 X396.563 Y304.623 E179.63808
+G1 X412.347 Y313.152 E181.03036
+G1 X412.948 Y288.231 E181.11543
+G1 X420.345 Y327.386 E182.19765
+G1 X394.308 Y288.318 E182.74436
+G1 X422.729 Y289.368 E183.34247
+G1 X392.851 Y309.359 E184.33855
+M106 S161
+M204 S500 P1000
+M106 S105
+M204 S500 P1000
+G1 X429.630 Y308.394 E184.63897
+G1 X393.681 Y281.801 E185.67530
+G1 F2700 E179.17530
+G1 F2700 E185.67530
+G1 X426.121 Y290.643 E186.67964
+G1 X403.791 Y300.158 E187.54734
+M117 Layer 291 of 99
+G1 X380.086 Y303.136 E188.02693
+G1 X407.017 Y281.765 E188.65394
+G1 X400.975 Y299.201 E190.34599
+G1 F600 X618.983 Y276.988 E190.34599
+G1 F1800 X206.054 Y322.244 E190.34599
+G1 X380.730 Y316.586 E191.85758
+G1 X390.081 Y315.951 E192.20201
+G1 X422.949 Y288.716 E193.91759
+G1 X429.935 Y294.513 E194.59186
+G1 X372.363 Y275.671 E194.72968
+G1 F30000 X355.176 Y297.707 E194.72968
+G1 X426.357 Y302.469 E195.57311
+G1 X389.398 Y291.730 E196.93637
+G1 X380.210 Y284.762 E197.69692
+G1 X409.282 Y309.827 E197.88706
+G1 X388.387 Y297.234 E198.11681
+G0 X372.35 Y322.92
+G1 X400.000 Y300.000 A0.13 B0.66
+G1 X422.889 Y312.692 E198.50066
+G1 X421.360 Y308.474 E199.11295
+G1 X417.875 Y308.132 E200.21876
+G1 X407.714 Y297.401 E200.55080
+G1 X375.901 Y305.757 E201.97081
+G1 X416.142 Y296.713 E203.87111
+G1 X408.555 Y313.161 E204.37058
+G1 X410.609 Y318.115 E205.29851
+G1 X423.101 Y307.663 E205.89440
+G1 X403.328 Y282.399 E206.97943
+G1 X398.876 Y320.544 E208.13466
+G0 X401.28 Y306.23
+G1 X387.318 Y301.435 E208.25040
+G1 X416.386 Y287.391 E208.99125
+G1 X371.970 Y299.249 E210.89432
+G1 X395.049 Y286.927 E212.82147
+G0 X405.49 Y297.66
+G1 F2700 E206.32147
+G1 F2700 E212.82147
+G1 X411.351 Y317.345 E213.47716
+G1 X409.118 Y302.342 E214.63101
+G1 X392.391 Y283.642 E215.56240
+;LAYER:331
+G0 F9000 X428.277 Y314.213 Z1.4
+;TIME_ELAPSED:122.470000
+G1 X400.438 Y309.956 E215.90414
+G1 X395.058 Y321.805 E216.10858
+G1 X382.301 Y284.153 E217.94877
+G1 X392.390 Y304.931 E219.81079
+G1 X403.455 Y303.061 E219.99838
+G0 X417.07 Y313.60
+G0 X401.84 Y270.16
+G1 X381.372 Y281.392 E220.92546
+G1 X423.931 Y298.165 E222.70376
+G1 X416.156 Y311.945 E222.85287
+G1 X407.108 Y306.255 E223.78342
+G1 F2700 E217.28342
+G1 F2700 E223.78342
+G0 X382.26 Y309.08
+G1 X428.100 Y311.786 E224.78823
+G1 X423.257 Y280.330 E225.85640
+G1 X373.478 Y281.251 E225.92344
+G0 X393.49 Y316.31
+G1 X381.275 Y277.916 E226.69115
+G1 F2700 E220.19115
+G1 F2700 E226.69115
+G1 X386.435 Y301.489 E228.61302
+G1 X420.310 Y286.002 E229.98810
+G1 X395.353 Y318.750 E230.45347
+G0 X423.98 Y303.64
+G0 X414.11 Y313.96
+G1 X412.963 Y322.017 E231.61756
+G1 X428.194 Y279.668 E233.25989
+G1 X395.980 Y318.926 E234.67701
+G1 X402.651 Y312.326 E235.04125
+M106 S3
+M204 S500 P1000
+G1 F2700 X619.722 Y320.041 E235.04125
+G1 X374.790 Y279.025 E236.89018
+;LAYER:363
+G0 F9000 X373.509 Y306.109 Z1.6
+;TIME_ELAPSED:134.310000
+G1 F2700 X287.058 Y304.292 E236.89018
+G0 X389.75 Y328.16
+G1 X403.525 Y328.685 E237.67661
+G1 X376.553 Y300.843 E238.63735
+G1 F2700 X265.420 Y309.910 E238.63735
+G1 X413.815 Y294.438 E238.82598
+G1 X416.725 Y288.572 E240.53908
+G1 X401.133 Y274.950 E240.78606
+G1 X408.180 Y272.442 E242.61809
+G1 X396.583 Y279.069 E243.55710
+G1 X374.267 Y310.463 E244.45614
+G1 X375.450 Y288.157 E245.03669
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X390.747 Y326.703 E245.22857
+G1 X382.541 Y310.909 E245.91351
+G1 X421.737 Y289.686 E246.11012
+G1 X422.303 Y273.490 E247.01578
+G1 X385.860 Y319.319 E247.58703
+G1 X400.412 Y320.748 E248.28052
+G1 X409.410 Y306.905 E249.18341
+G1 X377.902 Y296.344 E250.03605
+G0 X388.36 Y291.91
+G1 X380.522 Y296.755 E251.21697
+G1 F600 X432.523 Y305.384 E251.21697
+G1 X425.335 Y287.695 E251.31253
+G1 X383.916 Y296.010 E252.17642
+G1 X401.681 Y329.808 E253.56583
+G1 X397.975 Y297.758 E254.35655
+G1 X429.804 Y320.968 E255.08752
+G1 X386.402 Y325.227 E255.96288
+G1 X376.919 Y294.118 E257.21814
+G1 X378.674 Y318.020 E257.74737
+G1 X380.867 Y329.032 E258.46198
+;LAYER:397
+G0 F9000 X411.010 Y288.927 Z1.8
+;TIME_ELAPSED:146.890000
+G1 X424.671 Y300.955 E258.77314
+G1 X381.645 Y281.613 E259.52947
+G1 X422.511 Y310.070 E260.91194
+G1 X403.271 Y275.954 E261.13861
+G1 X420.821 Y270.758 E261.83387
+G1 X398.525 Y282.293 E261.90000
+G92 E0
+G1 X400.000 Y300.000 A0.33 B0.31
+G1 X411.921 Y315.540 E0.03382
+G1 X377.174 Y323.938 E1.42090
+G1 X423.715 Y305.069 E2.96532
+G92 E0
+G1 X394.648 Y316.622 E0.67437
+G1 X384.462 Y327.788 E1.45697
+G0 X416.03 Y298.19
+G1 X414.799 Y315.355 E1.56743
+M106 S111
+M204 S500 P1000
+G1 X386.946 Y272.188 E2.71383
+G1 X377.210 Y274.836 E3.62902
+G1 X427.425 Y299.219 E4.36532
+G0 X414.66 Y305.54
+G1 X389.030 Y308.060 E5.15064
+G0 X417.44 Y287.72
+G1 X405.071 Y283.684 E5.16849
+;LAYER:422
+G0 F9000 X388.123 Y283.705 Z2.0
+;TIME_ELAPSED:156.140000
+G1 X405.061 Y286.903 E6.49726
+G1 F1200 X524.652 Y280.157 E6.49726
+G1 X420.280 Y305.772 E7.72742
+G1 X388.361 Y285.242 E8.60576
+G1 X418.036 Y309.003 E9.78539
+G1 X404.057 Y326.696 E11.06504
+G1 X400.000 Y300.000 A0.01 B0.01
+G1 X417.197 Y292.737 E11.38431
+G0 X421.12 Y306.34
+G1 X402.882 Y307.858 E11.77227
+G1 F30000 X605.894 Y271.248 E11.77227
+G1 X371.866 Y286.196 E12.36161
+G1 X424.588 Y274.764 E13.16198
+G1 X407.495 Y271.250 E14.55192
+G1 X423.698 Y296.526 E15.11411
+G1 X399.108 Y278.967 E16.07449
+G1 X398.635 Y302.244 E17.51630
+G1 F2700 X454.147 Y272.660 E17.51630
+G1 X389.854 Y311.056 E18.84082
+G1 X406.850 Y310.201 E20.07368
+G92 E0
+G1 F1200 X431.697 Y317.126 E0.00000
+G1 X428.840 Y295.020 E0.56613
+G1 X380.564 Y318.680 E2.26681
+G1 X407.876 Y284.318 E3.24807
+G1 X383.223 Y278.807 E4.66917
+G1 X398.094 Y309.041 E5.56122
+G1 X370.823 Y311.878 E6.91181
+G1 X376.712 Y272.811 E7.19237
+G1 F2700 X371.731 Y281.021 E7.19237
+G1 X417.311 Y296.148 E7.23346
+G1 X400.000 Y300.000 A0.52 B0.76
+G1 X379.828 Y300.736 E7.68146
+G0 X423.62 Y289.39
+G1 F30000 X312.997 Y299.978 E7.68146
+G1 X425.724 Y286.642 E8.06216
+G1 X384.482 Y310.049 E9.68596
+G1 X398.609 Y289.718 E11.47879
+G1 X370.007 Y277.170 E12.20642
+G1 X416.104 Y326.517 E12.83558
+G1 X387.597 Y307.741 E13.33521
+G1 X401.427 Y286.136 E13.57022
+G1 X376.313 Y296.359 E15.14070
+G1 F30000 X606.470 Y283.282 E15.14070
+G1 X395.872 Y309.062 E15.50908
+G1 X420.069 Y301.533 E15.73782
+G1 X375.774 Y288.838 E15.91317
+G1 X413.192 Y307.677 E16.19052
+G1 X421.956 Y286.682 E18.11753
+G1 X370.440 Y298.797 E20.04456
+G1 F2700 X207.424 Y301.231 E20.04456
+G1 X376.587 Y304.984 E22.02826
+G1 X393.373 Y281.522 E23.04340
+G1 X401.261 Y282.113 E23.99090
+G1 F600 X218.049 Y294.317 E23.99090
+G1 X390.235 Y284.014 E25.34013
+G1 X382.575 Y321.143 E26.32578
+G1 X375.113 Y323.418 E26.46303
+G1 X412.784 Y272.759 E27.04568
+G0 X426.19 Y309.86
+G1 X420.211 Y305.607 E27.89721
+G1 X373.820 Y301.310 E28.36609
+G1 X423.735 Y324.051 E29.25713
+G1 X378.043 Y326.865 E30.82506
+G0 X398.96 Y323.16
+G1 X389.371 Y325.460 E32.78598
+G0 X426.07 Y313.62
+G1 X409.341 Y324.517 E33.34513
+G1 X390.858 Y290.704 E33.42320
+G1 X400.970 Y292.368 E33.87325
+G1 X426.834 Y305.804 E34.69736
+G1 F600 X324.091 Y272.676 E34.69736
+G1 F2700 X521.402 Y306.889 E34.69736
+G1 X395.679 Y281.664 E36.14166
+G1 X372.203 Y327.118 E36.36706
+M117 Layer 498 of 99
+G1 X386.729 Y316.878 E37.19205
+G1 X423.049 Y325.721 E37.53291
+G1 X383.258 Y308.346 E38.45120
+G1 X388.144 Y306.440 E39.04693
+G1 X410.835 Y298.396 E40.02251
+M106 S224
+M204 S500 P1000
+G1 X400.000 Y300.000 A0.27 B0.64
+G1 F2700 E33.52251
+G1 F2700 E40.02251
+G1 X405.887 Y276.353 E41.62134
+G1 F30000 X170.113 Y311.237 E41.62134
+G1 X371.562 Y271.355 E42.13089
+G1 X396.163 Y310.552 E42.84663
+G1 F2700 E36.34663
+G1 F2700 E42.84663
+G1 F1200 X479.620 Y315.239 E42.84663
+G1 X389.117 Y311.904 E44.81267
+G1 X379.660 Y306.312 E45.60288
+G1 X393.848 Y297.259 E47.59546
+G1 F1800 X318.594 Y328.694 E47.59546
+G1 X403.717 Y309.343 E48.53797
+G1 X376.549 Y304.926 E48.68972
+G1 X407.257 Y321.181 E50.64565
+G1 X400.000 Y300.000 A0.50 B0.42
+G1 X415.608 Y304.512 E51.38903
+G1 X401.586 Y314.923 E53.29990
+G1 X404.568 Y276.881 E54.47694
+G1 X390.973 Y277.728 E55.93876
+G0 X414.88 Y315.83
+G1 X415.573 Y282.936 E56.20217
+G1 X386.399 Y270.131 E57.59506
+G1 X405.305 Y329.063 E59.17572
+G1 X396.119 Y304.817 E60.63790
+G1 X402.904 Y306.447 E61.09875
+G1 F2700 E54.59875
+G1 F2700 E61.09875
+G1 X409.055 Y307.676 E62.09813
+G1 X410.940 Y293.212 E62.63135
+G1 X391.539 Y311.194 E62.97135
+G1 X418.981 Y289.589 E63.95177
+G1 X410.757 Y295.552 E65.45413
+G0 X371.58 Y302.18
+G0 X422.74 Y281.59
+G0 X401.99 Y326.11
+G1 X408.512 Y329.431 E66.78300
+G1 X377.483 Y311.023 E67.56225
+G1 X378.765 Y281.439 E69.26070
+M106 S255
+M204 S500 P1000
+G1 X392.932 Y305.928 E70.93251
+G1 X375.041 Y309.733 E72.93129
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X394.825 Y318.467 E73.00148
+G1 X389.260 Y277.612 E74.75077
+G1 X396.478 Y281.743 E74.77464
+G0 X410.59 Y317.08
+G1 X397.129 Y274.684 E75.76078
+G0 X380.43 Y318.39
+G1 X373.778 Y271.304 E77.53016
+G1 X419.409 Y298.425 E79.49769
+G0 X420.91 Y302.23
+G1 X371.543 Y284.204 E80.42078
+G1 X376.688 Y281.728 E80.50110
+G1 X428.129 Y303.953 E80.94372
+G1 X381.573 Y326.016 E81.41554
+G0 X377.48 Y305.48
+G1 X422.658 Y325.890 E81.44706
+G1 X371.154 Y314.866 E81.47690
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X422.407 Y280.428 E82.24531
+G1 X385.764 Y282.066 E83.62645
+G1 X409.617 Y292.321 E84.70837
+G1 F1200 X395.180 Y318.365 E84.70837
+G1 X426.848 Y302.957 E86.64918
+G1 X400.000 Y300.000 A0.80 B0.97
+G1 F2700 E80.14918
+G1 F2700 E86.64918
+N571 G1 X1 Y2*15
+G1 X416.331 Y286.013 E87.15983
+G0 X426.72 Y325.78
+G1 X398.310 Y323.078 E89.01786
+G1 X385.524 Y315.448 E90.09985
+G1 X412.448 Y295.737 E91.86745
+G1 X395.034 Y292.219 E92.40464
+G1 X398.053 Y323.551 E92.41510
+M117 Layer 579 of 99
+G1 X406.169 Y329.956 E93.78813
+G1 F2700 X498.899 Y293.303 E93.78813
+G1 F600 X447.182 Y288.453 E93.78813
+G1 X426.608 Y329.982 E94.76500
+G1 X400.000 Y300.000 A0.95 B0.04
+G1 X419.607 Y303.495 E95.44327
+G1 X385.004 Y277.638 E95.64457
+G1 X381.592 Y280.014 E97.13435
+G1 X420.002 Y309.010 E97.39539
+G0 X413.56 Y313.84
+G1 X392.791 Y293.520 E98.24098
+G1 F2700 E91.74098
+G1 F2700 E98.24098
+G1 X407.846 Y274.963 E99.83934
+G1 X417.361 Y283.984 E100.99503
+G1 X397.542 Y295.203 E101.74909
+G92 E0
+G1 X390.646 Y300.462 E0.55636
+G1 X373.895 Y309.385 E1.34033
+G0 X423.93 Y305.83
+G1 X403.333 Y280.590 E2.46023
+G1 X381.840 Y296.569 E3.45466
+G0 X408.49 Y289.74
+G1 X403.167 Y287.877 E4.71524
+G1 X407.632 Y322.701 E5.52877
+G1 X403.719 Y310.035 E6.60486
+G1 X425.346 Y278.722 E7.09868
+G1 X399.470 Y297.082 E7.61900
+G1 X427.442 Y272.316 E7.97127
+G1 X392.275 Y281.707 E9.44901
+G1 F1200 X568.046 Y328.001 E9.44901
+G1 X406.930 Y316.427 E11.40561
+G1 X385.276 Y320.555 E12.67597
+G1 F2700 E6.17597
+G1 F2700 E12.67597
+G1 F2700 X603.365 Y309.047 E12.67597
+G1 X429.331 Y316.945 E14.07804
+G1 F2700 X252.417 Y310.984 E14.07804
+G1 X405.130 Y313.413 E14.99736
+G1 X417.389 Y275.335 E15.12272
+G1 X421.896 Y283.539 E15.64311
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G0 X410.85 Y298.47
+G0 X374.15 Y321.03
+G1 X370.478 Y329.961 E16.13430
+G1 F600 X481.883 Y319.184 E16.13430
+G1 X426.423 Y274.237 E17.91225
+G1 X397.989 Y302.900 E18.67359
+G0 X407.85 Y323.30
+G1 X393.506 Y280.948 E20.26738
+G0 X404.64 Y283.53
+G0 X399.50 Y310.44
+G1 X400.000 Y300.000 A0.33 B0.54
+G1 X402.043 Y327.961 E20.83810
+G1 X411.007 Y306.925 E21.36880
+G1 X392.554 Y316.874 E22.71121
+G1 X387.832 Y280.305 E24.35947
+G1 X422.496 Y329.739 E24.61076
+G1 X422.915 Y321.073 E25.09104
+G1 X399.846 Y277.927 E25.70211
+G1 X377.168 Y278.666 E26.49694
+G1 X424.924 Y327.686 E27.09834
+G1 X415.582 Y290.323 E27.64811
+G0 X395.42 Y311.51
+G1 F2700 X521.265 Y290.538 E27.64811
+G1 X427.515 Y272.211 E28.38506
+G1 X396.418 Y322.239 E29.00397
+G1 X371.064 Y290.386 E29.21238
+G1 F2700 X417.614 Y286.769 E29.21238
+G1 X424.438 Y318.611 E30.00881
+G1 X379.966 Y292.841 E31.76364
+G0 X390.85 Y271.15
+G1 X375.325 Y285.504 E32.90103
+G1 F30000 X305.326 Y293.122 E32.90103
+G1 F1800 X189.865 Y321.199 E32.90103
+G1 X377.553 Y323.254 E33.48013
+G1 X413.712 Y312.282 E34.62409
+G1 X405.776 Y304.611 E35.90852
+G1 F30000 X618.806 Y277.502 E35.90852
+G1 X405.348 Y316.920 E37.62135
+G1 X400.000 Y300.000 A0.77 B0.61
+G1 F30000 X401.321 Y323.828 E37.62135
+G1 X381.184 Y322.942 E38.47226
+G1 X388.109 Y318.265 E39.65993
+G1 X386.154 Y288.308 E40.19769
+G1 X370.528 Y275.386 E40.29466
+G1 X423.581 Y321.499 E40.67198
+G1 X381.811 Y289.875 E42.17312
+G1 X391.020 Y277.306 E43.10053
+G1 X411.934 Y293.710 E44.35919
+G1 X407.680 Y324.488 E44.84762
+G1 X397.553 Y284.937 E46.77842
+G1 F600 X228.327 Y305.960 E46.77842
+G1 X424.124 Y278.074 E47.20457
+M117 Layer 672 of 99
+G1 X416.765 Y297.793 E48.07346
+G1 X406.322 Y270.593 E48.97563
+G1 X388.450 Y296.097 E50.37942
+G1 X416.324 Y302.821 E51.44311
+G1 X375.599 Y278.757 E52.10006
+M117 Layer 678 of 99
+G1 X400.000 Y300.000 A0.92 B0.22
+G1 X400.233 Y323.231 E52.47547
+G1 F600 X170.627 Y328.426 E52.47547
+G1 X395.185 Y277.234 E54.26161
+G1 X373.339 Y302.564 E55.27592
+;LAYER:684
+G0 F9000 X387.918 Y312.659 Z2.2
+;TIME_ELAPSED:253.080000
+G0 X380.68 Y294.40
+M106 S161
+M204 S500 P1000
+G1 X418.624 Y321.940 E56.37222
+G1 X381.750 Y321.663 E57.22867
+G1 X397.152 Y307.166 E57.74121
+G1 X385.593 Y286.939 E58.24258
+G1 X415.756 Y317.633 E59.44634
+M106 S199
+M204 S500 P1000
+G1 X388.085 Y324.248 E60.72465
+G1 X408.068 Y305.731 E61.67304
+G92 E0
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 F1800 X415.673 Y300.442 E0.00000
+G1 X423.343 Y321.192 E0.59058
+G1 F2700 X337.472 Y272.660 E0.59058
+G1 X429.259 Y294.073 E1.86359
+G1 X388.729 Y276.690 E3.03822
+G1 F2700 X540.444 Y281.378 E3.03822
+G1 X424.530 Y282.565 E3.31514
+G1 X412.188 Y272.307 E4.50390
+G1 X403.253 Y300.932 E5.56371
+G1 F2700 X573.218 Y289.851 E5.56371
+G1 X371.594 Y308.192 E6.50499
+G1 X419.996 Y313.953 E7.99844
+G1 X413.569 Y308.363 E8.66416
+G1 X398.361 Y301.864 E10.40228
+G1 X398.425 Y314.536 E12.06460
+G0 X401.14 Y305.11
+G1 X417.946 Y325.242 E12.53988
+G1 X398.191 Y274.793 E12.60598
+G1 X384.454 Y316.530 E13.28967
+G1 X381.665 Y292.829 E15.13304
+G1 X395.673 Y281.160 E16.67859
+G1 X428.038 Y309.063 E17.81476
+G0 X420.03 Y295.72
+G1 X413.394 Y293.979 E19.48195
+G1 X387.547 Y285.890 E20.94530
+G1 X408.787 Y326.219 E22.31876
+G1 X423.065 Y278.316 E23.28579
+G1 X389.984 Y279.130 E25.26049
+G1 X413.941 Y294.747 E25.31527
+G0 X420.12 Y271.56
+G1 X385.832 Y271.727 E25.84297
+G1 X397.151 Y301.864 E26.52264
+G1 X400.000 Y300.000 A0.11 B0.13
+G1 F2700 E20.02264
+G1 F2700 E26.52264
+G1 X388.306 Y323.720 E27.59998
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X392.293 Y312.240 E27.78805
+G1 X393.817 Y273.694 E28.34864
+G1 X393.233 Y297.975 E29.99780
+G1 X395.014 Y293.121 E31.42314
+G1 F1800 X321.765 Y320.350 E31.42314
+G1 X391.254 Y291.566 E33.16996
+G1 F30000 X355.442 Y277.809 E33.16996
+G1 X424.901 Y309.743 E34.34398
+N741 G1 X1 Y2*52
+G1 X426.706 Y272.149 E35.88908
+G1 X371.856 Y292.334 E36.11156
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X414.167 Y296.745 E37.68031
+G0 X373.17 Y315.87
+G1 X413.611 Y303.276 E39.44399
+G1 X427.118 Y272.358 E40.63776
+G1 X421.518 Y308.517 E42.56155
+G1 X415.267 Y322.523 E44.40893
+G1 X380.925 Y327.585 E45.79571
+G1 X393.114 Y298.022 E47.38964
+G1 X413.825 Y280.058 E49.11408
+G1 X412.406 Y302.870 E50.89738
+G1 X380.888 Y305.911 E50.98573
+G1 X372.287 Y277.085 E51.76881
+G1 X422.562 Y274.285 E53.67895
+G1 X403.094 Y276.294 E55.56854
+M106 S209
+M204 S500 P1000
+G0 X424.94 Y319.82
+G1 X387.486 Y303.727 E57.17682
+G1 X400.738 Y280.580 E59.04946
+G1 X400.000 Y300.000 A0.62 B0.21
+G0 X407.57 Y307.35
+G0 X388.95 Y286.66
+G1 X411.928 Y298.622 E59.45609
+G1 X379.727 Y304.562 E59.70534
+G1 F2700 E53.20534
+G1 F2700 E59.70534
+G1 F30000 X334.076 Y298.579 E59.70534
+G1 X412.235 Y289.507 E60.07506
+G1 X387.358 Y322.917 E61.57762
+G0 X376.97 Y280.38
+G1 X400.000 Y300.000 A0.29 B0.41
+G1 F2700 E55.07762
+G1 F2700 E61.57762
+G1 X378.404 Y299.582 E62.44863
+G1 X384.516 Y318.700 E64.33851
+G0 X416.56 Y298.42
+G0 X372.92 Y276.33
+G0 X409.60 Y270.97
+G1 X388.889 Y277.826 E64.80194
+G1 X412.737 Y287.326 E65.92971
+G1 X400.549 Y285.711 E66.01641
+G1 X400.000 Y300.000 A0.18 B0.54
+G1 X424.869 Y290.247 E66.67979
+G1 X426.701 Y310.220 E68.43560
+G1 X380.282 Y311.188 E69.42776
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X380.367 Y287.585 E70.83440
+G1 X403.470 Y316.716 E72.56551
+G1 X420.622 Y302.900 E73.24119
+G1 X416.123 Y298.880 E74.17273
+G1 X405.302 Y272.427 E75.39419
+G1 X422.763 Y317.000 E76.58103
+G0 X428.62 Y297.97
+G1 X374.586 Y274.750 E78.23280
+G1 X371.648 Y296.727 E79.69454
+G1 X419.670 Y322.954 E79.89656
+G1 X383.075 Y314.389 E80.34172
+G1 X390.780 Y329.659 E81.53243
+G1 X380.577 Y275.378 E82.20754
+G1 X386.340 Y309.787 E82.81487
+G1 X370.645 Y316.475 E84.11232
+G1 F1800 X608.181 Y304.718 E84.11232
+G1 X389.789 Y298.727 E84.77178
+G0 X382.34 Y294.59
+G1 F30000 X610.403 Y271.221 E84.77178
+G1 X403.967 Y295.184 E86.51676
+G1 F2700 X174.504 Y277.319 E86.51676
+G1 X380.591 Y323.593 E88.39365
+G1 F600 X197.899 Y286.691 E88.39365
+G1 F1800 X490.229 Y292.922 E88.39365
+G1 F30000 X350.170 Y275.412 E88.39365
+G1 X413.265 Y302.040 E90.13692
+G0 X423.59 Y297.42
+G1 X370.530 Y280.582 E91.61533
+G1 X371.713 Y270.675 E91.81930
+G1 X407.402 Y309.969 E92.32144
+G0 X399.03 Y287.98
+G1 F600 X178.781 Y319.994 E92.32144
+G1 X422.953 Y276.971 E92.73662
+G1 X411.925 Y284.209 E94.08149
+G1 X387.628 Y306.328 E95.34349
+G1 F600 X378.492 Y294.474 E95.34349
+G0 X375.95 Y273.73
+G0 X412.02 Y313.70
+G1 F2700 E88.84349
+G1 F2700 E95.34349
+G0 X376.79 Y290.70
+G1 X410.170 Y310.925 E96.93562
+G1 X391.063 Y312.663 E97.37370
+G1 X406.721 Y298.826 E97.40266
+G1 X416.730 Y328.788 E98.55103
+G0 X396.61 Y285.85
+G92 E0
+G1 X387.572 Y292.321 E1.18039
+G1 X429.148 Y322.703 E1.79462
+G1 F2700 X400.238 Y316.959 E1.79462
+G1 F2700 E-4.70538
+G1 F2700 E1.79462
+G0 X418.12 Y329.76
+G1 X401.624 Y319.352 E2.32173
+G1 X390.110 Y297.960 E3.95173
+G1 F30000 X499.689 Y274.104 E3.95173
+G0 X428.36 Y327.90
+G1 X428.990 Y276.422 E5.61847
+G1 X429.302 Y271.837 E6.94721
+G0 X409.61 Y298.50
+G1 X399.908 Y282.086 E7.96125
+G1 F2700 E1.46125
+G1 F2700 E7.96125
+G1 F1200 X547.913 Y312.723 E7.96125
+G1 X391.102 Y279.648 E8.43181
+G1 X412.035 Y288.429 E8.61489
+G0 X385.83 Y290.86
+G1 X381.949 Y324.106 E9.23386
+G0 X409.95 Y327.18
+M106 S58
+M204 S500 P1000
+G1 X397.059 Y320.753 E10.06356
+G1 X418.241 Y319.916 E11.51958
+G1 X398.018 Y305.223 E12.73467
+G1 X384.733 Y317.053 E13.11436
+G1 F2700 X444.622 Y284.900 E13.11436
+G1 X417.252 Y310.334 E14.84150
+G1 X385.389 Y323.340 E16.34160
+G1 X381.528 Y273.284 E17.23248
+M117 Layer 863 of 99
+G1 X417.389 Y287.839 E17.35080
+G1 F600 X407.146 Y318.146 E17.35080
+G1 X381.349 Y292.752 E19.29086
+G1 X411.769 Y300.371 E20.47248
+G1 X417.665 Y274.278 E22.03643
+G0 X370.35 Y311.06
+G1 X375.375 Y285.457 E22.63090
+G1 X418.810 Y280.308 E23.69843
+G1 X372.560 Y281.233 E24.30549
+G1 X372.267 Y328.549 E24.62418
+G1 X395.329 Y300.661 E26.13912
+G1 X382.688 Y327.592 E28.02820
+G1 F2700 X206.673 Y329.202 E28.02820
+G1 X404.039 Y296.729 E29.18697
+M117 Layer 878 of 99
+G1 X400.000 Y300.000 A0.95 B0.14
+G1 X381.007 Y323.446 E30.58766
+G1 F600 X370.110 Y284.327 E30.58766
+G1 F2700 X639.131 Y286.570 E30.58766
+G0 X405.17 Y291.73
+G1 X372.078 Y295.813 E30.79884
+G1 X389.316 Y278.151 E31.20654
+G1 X428.526 Y295.439 E31.71906
+G1 X427.583 Y319.561 E32.80068
+G92 E0
+G0 X414.29 Y322.57
+G1 X389.858 Y325.529 E1.21566
+G1 X384.187 Y290.390 E3.21510
+G1 F30000 X271.937 Y329.093 E3.21510
+G1 X393.069 Y323.770 E4.49492
+G1 F600 X388.900 Y279.838 E4.49492
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X393.607 Y312.700 E5.83078
+G1 X391.372 Y315.705 E6.18813
+G0 X400.84 Y309.58
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X385.166 Y322.345 E8.14010
+G1 F30000 X169.492 Y325.331 E8.14010
+G1 X401.904 Y288.760 E8.40362
+G1 F2700 X460.510 Y304.978 E8.40362
+G1 X374.202 Y313.994 E9.48343
+G0 X385.71 Y293.98
+G1 X391.808 Y318.126 E10.97681
+;LAYER:907
+G0 F9000 X415.232 Y277.305 Z2.4
+;TIME_ELAPSED:335.590000
+G1 X376.779 Y275.539 E12.01742
+G1 X402.783 Y314.316 E12.73258
+G0 X425.27 Y326.76
+M106 S13
+M204 S500 P1000
+G1 X371.144 Y308.763 E13.49807
+G1 X392.102 Y310.199 E13.72359
+G1 F2700 X351.956 Y329.573 E13.72359
+G1 F1200 X392.104 Y328.190 E13.72359
+G1 X371.805 Y277.976 E14.76897
+G1 X380.474 Y276.501 E15.14262
+G1 F2700 E8.64262
+G1 F2700 E15.14262
+G1 X403.710 Y286.988 E16.12207
+G0 X414.15 Y295.61
+G1 X372.119 Y313.552 E16.12253
+G1 X401.101 Y292.238 E17.02168
+G1 X427.257 Y315.294 E18.90127
+G1 X412.118 Y283.866 E20.80508
+G1 X376.230 Y293.384 E21.09664
+G1 X374.886 Y290.218 E21.51389
+G1 X423.472 Y319.307 E23.27292
+G1 X386.849 Y305.120 E24.91954
+G1 X402.454 Y285.794 E25.38536
+G1 F1200 X392.171 Y284.486 E25.38536
+G1 X403.870 Y290.549 E25.49554
+G92 E0
+G1 X420.103 Y320.788 E1.67479
+G92 E0
+G1 X410.017 Y302.086 E1.67448
+G1 F2700 E-4.82552
+G1 F2700 E1.67448
+G1 F30000 X397.608 Y279.302 E1.67448
+G0 X412.56 Y280.95
+G1 X400.683 Y308.186 E1.89832
+G1 F1200 X452.543 Y271.501 E1.89832
+G1 X376.900 Y309.413 E3.12892
+G1 F2700 E-3.37108
+G1 F2700 E3.12892
+G1 F30000 X169.744 Y278.827 E3.12892
+G1 X421.028 Y317.923 E4.00525
+G1 X402.448 Y281.708 E4.02920
+G1 X387.268 Y293.681 E5.89290
+G1 X373.670 Y305.389 E7.75775
+G1 X376.117 Y290.001 E8.01005
+G1 X428.113 Y309.749 E9.40698
+G1 X426.051 Y296.396 E11.40077
+G1 X376.318 Y308.635 E12.43592
+G1 F2700 X210.526 Y274.854 E12.43592
+G1 F2700 X490.689 Y322.993 E12.43592
+G1 F2700 X430.151 Y308.544 E12.43592
+G1 X426.192 Y271.630 E12.61710
+N956 G1 X1 Y2*54
+G1 F1800 X595.260 Y310.712 E12.61710
+G1 X376.391 Y316.424 E12.96914
+G1 X392.322 Y296.154 E13.11439
+G1 X402.563 Y283.225 E14.10181
+G1 X411.988 Y315.802 E15.96386
+G0 X387.16 Y280.29
+G1 X377.115 Y325.859 E16.43131
+G0 X390.15 Y312.65
+G0 X417.40 Y274.36
+G1 X380.985 Y329.840 E17.44241
+G1 X405.709 Y289.948 E19.27018
+G1 X393.673 Y308.485 E21.14631
+G1 X383.994 Y308.744 E22.64311
+G1 X406.768 Y296.737 E24.14883
+G1 X418.315 Y270.403 E24.36276
+G1 X393.544 Y288.690 E25.67829
+G1 X412.953 Y323.550 E26.42418
+G1 X393.339 Y300.081 E27.63657
+G0 X417.36 Y288.61
+G1 X401.648 Y308.504 E27.83551
+G1 X387.419 Y311.682 E28.44192
+G1 X395.656 Y322.948 E28.90505
+G1 X426.080 Y275.899 E29.44184
+G1 X410.975 Y299.863 E30.25106
+G1 F2700 E23.75106
+G1 F2700 E30.25106
+G1 X420.111 Y323.723 E31.83398
+G1 X424.388 Y272.460 E33.59932
+G1 F2700 E27.09932
+G1 F2700 E33.59932
+G1 X390.155 Y296.988 E34.75191
+G1 X380.246 Y318.419 E35.62872
+G1 F1200 X304.091 Y327.769 E35.62872
+G1 X421.993 Y276.566 E36.57817
+G1 X407.415 Y272.259 E37.78432
+G0 X416.05 Y305.74
+G1 X383.229 Y329.957 E39.63097
+G1 X402.719 Y306.346 E41.44872
+M106 S224
+M204 S500 P1000
+G1 X399.326 Y272.082 E43.15246
+G1 F1200 X525.269 Y282.608 E43.15246
+G1 X420.216 Y274.863 E43.26846
+G0 X417.73 Y329.21
+G1 X374.984 Y276.663 E44.88918
+G0 X378.44 Y314.20
+G1 X400.000 Y300.000 A0.48 B0.42
+G0 X408.20 Y329.06
+G1 X372.730 Y323.554 E45.78155
+G1 F1200 X611.285 Y277.452 E45.78155
+G1 X415.691 Y314.444 E46.77472
+G1 X416.545 Y286.552 E46.95813
+G1 F1200 X279.831 Y316.488 E46.95813
+G1 F600 X316.836 Y275.032 E46.95813
+G1 X400.773 Y275.252 E48.62792
+G1 X406.470 Y276.803 E48.87051
+G1 X403.445 Y324.756 E49.77994
+G1 X426.972 Y277.567 E49.90379
+G0 X422.26 Y289.03
+G1 X405.535 Y322.083 E51.18311
+G1 X400.180 Y270.692 E53.01223
+G1 F2700 X345.274 Y309.564 E53.01223
+G1 X389.479 Y285.215 E53.72362
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X408.494 Y329.808 E54.09242
+G1 X401.961 Y328.077 E55.73288
+G1 X382.184 Y291.439 E56.95455
+G1 X415.835 Y283.539 E57.47233
+N1023 G1 X1 Y2*1
+G1 X406.566 Y300.093 E59.23794
+G1 X384.410 Y324.869 E59.92705
+G1 X405.491 Y299.784 E60.64236
+G1 X415.978 Y278.252 E61.18671
+G1 X374.581 Y328.704 E61.40646
+G1 X374.400 Y279.641 E62.34191
+G1 X426.286 Y293.948 E64.20254
+G1 X420.047 Y278.300 E64.64423
+G1 X414.351 Y322.076 E65.02777
+G1 X424.999 Y275.948 E65.68894
+G1 F1800 X312.106 Y305.851 E65.68894
+G1 F1800 X310.387 Y282.255 E65.68894
+G1 X404.592 Y288.507 E65.84028
+G1 X411.339 Y286.033 E66.05081
+G1 X380.026 Y289.535 E67.49552
+G1 F600 X587.974 Y271.760 E67.49552
+G1 X423.055 Y299.967 E68.19396
+G1 X396.643 Y290.352 E68.51287
+G1 X423.337 Y294.387 E69.77220
+G1 X427.290 Y327.638 E71.53017
+G1 F1200 X275.094 Y320.271 E71.53017
+G1 F1200 X233.721 Y283.597 E71.53017
+G1 X400.000 Y300.000 A0.34 B0.59
+G1 X370.304 Y318.439 E72.96507
+G1 F2700 E66.46507
+G1 F2700 E72.96507
+G1 X411.586 Y282.658 E73.66877
+G1 F30000 X444.939 Y315.123 E73.66877
+G1 X424.183 Y315.573 E75.20724
+G1 F2700 E68.70724
+G1 F2700 E75.20724
+G1 F600 X553.240 Y302.453 E75.20724
+G1 X418.743 Y297.891 E76.24803
+G1 X390.612 Y295.517 E77.04784
+G1 X402.873 Y275.142 E77.38765
+G0 X384.27 Y281.59
+G1 X421.852 Y306.702 E78.64866
+G0 X412.47 Y323.01
+G1 F30000 X203.893 Y277.373 E78.64866
+G1 X417.470 Y292.458 E79.73092
+G0 X399.82 Y327.44
+G1 X379.684 Y317.420 E80.37860
+G1 X399.787 Y315.885 E82.27759
+G1 X374.400 Y281.351 E84.14043
+G1 X400.000 Y300.000 A0.07 B0.96
+G1 X400.000 Y300.000 A0.06 B0.42
+G1 F30000 X346.012 Y319.293 E84.14043
+G1 X404.251 Y281.380 E84.53162
+G1 X389.065 Y324.330 E85.64677
+G1 X429.875 Y294.854 E87.13044
+G1 X380.224 Y316.383 E87.14211
+G1 X405.458 Y270.814 E88.74194
+G1 X378.014 Y280.836 E90.40851
+G1 X399.188 Y277.431 E90.68749
+G1 F1800 X560.202 Y309.142 E90.68749
+G1 X400.000 Y300.000 A0.99 B0.78
+G0 X400.00 Y323.61
+G1 X428.880 Y319.161 E92.57403
+N1080 G1 X1 Y2*87
+G1 X388.384 Y287.853 E94.35151
+G1 X373.621 Y279.699 E94.48363
+G1 F1800 X448.934 Y299.350 E94.48363
+G0 X405.84 Y294.61
+G1 F2700 X337.839 Y309.969 E94.48363
+G1 X386.262 Y278.788 E94.69551
+G1 X415.852 Y305.451 E94.91952
+G1 X417.132 Y271.975 E96.32550
+G1 F2700 X299.191 Y316.069 E96.32550
+G92 E0
+G92 E0
+G1 X376.422 Y295.194 E0.38971
+G1 F2700 X272.735 Y292.783 E0.38971
+G1 X410.710 Y307.247 E1.71210
+G1 F1800 X337.770 Y314.720 E1.71210
+G1 X397.367 Y329.224 E3.19899
+G1 X399.406 Y313.508 E4.09715
+G1 X402.773 Y322.870 E4.67909
+M106 S36
+M204 S500 P1000
+G1 X375.101 Y325.922 E4.68118
+G1 X400.000 Y300.000 A0.75 B0.60
+G1 X379.624 Y278.017 E5.90229
+G1 F2700 X586.247 Y305.343 E5.90229
+G1 F600 X251.272 Y299.435 E5.90229
+G0 X380.50 Y320.33
+G1 F600 X390.112 Y317.975 E5.90229
+G1 F600 X516.831 Y325.173 E5.90229
+G1 X403.057 Y311.840 E5.97895
+G1 X389.555 Y284.251 E7.78079
+;LAYER:1110
+G0 F9000 X423.755 Y313.983 Z2.6
+;TIME_ELAPSED:410.700000
+G1 F1800 X554.063 Y270.737 E7.78079
+G1 F30000 X509.144 Y326.655 E7.78079
+G1 X379.290 Y320.390 E7.83248
+G1 X429.432 Y317.216 E9.35092
+G1 X420.403 Y281.459 E9.75881
+;LAYER:1116
+G0 F9000 X398.716 Y325.362 Z2.8
+;TIME_ELAPSED:412.920000
+G1 X400.000 Y300.000 A0.51 B0.04
+G1 X409.258 Y292.625 E10.63516
+G1 X417.831 Y285.016 E12.34505
+G1 X400.157 Y270.777 E12.43448
+G1 X425.912 Y300.375 E13.21062
+G1 X393.448 Y303.352 E14.72433
+G1 F2700 X338.027 Y319.759 E14.72433
+G1 F600 X194.876 Y299.832 E14.72433
+G1 X391.663 Y270.611 E15.14734
+M106 S159
+M204 S500 P1000
+G1 X397.311 Y312.174 E17.10625
+G1 X376.827 Y289.584 E17.39644
+G1 X428.148 Y283.084 E17.47347
+G1 F2700 E10.97347
+G1 F2700 E17.47347
+G1 X379.902 Y304.038 E19.07284
+G0 X426.13 Y311.60
+G0 X372.89 Y303.93
+G1 X398.541 Y321.029 E19.11228
+G1 X386.982 Y280.495 E19.36763
+G0 X400.53 Y274.82
+M106 S210
+M204 S500 P1000
+G0 X402.35 Y300.94
+G1 X380.453 Y302.834 E20.63559
+G1 X399.321 Y300.472 E21.62477
+G1 X379.207 Y329.790 E22.25025
+G1 F1800 X388.209 Y311.201 E22.25025
+G1 F1800 X296.416 Y281.748 E22.25025
+G1 X424.651 Y328.256 E22.74765
+G1 X373.120 Y302.826 E24.69697
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X425.916 Y306.522 E24.74277
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X405.091 Y321.979 E26.40597
+G1 X407.997 Y290.502 E26.46270
+G1 X375.514 Y306.433 E26.77258
+G1 F600 X469.691 Y278.276 E26.77258
+N1153 G1 X1 Y2*40
+G1 X419.047 Y304.938 E27.14733
+G1 X410.208 Y284.249 E27.82199
+G1 X371.293 Y273.484 E28.61546
+G1 X418.932 Y323.647 E29.21464
+G1 X419.472 Y328.460 E30.69446
+G1 X423.805 Y314.772 E32.09519
+G1 X416.123 Y305.861 E33.76307
+G1 X370.449 Y303.207 E33.92452
+G1 X420.095 Y294.519 E34.12721
+G1 X385.849 Y282.876 E35.29882
+G1 X375.929 Y284.185 E36.87466
+G1 X410.643 Y295.693 E38.20710
+G1 X425.706 Y306.143 E38.24740
+G1 X420.008 Y282.228 E39.52203
+M106 S86
+M204 S500 P1000
+G1 X377.678 Y304.978 E40.33356
+G1 X408.746 Y270.997 E42.17316
+G1 F1800 X625.707 Y302.230 E42.17316
+G1 F1200 X344.131 Y286.272 E42.17316
+G1 X421.444 Y274.206 E44.13494
+G1 F2700 E37.63494
+G1 F2700 E44.13494
+G1 X385.697 Y275.246 E45.76492
+G1 X403.486 Y282.118 E46.04559
+G1 F30000 X510.402 Y282.965 E46.04559
+G0 X414.54 Y315.54
+G1 F1200 X599.366 Y316.771 E46.04559
+G1 X400.000 Y300.000 A0.17 B0.23
+G1 X400.000 Y300.000 A0.49 B0.95
+G1 X376.099 Y278.198 E47.97821
+G1 X385.815 Y291.281 E48.40059
+G1 X401.661 Y304.402 E49.54596
+G1 X394.495 Y294.463 E51.21619
+G1 X393.517 Y310.816 E53.12874
+G1 X402.119 Y296.704 E54.46485
+G1 X409.245 Y278.213 E55.11063
+G1 X399.692 Y315.340 E56.31041
+G1 X401.234 Y307.982 E57.29418
+G1 X386.060 Y295.753 E58.36816
+G1 X405.820 Y270.378 E60.15353
+G1 X377.392 Y271.813 E62.12596
+G1 X400.000 Y300.000 A0.02 B0.71
+G1 X396.315 Y315.390 E62.70998
+G1 X400.047 Y316.542 E62.73389
+G1 X407.785 Y284.357 E63.59841
+G1 F1800 X265.951 Y273.446 E63.59841
+N1199 G1 X1 Y2*62
+G1 X408.011 Y277.302 E64.12710
+G1 X401.972 Y305.166 E65.21289
+G1 X416.194 Y329.429 E65.73397
+G1 X422.808 Y329.869 E65.90499
+G1 X405.660 Y324.104 E67.83133
+G1 X420.348 Y298.030 E67.87538
+G1 X370.074 Y281.610 E69.42230
+G1 F30000 X497.356 Y281.963 E69.42230
+M117 Layer 1208 of 99
+G1 X387.913 Y311.070 E70.96671
+G1 X417.911 Y326.287 E71.92352
+G1 X429.036 Y273.384 E72.41461
+G1 X425.881 Y328.852 E73.21922
+G0 X429.50 Y302.70
+G1 F1800 X504.928 Y284.840 E73.21922
+G1 X405.570 Y302.719 E74.66445
+G1 X389.266 Y300.013 E75.19376
+G1 X373.418 Y329.496 E75.60622
+G1 X423.692 Y279.751 E77.37778
+G1 X370.169 Y283.276 E77.83804
+G1 X380.393 Y301.613 E79.23995
+G1 X411.063 Y315.399 E80.68631
+G1 X413.498 Y296.811 E80.94582
+G1 F1200 X530.682 Y312.737 E80.94582
+G1 X410.209 Y298.927 E82.74827
+G0 X390.59 Y290.69
+G1 X381.423 Y287.423 E84.70907
+G1 X398.626 Y298.669 E86.00977
+G1 X404.806 Y279.533 E86.74328
+G1 X400.610 Y299.769 E87.03693
+G1 X417.999 Y284.109 E87.66753
+G1 X391.974 Y295.225 E89.59812
+G1 X416.872 Y323.241 E90.59276
+G1 X398.400 Y297.439 E91.59752
+G1 X386.816 Y284.738 E91.98094
+G1 X387.936 Y326.778 E92.60995
+G1 X375.835 Y308.044 E93.24153
+G1 X372.710 Y306.322 E94.38340
+G1 F30000 X257.140 Y309.312 E94.38340
+G1 X373.020 Y312.099 E94.93948
+G0 X399.31 Y308.43
+G1 X428.283 Y314.317 E95.93876
+G1 X427.384 Y274.265 E97.75883
+N1243 G1 X1 Y2*15
+G1 X371.633 Y289.889 E99.50281
+G1 X370.587 Y289.591 E99.84684
+G1 X381.265 Y305.621 E101.57125
+G0 X415.79 Y308.22
+G1 X386.532 Y303.839 E102.02641
+G1 X384.884 Y307.411 E103.43066
+G1 X423.071 Y323.463 E104.80315
+G1 X378.376 Y293.557 E106.65707
+G1 X373.328 Y291.611 E107.43622
+G1 X396.667 Y325.390 E108.93635
+G1 X420.314 Y291.332 E110.41804
+G1 F2700 X261.648 Y316.235 E110.41804
+G1 X380.197 Y281.815 E111.84802
+G1 X400.000 Y300.000 A0.64 B0.36
+G1 X425.260 Y325.204 E111.91811
+G0 X372.58 Y281.31
+N1260 G1 X1 Y2*84
+G1 X423.769 Y314.142 E112.49932
+G1 X405.997 Y280.450 E113.51830
+G0 X428.46 Y309.47
+G1 F2700 X305.781 Y297.776 E113.51830
+G1 X382.575 Y283.919 E114.30479
+G1 X383.580 Y288.908 E116.29126
+G1 X404.981 Y298.898 E117.47374
+;LAYER:1268
+G0 F9000 X385.505 Y302.090 Z3.0
+;TIME_ELAPSED:469.160000
+G1 X417.211 Y294.676 E118.57390
+G1 X411.198 Y327.456 E120.34132
+G1 X394.976 Y313.270 E120.92055
+G1 X386.414 Y328.450 E122.88519
+G1 X390.823 Y271.733 E123.15081
+G1 X405.835 Y272.044 E123.38649
+G0 X383.22 Y296.32
+G1 X378.952 Y293.674 E124.55183
+G1 X422.215 Y292.226 E124.59922
+G1 X393.289 Y279.841 E125.54957
+G1 X392.409 Y314.393 E126.21443
+G1 X422.066 Y308.124 E126.43194
+G1 X425.361 Y313.662 E127.74565
+G1 X413.801 Y279.082 E127.85511
+G1 X385.095 Y277.220 E129.78950
+G1 F1200 X498.874 Y283.795 E129.78950
+G1 X426.110 Y291.854 E131.76095
+G1 F1800 X361.267 Y326.071 E131.76095
+G1 X424.179 Y273.232 E133.11127
+G1 X386.634 Y328.287 E133.24164
+G1 F1800 X351.052 Y278.437 E133.24164
+G0 X389.46 Y287.61
+M117 Layer 1291 of 99
+G1 X402.572 Y292.226 E133.70820
+G1 X419.324 Y294.048 E134.10231
+G1 X382.100 Y271.163 E135.76197
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G0 X380.68 Y290.72
+G1 F1800 X483.908 Y326.289 E135.76197
+G1 X397.065 Y326.476 E135.86610
+G0 X383.28 Y306.79
+G1 X374.091 Y326.598 E137.47728
+G1 X390.546 Y276.881 E138.09701
+G1 X371.961 Y298.157 E138.51924
+G0 X415.48 Y302.58
+G1 X385.284 Y297.687 E139.43305
+G0 X381.70 Y301.99
+G1 X374.214 Y324.930 E140.31593
+G0 X383.00 Y321.90
+G1 X388.532 Y273.385 E142.03310
+G1 X400.000 Y300.000 A0.36 B0.04
+G1 X419.923 Y328.009 E142.69950
+G1 X377.044 Y329.175 E142.94370
+G1 X388.555 Y300.800 E143.20504
+G1 X416.437 Y296.809 E144.27237
+G0 X411.09 Y306.35
+G1 X386.673 Y322.423 E144.90775
+G0 X412.12 Y310.85
+G1 X374.696 Y296.792 E144.94063
+G1 X375.778 Y307.352 E146.92350
+G1 X418.767 Y319.285 E147.28919
+G1 X376.961 Y306.115 E148.25651
+G1 F1800 X546.995 Y281.645 E148.25651
+G92 E0
+G1 X402.720 Y312.712 E0.47392
+G1 X412.862 Y294.121 E1.70395
+G1 X404.721 Y313.069 E2.27305
+G1 X421.143 Y306.970 E3.37351
+G1 X376.204 Y292.387 E4.18200
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X409.494 Y283.702 E5.10616
+G1 X401.576 Y300.480 E5.59502
+G1 F30000 X334.004 Y329.413 E5.59502
+G1 X379.712 Y270.957 E6.37182
+G1 X386.231 Y277.763 E7.59778
+G1 X383.180 Y299.909 E7.85459
+G1 F1800 X590.562 Y278.162 E7.85459
+G1 X379.751 Y306.129 E9.16713
+G0 X397.78 Y272.44
+G1 X384.364 Y324.888 E9.20144
+G1 X381.576 Y321.478 E9.62188
+G1 F1200 X521.381 Y271.547 E9.62188
+G1 X417.375 Y325.312 E11.11735
+G1 X414.669 Y329.143 E11.21393
+M106 S11
+M204 S500 P1000
+G1 X392.527 Y318.980 E12.93907
+;LAYER:1345
+G0 F9000 X382.816 Y303.242 Z3.2
+;TIME_ELAPSED:497.650000
+G0 X411.56 Y324.98
+G1 X404.201 Y314.166 E12.95821
+G1 X381.941 Y282.394 E14.49921
+G1 X402.699 Y277.662 E15.83328
+G1 X416.511 Y325.057 E16.66385
+G1 X399.158 Y320.842 E18.20633
+G1 X390.150 Y322.815 E18.63192
+G1 X400.000 Y300.000 A0.37 B0.16
+G1 F30000 X354.327 Y302.152 E18.63192
+G0 X388.30 Y298.22
+G1 X427.952 Y320.784 E18.74282
+G1 F600 X258.992 Y308.737 E18.74282
+G1 X415.970 Y288.981 E20.15819
+G0 X412.51 Y323.98
+G1 X376.806 Y324.026 E22.07675
+G1 X371.225 Y273.174 E22.75508
+G1 X376.269 Y299.199 E24.68072
+G1 X408.953 Y302.908 E25.46196
+G1 X414.658 Y276.771 E27.02690
+G1 X383.487 Y304.332 E27.35853
+G1 X404.825 Y304.187 E28.06391
+G1 X403.829 Y312.837 E28.20928
+G1 X384.852 Y279.211 E28.20991
+G1 X425.360 Y315.684 E28.42764
+G1 F600 X267.525 Y282.116 E28.42764
+G1 X423.516 Y275.625 E29.03162
+G1 X373.769 Y272.988 E30.51672
+G1 X400.027 Y305.342 E31.29910
+G1 F2700 X284.207 Y297.118 E31.29910
+G1 X403.570 Y321.022 E31.67178
+G1 X375.040 Y294.092 E31.99401
+G1 X400.000 Y300.000 A0.64 B0.12
+N1378 G1 X1 Y2*27
+G1 F30000 X446.227 Y328.344 E31.99401
+G0 X390.73 Y327.56
+G1 X388.576 Y307.803 E33.63167
+G1 F30000 X518.902 Y319.688 E33.63167
+G0 X425.22 Y328.13
+G1 X422.236 Y283.240 E33.87861
+G1 X376.610 Y318.881 E34.56189
+G1 X407.296 Y313.699 E35.12066
+G1 F2700 E28.62066
+G1 F2700 E35.12066
+G1 X422.489 Y284.551 E36.23218
+G1 X421.860 Y323.093 E37.10453
+G1 X400.174 Y299.472 E37.35953
+G1 X417.568 Y281.047 E38.18640
+G1 X420.800 Y318.307 E39.85469
+G1 X391.911 Y282.768 E40.56286
+G1 X420.855 Y300.804 E41.19862
+G1 X423.082 Y273.278 E41.41876
+G0 X398.70 Y323.53
+M117 Layer 1397 of 99
+G1 X371.229 Y316.392 E42.79957
+G1 F600 X276.171 Y319.592 E42.79957
+G1 X406.770 Y313.873 E43.38566
+G1 X417.871 Y303.026 E44.57186
+G1 X422.041 Y325.859 E45.42218
+G1 X422.985 Y276.976 E46.64926
+G1 X405.244 Y316.649 E47.32188
+G1 X416.673 Y291.552 E48.44676
+G1 X398.061 Y315.361 E49.98316
+G1 X413.631 Y311.722 E51.21616
+G1 X408.122 Y312.668 E52.25248
+M106 S57
+M204 S500 P1000
+G1 X387.661 Y309.955 E52.25797
+G1 X398.374 Y294.879 E53.87783
+G1 X382.220 Y323.772 E55.38747
+G1 F1800 X336.504 Y303.585 E55.38747
+G1 X400.000 Y300.000 A0.61 B0.87
+G0 X394.58 Y309.63
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G0 X429.11 Y294.24
+G1 F1200 X280.835 Y327.698 E55.38747
+G1 X387.051 Y318.353 E55.72278
+G0 X418.46 Y283.50
+G1 X401.624 Y326.000 E56.80192
+G1 F30000 X598.467 Y328.052 E56.80192
+G1 F2700 X554.207 Y315.105 E56.80192
+G1 F600 X520.519 Y304.871 E56.80192
+G1 X373.167 Y307.023 E58.02352
+G1 X376.440 Y286.768 E59.76192
+G1 F1200 X446.657 Y296.852 E59.76192
+G0 X391.71 Y273.98
+G1 X400.711 Y297.397 E60.23611
+G1 X422.690 Y275.953 E61.59016
+G1 X412.690 Y290.161 E61.85876
+G1 X398.983 Y286.227 E61.96671
+G1 F30000 X390.543 Y314.827 E61.96671
+G1 X393.086 Y283.234 E63.32660
+G1 X410.289 Y303.351 E64.50248
+G1 X380.587 Y322.125 E64.70341
+G1 X380.212 Y284.509 E65.91463
+G1 X385.864 Y295.841 E67.89399
+G1 X428.357 Y292.899 E68.77249
+;LAYER:1440
+G0 F9000 X394.571 Y306.546 Z3.4
+;TIME_ELAPSED:532.800000
+G1 X410.771 Y296.124 E68.84985
+G0 X428.36 Y306.64
+G1 F600 X196.393 Y306.025 E68.84985
+G1 F1800 X441.095 Y314.662 E68.84985
+G0 X419.45 Y283.77
+G1 X400.000 Y300.000 A0.88 B0.09
+G1 X401.552 Y278.729 E69.02486
+G1 X404.904 Y288.852 E69.73327
+G1 X424.108 Y292.954 E69.73607
+G1 X374.199 Y302.094 E69.88056
+G1 X385.898 Y322.622 E71.73564
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X375.294 Y310.166 E72.88125
+G1 F1200 X451.594 Y289.870 E72.88125
+G1 X407.496 Y272.313 E73.73407
+G1 X406.118 Y325.086 E75.45046
+G1 X384.497 Y308.321 E76.46728
+N1458 G1 X1 Y2*81
+G0 X423.68 Y314.15
+G1 X422.373 Y274.766 E77.48811
+G1 F30000 X528.410 Y321.295 E77.48811
+;LAYER:1462
+G0 F9000 X404.872 Y300.475 Z3.6
+;TIME_ELAPSED:540.940000
+G1 X375.640 Y301.693 E78.13766
+G0 X417.07 Y271.03
+G1 X423.553 Y318.658 E78.83764
+G1 X371.748 Y295.762 E79.36855
+G1 X400.639 Y300.365 E80.91537
+G1 X381.434 Y279.745 E81.17389
+G1 X402.626 Y300.689 E81.82913
+G1 X373.382 Y294.519 E82.84018
+G1 X409.897 Y324.960 E82.88334
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+N1473 G1 X1 Y2*40
+G1 X415.303 Y303.500 E83.83429
+G1 X402.677 Y319.367 E84.18092
+G1 X426.081 Y318.856 E84.67440
+G1 X372.663 Y291.201 E86.14832
+G1 X422.840 Y310.616 E87.54701
+G1 X419.509 Y326.031 E87.79758
+G0 X391.94 Y293.00
+G1 X402.516 Y296.571 E88.52545
+G1 X400.743 Y308.574 E90.44019
+G1 X384.827 Y272.701 E92.19608
+G1 X371.292 Y292.708 E93.91508
+G1 X412.057 Y294.853 E95.84913
+G0 X388.00 Y287.31
+G1 X413.367 Y300.581 E97.81716
+G1 X412.872 Y297.700 E98.04866
+G1 X393.241 Y325.543 E99.57046
+G1 X377.624 Y299.343 E101.30452
+G1 X414.211 Y302.886 E102.23387
+G1 X370.685 Y286.037 E103.06959
+G1 X425.282 Y278.934 E105.06629
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X411.993 Y322.875 E105.59567
+G1 X418.551 Y300.123 E107.28865
+G1 X406.969 Y329.137 E108.43285
+G1 X408.186 Y288.229 E109.34512
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+M107
+M104 S0
+G28 X0 Y0
+M84
@@ -0,0 +1,1642 @@
+;FLAVOR:Marlin
+;TIME:31039
+M104 S210
+M140 S60
+M190 S60
+M109 S210
+G28 ;Home
+G92 E0
+G1 Z15.0 F6000
+M117 Printing hello world  
+M106 S255
+M107
+G21
+G90
+M82
+M4010 I1 T0 'abcdef'
+T0
+G1 X98.733 Y75.406 E1.44243
+G1 X87.363 Y129.401 E2.54124
+G1 X91.615 Y116.785 E3.58192
+G0 X85.70 Y126.58
+G1 X85.615 Y86.305 E4.86329
+G1 X122.039 Y127.655 E5.44257
+G0 X92.34 Y120.69
+G1 X84.932 Y84.839 E6.21844
+G1 X119.073 Y126.532 E8.10759
+G0 X70.43 Y87.52
+G1 F1800 X267.061 Y100.502 E8.10759
+G1 X95.863 Y79.679 E9.30542
+G1 X72.594 Y72.779 E10.93060
+G1 X102.077 Y98.274 E11.49147
+G1 X81.734 Y94.768 E13.48603
+G1 X86.578 Y91.350 E14.75136
+G1 F1800 X164.527 Y81.923 E14.75136
+G1 X112.490 Y86.649 E16.43021
+G1 X77.329 Y126.075 E18.15441
+G1 X91.425 Y74.957 E18.20576
+N20 G1 X1 Y2*36
+G1 F1800 X-131.270 Y87.340 E18.20576
+N22 G1 X1 Y2*99
+G1 X122.170 Y110.803 E19.92851
+G1 X123.645 Y87.520 E21.16397
+G1 X79.534 Y104.385 E22.36159
+G1 X91.911 Y118.261 E23.27116
+G1 X100.000 Y100.000 A0.57 B0.44
+G1 X76.817 Y73.733 E25.10422
+G1 F30000 X184.877 Y78.978 E25.10422
+G1 X84.944 Y129.858 E26.08555
+G1 X116.428 Y94.559 E27.14403
+G1 X100.000 Y100.000 A0.48 B0.24
+G1 X95.273 Y84.915 E27.21777
+G0 X119.86 Y99.91
+G1 X84.543 Y82.484 E27.72656
+G1 X78.502 Y73.076 E29.46598
+G92 E0
+G1 X94.178 Y124.057 E1.98114
+G1 X114.684 Y99.657 E3.56286
+G1 X122.428 Y123.986 E3.98470
+G92 E0
+G1 X117.970 Y108.550 E1.31382
+G0 X101.68 Y109.28
+G1 X125.368 Y127.377 E1.85042
+G1 X127.706 Y110.101 E3.79259
+G1 X77.658 Y128.112 E5.59053
+G1 X80.036 Y108.111 E5.71150
+G1 X125.649 Y83.112 E7.20449
+;LAYER:49
+G0 F9000 X125.342 Y70.787 Z0.4
+;TIME_ELAPSED:18.130000
+G0 X76.95 Y118.59
+G1 F1200 X124.292 Y122.722 E7.20449
+G1 X89.839 Y123.505 E8.54745
+G1 F2700 X299.313 Y96.379 E8.54745
+G1 X76.775 Y103.648 E9.93830
+G1 X72.483 Y74.781 E11.48653
+G0 X124.30 Y87.82
+G1 X127.592 Y97.226 E11.63600
+G1 X93.318 Y115.523 E13.58913
+G0 X94.00 Y74.63
+G1 F2700 E7.08913
+G1 F2700 E13.58913
+G1 F1800 X105.988 Y96.037 E13.58913
+G0 X116.60 Y74.02
+G0 X81.75 Y88.14
+G0 X95.35 Y117.90
+G1 X80.581 Y78.958 E15.33771
+G1 X102.512 Y124.244 E16.01488
+G1 F600 X171.090 Y77.257 E16.01488
+G1 X106.060 Y101.579 E17.58732
+G1 X87.607 Y83.753 E18.40967
+G1 X70.102 Y73.175 E20.13757
+G1 F2700 E13.63757
+G1 F2700 E20.13757
+G1 X116.947 Y104.100 E21.95587
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X107.048 Y93.508 E22.83738
+G1 X129.154 Y90.403 E24.03155
+G1 X110.523 Y107.327 E25.24280
+G1 X81.849 Y117.634 E27.12184
+G1 X74.624 Y108.741 E28.88832
+G1 F2700 E22.38832
+G1 F2700 E28.88832
+G1 X80.477 Y122.997 E29.63211
+G1 X115.272 Y75.322 E30.67998
+G1 X75.904 Y80.944 E32.30577
+G1 X100.000 Y100.000 A0.66 B0.99
+G1 X129.183 Y80.321 E34.15718
+G1 X83.330 Y117.201 E35.92983
+G1 X111.266 Y122.862 E37.63538
+G1 X83.267 Y92.057 E38.61505
+G1 F30000 X160.862 Y129.787 E38.61505
+G0 X94.01 Y94.04
+G0 X87.03 Y94.69
+G1 X102.412 Y111.597 E38.98284
+G1 X127.064 Y107.394 E39.71144
+G1 X128.427 Y129.269 E39.84688
+G1 F2700 E33.34688
+G1 F2700 E39.84688
+G1 X75.480 Y85.474 E40.47135
+G1 X123.554 Y116.675 E42.32784
+G1 X87.953 Y126.876 E42.80454
+G1 X110.842 Y102.828 E44.38542
+M117 Layer 99 of 99
+G1 X79.451 Y75.806 E45.43416
+G1 X77.306 Y73.675 E46.06719
+G1 X100.000 Y100.000 A0.29 B0.89
+G1 F1200 X174.486 Y127.157 E46.06719
+G0 X113.17 Y103.60
+G1 X103.141 Y100.153 E47.51461
+G1 X99.052 Y74.068 E49.20328
+G1 X85.364 Y93.479 E50.95284
+G1 X89.705 Y93.208 E52.67603
+G1 X122.599 Y71.140 E52.73214
+N110 G1 X1 Y2*19
+G1 X106.561 Y70.923 E52.96407
+G1 X124.661 Y101.934 E52.98130
+G0 X97.14 Y113.90
+G0 X111.01 Y111.84
+G1 X101.819 Y81.277 E53.32645
+G1 X91.407 Y125.828 E55.13260
+G0 X94.80 Y114.28
+G0 X82.72 Y104.74
+G0 X105.46 Y117.06
+G1 X118.439 Y74.999 E56.80011
+G1 X76.214 Y128.535 E57.43218
+G1 X98.569 Y127.311 E58.07688
+G92 E0
+G1 X101.148 Y119.630 E0.08631
+G1 F600 X-43.593 Y74.281 E0.08631
+G1 F1200 X194.421 Y77.007 E0.08631
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G0 X100.56 Y70.05
+G0 X107.40 Y107.34
+G1 X72.058 Y98.685 E1.55237
+G1 X123.410 Y114.904 E2.27204
+G0 X87.89 Y93.31
+G1 X94.738 Y128.493 E2.34012
+G1 F30000 X3.411 Y111.444 E2.34012
+G1 F2700 X14.486 Y82.883 E2.34012
+G1 X128.305 Y89.881 E3.21455
+G1 F2700 E-3.28545
+G1 F2700 E3.21455
+M106 S209
+M204 S500 P1000
+G1 X85.359 Y100.667 E4.45478
+G1 X87.229 Y124.870 E4.98193
+G1 X75.205 Y129.181 E6.49848
+G1 X82.696 Y125.984 E6.68274
+G1 X99.955 Y76.841 E8.46385
+G1 X129.418 Y79.988 E9.37510
+G1 X76.840 Y128.284 E11.06160
+G1 X109.638 Y124.421 E12.19610
+G1 X80.756 Y113.097 E13.88968
+G1 X80.865 Y82.369 E15.42301
+G1 X89.688 Y128.975 E16.07185
+G1 X129.407 Y80.312 E16.80041
+G1 X127.086 Y111.047 E18.71259
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X112.259 Y110.085 E20.51971
+G0 X76.25 Y81.97
+G1 X102.769 Y102.437 E21.47726
+G1 X120.305 Y115.511 E22.96468
+G1 X83.155 Y84.296 E23.27051
+G1 X107.480 Y90.644 E23.65959
+G1 X126.662 Y81.438 E25.07575
+G1 X82.757 Y71.617 E27.03887
+G1 X113.877 Y126.306 E28.68970
+G1 X88.374 Y113.152 E28.77241
+G1 X92.542 Y97.825 E29.05159
+G1 X78.178 Y71.786 E29.94441
+G1 F2700 X-38.493 Y89.830 E29.94441
+G1 X74.704 Y79.680 E30.05309
+G1 X120.103 Y84.463 E30.17520
+G1 X109.659 Y92.968 E30.21436
+G1 X107.298 Y78.038 E31.38495
+G1 X114.397 Y102.457 E31.85197
+G1 X125.698 Y120.206 E33.31188
+G1 X90.693 Y105.810 E34.45684
+N173 G1 X1 Y2*4
+G1 X121.760 Y81.815 E35.18848
+G1 X122.985 Y105.741 E35.42733
+G1 X100.000 Y100.000 A0.14 B0.71
+G1 X119.202 Y122.451 E35.53020
+G1 X117.098 Y106.273 E37.41360
+G1 X73.437 Y98.528 E37.93990
+G0 X82.55 Y98.35
+G1 X127.578 Y123.283 E39.32180
+G1 X70.159 Y101.762 E40.15574
+G0 X120.69 Y74.32
+G1 X95.468 Y124.771 E40.31582
+G1 X127.318 Y119.103 E42.00726
+G1 X125.371 Y129.915 E43.84371
+G1 X87.486 Y101.060 E43.85092
+G1 X108.430 Y110.064 E44.03588
+G1 X102.957 Y111.387 E45.05712
+G1 X78.130 Y76.241 E45.92962
+G1 F1800 X106.557 Y109.901 E45.92962
+G1 X104.803 Y107.392 E47.10032
+G1 X72.590 Y86.339 E47.11058
+G1 X105.572 Y127.817 E48.65918
+G1 X97.420 Y129.134 E49.38418
+G1 X129.897 Y104.809 E51.34544
+G1 X128.018 Y85.689 E52.46136
+G1 X105.897 Y111.829 E53.60865
+M106 S82
+M204 S500 P1000
+G1 X88.009 Y88.966 E54.24119
+G1 X87.524 Y92.108 E55.20917
+G1 X121.802 Y117.850 E55.83957
+G1 X80.590 Y75.750 E57.50842
+G1 X100.000 Y100.000 A0.03 B0.01
+G0 X70.16 Y109.31
+G1 X84.731 Y128.031 E57.95413
+G1 X96.488 Y113.930 E58.43772
+G1 X117.443 Y75.767 E58.61581
+G1 X129.609 Y96.051 E58.62523
+G1 F30000 X-33.130 Y92.438 E58.62523
+G1 X77.958 Y90.785 E60.38195
+G1 X82.867 Y91.113 E61.13904
+G1 X75.477 Y79.460 E62.24457
+G1 X115.074 Y75.526 E63.29451
+G1 X96.269 Y90.967 E63.54852
+G1 F2700 E57.04852
+G1 F2700 E63.54852
+G1 X88.542 Y117.072 E64.35119
+G0 X113.70 Y117.89
+G1 X100.557 Y74.612 E65.10234
+G1 X92.086 Y83.644 E67.07300
+G0 X79.81 Y95.67
+G1 X101.203 Y116.598 E68.14208
+G0 X111.04 Y106.85
+G1 F1200 X280.982 Y91.281 E68.14208
+G1 X120.667 Y77.435 E68.97786
+G0 X70.70 Y111.95
+G1 F2700 X283.497 Y114.960 E68.97786
+G1 X79.169 Y102.476 E69.64402
+M106 S247
+M204 S500 P1000
+G1 F1200 X325.596 Y125.726 E69.64402
+G1 F1800 X158.467 Y119.163 E69.64402
+M106 S16
+M204 S500 P1000
+G1 F2700 X-17.917 Y107.294 E69.64402
+G1 X80.562 Y71.059 E70.93798
+M117 Layer 235 of 99
+G0 X88.29 Y72.70
+G0 X116.28 Y79.29
+G0 X120.31 Y104.46
+G1 X73.805 Y96.461 E71.05088
+G1 F1200 X-32.101 Y117.887 E71.05088
+G1 X80.443 Y70.326 E72.27894
+G1 X83.187 Y70.843 E73.87052
+G1 X104.437 Y104.637 E74.56855
+G1 F1800 X176.866 Y111.957 E74.56855
+G1 X73.453 Y128.702 E75.09642
+G1 F2700 E68.59642
+G1 F2700 E75.09642
+G1 X74.131 Y112.716 E76.65571
+G1 X92.005 Y126.503 E78.12225
+G1 F600 X265.768 Y113.529 E78.12225
+G0 X112.23 Y95.68
+G0 X125.07 Y76.45
+G1 X97.344 Y121.861 E78.46192
+G1 X91.986 Y103.934 E80.17238
+G1 X86.207 Y70.446 E81.45260
+G1 X122.869 Y87.182 E82.57986
+G92 E0
+G0 X79.45 Y116.72
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+N259 G1 X1 Y2*88
+G1 F30000 X-78.004 Y81.033 E0.00000
+G0 X103.74 Y74.31
+G1 F1800 X-125.064 Y100.326 E0.00000
+G1 X70.427 Y85.876 E1.29420
+G1 X76.999 Y85.330 E2.81547
+G1 X86.319 Y76.120 E3.87149
+G1 X114.165 Y106.066 E5.48885
+G1 F1200 X267.753 Y99.438 E5.48885
+G1 X80.083 Y113.963 E7.38337
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X126.532 Y89.362 E8.46031
+G1 X104.692 Y95.784 E10.08920
+G1 F1800 X17.405 Y124.817 E10.08920
+G1 X118.334 Y99.077 E11.60103
+G1 X109.447 Y114.912 E11.82503
+G1 F2700 E5.32503
+G1 F2700 E11.82503
+G1 F2700 E5.32503
+G1 F2700 E11.82503
+G1 X127.894 Y75.146 E12.80281
+G1 X106.098 Y106.664 E13.89377
+G1 X80.555 Y93.036 E14.91020
+G1 X107.615 Y93.932 E15.54972
+G1 X110.196 Y88.076 E16.48730
+G1 X111.739 Y72.183 E17.35963
+G1 X123.393 Y81.470 E17.46962
+G0 X72.04 Y99.60
+G1 X116.261 Y77.605 E19.02163
+G1 X95.140 Y92.366 E20.48224
+G1 X104.593 Y93.293 E21.21591
+G1 X129.309 Y116.001 E22.15882
+G1 F2700 X114.216 Y92.053 E22.15882
+G1 X80.832 Y88.274 E23.74905
+G1 F2700 E17.24905
+G1 F2700 E23.74905
+G1 X99.589 Y112.472 E24.05518
+G1 X112.728 Y107.493 E25.86420
+G1 X95.871 Y86.213 E27.39716
+G1 X126.565 Y76.552 E29.06004
+G92 E0
+N297 G1 X1 Y2*35
+G1 X119.216 Y122.671 E1.84275
+G1 X114.065 Y112.983 E2.36129
+G92 E0
+G1 X90.470 Y85.351 E0.04429
+G1 X106.633 Y95.641 E0.16371
+G1 X104.446 Y75.962 E0.36673
+G0 X86.61 Y123.88
+G1 X116.704 Y101.291 E1.14586
+G1 X79.842 Y121.071 E2.90784
+G1 X90.996 Y86.708 E3.47900
+G1 X101.085 Y108.954 E4.36051
+G0 X111.90 Y87.74
+G1 X124.489 Y93.172 E5.74501
+G1 X90.076 Y89.570 E7.25816
+G1 X120.840 Y90.831 E8.00529
+G1 X105.903 Y129.422 E9.22499
+M106 S215
+M204 S500 P1000
+G0 X87.32 Y94.98
+G1 X83.315 Y93.436 E10.64994
+G1 X78.332 Y120.109 E11.27555
+G1 X98.738 Y108.744 E11.70421
+G1 X127.737 Y71.026 E11.82923
+G1 X114.945 Y78.396 E12.48674
+G1 X92.229 Y113.205 E12.60916
+G1 F600 X31.901 Y103.418 E12.60916
+G1 X96.424 Y106.556 E13.54143
+G1 X109.370 Y94.538 E13.79235
+G0 X77.93 Y102.75
+G1 X119.080 Y108.970 E15.05744
+G1 X83.570 Y129.738 E16.92043
+G1 X77.788 Y71.807 E18.18707
+G1 X84.414 Y117.678 E19.27350
+G1 X124.006 Y111.575 E20.59929
+G92 E0
+G0 X121.46 Y72.39
+G1 X96.320 Y113.712 E0.59826
+G1 F1200 X160.606 Y106.570 E0.59826
+G1 X88.869 Y71.805 E1.97279
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X80.617 Y85.817 E3.68436
+G0 X72.87 Y122.32
+G1 X98.390 Y114.484 E4.23093
+G1 X87.423 Y85.181 E4.86130
+G1 X101.385 Y102.056 E5.48007
+G1 X70.069 Y101.461 E5.99651
+G1 X105.637 Y114.055 E6.51733
+G1 F30000 X72.080 Y110.199 E6.51733
+G1 X98.476 Y121.695 E7.45127
+G1 F1800 X131.827 Y101.099 E7.45127
+G1 X93.728 Y87.136 E8.61067
+G0 X91.26 Y112.78
+G1 X82.973 Y95.199 E10.58560
+G1 X113.903 Y85.743 E12.34066
+G1 X96.793 Y80.806 E13.82724
+G1 X109.664 Y118.376 E15.26935
+G1 X78.682 Y104.209 E16.22999
+G1 X103.655 Y79.849 E16.69006
+G1 F1200 X-108.041 Y77.525 E16.69006
+G1 F1200 X3.283 Y117.007 E16.69006
+G1 X122.124 Y127.790 E18.31054
+G1 X97.256 Y87.194 E19.09621
+G0 X93.66 Y125.66
+G1 X107.697 Y117.184 E19.98463
+G1 X87.822 Y91.338 E21.78343
+G1 X99.168 Y113.877 E22.16192
+G1 X95.982 Y128.956 E23.13817
+G1 X84.069 Y123.693 E24.75632
+G1 X108.074 Y101.822 E25.05952
+G1 X90.872 Y109.722 E26.30437
+G1 X112.851 Y88.575 E27.47466
+G1 F1200 X334.641 Y73.752 E27.47466
+G1 X80.083 Y98.355 E27.80268
+G1 F1200 X-124.794 Y120.832 E27.80268
+G1 X100.593 Y90.630 E29.54535
+G1 X127.408 Y71.234 E30.30915
+G1 X121.784 Y88.007 E30.74548
+G1 X88.142 Y121.962 E32.67628
+G1 X93.698 Y115.349 E32.86816
+G1 X113.712 Y120.876 E33.23947
+G1 X100.537 Y113.723 E35.00657
+M106 S144
+M204 S500 P1000
+G1 X100.786 Y115.571 E35.91654
+G1 F2700 X211.605 Y110.617 E35.91654
+M106 S222
+M204 S500 P1000
+G1 X93.913 Y105.751 E36.05229
+G0 X108.38 Y127.30
+G1 X71.112 Y99.587 E37.99688
+G1 X106.467 Y95.289 E39.70193
+G1 X121.762 Y118.225 E40.66316
+G1 X82.000 Y103.325 E40.94911
+G1 F600 X-75.307 Y106.404 E40.94911
+G1 F1200 X-91.172 Y109.002 E40.94911
+G1 X122.974 Y95.403 E41.96161
+G1 X121.189 Y96.047 E42.22100
+G1 X109.863 Y79.383 E42.47965
+G1 F2700 X-126.426 Y99.920 E42.47965
+G1 X99.414 Y121.301 E43.29941
+G1 X123.012 Y101.413 E44.07698
+G1 F1800 X-9.779 Y106.285 E44.07698
+G1 X73.368 Y73.940 E44.42191
+G1 F1200 X235.156 Y125.083 E44.42191
+G1 F30000 X-63.300 Y95.616 E44.42191
+G1 F1200 X87.878 Y108.411 E44.42191
+G1 F30000 X2.378 Y89.382 E44.42191
+G1 X126.781 Y77.985 E45.95560
+G1 X83.422 Y115.163 E46.14745
+G1 X115.196 Y73.439 E47.80933
+G1 X70.158 Y117.583 E49.08601
+G1 F2700 X289.306 Y104.125 E49.08601
+G1 X114.021 Y123.861 E51.03322
+G0 X128.97 Y111.02
+G1 F30000 X101.486 Y86.666 E51.03322
+G1 X105.865 Y106.919 E52.64689
+G1 X107.606 Y114.861 E54.17477
+G1 X80.308 Y82.222 E54.49911
+G1 X110.355 Y125.561 E55.66273
+G1 X70.525 Y121.676 E56.58041
+G0 X101.53 Y114.53
+G0 X115.50 Y107.01
+G92 E0
+G1 X78.482 Y126.989 E0.60727
+;LAYER:419
+G0 F9000 X93.102 Y78.266 Z0.6
+;TIME_ELAPSED:155.030000
+G0 X121.55 Y105.22
+G1 X99.658 Y73.688 E0.71073
+G1 X96.079 Y126.523 E1.76413
+G1 X112.850 Y119.192 E2.16325
+G1 X82.702 Y98.864 E3.33175
+G0 X73.79 Y85.37
+N426 G1 X1 Y2*76
+G1 X103.711 Y82.963 E4.49584
+G1 X111.686 Y84.630 E5.49953
+G1 X111.215 Y115.458 E7.25216
+G1 X92.761 Y110.812 E8.41829
+M117 Layer 431 of 99
+G1 X112.069 Y99.764 E9.32976
+G1 X119.135 Y100.572 E9.37433
+G0 X90.62 Y123.05
+G0 X84.00 Y116.71
+G1 X116.807 Y113.281 E10.66359
+G1 X80.917 Y123.824 E11.36745
+G1 X99.407 Y95.954 E12.93071
+M106 S165
+M204 S500 P1000
+G1 X73.323 Y77.506 E14.81584
+G0 X119.93 Y121.97
+G0 X116.57 Y70.63
+G1 X82.530 Y73.925 E16.51261
+N444 G1 X1 Y2*5
+G1 X70.904 Y125.920 E18.03214
+G1 X71.585 Y92.505 E19.02791
+G1 X81.485 Y77.673 E20.92023
+G0 X125.27 Y99.84
+G1 X97.674 Y97.030 E22.68161
+G1 X86.478 Y92.001 E23.16689
+G1 X116.785 Y122.262 E24.09353
+G1 X122.198 Y127.365 E24.82200
+G1 X120.398 Y87.730 E25.17819
+G1 X85.111 Y87.723 E27.02832
+G1 X100.372 Y104.572 E27.19724
+G1 X110.001 Y104.849 E28.67877
+G0 X78.58 Y80.70
+G1 X123.855 Y121.036 E29.02900
+G0 X93.48 Y121.06
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 F600 X188.967 Y70.742 E29.02900
+G1 X101.792 Y103.774 E29.54559
+G1 F2700 E23.04559
+G1 F2700 E29.54559
+G1 X79.135 Y117.105 E31.49858
+G1 X107.039 Y72.926 E32.62411
+G1 X85.602 Y75.609 E33.94395
+G1 X80.596 Y84.456 E34.46422
+G1 X93.007 Y77.062 E35.40195
+G1 X94.006 Y80.978 E36.62954
+G0 X102.81 Y90.71
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X98.736 Y85.895 E36.93457
+G0 X116.76 Y74.52
+G1 X100.194 Y88.716 E38.28125
+G1 X98.123 Y104.038 E38.55875
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X72.302 Y100.279 E39.71126
+G1 X88.796 Y126.574 E41.03986
+G1 F1200 X132.312 Y125.726 E41.03986
+G1 X103.751 Y106.048 E41.67323
+G1 F1800 X119.530 Y105.357 E41.67323
+G1 X118.676 Y129.160 E42.75132
+G1 X93.523 Y74.707 E43.58287
+G1 X114.644 Y80.843 E43.94579
+G1 X94.504 Y129.959 E45.89879
+G1 X78.573 Y79.215 E46.61017
+G1 X109.282 Y83.381 E48.15895
+G1 X89.847 Y102.982 E48.31052
+;LAYER:489
+G0 F9000 X76.306 Y109.975 Z0.8
+;TIME_ELAPSED:180.930000
+G1 X118.645 Y74.510 E48.39909
+G1 F600 X-66.444 Y128.553 E48.39909
+G1 F1200 X126.257 Y96.199 E48.39909
+G1 X72.672 Y101.782 E49.48098
+G0 X118.58 Y73.74
+G1 F30000 X1.494 Y90.302 E49.48098
+M106 S236
+M204 S500 P1000
+G1 X119.585 Y115.565 E49.94764
+G1 X127.853 Y109.482 E50.46837
+G1 X89.521 Y86.417 E50.94089
+G1 X83.809 Y122.615 E52.18364
+G1 X107.428 Y99.624 E52.61599
+G92 E0
+G1 F30000 X55.943 Y106.117 E0.00000
+G1 F1800 X95.099 Y88.347 E0.00000
+G1 F2700 X-104.549 Y73.028 E0.00000
+G1 X103.754 Y114.140 E0.44418
+G1 X88.193 Y81.341 E1.90337
+G0 X103.33 Y83.05
+G1 X73.671 Y121.216 E3.67163
+G1 X102.068 Y77.458 E5.42680
+G1 X106.161 Y117.369 E6.21436
+G0 X83.20 Y104.82
+G1 F1200 X6.921 Y113.158 E6.21436
+G1 X78.875 Y111.704 E6.30617
+N515 G1 X1 Y2*47
+G1 X107.730 Y124.068 E8.23596
+G1 X104.974 Y116.652 E8.87630
+G1 X96.672 Y116.128 E9.02614
+G0 X75.36 Y93.52
+G1 F2700 E2.52614
+G1 F2700 E9.02614
+G1 F30000 X-114.613 Y126.172 E9.02614
+G1 X98.415 Y92.585 E9.85613
+G1 X111.619 Y88.319 E10.90625
+G1 F1200 X127.405 Y117.189 E10.90625
+G1 F30000 X326.452 Y88.122 E10.90625
+G1 X78.294 Y105.765 E10.99612
+G1 F2700 E4.49612
+G1 F2700 E10.99612
+G1 X78.036 Y75.330 E12.66574
+G1 X73.526 Y72.981 E14.48630
+G1 X111.151 Y105.873 E15.72415
+G1 X71.542 Y127.629 E17.22345
+G1 F600 X-107.969 Y81.781 E17.22345
+G1 X73.044 Y110.299 E17.85819
+G1 X99.306 Y72.241 E19.15270
+G1 F2700 E12.65270
+G1 F2700 E19.15270
+G1 F600 X329.606 Y70.920 E19.15270
+G1 X100.812 Y74.822 E21.01050
+G1 F30000 X304.373 Y87.646 E21.01050
+G1 X93.157 Y70.580 E21.94950
+G1 X71.611 Y81.093 E22.02349
+G1 X104.330 Y113.806 E22.45869
+G1 X81.563 Y78.025 E22.47611
+G1 X76.017 Y95.427 E23.94690
+G1 X87.440 Y74.741 E25.14982
+G1 X120.766 Y105.814 E26.86476
+G1 F30000 X24.346 Y106.245 E26.86476
+G1 X118.572 Y76.789 E27.42752
+G1 X118.412 Y108.501 E27.59643
+G1 X109.086 Y108.640 E29.36132
+G1 X111.947 Y93.056 E31.01444
+G1 X83.224 Y117.321 E32.55898
+G1 X96.925 Y86.913 E33.30175
+G1 X103.814 Y93.263 E35.07049
+G1 X81.045 Y103.612 E37.01792
+G0 X103.18 Y84.17
+G1 X104.365 Y74.693 E38.42975
+G1 X103.066 Y96.365 E39.04316
+G1 X105.426 Y117.195 E39.53379
+G1 X111.898 Y91.907 E40.45285
+G1 F600 X-121.812 Y113.794 E40.45285
+G1 X98.095 Y124.613 E41.51637
+G1 X91.586 Y107.289 E42.41399
+G1 X116.163 Y79.152 E42.95740
+G1 X95.849 Y77.217 E43.92098
+G1 X107.968 Y71.545 E43.99660
+G92 E0
+G1 X109.380 Y125.710 E1.10212
+G0 X101.58 Y80.66
+G1 F1200 X320.532 Y77.077 E1.10212
+G1 X96.032 Y123.841 E1.18548
+M106 S220
+M204 S500 P1000
+G1 X95.907 Y76.417 E1.92788
+G1 X70.488 Y90.372 E3.31025
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 F2700 E-3.18975
+G1 F2700 E3.31025
+G1 X125.064 Y107.876 E5.12831
+G1 X78.820 Y102.935 E6.06341
+G1 X78.469 Y110.711 E6.84717
+G1 X119.641 Y79.359 E8.54475
+G1 F600 X-10.218 Y119.569 E8.54475
+G1 X111.407 Y118.342 E9.18485
+M106 S128
+M204 S500 P1000
+G1 F1800 X-126.809 Y79.835 E9.18485
+G1 X114.406 Y103.252 E10.80250
+G1 X70.188 Y108.413 E12.77684
+G1 X112.140 Y126.588 E13.91730
+G1 F2700 E7.41730
+G1 F2700 E13.91730
+G1 X92.443 Y96.285 E14.82830
+G0 X108.33 Y78.64
+G1 F2700 X285.541 Y111.264 E14.82830
+G1 X98.431 Y122.070 E15.37583
+G1 X107.321 Y101.392 E16.02099
+G1 X89.523 Y116.717 E17.02734
+G1 X73.028 Y78.615 E18.98863
+G1 F600 X225.817 Y129.125 E18.98863
+G1 X100.000 Y100.000 A0.35 B0.64
+G0 X75.93 Y101.98
+G1 X95.929 Y75.930 E20.92582
+G1 X83.426 Y123.036 E21.44838
+G1 X82.173 Y116.291 E23.07202
+G0 X121.78 Y120.64
+G1 X110.735 Y122.518 E23.50516
+G1 X111.198 Y97.150 E24.36373
+G1 X100.000 Y100.000 A0.41 B0.92
+G1 X73.850 Y121.307 E25.11268
+G1 X104.089 Y90.781 E25.87289
+G1 X77.590 Y117.603 E27.27385
+G1 F1800 X-117.822 Y87.859 E27.27385
+G1 X91.147 Y89.295 E28.03422
+G1 X120.074 Y124.214 E28.66144
+G1 X84.822 Y127.092 E29.81173
+G1 X101.602 Y100.532 E30.82287
+G92 E0
+G1 X76.478 Y105.607 E0.23259
+G1 X116.734 Y97.913 E1.00216
+G1 X100.000 Y100.000 A0.47 B0.34
+G1 X95.170 Y113.011 E1.90286
+G1 X98.505 Y95.257 E3.64449
+G1 X89.340 Y97.850 E5.13545
+G1 X81.042 Y110.084 E6.22805
+G1 X129.776 Y129.141 E8.04677
+G1 X103.916 Y115.887 E8.75728
+G1 X90.392 Y92.689 E10.03319
+G1 X90.297 Y103.517 E11.48312
+G1 X113.845 Y114.447 E13.21722
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G0 X78.88 Y122.09
+G0 X81.31 Y86.77
+G1 F30000 X-109.142 Y116.245 E13.21722
+G0 X96.91 Y83.67
+G1 X121.107 Y115.429 E13.69336
+G1 X119.067 Y85.792 E15.18192
+G0 X106.87 Y73.87
+G1 X81.749 Y107.612 E15.86154
+G1 X96.995 Y104.129 E17.75937
+G1 F2700 E11.25937
+G1 F2700 E17.75937
+;LAYER:637
+G0 F9000 X88.778 Y124.295 Z1.0
+;TIME_ELAPSED:235.690000
+G1 X74.005 Y117.483 E19.43595
+G1 X91.301 Y101.619 E20.06750
+G0 X109.81 Y111.61
+G1 X92.601 Y119.940 E21.46775
+G1 X93.537 Y109.865 E21.81337
+G1 X82.397 Y114.410 E22.26210
+G1 X116.778 Y82.222 E23.30528
+G1 X119.219 Y112.837 E25.23750
+G1 F30000 X88.397 Y124.750 E25.23750
+M117 Layer 647 of 99
+G1 F600 X-89.796 Y94.307 E25.23750
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X123.283 Y120.714 E26.83377
+G1 X92.408 Y85.786 E27.12649
+G1 X107.057 Y76.372 E28.17725
+G1 X110.210 Y90.327 E29.89819
+G0 X70.05 Y81.99
+G0 X123.04 Y95.46
+G1 X114.161 Y82.783 E31.31393
+G1 X101.015 Y97.720 E32.02568
+G1 X95.228 Y101.763 E33.22844
+G1 X86.123 Y102.620 E33.42151
+G1 X77.673 Y125.863 E34.88959
+G1 X98.841 Y85.104 E36.37624
+G1 F1800 X115.752 Y94.985 E36.37624
+G1 X87.834 Y99.384 E36.55981
+G1 X104.884 Y127.666 E37.42942
+G1 X80.598 Y117.024 E38.50713
+G1 X86.331 Y122.469 E39.91700
+G1 X110.535 Y121.933 E41.81370
+G0 X83.79 Y109.40
+G1 X97.268 Y84.420 E42.58973
+G1 X112.220 Y84.706 E44.41211
+G1 X97.980 Y71.060 E45.38793
+G0 X79.22 Y95.08
+G1 X100.073 Y125.383 E46.70830
+G0 X114.98 Y93.25
+G1 X112.013 Y82.656 E48.59545
+;LAYER:676
+G0 F9000 X78.467 Y103.331 Z1.2
+;TIME_ELAPSED:250.120000
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X80.447 Y98.272 E48.85487
+G1 X74.182 Y123.863 E48.92058
+G1 X126.503 Y85.678 E50.50916
+G1 X78.109 Y107.067 E51.87686
+G0 X96.38 Y92.48
+G1 X125.094 Y101.472 E52.26982
+G1 F600 X117.484 Y70.288 E52.26982
+G1 X116.898 Y86.115 E53.26448
+G0 X103.17 Y121.45
+G1 X76.689 Y115.711 E53.95019
+G1 X82.215 Y82.109 E55.05618
+G1 X109.651 Y128.099 E55.38786
+G1 X115.227 Y113.730 E56.56983
+G0 X128.34 Y120.20
+G0 X124.31 Y109.36
+G1 X129.315 Y74.501 E57.15671
+G1 X90.640 Y106.186 E58.07108
+G1 X100.000 Y100.000 A0.69 B0.54
+G1 X94.019 Y85.338 E59.54565
+G1 X100.445 Y76.979 E61.02220
+G1 X78.714 Y125.565 E61.18657
+G1 X99.142 Y113.414 E61.58486
+G1 X70.358 Y129.660 E62.50891
+G1 X126.453 Y80.708 E63.72729
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 F1200 X-100.357 Y79.742 E63.72729
+G1 X87.910 Y104.428 E65.71257
+G1 X98.269 Y71.040 E66.55274
+G1 X80.524 Y94.689 E67.65843
+G1 X85.247 Y108.807 E68.72316
+G1 F30000 X281.797 Y123.908 E68.72316
+G1 X108.398 Y129.478 E69.72670
+G1 X100.873 Y102.700 E70.76935
+G1 X111.752 Y104.253 E71.27267
+G1 X84.579 Y79.663 E73.03228
+G1 X124.191 Y100.274 E74.46287
+G1 X125.807 Y85.871 E76.14110
+G1 X126.746 Y117.200 E77.17913
+G1 X117.266 Y103.593 E79.16814
+G1 X111.342 Y90.509 E80.39548
+G1 X113.251 Y129.635 E80.64961
+G1 F1200 X-59.699 Y98.461 E80.64961
+G1 X118.827 Y126.309 E81.02261
+G1 X75.914 Y108.124 E81.60249
+G1 X88.288 Y99.225 E83.17901
+G1 F600 X-30.282 Y83.815 E83.17901
+G0 X84.16 Y122.19
+G1 X97.272 Y89.614 E84.30646
+G1 X129.961 Y124.790 E84.70933
+G1 X79.605 Y114.184 E85.76592
+G1 X93.954 Y97.960 E87.44042
+G1 X75.726 Y100.260 E88.50625
+G1 X106.472 Y89.156 E88.98943
+G1 X73.638 Y129.440 E89.77924
+G1 X117.104 Y124.995 E91.67469
+N733 G1 X1 Y2*43
+G1 F600 X270.958 Y98.384 E91.67469
+G1 X88.633 Y111.791 E91.96611
+G0 X89.17 Y71.60
+G1 X80.361 Y73.141 E92.33009
+G1 X80.513 Y83.831 E93.41569
+G1 X71.292 Y102.213 E93.42103
+G1 X124.981 Y112.228 E94.70849
+G1 X122.372 Y72.542 E96.25906
+G1 X101.119 Y117.044 E97.73078
+G1 F2700 X304.258 Y86.119 E97.73078
+G1 X80.637 Y85.308 E99.19242
+G1 X124.840 Y101.171 E99.20692
+G1 X117.954 Y82.856 E101.16253
+G1 X124.150 Y77.909 E101.61754
+G1 X128.242 Y96.896 E101.80009
+G1 X116.214 Y92.984 E101.89774
+G1 X76.697 Y102.177 E102.11619
+N751 G1 X1 Y2*70
+G0 X80.54 Y83.22
+M117 Layer 753 of 99
+G0 X116.59 Y127.81
+G1 F1200 X130.989 Y116.455 E102.11619
+M106 S230
+M204 S500 P1000
+G0 X128.12 Y101.70
+G0 X128.67 Y108.70
+G1 F1200 X-62.920 Y76.708 E102.11619
+G1 X81.534 Y88.869 E103.90102
+G1 X107.841 Y107.292 E103.94163
+;LAYER:762
+G0 F9000 X76.748 Y100.923 Z1.4
+;TIME_ELAPSED:281.940000
+G1 F2700 E97.44163
+G1 F2700 E103.94163
+G1 X76.768 Y78.723 E104.26263
+G1 X113.621 Y114.317 E104.35387
+G1 X108.912 Y93.336 E104.53750
+G1 X93.554 Y71.685 E105.86331
+G1 X124.437 Y112.078 E107.80945
+G0 X109.25 Y89.37
+G1 X78.591 Y78.478 E108.65489
+G0 X100.12 Y110.45
+G1 X74.308 Y97.906 E109.17205
+G92 E0
+G1 F2700 E-6.50000
+G1 F2700 E0.00000
+G1 X98.874 Y113.072 E1.67186
+G1 X79.232 Y102.488 E2.66341
+G1 X118.366 Y113.858 E4.29416
+G1 X70.928 Y79.947 E4.67779
+G1 X70.040 Y74.003 E5.52574
+G1 X109.638 Y116.274 E6.48918
+G0 X71.75 Y99.73
+G1 X75.786 Y80.409 E7.47855
+G1 F30000 X310.843 Y70.840 E7.47855
+G1 X89.063 Y78.061 E9.07177
+G1 X100.000 Y100.000 A0.82 B0.07
+G1 X113.228 Y99.185 E9.54664
+G1 X76.592 Y91.148 E9.77297
+G1 X128.457 Y106.395 E10.10045
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 F2700 E3.60045
+G1 F2700 E10.10045
+G1 X125.174 Y94.249 E10.24992
+G0 X98.16 Y77.57
+G1 X95.410 Y78.022 E11.70850
+G1 F2700 E5.20850
+G1 F2700 E11.70850
+G1 X82.448 Y125.092 E13.10343
+G0 X114.75 Y107.32
+G1 X121.004 Y112.395 E14.46301
+G1 X119.219 Y110.920 E15.57056
+N799 G1 X1 Y2*36
+G1 X92.599 Y76.967 E16.91011
+G1 X94.323 Y124.846 E17.48020
+G1 X82.600 Y121.308 E18.48438
+G1 F1200 X165.110 Y98.232 E18.48438
+G0 X121.62 Y106.34
+G1 X83.618 Y127.406 E20.33664
+G1 X109.049 Y112.160 E22.09166
+G0 X101.69 Y95.51
+G0 X72.15 Y128.83
+G1 X70.364 Y71.738 E23.26114
+G1 X109.521 Y71.208 E23.31281
+G1 X101.465 Y78.263 E24.41356
+G1 X74.217 Y100.307 E25.35869
+G0 X110.60 Y75.43
+G92 E0
+G1 X129.777 Y119.013 E0.22809
+G0 X94.34 Y124.56
+G1 X97.991 Y119.581 E1.74275
+G1 X106.110 Y81.533 E3.38870
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X97.118 Y124.118 E5.03270
+G1 X120.913 Y115.886 E6.13899
+G1 F30000 X71.688 Y104.122 E6.13899
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X88.297 Y90.721 E7.93232
+G1 X93.539 Y83.524 E7.93770
+G1 X75.183 Y82.205 E8.58855
+G1 X74.368 Y126.535 E9.75941
+G1 F2700 E3.25941
+G1 F2700 E9.75941
+G0 X91.37 Y101.96
+G1 F2700 X313.014 Y117.267 E9.75941
+G0 X74.29 Y81.15
+G1 X113.179 Y87.127 E9.96865
+G1 F1800 X269.311 Y103.016 E9.96865
+G1 X127.973 Y107.208 E11.25348
+G1 X100.000 Y100.000 A0.49 B0.89
+G1 X114.390 Y80.309 E12.53802
+G0 X111.04 Y120.92
+G1 X89.786 Y111.707 E13.13340
+G1 F1800 X-66.547 Y71.740 E13.13340
+G1 X91.881 Y113.940 E14.41376
+G0 X100.51 Y89.11
+G1 F600 X123.473 Y94.864 E14.41376
+G1 F1200 X-5.713 Y72.526 E14.41376
+G0 X109.69 Y107.86
+G1 X106.658 Y105.897 E15.93599
+G1 X89.695 Y71.922 E17.38695
+G0 X73.25 Y85.50
+G1 F2700 E10.88695
+G1 F2700 E17.38695
+G1 F2700 E10.88695
+G1 F2700 E17.38695
+G1 X79.731 Y77.035 E18.31171
+G0 X116.62 Y121.58
+G1 F1800 X326.821 Y78.571 E18.31171
+G1 X82.593 Y102.320 E19.62248
+G1 X109.894 Y89.078 E20.26390
+G0 X77.32 Y127.73
+G1 X105.026 Y114.567 E21.10089
+G1 X101.529 Y128.442 E21.71829
+G1 X103.456 Y72.274 E23.42118
+G1 X112.491 Y104.889 E24.83631
+G1 F30000 X-13.422 Y124.631 E24.83631
+G1 X105.827 Y72.011 E25.47358
+G1 X123.742 Y71.745 E26.22468
+G0 X89.09 Y101.92
+G1 X127.671 Y121.030 E26.30787
+G1 X92.336 Y81.238 E26.31163
+N866 G1 X1 Y2*32
+G0 X116.72 Y107.47
+G1 X72.821 Y89.110 E27.43927
+G1 X119.573 Y119.342 E27.91544
+G1 X70.511 Y99.886 E28.85467
+G1 X111.259 Y106.461 E30.81737
+G1 X86.460 Y97.900 E31.89512
+G1 X100.000 Y100.000 A0.89 B0.88
+G1 X107.683 Y108.051 E33.57899
+G1 X80.533 Y87.215 E34.36853
+G1 X94.753 Y108.969 E34.59599
+N877 G1 X1 Y2*88
+G1 X107.645 Y73.919 E36.04401
+G1 X82.029 Y124.187 E37.74757
+G1 F2700 X295.274 Y96.977 E37.74757
+G1 X93.847 Y74.178 E39.38183
+G0 X76.30 Y126.67
+G1 X100.000 Y100.000 A0.27 B0.30
+M106 S240
+M204 S500 P1000
+G1 X85.996 Y108.205 E40.61916
+G1 X94.050 Y96.028 E41.17476
+G1 X119.703 Y71.941 E42.09046
+G1 X80.970 Y76.564 E42.76593
+G1 X121.409 Y111.174 E44.38247
+G1 F2700 E37.88247
+G1 F2700 E44.38247
+G1 X120.627 Y117.227 E45.41540
+G1 X93.634 Y105.597 E47.17972
+G1 X100.655 Y85.295 E48.53707
+G1 X96.496 Y103.836 E49.56633
+G1 X118.079 Y87.137 E50.80701
+G1 X97.805 Y107.743 E51.44391
+G0 X72.56 Y114.39
+G1 X129.452 Y78.401 E53.21204
+G1 X100.000 Y100.000 A0.46 B0.27
+G1 X114.698 Y83.280 E53.71975
+G1 X121.763 Y124.544 E53.79576
+G1 X90.291 Y75.966 E53.84708
+G1 F1200 X-126.190 Y93.943 E53.84708
+G1 F1200 X-12.947 Y89.688 E53.84708
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X99.481 Y81.523 E54.18329
+G1 X116.445 Y96.926 E54.60393
+G1 X110.717 Y83.327 E55.01163
+G1 X118.136 Y95.437 E56.01202
+G1 X75.341 Y123.096 E57.42924
+G1 X91.479 Y114.735 E58.33275
+G0 X113.39 Y104.00
+G1 X93.049 Y72.851 E58.60997
+G0 X118.15 Y102.09
+G0 X101.78 Y102.40
+G1 F2700 E52.10997
+G1 F2700 E58.60997
+G1 F1800 X-78.270 Y114.885 E58.60997
+G1 X122.163 Y123.478 E59.13375
+G1 X116.818 Y118.360 E60.03595
+G1 X99.863 Y72.120 E60.70483
+G0 X85.92 Y90.92
+G1 X110.777 Y117.651 E61.36199
+G1 X128.540 Y84.020 E61.82819
+G1 X102.656 Y95.424 E63.56970
+G1 F600 X-122.260 Y81.896 E63.56970
+G1 X116.870 Y127.710 E63.84421
+M106 S53
+M204 S500 P1000
+G1 X120.411 Y79.979 E64.00370
+G1 X74.434 Y114.781 E64.36256
+G1 X108.390 Y119.822 E66.18970
+G1 X72.109 Y103.083 E67.97030
+G1 X115.169 Y104.605 E69.93353
+G0 X107.65 Y106.81
+G1 X105.585 Y88.090 E70.26799
+G1 X81.162 Y114.612 E70.71060
+G0 X92.64 Y75.81
+G1 X110.458 Y86.653 E70.73812
+M106 S159
+M204 S500 P1000
+G1 X83.818 Y125.781 E70.91854
+G1 X94.501 Y78.270 E72.04637
+G1 X105.948 Y95.951 E73.14621
+G1 X91.283 Y80.792 E73.75869
+G0 X79.49 Y99.10
+G1 X88.026 Y87.418 E74.32470
+G1 X72.781 Y113.983 E75.90190
+G1 X83.778 Y118.313 E77.29002
+G1 X110.797 Y83.389 E78.86082
+G1 X80.480 Y105.056 E79.06242
+G1 X99.390 Y108.095 E79.08935
+G1 F600 X261.532 Y104.656 E79.08935
+G1 X102.107 Y75.540 E80.84672
+M106 S133
+M204 S500 P1000
+G0 X77.30 Y117.58
+G1 X118.698 Y100.911 E82.58758
+G1 X119.245 Y107.786 E82.79238
+G1 X128.044 Y125.603 E82.99394
+G0 X89.40 Y114.71
+G1 X101.479 Y98.793 E84.49080
+G1 X120.733 Y117.212 E85.88345
+G1 X112.248 Y82.064 E86.88622
+G1 X122.891 Y86.529 E87.61150
+G0 X113.08 Y73.09
+G1 X75.654 Y87.214 E89.13207
+G1 X87.619 Y116.206 E90.19207
+G1 F2700 E83.69207
+G1 F2700 E90.19207
+G1 F1800 X30.960 Y113.642 E90.19207
+M117 Layer 967 of 99
+G1 X102.472 Y93.411 E90.30975
+G1 F2700 E83.80975
+G1 F2700 E90.30975
+G1 F1800 X-59.756 Y119.500 E90.30975
+;LAYER:971
+G0 F9000 X99.172 Y71.693 Z1.6
+;TIME_ELAPSED:359.270000
+G1 X112.309 Y125.869 E90.36968
+G1 X72.248 Y91.901 E91.44039
+G1 F1800 X203.461 Y91.850 E91.44039
+G1 X100.554 Y104.537 E92.40192
+M117 Layer 976 of 99
+G1 X82.110 Y127.168 E94.31992
+G1 X89.249 Y81.737 E94.81995
+G1 X94.580 Y86.442 E95.66092
+G92 E0
+G1 X76.010 Y95.389 E1.69285
+G0 X95.38 Y86.11
+G1 X121.682 Y126.199 E3.18891
+G1 X119.026 Y92.224 E3.39879
+G1 F30000 X82.510 Y80.091 E3.39879
+G1 X70.890 Y80.726 E4.67363
+G0 X82.24 Y106.41
+G1 X77.336 Y108.072 E5.69121
+G1 F1800 X-107.460 Y124.847 E5.69121
+G0 X99.54 Y129.56
+G1 X79.415 Y122.653 E6.73226
+G1 X112.840 Y111.764 E7.78413
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G0 X93.71 Y126.30
+G1 F1200 X-67.347 Y128.013 E7.78413
+G1 X81.293 Y94.951 E7.78929
+G0 X108.18 Y93.42
+G1 X82.497 Y122.511 E8.27526
+G1 X96.044 Y95.166 E9.55121
+G1 X127.165 Y86.455 E10.59834
+G1 X129.701 Y91.848 E11.45677
+G1 F2700 E4.95677
+G1 F2700 E11.45677
+G1 X94.477 Y125.835 E13.00079
+G1 X109.423 Y91.938 E14.17680
+G1 X110.335 Y97.048 E15.86164
+G1 X90.368 Y86.339 E16.69684
+G1 F2700 X189.944 Y82.784 E16.69684
+G1 X90.114 Y81.920 E18.66030
+G1 X70.391 Y101.686 E19.45701
+G1 X107.457 Y94.503 E20.71650
+G1 X98.213 Y118.436 E21.66837
+G1 F1800 X260.766 Y109.677 E21.66837
+G1 X99.409 Y99.316 E22.09456
+G1 X86.700 Y114.339 E22.98104
+G1 X105.615 Y80.086 E23.21642
+G1 X126.521 Y126.767 E24.39190
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 F30000 X133.359 Y97.618 E24.39190
+G1 X99.984 Y129.902 E25.02300
+G1 X116.520 Y111.666 E26.68719
+G1 X76.741 Y77.149 E27.38217
+G1 X82.004 Y73.350 E28.02882
+G0 X103.15 Y85.79
+G1 X113.182 Y105.389 E29.48580
+G1 X120.636 Y84.287 E31.30120
+G0 X115.25 Y84.97
+G1 X105.271 Y84.307 E32.67113
+G1 X100.220 Y82.768 E33.97112
+G1 X101.578 Y113.006 E34.65748
+G1 X114.991 Y93.300 E36.05729
+G92 E0
+G1 X100.000 Y100.000 A0.05 B0.35
+G1 X124.770 Y94.013 E1.20725
+G1 X91.321 Y79.513 E3.20303
+G1 F600 X-56.675 Y99.584 E3.20303
+G1 F30000 X-21.502 Y127.484 E3.20303
+G1 X124.037 Y121.752 E3.76680
+G1 X105.595 Y110.017 E4.10702
+G1 X91.637 Y89.161 E5.62073
+G1 X99.458 Y98.472 E6.04766
+G1 X109.699 Y82.797 E7.71392
+G1 F2700 X177.144 Y102.874 E7.71392
+G1 X105.220 Y76.634 E7.87899
+G1 X76.150 Y117.060 E9.38666
+G1 X129.595 Y116.779 E10.28703
+G1 X119.890 Y123.104 E10.57119
+G1 X100.000 Y100.000 A0.43 B0.02
+G1 X116.777 Y110.612 E11.73043
+G1 X116.524 Y126.622 E12.70348
+G0 X103.86 Y92.17
+G1 X100.000 Y100.000 A0.96 B0.76
+G1 X108.511 Y104.719 E14.48737
+G1 X112.726 Y88.678 E15.74260
+G1 X124.644 Y76.657 E17.64080
+G1 X100.060 Y121.710 E18.90552
+G1 X93.697 Y95.197 E19.77879
+G1 X121.454 Y111.744 E20.49183
+G1 X85.760 Y110.931 E21.30338
+G1 X72.221 Y83.005 E22.13786
+G1 X105.456 Y127.390 E23.17562
+G1 X129.825 Y124.469 E24.94764
+;LAYER:1062
+G0 F9000 X126.947 Y120.612 Z1.8
+;TIME_ELAPSED:392.940000
+G92 E0
+G1 X96.673 Y105.643 E1.73007
+G1 X104.393 Y106.187 E2.78369
+G1 X115.248 Y89.979 E4.48120
+G1 X73.217 Y95.120 E5.50722
+G1 X98.891 Y78.537 E5.59723
+G0 X99.42 Y89.03
+G1 X120.817 Y124.666 E5.89621
+G0 X126.60 Y92.87
+G1 X75.701 Y122.543 E6.41643
+N1073 G1 X1 Y2*49
+N1074 G1 X1 Y2*4
+G1 X111.717 Y72.780 E7.49498
+G1 X117.773 Y115.495 E8.41993
+G1 X100.865 Y109.804 E9.36230
+G1 F600 X280.308 Y124.133 E9.36230
+G0 X124.17 Y121.54
+G1 X129.711 Y71.171 E11.19039
+G1 X88.755 Y112.223 E11.90342
+G1 X115.373 Y71.630 E13.72378
+G1 X99.616 Y114.918 E14.68250
+G92 E0
+G1 X89.766 Y81.720 E1.77617
+G1 X86.524 Y106.546 E2.54462
+G1 X102.623 Y99.564 E2.79825
+G1 F600 X15.384 Y100.183 E2.79825
+G1 F2700 X2.973 Y88.373 E2.79825
+G1 X127.238 Y84.981 E3.08632
+G1 X100.000 Y100.000 A0.41 B0.70
+G1 X91.726 Y106.255 E3.46233
+G1 X98.608 Y114.127 E3.60641
+G1 X111.185 Y114.313 E3.83781
+G1 X116.803 Y104.172 E4.34279
+G1 X102.542 Y74.796 E5.13719
+G1 X106.173 Y80.080 E5.87131
+G0 X124.04 Y79.01
+G0 X104.21 Y73.43
+G1 X70.160 Y126.944 E7.24706
+G1 X85.208 Y115.730 E7.27632
+G1 X100.053 Y95.435 E8.77446
+G1 F1200 X70.621 Y129.719 E8.77446
+N1104 G1 X1 Y2*29
+G1 X80.291 Y95.962 E9.27210
+G1 F2700 E2.77210
+G1 F2700 E9.27210
+G1 X75.500 Y91.392 E10.43037
+M106 S63
+M204 S500 P1000
+G1 X116.983 Y86.726 E12.24765
+G1 X75.336 Y75.084 E12.56574
+G1 X105.920 Y120.924 E13.46112
+G1 X78.922 Y129.627 E13.95435
+G1 X129.747 Y96.032 E14.25537
+G92 E0
+G0 X74.61 Y89.48
+G1 F1200 X116.335 Y103.522 E0.00000
+G1 X91.719 Y123.558 E0.44127
+G0 X98.13 Y117.07
+G1 X94.610 Y84.676 E2.04686
+G1 X92.319 Y107.615 E3.29319
+G1 F2700 E-3.20681
+G1 F2700 E3.29319
+G1 X98.482 Y86.426 E3.30011
+G1 X84.166 Y112.068 E4.43707
+G1 X104.540 Y121.123 E4.49674
+G1 X124.261 Y109.699 E6.24227
+G1 X103.434 Y87.781 E7.36346
+G1 X77.122 Y111.632 E9.21662
+G1 X71.684 Y72.432 E10.87168
+G0 X99.19 Y129.98
+G0 X106.72 Y90.10
+G1 X93.052 Y88.247 E11.59338
+G0 X112.13 Y115.97
+G1 X121.547 Y77.892 E12.14490
+G1 X99.992 Y73.504 E13.82260
+G1 X94.154 Y75.916 E14.78470
+G1 X112.669 Y126.070 E16.58485
+G1 X120.079 Y129.842 E18.40668
+G1 X124.860 Y105.410 E19.50174
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X100.265 Y91.225 E20.43509
+G1 X74.045 Y104.841 E21.74426
+G1 X76.821 Y111.639 E22.24920
+G1 X119.121 Y91.585 E22.37511
+G1 F1200 X223.422 Y123.228 E22.37511
+G1 X71.451 Y116.607 E24.25598
+G1 X116.323 Y129.807 E26.22952
+G1 X125.835 Y74.925 E26.43675
+G1 X94.024 Y79.143 E28.36352
+G1 X119.229 Y109.995 E29.65080
+G1 X129.832 Y117.478 E29.70608
+G1 X119.951 Y78.082 E30.06136
+G1 X126.750 Y119.926 E31.26014
+G1 X112.209 Y76.770 E32.55642
+G1 F30000 X328.954 Y115.678 E32.55642
+G1 X111.093 Y90.793 E32.95059
+G1 F2700 E26.45059
+G1 F2700 E32.95059
+G1 X115.131 Y111.493 E34.77407
+G1 X122.298 Y98.731 E34.80689
+G1 X78.024 Y110.774 E35.91861
+G1 X102.683 Y98.296 E37.33517
+M106 S79
+M204 S500 P1000
+G1 X77.382 Y76.203 E38.97040
+G1 X108.912 Y87.267 E39.26296
+G1 X100.000 Y100.000 A0.71 B0.23
+G1 X117.019 Y100.772 E39.42887
+G1 F2700 E32.92887
+G1 F2700 E39.42887
+G1 X97.553 Y73.436 E39.93699
+N1168 G1 X1 Y2*5
+G1 X108.738 Y83.050 E40.94496
+G1 X125.313 Y120.182 E42.63157
+G1 X88.051 Y105.425 E43.97602
+G1 X84.290 Y83.207 E45.64323
+G1 X97.852 Y120.400 E46.50727
+G1 X122.532 Y94.093 E47.22918
+G1 X98.412 Y121.367 E47.79429
+G0 X122.32 Y86.17
+G1 X83.344 Y121.770 E48.85416
+G1 F1800 X5.430 Y100.905 E48.85416
+G1 X84.072 Y101.158 E50.68453
+G1 X125.543 Y97.383 E52.21861
+G1 X122.981 Y121.417 E52.86760
+G1 F2700 E46.36760
+G1 F2700 E52.86760
+G1 F1800 X189.611 Y109.624 E52.86760
+G1 X118.162 Y90.426 E53.74480
+G1 X125.127 Y113.539 E54.76000
+G1 X115.068 Y116.238 E55.24723
+G1 X126.692 Y101.428 E56.48673
+G1 X81.499 Y85.790 E57.52976
+G0 X106.70 Y74.69
+G1 X93.058 Y84.670 E57.72160
+G1 F600 X92.258 Y75.184 E57.72160
+G1 X106.113 Y82.837 E59.40601
+G0 X119.98 Y128.96
+G1 X126.530 Y88.325 E61.25838
+G1 X109.339 Y93.102 E62.10460
+G1 X100.000 Y100.000 A0.16 B0.84
+G1 F1200 X299.060 Y86.740 E62.10460
+G1 F2700 X264.965 Y89.549 E62.10460
+G0 X103.05 Y78.04
+G1 X89.234 Y111.735 E63.41365
+G1 X118.574 Y113.330 E64.96814
+G1 F2700 E58.46814
+G1 F2700 E64.96814
+G1 F600 X287.898 Y97.544 E64.96814
+G1 X117.982 Y87.942 E65.15692
+G1 X91.781 Y127.289 E66.98175
+G1 X87.412 Y108.259 E67.75778
+G0 X75.56 Y113.93
+G1 X76.449 Y114.228 E68.36329
+G1 X74.078 Y90.105 E69.16950
+G1 X125.052 Y70.238 E69.37417
+G1 X87.709 Y71.230 E70.62336
+N1212 G1 X1 Y2*53
+G1 X74.072 Y112.652 E72.50680
+G1 X88.009 Y104.292 E73.68076
+G1 X93.457 Y115.735 E75.09796
+;LAYER:1216
+G0 F9000 X78.465 Y73.851 Z2.0
+;TIME_ELAPSED:449.920000
+G1 F30000 X-117.256 Y110.039 E75.09796
+G1 X129.962 Y119.248 E76.68680
+G1 X81.356 Y89.719 E76.70085
+G1 X78.867 Y92.423 E78.58379
+M117 Layer 1221 of 99
+G1 X72.831 Y74.970 E79.97710
+G0 X127.96 Y98.30
+G1 X89.164 Y108.061 E80.11778
+G1 X117.959 Y129.810 E80.98271
+G1 F1800 X189.823 Y97.147 E80.98271
+G1 F1200 X236.707 Y83.027 E80.98271
+G1 X129.269 Y118.174 E81.82320
+G0 X104.58 Y71.43
+G0 X100.82 Y109.18
+G0 X123.80 Y85.47
+G1 F600 X78.224 Y84.817 E81.82320
+G1 X92.704 Y103.049 E83.27459
+G1 X117.376 Y91.225 E84.29374
+G1 X95.714 Y118.450 E85.86681
+G1 X84.545 Y86.295 E87.48601
+G1 X84.461 Y78.174 E89.13514
+M106 S43
+M204 S500 P1000
+G1 X89.655 Y99.478 E90.38100
+G1 X85.211 Y78.617 E91.91724
+G1 X109.196 Y101.516 E92.69824
+G0 X100.22 Y105.21
+G1 X115.996 Y76.584 E93.48511
+G1 F2700 E86.98511
+G1 F2700 E93.48511
+G1 X70.748 Y77.974 E94.01123
+G1 X82.677 Y116.772 E95.17420
+G1 X71.139 Y129.915 E96.98800
+G1 X99.410 Y113.307 E97.26622
+G1 X108.752 Y93.472 E98.98028
+G1 X110.103 Y128.051 E99.43809
+G1 X126.116 Y72.679 E101.33225
+G1 X118.779 Y105.022 E102.37234
+G1 F2700 X109.866 Y128.528 E102.37234
+G1 X103.789 Y95.334 E102.43714
+G1 X76.764 Y93.173 E104.09737
+G1 X86.440 Y100.068 E105.88389
+G1 F2700 X110.555 Y95.760 E105.88389
+G1 X106.705 Y126.269 E106.79815
+G1 X89.212 Y113.210 E108.11938
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X89.706 Y70.972 E108.24519
+G1 X70.668 Y117.966 E108.48185
+G1 X75.253 Y93.212 E108.92487
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X123.540 Y124.124 E110.01580
+G1 X86.269 Y105.786 E111.98764
+G1 X92.301 Y100.320 E113.42773
+G1 X122.723 Y105.530 E114.70678
+G1 X75.888 Y89.654 E116.14990
+G1 X93.035 Y90.818 E117.84836
+G1 X118.385 Y104.291 E118.30258
+G1 X116.253 Y77.031 E118.70528
+G1 X85.145 Y82.859 E120.43248
+G1 F1800 X260.780 Y85.161 E120.43248
+G1 X90.415 Y86.129 E122.36444
+G92 E0
+G1 X113.614 Y125.552 E1.08195
+G0 X123.84 Y89.29
+G0 X126.68 Y90.20
+G1 F1200 X-11.176 Y91.089 E1.08195
+G1 X116.751 Y79.466 E2.43541
+G1 X108.549 Y73.024 E3.07055
+G1 X120.009 Y100.932 E4.48989
+G1 X113.633 Y91.681 E4.81583
+G1 X116.495 Y86.348 E6.40692
+G1 X111.716 Y128.935 E8.27520
+G1 X76.832 Y116.811 E8.68769
+G1 X73.129 Y93.514 E8.97424
+G1 X123.318 Y116.601 E10.96205
+G1 X84.390 Y94.108 E11.98932
+G1 X115.311 Y89.045 E13.38367
+G1 X93.598 Y80.377 E14.35632
+G1 X100.000 Y100.000 A0.76 B0.10
+M117 Layer 1294 of 99
+G1 F1200 X-99.884 Y93.208 E14.35632
+G1 X82.373 Y120.470 E15.71236
+G0 X106.12 Y112.63
+G1 X107.953 Y89.541 E16.97606
+G0 X73.53 Y126.65
+G1 X91.832 Y101.049 E17.25559
+G1 X119.717 Y78.592 E17.41593
+G1 F2700 X277.285 Y70.555 E17.41593
+G0 X79.32 Y106.75
+;LAYER:1304
+G0 F9000 X110.576 Y86.316 Z2.2
+;TIME_ELAPSED:482.480000
+G1 X121.929 Y110.482 E19.27831
+G1 X109.331 Y86.626 E21.19896
+G1 X89.766 Y116.386 E21.91172
+G1 F600 X-76.997 Y81.246 E21.91172
+G1 X92.079 Y79.490 E23.45117
+G1 X70.436 Y80.262 E24.89102
+G1 X84.650 Y92.931 E26.54157
+G1 X123.503 Y126.521 E27.99289
+G1 X125.790 Y77.818 E28.77061
+G1 X90.966 Y120.922 E29.30422
+G1 X70.568 Y79.293 E31.23165
+G1 X92.831 Y73.259 E33.09468
+G1 X78.296 Y129.067 E33.76158
+G1 X81.924 Y88.290 E35.72970
+G1 X105.558 Y89.677 E37.29175
+G1 X88.073 Y112.294 E38.04676
+G1 F1800 X-20.830 Y90.487 E38.04676
+G1 X104.970 Y128.073 E38.97665
+G1 X78.646 Y94.326 E40.53096
+N1324 G1 X1 Y2*42
+G1 X114.314 Y120.876 E41.44706
+G0 X129.16 Y103.41
+G1 X74.020 Y79.772 E43.28249
+G1 X125.078 Y96.686 E43.32521
+G1 X85.540 Y105.926 E43.96509
+G1 X103.217 Y90.913 E45.38162
+G1 X129.180 Y79.797 E45.65536
+G1 X128.623 Y88.689 E45.66182
+G1 X118.178 Y121.385 E47.36574
+G1 F1200 X267.899 Y104.009 E47.36574
+G1 X85.738 Y123.968 E48.74771
+G1 X81.520 Y99.430 E48.94457
+G1 X95.017 Y94.303 E49.89530
+G1 X109.668 Y98.875 E51.41185
+M117 Layer 1339 of 99
+G0 X116.04 Y73.25
+G1 X93.687 Y105.509 E52.62118
+G1 X123.016 Y77.714 E54.32085
+G1 X114.297 Y128.790 E54.62841
+G1 X116.874 Y93.204 E55.58452
+G1 X100.000 Y100.000 A0.84 B0.35
+G1 X98.537 Y70.766 E57.21065
+G1 X75.130 Y128.066 E57.28384
+G1 X124.195 Y121.841 E57.99790
+G1 X81.608 Y72.806 E59.76194
+G1 X112.054 Y92.713 E60.65494
+G1 X128.699 Y72.888 E61.53405
+G1 F2700 X324.384 Y119.645 E61.53405
+G1 X104.905 Y108.105 E62.58024
+G1 X105.698 Y114.868 E62.88285
+G0 X102.78 Y86.56
+G1 X116.539 Y108.964 E63.72989
+G1 X98.226 Y96.690 E63.88851
+G1 X125.854 Y109.441 E65.20975
+G1 X89.923 Y97.076 E65.42829
+G1 X90.629 Y87.612 E67.38541
+G0 X124.30 Y92.72
+G1 X96.078 Y80.174 E69.11422
+G1 X110.764 Y74.671 E69.43600
+G1 X102.871 Y93.729 E69.50997
+G1 X122.535 Y121.786 E70.70666
+G0 X87.10 Y117.49
+G1 X118.546 Y104.342 E72.26566
+G0 X97.89 Y109.80
+G1 X95.473 Y101.509 E73.64563
+G1 X113.826 Y93.422 E73.86485
+G0 X78.83 Y97.22
+G1 X87.231 Y94.321 E75.21887
+G1 X92.826 Y120.178 E77.10148
+G1 X92.090 Y102.221 E78.03659
+;LAYER:1375
+G0 F9000 X108.549 Y114.001 Z2.4
+;TIME_ELAPSED:508.750000
+G1 X100.000 Y100.000 A0.77 B0.92
+G1 X115.750 Y75.254 E78.75264
+G1 X105.625 Y108.701 E79.53135
+G1 X101.690 Y73.148 E79.86077
+G1 X103.000 Y123.697 E80.27112
+G1 X100.000 Y100.000 A0.25 B0.51
+G1 X84.097 Y98.364 E80.97586
+G1 F2700 E74.47586
+G1 F2700 E80.97586
+G1 X74.050 Y119.664 E82.12394
+G1 X76.146 Y126.964 E83.51928
+G1 X129.798 Y101.199 E85.11828
+G1 X91.905 Y103.411 E85.44248
+G1 X79.628 Y87.737 E86.38255
+G1 F2700 E79.88255
+G1 F2700 E86.38255
+G1 X100.825 Y89.187 E87.84279
+G1 X99.374 Y86.802 E88.25871
+G1 F1200 X226.097 Y129.064 E88.25871
+G1 F1800 X233.753 Y128.962 E88.25871
+G1 X73.724 Y127.178 E88.45501
+G1 X104.357 Y81.641 E89.20493
+G1 X97.893 Y106.938 E90.27576
+G1 X75.869 Y121.385 E90.54942
+G1 F2700 X201.654 Y94.662 E90.54942
+G1 X73.713 Y87.915 E92.34317
+G0 X71.85 Y108.53
+G1 X76.957 Y97.235 E92.47276
+G1 X73.929 Y115.530 E93.20696
+G0 X71.94 Y72.49
+G1 X125.785 Y119.604 E94.36358
+G1 X105.874 Y75.873 E94.87171
+G1 F30000 X214.592 Y93.134 E94.87171
+G1 F600 X333.874 Y125.755 E94.87171
+G1 X93.894 Y77.313 E96.58952
+G1 X97.797 Y90.118 E97.06934
+G92 E0
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X98.026 Y124.474 E0.58718
+G1 F2700 E-5.91282
+G1 F2700 E0.58718
+G1 X101.643 Y116.770 E1.54303
+G1 X102.257 Y78.269 E1.84443
+G1 X89.484 Y102.761 E3.81861
+G1 F2700 E-2.68139
+G1 F2700 E3.81861
+G1 F1200 X78.759 Y96.967 E3.81861
+G1 X86.755 Y90.002 E4.44322
+G2 X10 Y10 I5 J5 R3 D1 C2 P0.5
+G1 X84.489 Y127.061 E5.26338
+G0 X121.11 Y114.44
+G91
+G1 Z1 E-2 F300
+G1 X5 Y-3 E0.1
+G90
+G1 X118.256 Y72.516 E7.14369
+G0 X79.41 Y83.31
+G1 X77.482 Y90.497 E9.02365
+G1 X106.194 Y77.130 E9.93412
+G1 X122.050 Y87.498 E10.29824
+G1 X100.000 Y100.000 A0.58 B0.00
+G0 X108.75 Y78.92
+G1 X79.829 Y103.451 E11.61744
+G1 X127.022 Y104.184 E12.22633
+G1 X76.381 Y70.809 E12.35952
+G1 X94.675 Y82.957 E12.81706
+G0 X102.18 Y89.96
+G1 X119.975 Y128.387 E14.52535
+G0 X86.61 Y119.31
+G1 X84.104 Y106.288 E14.53236
+G1 X110.733 Y80.988 E15.67084
+G1 X110.092 Y116.579 E16.34243
+G1 X109.846 Y97.899 E18.32838
+G1 X87.236 Y97.083 E19.57990
+G1 X73.017 Y120.026 E21.27105
+G1 X100.000 Y100.000 A0.72 B0.34
+G1 X92.806 Y127.585 E21.33275
+G0 X78.64 Y85.42
+M106 S160
+M204 S500 P1000
+G1 X116.533 Y86.538 E21.80127
+G1 X75.865 Y92.179 E23.71204
+G1 X125.628 Y122.432 E24.29473
+G1 X111.059 Y85.230 E25.20824
+G1 X70.994 Y114.066 E25.49574
+G1 X116.494 Y90.428 E26.10354
+G1 X128.009 Y112.660 E26.71295
+G1 X75.931 Y91.846 E27.00963
+G1 X77.602 Y75.039 E27.94180
+G1 X94.892 Y111.963 E29.54779
+G1 X109.449 Y88.371 E31.14986
+G1 X91.825 Y113.796 E32.23546
+G1 X81.593 Y109.962 E34.08615
+G1 X116.523 Y121.156 E34.84106
+G1 X129.352 Y89.327 E34.85593
+G1 X117.991 Y125.136 E35.78305
+G1 X77.706 Y115.952 E36.83424
+G0 X90.91 Y102.43
+G1 F30000 X-124.357 Y89.575 E36.83424
+G1 X128.600 Y84.630 E38.48663
+G1 F30000 X141.092 Y111.127 E38.48663
+G1 X97.023 Y92.730 E39.33938
+G1 X128.266 Y122.553 E39.93484
+G1 X99.018 Y87.238 E41.78102
+G1 X81.275 Y129.820 E43.63344
+G0 X70.59 Y106.78
+G1 X96.830 Y86.294 E45.04337
+G1 X120.975 Y107.638 E45.32144
+G1 X97.128 Y112.180 E46.63211
+G1 X100.000 Y100.000 A0.19 B0.69
+G1 F600 X115.673 Y78.959 E46.63211
+G1 X116.898 Y101.999 E48.21767
+G1 X89.263 Y114.824 E48.53188
+G1 X108.698 Y74.245 E50.10747
+G0 X108.18 Y117.36
+G1 F30000 X171.832 Y83.275 E50.10747
+G0 X75.40 Y113.77
+G0 X117.38 Y74.34
+G1 X98.830 Y127.156 E51.58148
+G1 F30000 X191.996 Y114.696 E51.58148
+G1 X123.244 Y115.639 E51.86535
+G1 X86.327 Y81.160 E52.66234
+G1 X126.768 Y94.043 E54.12178
+G1 X98.985 Y112.556 E56.02971
+G1 F600 X147.890 Y71.550 E56.02971
+G1 X72.180 Y93.141 E57.06115
+G0 X112.78 Y85.24
+G1 X122.016 Y106.872 E57.85511
+G1 F2700 X155.529 Y80.529 E57.85511
+G0 X128.23 Y78.56
+G0 X81.52 Y106.76
+G1 X124.337 Y88.045 E58.79151
+M107
+M104 S0
+G28 X0 Y0
+M84
@@ -0,0 +1,402 @@
+G913TXY+E1:X
+M104TZ54YRZ 5X	AC
+:X	:3XCT B(4F+A	* MIE:	EP1E :Y	XeD9M+5'7
+X1*RIERZ	*-9"6(xYA.4S"F94TIY 	
+G28"E0x9:7YZ;8EIYXE*T	M
+M5000(:2I0M70SeA9XD(BR339ZS63 ;B5
+M5000;:40M2CFZIFCICG9:IN(GF4+1e	'BE.eTMX
+T13333E8E3XPYD6SA"xXEG	F+E1eMYDe2FEN0
+X8AA9788*ZFE"N8ES-MD-1FE
+M104-
+G92EN-1S
+G91++."ECePR3CP-9
+G91M
+G288NPEx0601ZCEC8P"D
+T1eG8T0TZIA2:P8I5E"Z373ZSSBMF:7TFex8I0F  
+M117G
+G28-B5PDM
+G92(.R:'N+4BX07I
+X4.B+F-.M6IxGFIF8eA X'M-- 8E XRP;T
+G28.6 MY6
+G91.x.PE;6.+8.RE-N P6B4A36'YIR5YDI*AF:TI1F
+G927CE39SIC
+M117.3"4P0'Z1M" 76:M2"-e(.YACEZ
+G92TI;B5MN3F+.	9E'Z;
+G05Y;MEZNZxCY
+G927G" 4;e
+M117-:
+M28SNXIP*E
+G92D(6.MI;0MNTGM. P.8R6EIT5I9+3.*EDC
+G91:EB30XBGYEN5
+M117ZI2
+M5000I(xRE(T7IS;6GN1" 'RT*D0IG"2Z8;.T
+M28.GZNZF3:T3M**EC
+G1-FI:x2'9F(eTFT:.E5E.B-.	MM::METCZMTBE
+G9126 XEM
+MR9NG7Y.+ZI-Y8NYNRDCT792Y8M(TeETPY
+X"NTE*e	BG
+T19;M
+G1M9(:-(777A P*
+G1M(7Y.6;2DDY:ZF-N1BxE.;A:1C993M
+M117
+T13*F402'A"G'"3AP:G(N1Y32:Y15;
+M5000;EX
+M5000EFR;5.'P15ME3  DZX
+;TIME:6eBT(9X BS84"(*NTN3TR*8 I3
+G1TSYD.9 C6"
+G285B PRZI" Z'R1N	PM424-D2;"X9;
+XBM.-EDZ;R23T65*MBT5:8:9
+G03-76
+M28CFF-ME
+M5000Z TGBC	TT:*BEN-E5EAEY*-:P2NCx
+G0
+M1047;'TR8-R RM4:T*XMP9
+ZNCI51C9TE":41M3PG(.YD9P*P
+M28CN(Ee9eIC94IXxF3XDMxF4X:XI36:
+G91ZS"PIT-
+;TIME:T*I21"6SEGZ;Z04A D20*5ZX:8P1+
+T1'18ME4RE3T2T
+T1XNPY
+X1;"eTN:E';*GxEYMCE8:7
+G28N59B9IG*EFxR''71xZ.P3SR4
+G18 
+M104S5EYNeZDE49:6ICB47eM
+M28IA((;	;1NNP6RIRRF(:P'Y3NR.-CTET7TE
+G0C61T(CAXPx:PY1.I6xNIGEEx:e0DT1
+G91TDNTxTDG'
+G90Ie*YDT9 8Y4E3I FE+ZTS3E
+G92(I*4X*	044M1TP33DG5S5AZ3	1
+T1BGX FT3Z	e
+G91SF0(S-SYE29P*BT8'XxE2Z:eESECe3eP
+M5000I	DT3-S20AFRPT MTI'A2x7 E*T4*:
+M282I16.6IMGe97R6e7I83EYB051Z6
+M104ITTEBZ'.ZX.2TBMYeEAPB9(SMCY0eNS'
+X7FN.8D:Ne.R'1TPI3
+M117;M'2SNA-XE16 -:EEN+E31N21	F1"Z6CIeX(-N*E
+M5000I'GTCF(eE54.1XB9CeTTMXG	0*E-0+C4:*:BD
+G918SBGR:F6EYEFI;3NGXT 0xT:6x-9RSGTX+M3IRS
+G0Ge IPF
+G90-xT.TT4eI.*Y
+G92X8:+G257ZT6ICENCTTA"EN:X;E M5M-N(TDZ.GSN
+M28S'P2"xR2EEI+
+T1-EGM5C	*D3e:Y	SFTMAEeS0FEMMTBE
+TEYTY:1P+IY:2ERDDATTEZEE(8EBETD('"5NM0N(
+G0'x.8(eM4M5-E08:X+	D:Z	(
+M117G-P(XG09E9EI9:0.N	S(DEC9SAE
+G289E EE
+G91E33Z5TM1D*N5+.S2EC7B+x
+G28TT0:'-F6I 'S76EN:CB"7TER.P;*:eFFR'x-0S
+M28PNESIEP2FF**5;PEEE;D
+G90TG35EC.E(7MFNx3GR5E	:T4CITTE:
+M5000MITA75'NEEE4R3
+;TIME:SN587Me4-MIIT'G29ETN+DS:P-0E	7+D:8.ME1-"
+G90DMI3.Ae0EXN;23XGY44EEM0:NEC*3
+M10437DSBYEP8T CF0
+47( TB80C;:2MN5MI8G;0RT*'895eEZI1F*2XZ	'
+G28-0E:GIGD
+G1NxE:FCI60FD3+SeExZ
+E*P9ED-Z6IA AN4CB89 X87FE9R9S+xGS'7
+;TIME:9I(7154MYIE1ETMMeTM"E.89FTD:4EB"EI1"
+T1 D(5"5N X((093".;.0DT9A"P':*B:EZT
+G903+	X3*EGTP8xIX.+e2eFEMEExMZDTIE7EIE
+T4ETG1B* :N
+M5000I4T'M5	T:X9	-TA4	E3
+T1GM2x
+X84 EZT8DF
+
+G90
+G0ZDAB8M;
+;TIME:R6IX1:EFZ(E :97INX:TGXGTMeZ2**xS9xX'
+G9168MSFA1TSE4826;	"(;XeT:x"xGFx*:5R22M
+G90C6(EG'N;5S:T(F	F; M90+Z+ 92PC*xXM37:DN
+X
+G287+Z+0YC3:-N-'8.:PPDPZIE(
+G91	03-FRT91E1E7ZF'xM0;-xMETD	9:	DN;5E6
+G28xBNT"PI2ZMXT 1:79YxE3A:ZN'	CTZI.3I6S1
+M28ITN0X MXN.:T8X
+G1'GPM*::6T
+G1'1N2A182S6RFMG7:PTSCYe1B6E2MEY
+T1'C8AE1F"CXI:6 F6F;44R
+M117;
+X"SN9E'78AF.XEID 8(
+G1P15NRRE2(4SX(FEM
+T1".B6G-(I15T4D;	IBI-C:IPxZZx9;IDB
+XP:*PGYE-4X-0"(E9ZG48BI;RI	1TSE1	xG0-6-YA
+G91':2	X(E96.M-+BM
+M28CeISE
+G92 MMEEPNMxE	7-RE6
+G1E:IT;A79:.;AAA3B+:CCFI
+X3SME2E4xx-T3X1"3R":5	'3 X'-FM
+G915IEG1E-IY'5P.IM
+M28437ETTTT
+XMe;E+TeENA-G5RT(A
+G92TSAXx.;Z7:+F6A.B(4	(;R
+;TIME:+(7eE
+XT2P :17 *e88*M
+M28CP.+2:3G0SR' '9;(D(XM
+M117Yx06IX-260E-CMF4"I0BMPee;-E8;E:E:B4
+M5000G4 :A9
+G90F4;exA26E7(0(03- x2T'G926*I+*F5	2:CZ
+M5000'xR'D5GMXN	9*+*+e5--M
+G9070TxM06GMY-CE41.3T 	FP49
+G90e:"E-ZS1'1Y*.IAT(E".4ES-(.D.
+M28IXE	xE0	EETE4GG*:E G*3E:GI
+G0I9 	;T+.F	P4
+XFS-.EME
+G1-97e5XTGM:
+G91:R0;ST;EE
+M5000Y0P6e2MXC3:T6XeRRCTS:I'G7*4xN9YRM2M::
+M28*3:9MRZIS02IG(3 1A"+2"3TYA
+G90 R2P7(0R5T;IM"FR:BZP;+
+M5000 67RS10D
+;TIME:2E:D*8.DC6MB:Nx6:1+R3x.DB
+M5000M.Z+;2M
+F*G2:ZEIC'PIEY 1.*PY:*ZC(B:3(037EEB;
+M1171
+4MI:E7R30EEI(A;xC:MT3T
+X5P*F2T *EE
+M117C	9:-N5IM	0GAT(T:xEXRMAT'D0Z4E3eC;-Z
+G916"E.EEE6.XMED5M.B9PTE NI+SE
+M28NRXS004ZPE*BBM:9I8R:RG.E6BT0E*B:F:
+X"EA 5SMIFx73DAE
+G92
+G91DTX;*PAE*6AS'67	1(S YTG79Z:"	NE
+59P+'G0ZT(EeTENTRZBMM3F(1IE-MSE
+G28e'2IT0'C1B 1NRXTE	E
+M5000XD959S*x:EZFECSB6E3ZT68PD
+;TIME:GTe.5F(YIX.:4"Y6GIIS2(G
+T1M0	P8Z+'-75+EF3xeZXM"xI*		418ITB*"-E
+G0CM6EZFI:1 :4
+G91R	63NACIP ACNTEP-IN:9C 7C+	EA.:	Z
+M5000MY6B. .:AE.E7M3+SP	8ZB1eX3
+M281TG
+;TIME:D7*A:B5ZeP	A0S1"MGNAR1.-09Tx0E0 'xATMR
+G92PE6M:6AM9AYNIF (MI2F:N
+M1046GM"F9.8TTYIeTMx3
+M5000SE63Ce-Y1"-D*B:eTDS17"	720'G":
+T1CMR7xTEFIF;2;Y.N0		-:
+M117 E
+M50005E	EE1(RFMY*
+G281.ER0 :3"X:"I'8.1RR0F
+M117GI7363	*S:YF*
+;TIME:N	 I"YP:Z:I*:070E5Y
+M5000'I;N+MSE;R:MDX36Px(.TEPRXBxXZY	
+G91GP;+TGE'
+G0''MT93eM"IX4T
+G1e"9x3N7GM'	T'X4e:"SZMFDF-Z0150+M: FIx	"C
+;TIME:N:8TT*T :7 ;1--;BNG 8ET1FEC3ZMeBAX+.D I
+G921FIS-M0:R69DE027D'MEIGYT3M0XC	242IECMN
+G0:5RC0D'5T;*9D	S8
+M5000B*(Z"G9RS'Mex6D:X
+G281T6I5B*MMAFGB
+G92.0ES7M3Z4
+G91"T:RPEEGTB.xC	5EEMX'YAA9B
+M104GICM+FE+.A-09Y0DCY;:IGN;YTP
+M1044 1
+G92
+G91T7
+M104 "E4:;35'+42F224FE
+G0x.NEe2RPIAZeT:X
+G90'MT6 I'7	G8T8.":+2RE20:Y3-;eIM'YE+I
+M28NN80-:8	CFY-1-D-S1RMIFI7IETT'215A4FEN2E
+G91I--*6IZ;3(6EA6E8I-FGMB
+G91-IRe1-"2NM PG	NX:I*:+;'NRN6Z-E9
+M5000PB5(e
+G28T:621T:(45TxN0R2:BeP::1
+G1"YZ623-49TME:
+X7E548IY639B.GICP3+TM( "27AZCY
+X
+G1ZD	7XMP:"8X E4:B4XEF'"P-GI+;-NZ
+G91NI* 3.4MX**R25+N*PBXD+T1
+T1::F1"P7: IX'G+Y4	'T;C6(P:D:e736
+M28XI5EAXBYx9IG 
+;TIME:9CMM(D+SF:
+M28E7EPZX4CIN:6M5FXEBTS6(C:': F*N' D
+M1173T'2FT(CT+EZP7
+M1175"M3AT0AIDT
+M104Y(90M9ZP9;*x:+ZPB8;C:*T:xEG0PFI*X
+M117068R"1IA*Y 7E ASx37TT
+G0:E4TEB4	0Y1IS1SIZ"GT8*FNEERAF9;+
+M104'7RS	+T
+M1041P(3 DBR+.REGEX9
+G28DECZSFNM53e-A(	AZI:DCRx.:XRYx"ETDeEI
+M5000"Z7:IG'44TZRF.MSF0B
+M28CM":YG8T9-"Y
+G28EYPEX14ZT:0:S9M9BNE*X7M:S52E.*:+TEAYNC
+M28:7 R9	M:X3I3
+G28M"23ZCTM"Ix5*G*9xMA844x*7F"+DZ037eT("Z;I
+;TIME:4I+RADMET2I2;"F1SC0e3*9'.xPS
+G90GGIER7	IN0ME .I2BNI4Y.e"6;(1*I:EM
+G90MXT991EMXMA 26*.Fx7T'8BG;FP:	.T3I
+;TIME:T;ER(+M4 4TZME29:1E;'S	9X+0BP-XS*-SM*
+G0*21EI;*8Pe'63EMN13'28;ADe6.4ES'TF;+8I
+M104Y;31:3-(EAN6GT+E	*0x1NRY E
+G28M4:A*STIEEA33"339"0I:F+-4I(BD"MY4Y.G	I
+M2853D	;MBFCIR.A(TT2(BT::2e;:Yxx.;xDC*E
+G91Z1ME-YA'DG7EB6;.X6: xTT+7A8C(E""-	CD
+M104(	+:MCIM.;51Y
+Z:A32.:4CIX1+"INY
+	B57M:e7P"ePA3S(PY-M6P:PNP E(M
+;TIME:MY0D4GTE+N 0ES	E'0*ETIE04M:7E"EF189Z"'8
+M5000E-	N.2D0
+G92P
+;TIME:-52S5BBGAD:+2MGZ7
+G28D	
+M104'"e 
+T1EDGRD02EE:BP67	:EM:6Y	X8S3TM:R:
+E8xFA9x2YERCG3	CETTREPGT7X3RCM
+G0E	4NTF7M8E:EIF-Se.'E.2GYM TZ. eex+Y
+;TIME:I+e
+G923IG DMI.7DA:TDI5AeZ+-0MEZREZ1
+G92*(F9x	"PGZYTAMExD-2
+T1e	TDZMX:MIMB5XIe(6N:BN*0M'
+G90S6STT8
+G28';RG4+M"C+0"GR"Z+SET'5E"1Y+A7SD-XTI+R4-
+;TIME:ZTDD(G:N5:AIe6eMSE(3R"NMZEDTNeTT:FTYxYE3
+G92YY+G
+G1YF A9T.E;6IEN*34EEI6E7"
+G91M2CED0I";eGPY
+G1II:*INITF8
+G12NT
+G1:CXY(G;B01+IB1N11S-IARS(2MCTPC21RT8N
+M5000
+G0I21R(M
+T19AA7 :9Z3A98IC56XAPY;168R" X
+G1C8D	e2AX5-XR-S.'DEZ8N77BY6E'ED;I
+G28YA:88NI.GET.MT8MT+TC9Ix
+M117F2'T1ITIECMx7Z6DT(6BP*'
+XY3MMSG18CY81
+M104MDeDP8P*7;C'T4I"4I:M	1SRGFxNx78
+M104:2BNR A;4FB-B:'XSC5SZ:64N	ICF;:4EX5
+M5000M(Y(IB
+G90-2*I
+:A6R9I-:M1- P5Y:N	2IENTR41-NMYEX
+XDM'G68"M:TI7'C5ZD+43BC1:12I91B
+M28D;AT.B3e4TY8:7"	+00:5'I8EMMMS31AE( TDER:
+X1*TNSYx7I:TP
+G0+4 ;MYGIZERGICIN:RMMAZZPF8"Y-0'(48N"XZ
+G92NZYeXENB""
+M104FPx XFE52(:MC*Y8EY:FP:67CeZI8	5
+M117
+M28DEE7RN.5-+"XMCMC.(DE:E7ePID*INBSXC7":
+;TIME:3'-*Xx'Z(X'.RFIER7M
+M28A.:-1M:8-*YEIYe258YN
+G28C6'8:4:1+6'eXE7ZE;BT BY7MeT*IYI"
+G90ZF3EE:XT(IB-EEY'S+x4SRI25:"1AR7 A
+G128CIx(73:PBP9E."
+G28MN.8EFe''I"MPI4
+G0
+M5000	0GNxTT'C';1*1
+X32(ACGM4E	RTXSF*N.T'25
+M5000BR+:"IX0I'BM+TX 7"8
+G28D"1RYEA'MMC1YeY9XP7E3*82*EE	8
+G91*0	Ex:-Y864GICDD1+1IEA
+T7:	5M:B5ZI-(.0ECxXC15S2E:Y4P'*".I9+
+G28GIFx2 SIMT A	1XXD.M.::D.7F DFFE6
+G285
+M117ENx;C4D.E7XZG":SR+NC-ICxIP:A7:x:D;5.X9
+G0ZY M4F'7SED+"4RPCS40e5**SED6
+G1P:'A.(I48
+M5000:98;8-P8:.F.SCY0E2Y3E05"0:E3
+7	 GT80.E
+;TIME:5e*S TIGMFE1M3':	MC"S  3T
+M117ABMe'869;1-M0 +'E8
+G1N2ex	NM12Y1E+G;"(9SE2
+G0PDXB
+M117CCX5NAEF  ZF5PT925Z
+xB*TZXSATM'
+;TIME:SA7SEIPx0MP1A5'34N6C8MM:ISIF0ETX6-eMT6 	
+G06MxE"I3.FX -F9IE2SETG.E.G14:
+	2I4"8:eS'2P
+G92IeG:E''T Ne"S
+X9;Z9TF5Z	4(:.5:GZ:BE2;Ax56NZ6T1ET9
+M5000DYTN;1D..-5	ET;7T'3
+ATFM(Xx+B0E2RN.T68MZZTD7x8:Z("
+M5000IBTATI.N"SSC8CNNXCSe*YE2+e6DE48'MX2CT7
+T1PNS-MA '3SB889;	1E 9:"S"E12AB9:("
+G90 I'M'D7A(7E1	ME18EP+III1PxP*(:R::Y4G
+M28YD..IARIAM(EPM::IG;X5Z;'	EG.40::+IG
+XICEDA;:.'M23
+;TIME:Y
+XA;.F51IMMX5e+T2S11 B01N+FSS
+M117A:AS*.		E
+M10447+GXR5BRGR0RZ8:25"8TCIX6.RTxIP
+G1Z"Z"TZ5*Y.6RMFI*
+G90E:.5S:T9ATSEX(.T"XE-
+;TIME:.3SCID5NI7ZR
+T1
+;TIME:I3EP4Z+M(1"R;I
+CT34E5YFZYX+PNEE2.M9N
+M28I9	6(Y
+XBFY85BIMMEI:T:YA'RXC:;0SE14:;S
+T1IGBZ+5REFIN:AA2ZICGFT0Z*:' :
+T1+P*-D8"B10. :Ce;I.B.M45IxIT+(;AE:61-
+T1:.+2+((3:TN8'MD
+;TIME:0:*71Z1TDC5TMNE1EM; X"14T5x-
+C""8EI9E1P;9T:B"46(
+G90'FTI:S0;X
+"TIX55PF1.AA;6.
+G90NM32I2G1A'"BMTe:PDM:M	eC(EP:RC8:	'AT	'
+M104Z.7ARD6*41GCA"3RT5R":R2ET- *;8:87GXI27
+M28eIx8 2SEN6Z*7DEGYZZI1G54.7(E0-1:SE.-9A
+G91+DC20"xe 	;(Ze:1A1
+T'B"MA"S4M1C3GSIPI+613NCI:7S1XM2C'
+MT9+8P+IYTIEINT.BEeSI.'( 
+M104:8eAB;**
++e	CI6'	B196
+M104XTEZeeT:E.
+;TIME:;YI-MMeC6
+G1+RIP'E"xMB"1YYMeAXSE(I;*ZD6x;
+M104
+G28(C*
+G18exF2E+727PC;;.RBE*3TCED617.0.9Me:0
+G90S09I3S-F5I8.D
+G28TR0	EN;0EA8(
+G90:D'5G*NB  x	EBES(MEM575M:5PEF4I.F'CT5
+G90FEI	PS8:+P6T.9EMP
+T1T	
+G15D*ExC	IT01E8YTSE*FN EX	XPRDZNNZN9
+M117G*7C1R4ACGA"E6E9
+G28C
+M28T'24T+3C*4Ye.6M5:-8;I4
+M5000DIX D7	R .AZM15GGNE9ESP8B*
+G90DFT3IGI(M26'-xC"YBXIZ(T(*+ESAZTY*M1:Ie3E
+M104AA-7*962E5C2P'8T:23- ;A:TT
+T1PF62e;1Fx-S5F;RA
+M1044
+G1e6
+:6:YEE3*.:M21B8ZMMF
+M104EZZ Px-YB(46N:
+M28X	E+I4*xXAE5Y	ED:;M9
+G92	5M(7:'* ;E
+ZE-9"C1A'..(*1R4.;xxR57NeDB TB G
+G1:I1NEeP37I:TE*IE
+M117TT-M4TP33M5P1IE T(3I	3.3P2F." 
+T1ZR
+: I1
+G2878"*x1I+IISZF	-D8
+G91-FF: C
+M5000(*Z;D3G5C27G6E2GEC3NR
+G0E7:4:I.ZR6(DX1	TA:ME::E9 F3F+7;03SPZ:
+X"x5P(	M'X.1.ET"N:TNI;5-6677	'AEeIARMM:BD
+M1179I"P"68TEIXI6
+G16MM8
+;TIME:.Z4CBX:4R"*E943XT.G'Tx5PC"
+G0E
+M500059E
+T1E:2:'G2EN4eY9+-2E9E3IE9
+;TIME:.xMAx8*Tx4Ix;IG8R0	72E(ExeX
+G91+R	3	IM57 E:Fe8*E+T
+;TIME:IGF':EXRMTSNR2C::-
+Xe:FER6-20F6I (1M-;9X
+G1G3 MY'"YF2
+M117+ET:A7.F9ADF*CGXNEI
+G28E-'BI':M3MFM	6;Nx+IBe1FREEMM
+M5000P*G*'E(
+G28+S6EZ03ISDYGZI3ZBR7IX4E6AM3"P
+M285:07+1EB2Y(4((AD5'6(PE8*2eZA6Y	65N9N3
+G1.ETS.5PG82"2TA
+M104Z3IF*4.B('67(:8eeBINE.M4:M;+91D5M74PEMZZ
+*2P41	IM7E512E
+M117 xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+G1 X1                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                            Y2
\ No newline at end of file
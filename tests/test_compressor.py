@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+import tempfile
+import types
+
+import pytest
+
+try:
+    import UM.Logger
+except ImportError:
+    # the compressor only logs through Uranium, the tests run without Cura
+    class _Logger:
+        @staticmethod
+        def log(*args, **kwargs):
+            pass
+
+    sys.modules["UM"] = types.ModuleType("UM")
+    sys.modules["UM.Logger"] = types.ModuleType("UM.Logger")
+    sys.modules["UM.Logger"].Logger = _Logger
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from QidiGcodeCompressor import QidiGcodeCompressor
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# data/<name>.gcode.tz was written by VC_compress_gcode from data/<name>.gcode with these M4001 values:
+# x, y, z and e mm per step, bed x, y and z max, machine type
+CASES = {
+    "cura_type0": ("0.003125", "0.003125", "0.0025", "0.00189", "300", "300", "300", "0"),
+    "cura_type0_shift": ("0.003125", "0.003125", "0.0025", "0.00189", "300", "300", "300", "0"),
+    "cura_type1": ("0.0125", "0.0125", "0.0025", "0.0106", "230", "200", "200", "1"),
+    "cura_type1_shift": ("0.0125", "0.0125", "0.0025", "0.0106", "230", "200", "200", "1"),
+    "cura_type2": ("0.00625", "0.00625", "0.00125", "0.00235", "230", "150", "150", "2"),
+    "fuzz": ("0.003125", "0.003125", "0.0025", "0.00189", "300", "300", "300", "0"),
+}
+RECENTERED = {"cura_type0_shift", "cura_type1_shift"}  # moved to the bed center in a second pass
+
+
+def _binary():
+    # the shipped compressor, if it runs on this host
+    if sys.platform == "win32":
+        path = os.path.join(PLUGIN_DIR, "VC_compress_gcode.exe")
+    elif sys.platform == "darwin":
+        path = os.path.join(PLUGIN_DIR, "VC_compress_gcode_MAC")
+    else:
+        return None
+    return path if os.path.exists(path) else None
+
+
+def _golden(name):
+    with open(os.path.join(DATA_DIR, name + ".gcode.tz"), "rb") as fp:
+        return fp.read()
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_compress_matches_binary_output(name):
+    with tempfile.TemporaryDirectory() as out_dir:
+        out_path = os.path.join(out_dir, name + ".gcode.tz")
+        assert QidiGcodeCompressor(*CASES[name]).compress(os.path.join(DATA_DIR, name + ".gcode"), out_path)
+        with open(out_path, "rb") as fp:
+            assert fp.read() == _golden(name)
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_compress_stream_matches_binary_output(name):
+    # a single pass gives the same file, unless the print has to be re-centered
+    blocks = []
+    with open(os.path.join(DATA_DIR, name + ".gcode"), "rb") as fp:
+        complete = QidiGcodeCompressor(*CASES[name]).compressStream(fp, blocks.append)
+    assert complete == (name not in RECENTERED)
+    if complete:
+        assert b"".join(blocks) == _golden(name)
+
+
+@pytest.mark.skipif(_binary() is None, reason="VC_compress_gcode does not run on this host")
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_golden_files_match_binary(name):
+    x_step, y_step, z_step, e_step, x_max, y_max, z_max, machine_type = CASES[name]
+    with tempfile.TemporaryDirectory() as out_dir:
+        subprocess.run([_binary(), os.path.join(DATA_DIR, name + ".gcode"), x_step, y_step, z_step, e_step, out_dir,
+                        x_max, y_max, z_max, machine_type], stdout=subprocess.PIPE, check=True)
+        with open(os.path.join(out_dir, name + ".gcode.tz"), "rb") as fp:
+            assert fp.read() == _golden(name)